@@ -504,6 +504,9 @@ class Docker(Agent):
         modules = self.args.modules
         all_upstream = self.args.all_upstream
         all_downstream = self.args.all_downstream
+        executor = self.args.executor
+        keep_going = self.args.keep_going
+        fail_fast = self.args.fail_fast
 
         # Namespace to string conversion
         full_tb_cmd = "" if not full_tb else "--full-tb"
@@ -517,9 +520,12 @@ class Docker(Agent):
         ])
         all_upstream_cmd = "" if not all_upstream else "--all-upstream"
         all_downstream_cmd = "" if not all_downstream else "--all-downstream"
+        executor_cmd = "" if executor is None else f"--executor {executor}"
+        keep_going_cmd = "" if not keep_going else "--keep-going"
+        fail_fast_cmd = "" if not fail_fast else "--fail-fast"
 
         # Full command
-        full_cmd = f"prism run {full_tb_cmd} {log_level_cmd} {vars_cmd} {context_cmd} {modules_cmd} {all_upstream_cmd} {all_downstream_cmd}"  # noqa: E501
+        full_cmd = f"prism run {full_tb_cmd} {log_level_cmd} {vars_cmd} {context_cmd} {modules_cmd} {all_upstream_cmd} {all_downstream_cmd} {executor_cmd} {keep_going_cmd} {fail_fast_cmd}"  # noqa: E501
 
         # Run container
         container = client.containers.run(
@@ -73,6 +73,38 @@ class CompileTask(prism.cli.base.BaseTask, prism.mixins.compile.CompileMixin):
         all_modules = self.get_modules(modules_dir)
         event_list = fire_empty_line_event(event_list)
 
+        # ------------------------------------------------------------------------------
+        # The execution plan uses the thread count and resource limits in
+        # prism_project.py, so the project must be set up
+
+        plan = getattr(self.args, 'plan', False)
+        project = None
+        if plan:
+            project_event_manager = BaseEventManager(
+                idx=None,
+                total=None,
+                name='parsing prism_project.py',
+                full_tb=self.args.full_tb,
+                func=self.create_project
+            )
+            project_event_manager_output = project_event_manager.manage_events_during_run(  # noqa: E501
+                event_list=event_list,
+                project_dir=project_dir,
+                user_context={},
+                which=self.args.which,
+                filename="prism_project.py"
+            )
+            project = project_event_manager_output.outputs
+            event_list = project_event_manager_output.event_list
+            if project == 0:
+                event_list = fire_console_event(
+                    project_event_manager_output.event_to_fire,
+                    event_list,
+                    log_level='error'
+                )
+                event_list = self.fire_tail_event(event_list)
+                return prism.cli.base.TaskRunReturnResult(event_list, True)
+
         # ------------------------------------------------------------------------------
         # Parse module references
 
@@ -88,11 +120,15 @@ class CompileTask(prism.cli.base.BaseTask, prism.mixins.compile.CompileMixin):
             project_dir=project_dir,
             compiled_dir=compiled_dir,
             all_modules=all_modules,
-            user_arg_modules=user_arg_modules
+            user_arg_modules=user_arg_modules,
+            project=project,
+            plan=plan
         )
         compiled_dag = compiled_event_manager_output.outputs
         event_to_fire = compiled_event_manager_output.event_to_fire
         event_list = compiled_event_manager_output.event_list
+        if project is not None:
+            project.cleanup(project.run_context)
         if compiled_dag == 0:
             event_list = fire_console_event(
                 event_to_fire,
@@ -102,6 +138,16 @@ class CompileTask(prism.cli.base.BaseTask, prism.mixins.compile.CompileMixin):
             event_list = self.fire_tail_event(event_list)
             return prism.cli.base.TaskRunReturnResult(event_list, True)
 
+        # Print the execution plan
+        if compiled_dag.plan is not None:
+            event_list = fire_empty_line_event(event_list)
+            event_list = fire_console_event(
+                prism.logging.ExecutionPlanEvent(compiled_dag.plan),
+                event_list,
+                0,
+                log_level='info'
+            )
+
         # Print output message if successfully executed
         event_list = fire_empty_line_event(event_list)
         event_list = fire_console_event(
@@ -174,7 +220,9 @@ class CompileTask(prism.cli.base.BaseTask, prism.mixins.compile.CompileMixin):
             all_modules=all_modules,
             user_arg_modules=user_arg_modules,
             user_arg_all_downstream=all_downstream,
-            project=project
+            project=project,
+            changed_since=getattr(args, 'changed_since', None),
+            selectors=self.user_arg_selectors(args)
         )
         compiled_dag = compiled_event_manager_output.outputs
         if compiled_dag == 0:
@@ -21,11 +21,18 @@ import prism.logging
 from prism.logging import fire_console_event, fire_empty_line_event
 from prism.event_managers import base as base_event_manager
 from prism.infra import executor as prism_executor
+from prism.infra.manifest import hash_module
+from prism.infra.pipeline import PrismPipeline
+from prism.infra.project import PrismProject
+from prism.infra.task_manager import PrismTaskManager
+from prism.infra.watcher import ProjectWatcher
 from prism.triggers import TriggerManager
+from prism.constants import INTERNAL_TASK_MANAGER_VARNAME
 
 # Ohter library imports
 import json
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 
 ####################
@@ -37,6 +44,30 @@ class RunTask(prism.cli.compile.CompileTask, prism.mixins.run.RunMixin):
     Class for defining the "run" task
     """
 
+    def __init__(self, args):
+        super().__init__(args)
+
+        # With `--watch`, the project (along with its adapters' connections), the
+        # pipeline's task manager, and the last pipeline are kept between runs
+        self.watch_project: Optional[PrismProject] = None
+        self.watch_task_manager: Optional[PrismTaskManager] = None
+        self.watch_pipeline: Optional[PrismPipeline] = None
+        self.watch_module_hashes: Dict[str, str] = {}
+
+    def create_project(self,
+        project_dir: Path,
+        user_context: Dict[str, Any],
+        which: str,
+        filename: str = 'prism_project.py'
+    ) -> PrismProject:
+        """
+        Create the PrismProject object. With `--watch`, the project from the previous
+        run is reused until prism_project.py changes.
+        """
+        if self.watch_project is not None:
+            return self.watch_project
+        return super().create_project(project_dir, user_context, which, filename)
+
     def fire_error_events(self,
         event_list: List[prism.logging.Event],
         error_event: Optional[prism.logging.Event],
@@ -64,7 +95,119 @@ class RunTask(prism.cli.compile.CompileTask, prism.mixins.run.RunMixin):
 
     def run(self) -> prism.cli.base.TaskRunReturnResult:
         """
-        Execute run task. Function is organized as follows:
+        Execute run task, either once or, with `--watch`, whenever the project changes
+        """
+        if getattr(self.args, 'watch', False):
+            return self.run_watch()
+        return self.run_once()
+
+    def run_watch(self) -> prism.cli.base.TaskRunReturnResult:
+        """
+        Run the project, and then run it again whenever a module or prism_project.py
+        changes, until interrupted. Each run after the first is compiled with
+        `--changed-since` against the modules that ran successfully, so only the
+        modules that changed (or failed) and the modules downstream of them are run.
+        The other modules' outputs are reused from the previous run. If
+        prism_project.py changes, then the project is set up again and every module is
+        run.
+        """
+        task_return_result = prism.cli.base.TaskRunReturnResult([])
+        watcher = None
+        try:
+            while True:
+                task_return_result = self.run_once()
+                project_dir = self.project_dir
+                if project_dir is None:
+                    return task_return_result
+                self.dump_watch_manifest(project_dir)
+                if watcher is None:
+                    watcher = ProjectWatcher(
+                        project_dir, self.get_modules_dir(project_dir)
+                    )
+                fire_console_event(
+                    prism.logging.WatchingForChangesEvent(), [], 0, log_level='info'
+                )
+                changed = watcher.wait()
+                fire_console_event(
+                    prism.logging.FilesChangedEvent(
+                        [str(p.relative_to(project_dir)) for p in changed]
+                    ),
+                    [],
+                    0,
+                    log_level='info'
+                )
+                self.prepare_watch_run(project_dir, changed)
+        except KeyboardInterrupt:
+            return task_return_result
+        finally:
+            if self.watch_pipeline is not None:
+                self.watch_pipeline.close_adapters()
+
+    def dump_watch_manifest(self, project_dir: Path):
+        """
+        Copy the manifest of the last run to `.compiled/watch`, without the hashes of
+        modules whose outputs aren't available (e.g., because they failed or weren't
+        run). The next run is compiled with `--changed-since` against this manifest, so
+        those modules are treated as changed.
+
+        args:
+            project_dir: project directory
+        """
+        compiled_dir = self.get_compiled_dir(project_dir)
+        try:
+            with open(compiled_dir / 'manifest.json', 'r') as f:
+                manifest = json.loads(f.read())
+        except (OSError, ValueError):
+            self.args.changed_since = None
+            return
+        hashes = manifest.get("module_hashes", {})
+        for name in list(hashes.keys()):
+            if self.watch_task_manager is None or not self.watch_task_manager.has_output(name):  # noqa: E501
+                del hashes[name]
+        self.watch_module_hashes = hashes
+        watch_dir = compiled_dir / 'watch'
+        watch_dir.mkdir(parents=True, exist_ok=True)
+        with open(watch_dir / 'manifest.json', 'w') as f:
+            json.dump(manifest, f, sort_keys=False)
+        self.args.changed_since = str(watch_dir / 'manifest.json')
+
+    def prepare_watch_run(self, project_dir: Path, changed: List[Path]):
+        """
+        Prepare the next run after `changed` files changed. Outputs of modules whose
+        source changed are discarded, so that they are executed again even if they
+        aren't explicitly run (e.g., modules upstream of `--modules`). If
+        prism_project.py changed, the project's adapters are closed and everything is
+        set up again.
+
+        args:
+            project_dir: project directory
+            changed: paths of changed files
+        """
+        if project_dir / 'prism_project.py' in changed:
+            if self.watch_pipeline is not None:
+                self.watch_pipeline.close_adapters()
+            self.watch_project = None
+            self.watch_task_manager = None
+            self.watch_pipeline = None
+            return
+        if self.watch_task_manager is None:
+            return
+        modules_dir = self.get_modules_dir(project_dir)
+        for path in changed:
+            try:
+                name = str(path.relative_to(modules_dir))
+                with open(path, 'r') as f:
+                    module_hash: Optional[str] = hash_module(f.read())
+            except ValueError:
+                continue
+            except OSError:
+                module_hash = None
+            if self.watch_module_hashes.get(name, None) != module_hash:
+                self.watch_task_manager.discard(name)
+
+    def run_once(self) -> prism.cli.base.TaskRunReturnResult:
+        """
+        Execute run task once. Function is organized as follows:
 
         - Fire header events, get prism project
         - Compile DAG
@@ -80,6 +223,9 @@ class RunTask(prism.cli.compile.CompileTask, prism.mixins.run.RunMixin):
         if task_return_result.has_error or self.project_dir is None:
             return task_return_result
         event_list = task_return_result.event_list
+        watch = getattr(self.args, 'watch', False)
+        if watch:
+            self.watch_project = self.prism_project
 
         # ------------------------------------------------------------------------------
         # Run the sys.path engine
@@ -125,6 +271,21 @@ class RunTask(prism.cli.compile.CompileTask, prism.mixins.run.RunMixin):
             self.run_context = self.prism_project.cleanup(self.run_context)
             return prism.cli.base.TaskRunReturnResult(event_list, True)
 
+        # If no modules changed since the manifest passed to `--changed-since`, there is
+        # nothing to run
+        changed_since = getattr(self.args, 'changed_since', None)
+        if changed_since is not None and len(compiled_dag.user_arg_modules) == 0:
+            event_list = fire_empty_line_event(event_list)
+            event_list = fire_console_event(
+                prism.logging.NoChangedModulesEvent(changed_since),
+                event_list,
+                0,
+                log_level='info'
+            )
+            event_list = self.fire_tail_event(event_list)
+            self.run_context = self.prism_project.cleanup(self.run_context)
+            return prism.cli.base.TaskRunReturnResult(event_list)
+
         # ------------------------------------------------------------------------------
         # Create pipeline
 
@@ -138,13 +299,22 @@ class RunTask(prism.cli.compile.CompileTask, prism.mixins.run.RunMixin):
 
         # First, create DAG executor
         threads = self.prism_project.thread_count
+        executor = self.args.executor
+        if executor is None:
+            executor = self.prism_project.executor
         dag_executor = prism_executor.DagExecutor(
             self.project_dir,
             compiled_dag,
             self.args.all_upstream,
             self.args.all_downstream,
             threads,
-            user_context
+            user_context,
+            executor,
+            self.prism_project.resource_limits,
+            self.args.keep_going,
+            self.args.fail_fast,
+            self.prism_project.run_timeout,
+            self.prism_project.broker_dir
         )
 
         # Manager for creating pipeline
@@ -161,7 +331,8 @@ class RunTask(prism.cli.compile.CompileTask, prism.mixins.run.RunMixin):
             fire_empty_line_events=True,
             project=self.prism_project,
             dag_executor=dag_executor,
-            run_context=self.run_context
+            run_context=self.run_context,
+            task_manager=self.watch_task_manager
         )
         pipeline = pipeline_event_manager_output.outputs
         pipeline_event_to_fire = pipeline_event_manager_output.event_to_fire
@@ -174,6 +345,9 @@ class RunTask(prism.cli.compile.CompileTask, prism.mixins.run.RunMixin):
             )
             self.run_context = self.prism_project.cleanup(self.run_context)
             return prism.cli.base.TaskRunReturnResult(event_list, True)
+        if watch:
+            self.watch_task_manager = pipeline.run_context[INTERNAL_TASK_MANAGER_VARNAME]  # noqa: E501
+            self.watch_pipeline = pipeline
 
         # ------------------------------------------------------------------------------
         # Execute pipeline
@@ -200,7 +374,8 @@ class RunTask(prism.cli.compile.CompileTask, prism.mixins.run.RunMixin):
             fire_exec_events=False,
             fire_empty_line_events=False,
             event_list=event_list,
-            full_tb=self.args.full_tb
+            full_tb=self.args.full_tb,
+            close_adapters=not watch
         )
         executor_output = exec_event_manager_output.outputs
 
@@ -225,6 +400,17 @@ class RunTask(prism.cli.compile.CompileTask, prism.mixins.run.RunMixin):
             # multiprocessing. This return structure is confusing; we should eventually
             # fix this.
             if success == 0:
+
+                # With `--keep-going`, several tasks may have failed. Fire the errors in
+                # the order in which they occurred.
+                error_events = executor_output.error_events
+                if len(error_events) > 1:
+                    for other_error_event in error_events[:-1]:
+                        event_list = fire_console_event(
+                            other_error_event, event_list, log_level='error'
+                        )
+                        event_list = fire_empty_line_event(event_list)
+                    error_event = error_events[-1]
                 event_list = self.fire_error_events(
                     event_list,
                     error_event,
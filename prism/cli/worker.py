@@ -0,0 +1,229 @@
+"""
+Worker task class definition, called via `prism worker`
+
+Table of Contents
+- Imports
+- Constants
+- Class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+import time
+from typing import Dict, Optional
+
+# Prism-specific imports
+import prism.cli.base
+import prism.logging
+import prism.mixins.run
+from prism.event_managers import base as base_event_manager
+from prism.infra import executor as prism_executor
+from prism.infra import pipeline as prism_pipeline
+from prism.infra import project as prism_project
+from prism.infra.broker import LEASE_RENEW_SECONDS, FileBroker, TaskMessage
+from prism.logging import fire_console_event
+
+
+#############
+# Constants #
+#############
+
+# Number of seconds between checks for new tasks in the broker
+POLL_SECONDS = 0.05
+
+
+####################
+# Class definition #
+####################
+
+@dataclass
+class WorkerRun:
+    """
+    A run whose tasks the worker executes. If the run could not be set up (e.g., because
+    an adapter could not connect), then `err` is sent back for each of its tasks.
+    """
+    project: Optional[prism_project.PrismProject] = None
+    pipeline: Optional[prism_pipeline.PrismPipeline] = None
+    full_tb: bool = True
+    err: Optional[Exception] = None
+
+
+class WorkerTask(prism.cli.base.BaseTask, prism.mixins.run.RunMixin):
+    """
+    Class for defining the "worker" task. Workers execute the tasks of runs that use the
+    `distributed` executor. Any number of workers, on any number of machines, can serve
+    the same broker directory; each worker executes one task at a time.
+    """
+
+    def prepare_run(self, broker: FileBroker, project_dir: Path) -> WorkerRun:
+        """
+        Create the project and pipeline for the run in `broker`. These are equivalent to
+        those created by the coordinator, except that tasks are executed one at a time
+        via `DagExecutor.exec_single_in_process`.
+
+        args:
+            broker: FileBroker for the run
+            project_dir: project directory
+        returns:
+            WorkerRun
+        """
+        spec = broker.get_spec()
+        project = self.create_project(
+            project_dir=project_dir,
+            user_context=spec.user_context,
+            which="run",
+            filename="prism_project.py"
+        )
+        run_context = project.sys_path_engine.modify_sys_path(project.sys_path_config)
+        dag_executor = prism_executor.DagExecutor(
+            project_dir,
+            spec.compiled_dag,
+            spec.user_arg_all_upstream,
+            spec.user_arg_all_downstream,
+            1,
+            spec.user_context,
+            "distributed"
+        )
+        pipeline = self.create_pipeline(project, dag_executor, run_context)
+        dag_executor.prepare_worker(broker.buffers_dir)
+        return WorkerRun(project, pipeline, spec.full_tb)
+
+    def close_run(self, run: WorkerRun):
+        """
+        Close the adapter connections of a run and undo its sys.path changes
+        """
+        if run.pipeline is None or run.project is None:
+            return
+        run.pipeline.close_adapters()
+        run.pipeline.run_context = run.project.cleanup(run.pipeline.run_context)
+
+    def renew_lease(self,
+        broker: FileBroker,
+        task_id: str,
+        stop: threading.Event
+    ):
+        """
+        Renew the lease on a claimed task until `stop` is set, so that the coordinator
+        doesn't requeue the task while it's running
+
+        args:
+            broker: FileBroker for the task's run
+            task_id: ID of the claimed task
+            stop: event set once the task is complete
+        """
+        while not stop.wait(LEASE_RENEW_SECONDS):
+            if not broker.renew(task_id):
+                return
+
+    def exec_task(self,
+        run: WorkerRun,
+        message: TaskMessage
+    ) -> base_event_manager.EventManagerOutput:
+        """
+        Execute a task claimed from the broker
+
+        args:
+            run: WorkerRun for the task's run
+            message: claimed task
+        returns:
+            EventManagerOutput to send back to the coordinator
+        """
+        err = run.err
+        if run.pipeline is not None:
+            dag_executor = run.pipeline.dag_executor
+            try:
+                return dag_executor.exec_single_in_process(
+                    run.full_tb, message.name, message.upstream, message.attempt
+                )
+            except Exception as e:
+                err = e
+        error_event = prism.logging.ExecutionErrorEvent(
+            message.name, type(err), err, err.__traceback__, run.full_tb  # type: ignore
+        )
+        return base_event_manager.EventManagerOutput(0, error_event.detach(), [])
+
+    def run(self) -> prism.cli.base.TaskRunReturnResult:
+        """
+        Execute worker task. The worker claims tasks from open runs in the broker
+        directory until it is interrupted or, if `--max-idle` is specified, until it
+        hasn't received a task for `--max-idle` seconds.
+        """
+        task_return_result: prism.cli.base.TaskRunReturnResult = super().run()
+        if task_return_result.has_error or self.project_dir is None:
+            return task_return_result
+        event_list = task_return_result.event_list
+
+        if self.args.broker_dir is None:
+            broker_dir = self.prism_project.broker_dir
+        else:
+            broker_dir = Path(self.args.broker_dir).resolve()
+        event_list = fire_console_event(
+            prism.logging.WorkerStartEvent(str(broker_dir)), event_list, 0
+        )
+
+        runs: Dict[str, WorkerRun] = {}
+        last_task_time = time.monotonic()
+        try:
+            while True:
+                open_runs = FileBroker.list_runs(broker_dir)
+
+                # Clean up runs that are over
+                open_run_ids = [broker.run_id for broker in open_runs]
+                for run_id in list(runs.keys()):
+                    if run_id not in open_run_ids:
+                        self.close_run(runs.pop(run_id))
+
+                # Claim at most one task, oldest run first
+                claimed = None
+                for broker in open_runs:
+                    claimed = broker.claim()
+                    if claimed is not None:
+                        break
+                if claimed is None:
+                    idle_seconds = time.monotonic() - last_task_time
+                    if self.args.max_idle is not None and idle_seconds >= self.args.max_idle:  # noqa: E501
+                        event_list = fire_console_event(
+                            prism.logging.WorkerIdleEvent(self.args.max_idle),
+                            event_list,
+                            0
+                        )
+                        break
+                    time.sleep(POLL_SECONDS)
+                    continue
+
+                task_id, message = claimed
+                stop = threading.Event()
+                heartbeat = threading.Thread(
+                    target=self.renew_lease, args=(broker, task_id, stop), daemon=True
+                )
+                heartbeat.start()
+                try:
+                    if broker.run_id not in runs:
+                        try:
+                            runs[broker.run_id] = self.prepare_run(
+                                broker, self.project_dir
+                            )
+                        except Exception as err:
+                            runs[broker.run_id] = WorkerRun(err=err)
+                    result = self.exec_task(runs[broker.run_id], message)
+                finally:
+                    stop.set()
+                    heartbeat.join()
+                broker.put_result(task_id, message.name, message.attempt, result)
+                last_task_time = time.monotonic()
+
+        except KeyboardInterrupt:
+            pass
+        finally:
+            for run in runs.values():
+                self.close_run(run)
+
+        event_list = self.fire_tail_event(event_list)
+        return prism.cli.base.TaskRunReturnResult(event_list)
@@ -26,6 +26,7 @@ import prism.exceptions
 from prism.infra import executor as prism_executor
 from prism.infra import module as prism_module
 from prism.infra import compiler as prism_compiler
+from prism.infra.selector import is_selector
 import prism.mixins.base
 import prism.mixins.compile
 import prism.mixins.connect
@@ -149,10 +150,15 @@ class PrismDAG(
         all_downstream: bool = True
     ) -> prism_compiler.CompiledDag:
         """
-        Compile the Prism project
+        Compile the Prism project. `modules` can be module paths or selectors, e.g.,
+        `+module.py`, `module.py+`, or `tag:nightly`.
         """
+        selectors = None
         if modules is None:
             module_paths = self.all_modules
+        elif any(is_selector(m) for m in modules):
+            module_paths = self.all_modules
+            selectors = modules
         else:
             module_paths = [Path(p) for p in modules]
         self.user_arg_modules_list = module_paths
@@ -165,7 +171,8 @@ class PrismDAG(
             self.compiled_dir,
             self.all_modules,
             self.user_arg_modules_list,
-            all_downstream
+            all_downstream,
+            selectors=selectors
         )
 
     def run(self,
@@ -173,10 +180,16 @@ class PrismDAG(
         all_upstream: bool = True,
         all_downstream: bool = False,
         full_tb: bool = True,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        executor: Optional[str] = None,
+        keep_going: bool = False,
+        fail_fast: bool = False
     ):
         """
-        Run the Prism project
+        Run the Prism project. If `keep_going` is True, then every task that is not
+        downstream of a failed task still runs, and the first error is raised at the
+        end. If `fail_fast` is True, then queued and running tasks are cancelled as
+        soon as a task fails.
         """
         # Create PrismProject
         if user_context is None:
@@ -199,13 +212,26 @@ class PrismDAG(
 
         # Create DAG executor and Pipeline objects
         threads = prism_project.thread_count
+        if executor is None:
+            executor = prism_project.executor
+        elif executor not in prism.constants.VALID_EXECUTORS:
+            valid_executors_str = ','.join([f'`{k}`' for k in prism.constants.VALID_EXECUTORS])  # noqa: E501
+            raise prism.exceptions.RuntimeException(
+                message=f'invalid executor `{executor}`; must be one of {valid_executors_str}'  # noqa: E501
+            )
         dag_executor = prism_executor.DagExecutor(
             self.project_dir,
             compiled_dag,
             all_upstream,
             all_downstream,
             threads,
-            user_context
+            user_context,
+            executor,
+            prism_project.resource_limits,
+            keep_going,
+            fail_fast,
+            prism_project.run_timeout,
+            prism_project.broker_dir
         )
         pipeline = self.create_pipeline(
             prism_project, dag_executor, self.run_context
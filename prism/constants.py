@@ -43,6 +43,14 @@ VALID_TASK_TYPES = [
     "pyspark",
 ]
 
+# Executors used to run tasks concurrently
+VALID_EXECUTORS = [
+    "threads",
+    "processes",
+    "asyncio",
+    "distributed",
+]
+
 # Context
 CONTEXT = {
     '__builtins__': builtins,
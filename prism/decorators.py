@@ -4,6 +4,7 @@ Target decorators
 Table of Contents
 - Imports
 - Target decorators
+- Functions / utils
 """
 
 ###########
@@ -11,6 +12,9 @@ Table of Contents
 ###########
 
 # Standard library imports
+import asyncio
+import functools
+import inspect
 from pathlib import Path
 
 # Prism imports
@@ -32,6 +36,45 @@ def target(*, type, loc, **kwargs):
 
     def decorator_target(func):
 
+        def save_targets(self, hooks: prism.infra.hooks.PrismHooks, obj):
+
+            # Attempts that were cancelled (e.g., because they timed out) don't save
+            # their targets
+            self.raise_if_cancelled()
+            self.types.append(type)
+            self.locs.append(loc)
+            try:
+                self.kwargs.append(kwargs)
+            except TypeError:
+                self.kwargs.append({})
+
+            # If multiple things returned, we expected multiple targets
+            if isinstance(obj, tuple):
+                objects_to_save = zip(obj, self.types, self.locs, self.kwargs)
+                for zipped in objects_to_save:
+                    temp_o = zipped[0]
+                    temp_t = zipped[1]
+                    temp_l = zipped[2]
+                    temp_k = zipped[3]
+                    target = temp_t(temp_o, temp_l, hooks)
+                    target.save(**temp_k)
+
+                # If a target is set, just assume that the user wants to reference the
+                # location of the target when they call `mod`
+                return self.locs
+
+            # If return type is not a Tuple, we expect a single target
+            else:
+
+                # Initialize an instance of the target class and save the object using
+                # the target's `save` method
+                target = type(obj, loc, hooks)
+                target.save(**kwargs)
+
+                # If a target is set, just assume that the user wants to reference the
+                # location of the target when they call `mod`
+                return loc
+
         def wrapper_target(self,
             task_manager: prism.infra.task_manager.PrismTaskManager,
             hooks: prism.infra.hooks.PrismHooks
@@ -69,47 +112,23 @@ def target(*, type, loc, **kwargs):
                         message="`target` decorator can only be called on `run` function"  # noqa: E501
                     )
 
-                # If the task should be run in full, then call the run function
+                # If the task should be run in full, then call the run function. If
+                # `run` is a coroutine function, then save the targets once its output
+                # is available.
                 if self.bool_run:
                     obj = func(self, task_manager, hooks)
-                    self.types.append(type)
-                    self.locs.append(loc)
-                    try:
-                        self.kwargs.append(kwargs)
-                    except TypeError:
-                        self.kwargs.append({})
-
-                    # If multiple things returned, we expected multiple targets
-                    if isinstance(obj, tuple):
-                        objects_to_save = zip(obj, self.types, self.locs, self.kwargs)
-                        for zipped in objects_to_save:
-                            temp_o = zipped[0]
-                            temp_t = zipped[1]
-                            temp_l = zipped[2]
-                            temp_k = zipped[3]
-                            target = temp_t(temp_o, temp_l, hooks)
-                            target.save(**temp_k)
-
-                        # If a target is set, just assume that the user wants to
-                        # reference the location of the target when they call `mod`
-                        return self.locs
-
-                    # If return type is not a Tuple, we expect a single target
-                    else:
-
-                        # Initialize an instance of the target class and save the object
-                        # using the target's `save` method
-                        target = type(obj, loc, hooks)
-                        target.save(**kwargs)
-
-                        # If a target is set, just assume that the user wants to
-                        # reference the location of the target when they call `mod`
-                        return loc
+                    if inspect.isawaitable(obj):
+                        return _await_and_save(
+                            functools.partial(save_targets, self, hooks), obj
+                        )
+                    return save_targets(self, hooks, obj)
 
                 # If the task should not be run in full, then just return the location
                 # of the target
                 else:
-                    # We still need to append the last location to self.locs
+                    # We still need to append the last type and location, so that the
+                    # targets can be loaded via `tasks.ref(..., load=True)`
+                    self.types.append(type)
                     self.locs.append(loc)
 
                     # If multiple targets, then return all locs
@@ -132,6 +151,25 @@ def target_iterator(*, type, loc, **kwargs):
 
     def decorator_target_iterator(func):
 
+        def save_targets(self, hooks: prism.infra.hooks.PrismHooks, objs):
+            self.raise_if_cancelled()
+            if not isinstance(objs, dict):
+                raise prism.exceptions.RuntimeException(
+                    message="output of run function should be dict mapping name --> object to save"  # noqa: E501
+                )
+            for k, _ in objs.items():
+                if not isinstance(k, str):
+                    raise prism.exceptions.RuntimeException(
+                        message="output of run function should be dict mapping name --> object to save"  # noqa: E501
+                    )
+
+            # Iterate through objects and save them out
+            for name, obj in objs.items():
+                target = type(obj, Path(loc) / name, hooks)
+                target.save(**kwargs)
+
+            return loc
+
         def wrapper(self,
             task_manager: prism.infra.task_manager.PrismTaskManager,
             hooks: prism.infra.hooks.PrismHooks
@@ -151,24 +189,33 @@ def target_iterator(*, type, loc, **kwargs):
 
             if self.bool_run:
                 objs = func(self, task_manager, hooks)
-                if not isinstance(objs, dict):
-                    raise prism.exceptions.RuntimeException(
-                        message="output of run function should be dict mapping name --> object to save"  # noqa: E501
+                if inspect.isawaitable(objs):
+                    return _await_and_save(
+                        functools.partial(save_targets, self, hooks), objs
                     )
-                for k, _ in objs.items():
-                    if not isinstance(k, str):
-                        raise prism.exceptions.RuntimeException(
-                            message="output of run function should be dict mapping name --> object to save"  # noqa: E501
-                        )
-
-                # Iterate through objects and save them out
-                for name, obj in objs.items():
-                    target = type(obj, Path(loc) / name, hooks)
-                    target.save(**kwargs)
-
-                return loc
+                return save_targets(self, hooks, objs)
             else:
                 return loc
         return wrapper
 
     return decorator_target_iterator
+
+
+#####################
+# Functions / utils #
+#####################
+
+async def _await_and_save(save, awaitable):
+    """
+    Await the output of a coroutine `run` function and save it. Targets are saved in the
+    default executor, so that writing them doesn't block the event loop.
+
+    args:
+        save: function that saves the output and returns the target location(s)
+        awaitable: output of the `run` function
+    returns:
+        target location(s)
+    """
+    obj = await awaitable
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, save, obj)
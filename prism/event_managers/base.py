@@ -32,6 +32,11 @@ class EventManagerOutput:
     outputs: Any
     event_to_fire: Optional[prism.logging.Event]
     event_list: List[prism.logging.Event]
+    execution_time: Optional[float] = None
+
+    # Whether the task's `run` function was executed, as opposed to its output being
+    # loaded from a previous run
+    executed: bool = True
 
 
 class BaseEventManager:
@@ -131,53 +136,88 @@ class BaseEventManager:
         # Execute task
         try:
             outputs = self.run(**kwargs)
-            if fire_exec_events:
-                event_list = self.fire_success_exec_event(start_time, event_list)
+        except Exception:
+            return self.manage_error_events(
+                start_time, event_list, fire_exec_events, fire_empty_line_events
+            )
+        return self.manage_success_events(
+            outputs, start_time, event_list, fire_exec_events
+        )
+
+    async def amanage_events_during_run(self,
+        event_list: List[prism.logging.Event],
+        fire_exec_events=True,
+        fire_empty_line_events=True,
+        **kwargs
+    ) -> EventManagerOutput:
+        """
+        Fire relevant event managers. `func` must be a coroutine function.
+        """
+
+        start_time = time.time()
+        if fire_exec_events:
+            event_list = self.fire_running_exec_event(event_list)
+
+        # Execute task
+        try:
+            outputs = await self.func(**kwargs)
+        except Exception:
+            return self.manage_error_events(
+                start_time, event_list, fire_exec_events, fire_empty_line_events
+            )
+        return self.manage_success_events(
+            outputs, start_time, event_list, fire_exec_events
+        )
+
+    def manage_success_events(self,
+        outputs: Any,
+        start_time: float,
+        event_list: List[prism.logging.Event],
+        fire_exec_events: bool
+    ) -> EventManagerOutput:
+        """
+        Fire events for a task that executed successfully
+        """
+        execution_time = time.time() - start_time
+        if fire_exec_events:
+            event_list = self.fire_success_exec_event(start_time, event_list)
 
-            # Return output of task execution
-            return EventManagerOutput(outputs, None, event_list)
+        # Return output of task execution
+        return EventManagerOutput(outputs, None, event_list, execution_time)
+
+    def manage_error_events(self,
+        start_time: float,
+        event_list: List[prism.logging.Event],
+        fire_exec_events: bool,
+        fire_empty_line_events: bool
+    ) -> EventManagerOutput:
+        """
+        Fire events for a task that raised an exception. This must be called while the
+        exception is being handled.
+        """
+        exc_type, exc_value, exc_tb = sys.exc_info()
+        if fire_exec_events:
+            event_list = self.fire_error_exec_event(start_time, event_list)
+        if fire_empty_line_events:
+            event_list = fire_empty_line_event(event_list)
 
         # If PrismException, then create PrismExceptionErrorEvent
-        except prism.exceptions.PrismException as err:
-            if fire_exec_events:
-                event_list = self.fire_error_exec_event(start_time, event_list)
-            if fire_empty_line_events:
-                event_list = fire_empty_line_event(event_list)
+        if isinstance(exc_value, prism.exceptions.PrismException):
             prism_exception_event = prism.logging.PrismExceptionErrorEvent(
-                err, self.name
+                exc_value, self.name
             )
             return EventManagerOutput(0, prism_exception_event, event_list)
 
         # If SyntaxError, then create ExecutionSyntaxErrorEvent
-        except SyntaxError:
-            if fire_exec_events:
-                event_list = self.fire_error_exec_event(start_time, event_list)
-            if fire_empty_line_events:
-                event_list = fire_empty_line_event(event_list)
-            exc_type, exc_value, exc_tb = sys.exc_info()
-            if self.full_tb:
-                syntax_error_event = prism.logging.ExecutionSyntaxErrorEvent(
-                    self.name, exc_type, exc_value, exc_tb, True
-                )
-            else:
-                syntax_error_event = prism.logging.ExecutionSyntaxErrorEvent(
-                    self.name, exc_type, exc_value, exc_tb, False
-                )
+        elif isinstance(exc_value, SyntaxError):
+            syntax_error_event = prism.logging.ExecutionSyntaxErrorEvent(
+                self.name, exc_type, exc_value, exc_tb, self.full_tb
+            )
             return EventManagerOutput(0, syntax_error_event, event_list)
 
         # If any other Exception, then create ExecutionErrorEvent
-        except Exception:
-            if fire_exec_events:
-                event_list = self.fire_error_exec_event(start_time, event_list)
-            if fire_empty_line_events:
-                event_list = fire_empty_line_event(event_list)
-            exc_type, exc_value, exc_tb = sys.exc_info()
-            if self.full_tb:
-                exception_event = prism.logging.ExecutionErrorEvent(
-                    self.name, exc_type, exc_value, exc_tb, True
-                )
-            else:
-                exception_event = prism.logging.ExecutionErrorEvent(
-                    self.name, exc_type, exc_value, exc_tb, False
-                )
+        else:
+            exception_event = prism.logging.ExecutionErrorEvent(
+                self.name, exc_type, exc_value, exc_tb, self.full_tb
+            )
             return EventManagerOutput(0, exception_event, event_list)
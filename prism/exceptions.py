@@ -280,3 +280,29 @@ class EnvironmentVariableNotFoundException(PrismException):
 
     def __str__(self):
         return self.message
+
+
+class TimeoutException(PrismException):
+    """
+    Exception raised if a task or run exceeds its time limit
+    """
+
+    def __init__(self, message):
+        self.message = message
+        super().__init__(self.message)
+
+    def __str__(self):
+        return self.message
+
+
+class CancelledException(PrismException):
+    """
+    Exception raised if an attempt of a task was cancelled (e.g., because it timed out)
+    """
+
+    def __init__(self, message):
+        self.message = message
+        super().__init__(self.message)
+
+    def __str__(self):
+        return self.message
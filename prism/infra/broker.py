@@ -0,0 +1,422 @@
+"""
+File-based broker used by the `distributed` executor to hand tasks from the coordinator
+(i.e., the `prism run` process) to worker processes started with `prism worker`. The
+broker directory must be visible to the coordinator and every worker, e.g., on a shared
+filesystem when workers run on other machines.
+
+Each run gets its own directory within the broker directory:
+
+    {broker_dir}/{run_id}/
+        run.pkl         RunSpec, i.e., what a worker needs to execute the run's tasks
+        tasks/          tasks waiting for a worker
+        claimed/        tasks claimed by a worker, named {task ID}.{worker ID}.task
+        results/        results of completed tasks
+        buffers/        large task outputs, see `prism.infra.serialization`
+        done            created by the coordinator when the run is over
+
+Files are written to a temporary path and then renamed, so readers never see a partial
+file. Workers claim a task by renaming it from `tasks/` to `claimed/`; since renaming is
+atomic, each task is claimed by exactly one worker. The claimed file's name includes the
+worker's ID, so a worker whose lease expired can't renew or remove the claim of another
+worker that claimed the requeued task.
+
+A claimed task is leased to its worker, which renews the lease by touching the claimed
+file while the task runs. If the worker dies, then the lease expires and the coordinator
+moves the task back to `tasks/`. Leases are timed with the coordinator's clock (i.e., a
+lease expires when the claimed file's modification time hasn't changed for
+LEASE_SECONDS), so the clocks of the workers' machines don't matter. If no worker
+claims, renews, or completes a task for WORKER_TIMEOUT_SECONDS while tasks are waiting,
+then the coordinator withdraws the waiting tasks, so that the run fails rather than
+waiting forever.
+
+Table of Contents
+- Imports
+- Constants
+- Functions / utils
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import pickle
+import shutil
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, cast
+import uuid
+
+# Prism-specific imports
+import prism.exceptions
+from prism.infra.serialization import SerializedObject
+
+
+#############
+# Constants #
+#############
+
+RUN_SPEC_FILENAME = 'run.pkl'
+DONE_FILENAME = 'done'
+TASK_SUFFIX = '.task'
+RESULT_SUFFIX = '.result'
+
+# Claimed tasks whose lease isn't renewed for this many seconds are requeued
+LEASE_SECONDS = 30.0
+
+# Number of seconds between lease renewals by workers
+LEASE_RENEW_SECONDS = 5.0
+
+# Waiting tasks are withdrawn if no worker claims, renews, or completes a task for this
+# many seconds
+WORKER_TIMEOUT_SECONDS = 120.0
+
+
+#####################
+# Functions / utils #
+#####################
+
+def _mtime(path: Path) -> float:
+    """
+    Modification time of `path`, or 0 if it no longer exists
+    """
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+####################
+# Class definition #
+####################
+
+@dataclass
+class RunSpec:
+    """
+    Everything a worker needs to execute the tasks of a run. The compiled DAG includes
+    the source of each module, so workers only need the project's `prism_project.py`
+    and profile to create the same adapters as the coordinator.
+    """
+    compiled_dag: Any
+    user_arg_all_upstream: bool
+    user_arg_all_downstream: bool
+    user_context: Dict[Any, Any] = field(default_factory=dict)
+    full_tb: bool = True
+
+
+@dataclass
+class TaskMessage:
+    """
+    Attempt `attempt` of task `name`, along with the serialized outputs of its upstream
+    tasks
+    """
+    name: str
+    attempt: int
+    upstream: Dict[str, SerializedObject] = field(default_factory=dict)
+
+
+class FileBroker:
+    """
+    Broker for a single run
+    """
+
+    def __init__(self, broker_dir: Path, run_id: Optional[str] = None):
+        self.broker_dir = Path(broker_dir)
+        self.run_id = uuid.uuid4().hex if run_id is None else run_id
+        self.run_dir = self.broker_dir / self.run_id
+        self.tasks_dir = self.run_dir / 'tasks'
+        self.claimed_dir = self.run_dir / 'claimed'
+        self.results_dir = self.run_dir / 'results'
+        self.buffers_dir = self.run_dir / 'buffers'
+        self._seq = 0
+
+        # Worker state. Each FileBroker claims tasks under its own ID.
+        self.worker_id = uuid.uuid4().hex
+
+        # Coordinator state. Tasks are submitted from the main thread and the broker is
+        # polled from another thread.
+        self._lock = threading.Lock()
+        self._waiting: Dict[str, float] = {}
+        self._leases: Dict[str, Tuple[float, float]] = {}
+        self._last_activity = time.monotonic()
+
+    @classmethod
+    def list_runs(cls, broker_dir: Path) -> List["FileBroker"]:
+        """
+        Get the open runs in `broker_dir`, oldest first
+
+        args:
+            broker_dir: broker directory
+        returns:
+            list of FileBroker objects
+        """
+        broker_dir = Path(broker_dir)
+        if not broker_dir.is_dir():
+            return []
+        runs = []
+        for run_dir in broker_dir.iterdir():
+            if (run_dir / RUN_SPEC_FILENAME).is_file() and not (run_dir / DONE_FILENAME).exists():  # noqa: E501
+                runs.append(run_dir)
+        return [cls(broker_dir, run_dir.name) for run_dir in sorted(runs, key=_mtime)]
+
+    def _write(self, path: Path, obj: Any):
+        """
+        Pickle `obj` to `path` atomically
+        """
+        tmp_path = path.parent / f'.{path.name}.{uuid.uuid4().hex}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def _read(self, path: Path) -> Any:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def _claimed_path(self, task_id: str) -> Path:
+        """
+        Path of a task claimed by this worker
+        """
+        return self.claimed_dir / f'{task_id}.{self.worker_id}{TASK_SUFFIX}'
+
+    # ----------------------------------------------------------------------------------
+    # Coordinator
+
+    def open(self, spec: RunSpec):
+        """
+        Create the run's directory and publish its RunSpec. Workers only pick up the run
+        once the RunSpec exists.
+
+        args:
+            spec: RunSpec
+        """
+        for path in [self.tasks_dir, self.claimed_dir, self.results_dir, self.buffers_dir]:  # noqa: E501
+            path.mkdir(parents=True, exist_ok=True)
+        try:
+            self._write(self.run_dir / RUN_SPEC_FILENAME, spec)
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            raise prism.exceptions.RuntimeException(
+                message=f'could not send the compiled DAG to the broker: {err}'
+            )
+
+    def submit(self, message: TaskMessage) -> str:
+        """
+        Add a task to the queue
+
+        args:
+            message: TaskMessage
+        returns:
+            ID of the task, which can be used to withdraw it
+        """
+        self._seq += 1
+        task_id = f'{self._seq:08d}'
+        self._write(self.tasks_dir / f'{task_id}{TASK_SUFFIX}', message)
+        with self._lock:
+            self._waiting[task_id] = time.monotonic()
+        return task_id
+
+    def withdraw(self, task_id: str) -> bool:
+        """
+        Remove a task from the queue if no worker has claimed it yet
+
+        args:
+            task_id: ID returned by `submit`
+        returns:
+            True if the task was withdrawn
+        """
+        try:
+            os.unlink(self.tasks_dir / f'{task_id}{TASK_SUFFIX}')
+        except FileNotFoundError:
+            return False
+        with self._lock:
+            self._waiting.pop(task_id, None)
+        return True
+
+    def get_results(self) -> List[Tuple[str, int, Any]]:
+        """
+        Collect the results written by workers since the last call
+
+        returns:
+            list of (task name, attempt, result)
+        """
+        results = []
+        for path in sorted(self.results_dir.glob(f'*{RESULT_SUFFIX}')):
+            results.append(self._read(path))
+            os.unlink(path)
+            with self._lock:
+                self._waiting.pop(path.name[:-len(RESULT_SUFFIX)], None)
+                self._last_activity = time.monotonic()
+        return results
+
+    def requeue_expired(self, lease_seconds: float = LEASE_SECONDS) -> List[str]:
+        """
+        Move claimed tasks whose lease has expired back to the queue, so that another
+        worker can claim them
+
+        args:
+            lease_seconds: number of seconds after which a lease that hasn't been
+                renewed expires
+        returns:
+            IDs of the requeued tasks
+        """
+        now = time.monotonic()
+
+        # Leases are keyed by the claimed file's name, i.e., by task and worker
+        claimed: Dict[str, float] = {}
+        for path in self.claimed_dir.glob(f'*{TASK_SUFFIX}'):
+            claimed[path.name] = _mtime(path)
+        requeued = []
+        with self._lock:
+            for claim in list(self._leases.keys()):
+                if claim not in claimed:
+                    del self._leases[claim]
+            for claim, mtime in claimed.items():
+                task_id = claim.split('.', 1)[0]
+                self._waiting.pop(task_id, None)
+
+                # The lease was taken or renewed since the last check
+                if claim not in self._leases or self._leases[claim][0] != mtime:
+                    self._leases[claim] = (mtime, now)
+                    self._last_activity = now
+                    continue
+                if now - self._leases[claim][1] < lease_seconds:
+                    continue
+                try:
+                    os.rename(
+                        self.claimed_dir / claim,
+                        self.tasks_dir / f'{task_id}{TASK_SUFFIX}'
+                    )
+                except OSError:
+                    continue
+                del self._leases[claim]
+                self._waiting[task_id] = now
+                requeued.append(task_id)
+        return requeued
+
+    def withdraw_stalled(self,
+        timeout: float = WORKER_TIMEOUT_SECONDS
+    ) -> List[TaskMessage]:
+        """
+        Withdraw the waiting tasks if no worker has claimed, renewed, or completed a
+        task for `timeout` seconds while they were waiting, e.g., because no worker is
+        running
+
+        args:
+            timeout: number of seconds
+        returns:
+            withdrawn tasks
+        """
+        now = time.monotonic()
+        with self._lock:
+            stalled = [
+                task_id for task_id, waiting_since in self._waiting.items()
+                if now - max(waiting_since, self._last_activity) >= timeout
+            ]
+        withdrawn = []
+        for task_id in stalled:
+            with self._lock:
+                self._waiting.pop(task_id, None)
+
+            # Rename the task before reading it, so that it isn't read while a worker
+            # claims it
+            path = self.tasks_dir / f'{task_id}{TASK_SUFFIX}'
+            withdrawn_path = self.run_dir / f'.{path.name}.withdrawn'
+            try:
+                os.rename(path, withdrawn_path)
+            except OSError:
+                continue
+            withdrawn.append(self._read(withdrawn_path))
+            os.unlink(withdrawn_path)
+        return withdrawn
+
+    def close(self):
+        """
+        Mark the run as done and remove its directory. Workers stop claiming the run's
+        tasks as soon as the `done` marker exists.
+        """
+        if self.run_dir.is_dir():
+            (self.run_dir / DONE_FILENAME).touch()
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+
+    # ----------------------------------------------------------------------------------
+    # Worker
+
+    def is_open(self) -> bool:
+        """
+        Whether the run is still accepting results
+        """
+        return self.run_dir.is_dir() and not (self.run_dir / DONE_FILENAME).exists()
+
+    def get_spec(self) -> RunSpec:
+        return cast(RunSpec, self._read(self.run_dir / RUN_SPEC_FILENAME))
+
+    def claim(self) -> Optional[Tuple[str, TaskMessage]]:
+        """
+        Claim the oldest task in the queue
+
+        returns:
+            (task ID, TaskMessage), or None if there are no tasks to claim
+        """
+        try:
+            task_paths = sorted(self.tasks_dir.glob(f'*{TASK_SUFFIX}'))
+        except OSError:
+            return None
+        for path in task_paths:
+            task_id = path.name[:-len(TASK_SUFFIX)]
+            claimed_path = self._claimed_path(task_id)
+            try:
+                os.rename(path, claimed_path)
+            except OSError:
+                # Another worker claimed the task first, or the task was withdrawn
+                continue
+            try:
+                return task_id, self._read(claimed_path)
+            except OSError:
+                return None
+        return None
+
+    def renew(self, task_id: str) -> bool:
+        """
+        Renew the lease on a claimed task
+
+        args:
+            task_id: ID of the claimed task
+        returns:
+            False if the task is no longer leased to this worker, e.g., because its
+            lease expired and it was requeued
+        """
+        try:
+            os.utime(self._claimed_path(task_id))
+            return True
+        except OSError:
+            return False
+
+    def put_result(self, task_id: str, name: str, attempt: int, result: Any):
+        """
+        Send the result of a task back to the coordinator. If this worker's lease on the
+        task expired, then another worker may also complete the task; the coordinator
+        only keeps the first result.
+
+        args:
+            task_id: ID of the claimed task
+            name: task name
+            attempt: attempt number
+            result: result of the task
+        """
+        if not self.is_open():
+            return
+        try:
+            self._write(self.results_dir / f'{task_id}{RESULT_SUFFIX}', (name, attempt, result))  # noqa: E501
+
+        # The run was closed while the task was running
+        except OSError:
+            return
+
+        # The claim is gone if the lease expired and the task was requeued
+        try:
+            os.unlink(self._claimed_path(task_id))
+        except OSError:
+            pass
@@ -0,0 +1,122 @@
+"""
+Prism BytecodeCache class
+
+Table of Contents
+- Imports
+- Constants
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import hashlib
+import importlib.util
+import marshal
+import os
+from pathlib import Path
+from types import CodeType
+from typing import Any, Dict, Optional, Tuple
+import uuid
+
+
+#############
+# Constants #
+#############
+
+# Each module's code object is marshaled to `{name}{ENTRY_SUFFIX}`
+ENTRY_SUFFIX = '.bin'
+
+# Length of the source hash stored after the magic number
+HASH_SIZE = hashlib.sha256().digest_size
+
+
+####################
+# Class definition #
+####################
+
+class BytecodeCache:
+    """
+    Class used to persist the compiled code objects of modules in the compiled
+    directory, so that modules that haven't changed aren't recompiled on every run.
+    Alongside the code object, each entry stores metadata read from the module's AST
+    (e.g., the name of its task class), so that cached modules aren't parsed either.
+    Each entry starts with the interpreter's magic number and a hash of the module's
+    source and path, and is ignored if either doesn't match.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, name: str) -> Path:
+        return self.cache_dir / f'{name}{ENTRY_SUFFIX}'
+
+    def _header(self, module_str: str, filename: str) -> bytes:
+        h = hashlib.sha256()
+        h.update(filename.encode('utf-8'))
+        h.update(b'\0')
+        h.update(module_str.encode('utf-8'))
+        return importlib.util.MAGIC_NUMBER + h.digest()
+
+    def get(self,
+        name: str,
+        module_str: str,
+        filename: str
+    ) -> Optional[Tuple[CodeType, Dict[str, Any]]]:
+        """
+        Load a module's cached code object and metadata
+
+        args:
+            name: name of the cache entry
+            module_str: module source
+            filename: path to the module, used in tracebacks
+        returns:
+            code object and metadata, or None if the module changed since it was last
+            compiled
+        """
+        header = self._header(module_str, filename)
+        try:
+            with open(self._path(name), 'rb') as f:
+                data = f.read()
+            if data[:len(header)] != header:
+                return None
+            entry = marshal.loads(data[len(header):])
+            code, metadata = entry
+
+        # Missing or corrupt entries are treated as misses
+        except Exception:
+            return None
+        if not isinstance(code, CodeType) or not isinstance(metadata, dict):
+            return None
+        return code, metadata
+
+    def put(self,
+        name: str,
+        module_str: str,
+        filename: str,
+        code: CodeType,
+        metadata: Dict[str, Any]
+    ):
+        """
+        Cache a module's code object and metadata. Failing to cache them never fails
+        the run.
+
+        args:
+            name: name of the cache entry
+            module_str: module source
+            filename: path to the module, used in tracebacks
+            code: code object compiled from `module_str`
+            metadata: values read from the module's AST. These must be supported by
+                `marshal`.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f'.{name}.{uuid.uuid4().hex}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(self._header(module_str, filename))
+                f.write(marshal.dumps((code, metadata)))
+            os.replace(tmp_path, self._path(name))
+        except Exception:
+            return
@@ -0,0 +1,118 @@
+"""
+CancellationToken class
+
+Table of Contents
+- Imports
+- Class definition
+- Functions / utils
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import contextvars
+import threading
+from typing import Optional
+
+# Prism-specific imports
+import prism.exceptions
+
+
+####################
+# Class definition #
+####################
+
+class CancellationToken:
+    """
+    Token through which the executor cancels an attempt of a task. Threads cannot be
+    interrupted, so the attempt (i.e., the task, its targets, and its hooks) checks the
+    token's `event` and stops once it's set.
+
+    An attempt commits before it writes its output to state shared with the rest of
+    the run (the task manager, the project's globals, the state store, and the output
+    cache). Once an attempt has committed it can no longer be cancelled, and once it
+    has been cancelled it can no longer commit. An abandoned attempt therefore never
+    leaves its output behind.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self._lock = threading.Lock()
+        self._committed = False
+
+    def is_cancelled(self) -> bool:
+        """
+        Whether the attempt was cancelled
+        """
+        return self.event.is_set()
+
+    def cancel(self) -> bool:
+        """
+        Cancel the attempt, unless it has already committed
+
+        returns:
+            True if the attempt was cancelled
+        """
+        with self._lock:
+            if self._committed:
+                return False
+            self.event.set()
+            return True
+
+    def commit(self):
+        """
+        Commit the attempt, so that it can write its output. Raises a
+        CancelledException if the attempt was cancelled.
+        """
+        with self._lock:
+            if self.event.is_set():
+                raise prism.exceptions.CancelledException(
+                    message='attempt was cancelled'
+                )
+            self._committed = True
+
+
+#####################
+# Functions / utils #
+#####################
+
+# Token of the attempt executing in the current thread (or asyncio task). Attempts that
+# aren't run by the executor (e.g., in worker processes) don't have one.
+_current_token: "contextvars.ContextVar[Optional[CancellationToken]]" = contextvars.ContextVar(  # noqa: E501
+    'prism_cancellation_token', default=None
+)
+
+
+def set_current_token(token: Optional[CancellationToken]):
+    """
+    Set the token of the attempt executing in the current thread (or asyncio task)
+    """
+    _current_token.set(token)
+
+
+def get_current_token() -> Optional[CancellationToken]:
+    """
+    Get the token of the attempt executing in the current thread (or asyncio task)
+    """
+    return _current_token.get()
+
+
+def raise_if_cancelled():
+    """
+    Raise a CancelledException if the current attempt was cancelled
+    """
+    token = _current_token.get()
+    if token is not None and token.is_cancelled():
+        raise prism.exceptions.CancelledException(message='attempt was cancelled')
+
+
+def commit_attempt():
+    """
+    Commit the current attempt before writing its output to shared state. Raises a
+    CancelledException if the attempt was cancelled.
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.commit()
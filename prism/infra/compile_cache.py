@@ -0,0 +1,154 @@
+"""
+Prism CompileCache class
+
+Table of Contents
+- Imports
+- Constants
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, cast
+import uuid
+
+# Prism-specific imports
+import prism.constants
+
+
+#############
+# Constants #
+#############
+
+COMPILE_CACHE_FILENAME = 'compile_cache.json'
+
+# Incremented whenever the parse results stored in the cache change (e.g., when a new
+# field is added to the module manifest)
+COMPILE_CACHE_FORMAT = 3
+
+
+####################
+# Class definition #
+####################
+
+class CompileCache:
+    """
+    Class used to persist the result of parsing each module (i.e., its mod refs and its
+    module manifest) across compilations. The results are stored in `compile_cache.json`
+    in the compiled directory and are keyed by the module's relative path. An entry is
+    only reused if the module's size and modification time haven't changed, so only
+    modules that changed since the last compilation are re-parsed.
+    """
+
+    def __init__(self, compiled_dir: Path):
+        self.compiled_dir = compiled_dir
+        self.cache_dict: Dict[str, Any] = {
+            "version": prism.constants.VERSION,
+            "format": COMPILE_CACHE_FORMAT,
+            "modules": {}
+        }
+        if Path(self.compiled_dir / COMPILE_CACHE_FILENAME).is_file():
+            cache_dict = self.json_load(self.compiled_dir)
+
+            # Entries written by a different version of Prism (or in a different format)
+            # may not be valid
+            version = cache_dict.get("version", None)
+            cache_format = cache_dict.get("format", None)
+            if version == prism.constants.VERSION and cache_format == COMPILE_CACHE_FORMAT:  # noqa: E501
+                self.cache_dict.update(cache_dict)
+
+    @property
+    def modules(self) -> Dict[str, Any]:
+        return cast(Dict[str, Any], self.cache_dict["modules"])
+
+    def _stat(self, module_path: Path) -> Optional[List[int]]:
+        try:
+            stat = os.stat(module_path)
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def get(self,
+        module_name: Path,
+        module_path: Path
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached parse result for a module
+
+        args:
+            module_name: module path relative to the modules directory
+            module_path: full path to the module
+        returns:
+            dictionary with `refs` (list of str) and `manifest` (module manifest
+            dictionary), or None if the module changed since it was last parsed
+        """
+        entry = self.modules.get(str(module_name), None)
+
+        # Entries in a corrupt cache file may not be dictionaries
+        if not isinstance(entry, dict) or entry.get("stat", None) != self._stat(module_path):  # noqa: E501
+            return None
+        return cast(Dict[str, Any], entry)
+
+    def put(self,
+        module_name: Path,
+        module_path: Path,
+        refs: List[Path],
+        manifest_dict: Dict[str, Any]
+    ):
+        """
+        Cache the parse result for a module
+
+        args:
+            module_name: module path relative to the modules directory
+            module_path: full path to the module
+            refs: modules referenced via `mod`
+            manifest_dict: module manifest dictionary
+        """
+        stat = self._stat(module_path)
+        if stat is None:
+            return
+        self.modules[str(module_name)] = {
+            "stat": stat,
+            "refs": [str(r) for r in refs],
+            "manifest": manifest_dict,
+        }
+
+    def prune(self, modules: List[Path]):
+        """
+        Drop the entries of modules that no longer exist
+
+        args:
+            modules: all modules in the project
+        """
+        module_names = set(str(m) for m in modules)
+        self.cache_dict["modules"] = {
+            k: v for k, v in self.modules.items() if k in module_names
+        }
+
+    def json_dump(self, path: Path):
+        """
+        Persist the cache. Failing to persist the cache never fails the compilation.
+        """
+        tmp_path = path / f'.{COMPILE_CACHE_FILENAME}.{uuid.uuid4().hex}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.cache_dict, f, sort_keys=False)
+            os.replace(tmp_path, path / COMPILE_CACHE_FILENAME)
+        except OSError:
+            return
+
+    def json_load(self, path: Path):
+        try:
+            with open(path / COMPILE_CACHE_FILENAME, 'r') as f:
+                cache_dict = json.loads(f.read())
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(cache_dict, dict) or not isinstance(cache_dict.get("modules", None), dict):  # noqa: E501
+            return {}
+        return cache_dict
@@ -3,6 +3,8 @@ DagCompiler and CompiledDag classes
 
 Table of Contents
 - Imports
+- Constants
+- Functions / utils
 - Class definition
 """
 
@@ -11,8 +13,9 @@ Table of Contents
 ###########
 
 # Standard library imports
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import os
-import networkx as nx
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -22,8 +25,43 @@ import prism.exceptions
 import prism.logging
 import prism.parsers.ast_parser as ast_parser
 import prism.infra.module
+from prism.infra.bytecode_cache import BytecodeCache
+from prism.infra.compile_cache import CompileCache
+from prism.infra.dag import Dag
 from prism.infra.manifest import Manifest, ModuleManifest
+from prism.infra.planner import create_plan
 from prism.infra.project import PrismProject
+from prism.infra.run_results import RunResults
+from prism.infra.selector import ModuleSelector, ReachabilityIndex
+
+
+#############
+# Constants #
+#############
+
+# Modules are only parsed in parallel if each process gets at least this many modules;
+# otherwise, starting the processes takes longer than parsing the modules
+PARALLEL_PARSE_MIN_MODULES = 256
+
+
+#####################
+# Functions / utils #
+#####################
+
+def parse_module(module: Path, parent_path: Path) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Parse `module` in a worker process. The parser itself holds the module's AST, which
+    is expensive to send between processes, so only the results are returned.
+
+    args:
+        module: module to parse, relative to `parent_path`
+        parent_path: parent path of module
+    returns:
+        module's task refs and manifest dictionary
+    """
+    parser = ast_parser.AstParser(module, parent_path)
+    task_refs = parser.parse()
+    return task_refs, parser.module_manifest.manifest_dict
 
 
 ####################
@@ -36,17 +74,27 @@ class CompiledDag:
     """
     def __init__(self,
         modules_dir: Path,
-        nxdag: nx.DiGraph,
+        dag: Dag,
         topological_sort: List[Path],
         user_arg_modules: List[Path],
-        module_manifests: Dict[Path, ModuleManifest]
+        module_manifests: Dict[Path, ModuleManifest],
+        ast_parsers: Dict[Path, ast_parser.AstParser] = {},
+        compiled_dir: Optional[Path] = None
     ):
         self.modules_dir = modules_dir
-        self.nxdag = nxdag
+        self.dag = dag
         self.topological_sort = topological_sort
         self.user_arg_modules = user_arg_modules
         self.module_manifests = module_manifests
 
+        # Execution plan, only created with `prism compile --plan`
+        self.plan: Optional[Dict[str, Any]] = None
+
+        # Compiled code objects are cached alongside the manifest
+        self.bytecode_cache = None
+        if compiled_dir is not None:
+            self.bytecode_cache = BytecodeCache(Path(compiled_dir) / 'bytecode')
+
         # Store full paths in attribute
         self.topological_sort_full_path = [
             self.modules_dir / module for module in self.topological_sort
@@ -57,10 +105,21 @@ class CompiledDag:
         for relative, full in zip(self.topological_sort, self.topological_sort_full_path):  # noqa: E501
             self.compiled_modules.append(
                 prism.infra.module.CompiledModule(
-                    relative, full, self.module_manifests[relative]
+                    relative,
+                    full,
+                    self.module_manifests[relative],
+                    ast_parsers.get(relative, None),
+                    self.bytecode_cache
                 )
             )
 
+    @property
+    def nxdag(self) -> Any:
+        """
+        DAG as a networkx DiGraph. networkx must be installed separately.
+        """
+        return self.dag.to_networkx()
+
 
 class DagCompiler:
     """
@@ -73,7 +132,11 @@ class DagCompiler:
         all_modules: List[Path],
         user_arg_modules: List[Path],
         user_arg_all_downstream: bool,
-        project: Optional[PrismProject] = None
+        project: Optional[PrismProject] = None,
+        changed_since: Optional[Path] = None,
+        parse_processes: Optional[int] = None,
+        plan: bool = False,
+        selectors: Optional[List[str]] = None
     ):
         self.project_dir = project_dir
         self.compiled_dir = compiled_dir
@@ -82,6 +145,11 @@ class DagCompiler:
         self.project = project
         os.chdir(project_dir)
 
+        # Manifest from a previous compilation. If specified, only the modules that
+        # changed since that manifest (and everything downstream of them) are selected.
+        self.changed_since = changed_since
+        self.changed_since_manifest: Optional[Dict[str, Any]] = None
+
         # Modules can only be executed if their predecessors are explicitly run or have
         # targets. For example, if our DAG is A --> B --> C and we call `prism run
         # --modules C`, then Prism will parse the execution order, instantiate but NOT
@@ -101,6 +169,32 @@ class DagCompiler:
         # Module manifests
         self.module_manifests: Dict[Path, ModuleManifest] = {}
 
+        # Parsed modules, reused when the modules are executed
+        self.ast_parsers: Dict[Path, ast_parser.AstParser] = {}
+
+        # Parse results from previous compilations
+        self.compile_cache: Optional[CompileCache] = None
+        if self.compiled_dir is not None:
+            self.compile_cache = CompileCache(self.compiled_dir)
+
+        # Maximum number of processes used to parse modules. Defaults to the number of
+        # CPUs.
+        self.parse_processes = os.cpu_count() or 1
+        if parse_processes is not None:
+            self.parse_processes = parse_processes
+
+        # Whether to add the execution plan to the manifest. The plan uses the thread
+        # count and resource limits of `project`, so the project must be set up.
+        self.plan = plan
+
+        # Selectors passed to `--modules`, e.g., `+module.py` or `tag:nightly`. If
+        # specified, the selected modules replace `user_arg_modules`.
+        self.selectors = selectors
+
+        # Ancestors and descendants of each module, built the first time a subset of
+        # the DAG is selected
+        self.reachability_index: Optional[ReachabilityIndex] = None
+
     def parse_task_refs(self,
         modules: List[Path],
         parent_path: Path
@@ -118,62 +212,105 @@ class DagCompiler:
 
         # This is only ever called on the output of `get_all_modules`, which sorts the
         # modules alphabetically. Therefore, all mod refs will be sorted.
+
+        # Only parse modules that changed since the last compilation
+        cached_modules: Dict[Path, Dict[str, Any]] = {}
+        for m in modules:
+            if self.compile_cache is not None:
+                cached = self.compile_cache.get(m, parent_path / m)
+                if cached is not None:
+                    cached_modules[m] = cached
+        parsed_modules = self.parse_modules(
+            [m for m in modules if m not in cached_modules], parent_path
+        )
+
+        # Results are merged in the order of `modules`, regardless of how the modules
+        # were parsed
         task_refs_dict: Dict[Path, Any] = {}
         for m in modules:
-            parser = ast_parser.AstParser(m, parent_path)
-            task_refs = parser.parse()
+            if m in cached_modules:
+                cached = cached_modules[m]
+                refs = [Path(r) for r in cached["refs"]]
+                task_refs = refs[0] if len(refs) == 1 else refs
+                module_manifest = ModuleManifest()
+                module_manifest.manifest_dict = cached["manifest"]
+            else:
+                task_refs, module_manifest = parsed_modules[m]
+                if self.compile_cache is not None:
+                    self.compile_cache.put(
+                        m,
+                        parent_path / m,
+                        task_refs if isinstance(task_refs, list) else [task_refs],
+                        module_manifest.manifest_dict
+                    )
             if task_refs is None or task_refs == '' or task_refs == []:
                 task_refs_dict[m] = None
             else:
                 task_refs_dict[m] = task_refs
 
             # Keep track of module manifest
-            self.module_manifests[m] = parser.module_manifest
-
+            self.module_manifests[m] = module_manifest
         return task_refs_dict
 
-    def add_graph_elem(self,
-        elem: Any,
-        master: List[Any]
-    ) -> List[Any]:
+    def dump_compile_cache(self, modules: List[Path]):
         """
-        Add graph element `elem` to master list of elements
+        Save the parse results of `modules` for the next compilation. This is only
+        called once the DAG has compiled successfully.
 
         args:
-            elem: graph element to add (either a node or an edge)
-            master: master list of elements (either nodes or edges)
-        returns
-            master list of elements with new elem
+            modules: all modules in the project
         """
-        if elem not in master:
-            master += [elem]  # type: ignore
-        else:
-            return master
-        return master
+        if self.compile_cache is not None and Path(self.compiled_dir).is_dir():
+            self.compile_cache.prune(modules)
+            self.compile_cache.json_dump(self.compiled_dir)
 
-    def add_graph_node(self,
-        elem: Path,
-        master: List[Path]
-    ) -> List[Path]:
-        """
-        To resolve mypy errors...
+    def parse_modules(self,
+        modules: List[Path],
+        parent_path: Path
+    ) -> Dict[Path, Tuple[Any, ModuleManifest]]:
         """
-        return self.add_graph_elem(elem, master)
+        Parse `modules`. Parsing is CPU-bound, so if there are enough modules, they are
+        parsed in a pool of processes. In that case, the parsers aren't kept; modules
+        that are executed are parsed again, as with modules in the compile cache.
 
-    def add_graph_edge(self,
-        elem: Tuple[Path, Path],
-        master: List[Tuple[Path, Path]]
-    ) -> List[Tuple[Path, Path]]:
-        """
-        To resolve mypy errors...
+        args:
+            modules: modules to parse
+            parent_path: parent path of modules
+        returns:
+            dictionary mapping module --> (task refs, module manifest)
         """
-        return self.add_graph_elem(elem, master)
+        parsed: Dict[Path, Tuple[Any, ModuleManifest]] = {}
+        processes = min(
+            self.parse_processes, len(modules) // PARALLEL_PARSE_MIN_MODULES
+        )
+        if processes > 1:
+
+            # `map` returns the results in the order of `modules` and raises the error
+            # of the first module that couldn't be parsed, as a serial loop would
+            chunksize = max(1, len(modules) // (processes * 4))
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                results = pool.map(
+                    parse_module, modules, repeat(parent_path), chunksize=chunksize
+                )
+                for m, (task_refs, manifest_dict) in zip(modules, results):
+                    module_manifest = ModuleManifest()
+                    module_manifest.manifest_dict = manifest_dict
+                    parsed[m] = (task_refs, module_manifest)
+            return parsed
+
+        for m in modules:
+            parser = ast_parser.AstParser(m, parent_path)
+            parsed[m] = (parser.parse(), parser.module_manifest)
+            self.ast_parsers[m] = parser
+        return parsed
 
     def create_nodes_edges(self,
         module_references: Dict[Path, Any]
     ) -> Tuple[List[Path], List[Tuple[Path, Path]]]:
         """
-        Create nodes / edges from module connections
+        Create nodes / edges from module connections. Nodes and edges are deduplicated
+        with dictionaries (which preserve insertion order), so this is linear in the
+        number of references.
 
         args:
             module_references: connections defined via {{ mod(...) }} in modules
@@ -183,28 +320,28 @@ class DagCompiler:
         """
 
         # Create edges and nodes
-        edges: List[Tuple[Path, Path]] = []
-        nodes: List[Path] = []
+        edges: Dict[Tuple[Path, Path], None] = {}
+        nodes: Dict[Path, None] = {}
 
         # Iterate through module references. Keys represent distinct modules in the DAG,
         # and values represent the modules that feed into the key.
         for mod, ref in module_references.items():
-            nodes = self.add_graph_node(mod, nodes)
+            nodes[mod] = None
             if ref is None:
-                pass
+                refs = []
             elif isinstance(ref, Path):
-                nodes = self.add_graph_node(ref, nodes)
-                edges = self.add_graph_edge((ref, mod), edges)
+                refs = [ref]
             else:
-                for v in ref:
-                    nodes = self.add_graph_node(v, nodes)
-                    edges = self.add_graph_edge((v, mod), edges)
-        return nodes, edges
+                refs = ref
+            for v in refs:
+                nodes[v] = None
+                edges[(v, mod)] = None
+        return list(nodes.keys()), list(edges.keys())
 
     def create_dag(self,
         nodes: List[Path],
         edges: List[Tuple[Path, Path]]
-    ) -> nx.DiGraph:
+    ) -> Dag:
         """
         Create DAG from edges
 
@@ -216,7 +353,7 @@ class DagCompiler:
             topological sort of edges
         """
         # Instantiate graph
-        graph = nx.DiGraph()
+        graph = Dag()
 
         # If there are no nodes in the DAG, then throw an error. This should never
         # happen.
@@ -224,72 +361,50 @@ class DagCompiler:
             raise prism.exceptions.RuntimeException(message='DAG has 0 nodes')
 
         # Add the edges/nodes
-        graph.add_edges_from(edges)
-        graph.add_nodes_from(nodes)
+        for u, v in edges:
+            graph.add_edge(u, v)
+        for node in nodes:
+            graph.add_node(node)
 
         # Check if graph is a DAG
-        if not nx.is_directed_acyclic_graph(graph):
-            all_scc = nx.algorithms.components.strongly_connected_components(graph)
-            cycles = []
-            for component in all_scc:
-                component = set([str(elem) for elem in list(component)])
-                if len(component) > 1:
-                    cycles.append(component)
+        if not graph.is_acyclic():
             raise prism.exceptions.DAGException(
-                message=f"invalid DAG, cycle found in {str(cycles)}"
+                message=f"invalid DAG, cycle found in {str(graph.find_cycles())}"
             )
 
         return graph
 
     def get_node_dependencies(self,
-        graph: nx.DiGraph,
+        graph: Dag,
         start_nodes: List[Path]
     ) -> List[Path]:
         """
-        Parse the DiGraph and get all nodes upstream of the `start_nodes`
+        Get all nodes upstream of the `start_nodes` from the DAG's ReachabilityIndex
 
         args:
             graph: DAG
             start_nodes: list of nodes for which to retrieve upstream dependencies
         returns:
-            list of dependencies
+            list of dependencies, including the start nodes, in topological order
         """
-        # Add all start nodes to the list of dependencies with a depth of 0
-        deps = [x for x in start_nodes]
-
-        # Iterate through the start nodes and extract the predecessors
-        for node in deps:
-            for prenode in graph.predecessors(node):
-                deps.append(prenode)
-
-        # Get unique dependencies
-        unique_deps = list(set(deps))
-        return unique_deps
+        index = self.get_reachability_index(graph)
+        return index.to_nodes(index.upstream(index.to_mask(start_nodes)))
 
     def get_node_successors(self,
-        graph: nx.DiGraph,
+        graph: Dag,
         start_nodes: List[Path]
     ) -> List[Path]:
         """
-        Parse the DiGraph and get all nodes downstream of the `start_nodes`
+        Get all nodes downstream of the `start_nodes` from the DAG's ReachabilityIndex
 
         args:
             graph: DAG
-            start_nodes: list of nodes for which to retrieve upstream dependencies
+            start_nodes: list of nodes for which to retrieve downstream successors
         returns:
-            list of successors
+            list of successors, including the start nodes, in topological order
         """
-        # Add all start nodes to the list of successors with a depth of 0
-        successors = [x for x in start_nodes]
-
-        # Iterate through the start nodes and extract the predecessors
-        for node in successors:
-            for postnode in graph.successors(node):
-                successors.append(postnode)
-
-        # Get unique dependencies
-        unique_successors = list(set(successors))
-        return unique_successors
+        index = self.get_reachability_index(graph)
+        return index.to_nodes(index.downstream(index.to_mask(start_nodes)))
 
     def create_topsort(self,
         all_modules: List[Path],
@@ -319,15 +434,25 @@ class DagCompiler:
         nodes, edges = self.create_nodes_edges(task_refs)
         dag = self.create_dag(nodes, edges)
 
+        # Resolve the selectors passed to `--modules`
+        if self.selectors is not None:
+            user_arg_modules = self.select_modules(dag, all_modules, self.selectors)
+            self.user_arg_modules = user_arg_modules
+
+        # Only select the modules that changed since a previous manifest
+        if self.changed_since_manifest is not None:
+            user_arg_modules = self.get_changed_modules(
+                dag, all_modules, user_arg_modules, self.changed_since_manifest
+            )
+            self.user_arg_modules = user_arg_modules
+
         # If `user_arg_modules` is equivalent to `all_modules`, then create a
-        # topological sorting of the full DAG. From the NetworkX documentation: A
-        # topological sort is a nonunique permutation of the nodes of a directed graph
-        # such that an edge from u to v implies that u appears before v in the
-        # topological sort order. This ordering is valid only if the graph has no
-        # directed cycles.
+        # topological sorting of the full DAG. A topological sort is a nonunique
+        # permutation of the nodes of a directed graph such that an edge from u to v
+        # implies that u appears before v in the topological sort order. This ordering
+        # is valid only if the graph has no directed cycles.
         if len(user_arg_modules) == len(all_modules):
-            all_topological_sorts = nx.algorithms.dag.all_topological_sorts(dag)
-            all_topological_sorts_list = next(all_topological_sorts)
+            all_topological_sorts_list = dag.topological_sort()
 
         # Otherwise, the user has selected to run a subset of the modules. Identify all
         # modules upstream (and potentially downstream) of `user_arg_modules`.
@@ -340,35 +465,156 @@ class DagCompiler:
             if self.user_arg_all_downstream:
                 all_nodes.extend(self.get_node_successors(dag, user_arg_modules))
 
-            subgraph = dag.subgraph(list(set(all_nodes)))
-            all_topological_sorts = nx.algorithms.dag.all_topological_sorts(subgraph)  # noqa: E501
-            all_topological_sorts_list = next(all_topological_sorts)
+            subgraph = dag.subgraph(all_nodes)
+            all_topological_sorts_list = subgraph.topological_sort()
 
         # Add each module to manifest
+        all_modules_set = set(all_modules)
         for elem in all_topological_sorts_list:
 
             # Raise error if node not in project
-            if elem not in all_modules:
+            if elem not in all_modules_set:
                 raise prism.exceptions.CompileException(
                     message=f'module `{str(elem)}` not found in project'
                 )
 
+        # Only save the parse results if the DAG is valid
+        self.dump_compile_cache(all_modules)
         return dag, all_topological_sorts_list
 
-    def compile(self) -> CompiledDag:
+    def load_changed_since_manifest(self, path: Path) -> Dict[str, Any]:
         """
-        Compile the DAG
+        Load the manifest passed to `--changed-since`. This must happen before the
+        current manifest is dumped, since the user may pass the project's own
+        `.compiled/manifest.json`.
+
+        args:
+            path: path to a manifest.json, or to a directory containing one
+        returns:
+            manifest as a dictionary
         """
-        nxdag, all_topological_sorts_list = self.create_topsort(
-            self.all_modules, self.user_arg_modules, self.modules_dir
-        )
+        path = Path(path)
+        if path.is_dir():
+            path = path / 'manifest.json'
+        if not path.is_file():
+            raise prism.exceptions.CompileException(
+                message=f'manifest `{str(path)}` not found'
+            )
+        try:
+            manifest = Manifest().json_load(path.parent, path.name)
+        except ValueError:
+            manifest = None
+        if not isinstance(manifest, dict):
+            raise prism.exceptions.CompileException(
+                message=f'invalid manifest `{str(path)}`'
+            )
+        return manifest
 
-        # Dump manifest
-        manifest = Manifest(list(self.module_manifests.values()))
+    def get_changed_modules(self,
+        dag: Dag,
+        all_modules: List[Path],
+        user_arg_modules: List[Path],
+        changed_since_manifest: Dict[str, Any]
+    ) -> List[Path]:
+        """
+        Get the modules that changed since `changed_since_manifest`, along with all of
+        their successors. A module changed if its source is different or if it isn't in
+        the manifest. If `prism_project.py` changed, every module changed.
 
-        # Add the prism project to the Manifest
+        args:
+            dag: DAG of all modules
+            all_modules: all modules in project
+            user_arg_modules: modules passed in user argument; changed modules that
+                aren't in this list are not selected
+            changed_since_manifest: manifest from a previous compilation
+        returns:
+            changed modules and their successors, sorted
+        """
+        if changed_since_manifest.get("prism_project", None) != self.prism_project_py_str:  # noqa: E501
+            changed = list(all_modules)
+        else:
+            previous_hashes = changed_since_manifest.get("module_hashes", {})
+            changed = []
+            for m in all_modules:
+                current_hash = self.module_manifests[m].manifest_dict.get("hash", None)
+                if current_hash is None or previous_hashes.get(str(m), None) != current_hash:  # noqa: E501
+                    changed.append(m)
+        index = self.get_reachability_index(dag)
+        selected = set(index.to_nodes(index.downstream(index.to_mask(changed))))
+        return sorted(m for m in user_arg_modules if m in selected)
+
+    def get_reachability_index(self, dag: Dag) -> ReachabilityIndex:
+        """
+        Get the ancestors and descendants of each module in `dag`. The index is built
+        once per DAG and shared by every selection.
+
+        args:
+            dag: DAG of all modules
+        returns:
+            ReachabilityIndex object
+        """
+        if self.reachability_index is None or self.reachability_index.dag is not dag:
+            self.reachability_index = ReachabilityIndex(dag)
+        return self.reachability_index
+
+    def select_modules(self,
+        dag: Dag,
+        all_modules: List[Path],
+        selectors: List[str]
+    ) -> List[Path]:
+        """
+        Get the modules matched by the selectors passed to `--modules`
+
+        args:
+            dag: DAG of all modules
+            all_modules: all modules in project
+            selectors: `--modules` arguments
+        returns:
+            selected modules, in topological order
+        """
+        tags = {
+            m: self.module_manifests[m].manifest_dict.get("tags", [])
+            for m in all_modules
+        }
+        selector = ModuleSelector(self.get_reachability_index(dag), tags)
+        selected = selector.select(selectors)
+        if len(selected) == 0:
+            raise prism.exceptions.CompileException(
+                message=f'no modules match `--modules {" ".join(selectors)}`'
+            )
+        return selected
+
+    def create_plan(self, compiled_dag: CompiledDag) -> Dict[str, Any]:
+        """
+        Create the execution plan for the modules in the topological sort, using the
+        durations from previous runs
+
+        args:
+            compiled_dag: CompiledDag object
+        returns:
+            plan as a JSON-serializable dictionary
+        """
+        if self.project is None or not hasattr(self.project, "thread_count"):
+            raise prism.exceptions.CompileException(
+                message='cannot create execution plan; prism project is not set up'
+            )
+        modules = compiled_dag.compiled_modules
+        return create_plan(
+            compiled_dag.dag.subgraph(compiled_dag.topological_sort),
+            self.project.thread_count,
+            RunResults(self.compiled_dir).durations,
+            priorities={m.name: m.grab_priority() for m in modules},
+            resources={m.name: m.grab_resources() for m in modules},
+            resource_limits=self.project.resource_limits
+        )
+
+    def compile(self) -> CompiledDag:
+        """
+        Compile the DAG
+        """
+        # Get the prism project
         if self.project is not None:
-            prism_project_py_str = self.project.prism_project_py_str
+            self.prism_project_py_str = self.project.prism_project_py_str
         else:
             prism_project = PrismProject(
                 project_dir=self.project_dir,
@@ -376,16 +622,37 @@ class DagCompiler:
                 which="compile",
                 filename="prism_project.py"
             )
-            prism_project_py_str = prism_project.prism_project_py_str
-        manifest.add_prism_project(prism_project_py_str)
-        manifest.json_dump(self.compiled_dir)
+            self.prism_project_py_str = prism_project.prism_project_py_str
 
-        # Return dag
-        dag = CompiledDag(
+        if self.changed_since is not None:
+            self.changed_since_manifest = self.load_changed_since_manifest(
+                self.changed_since
+            )
+        dag, all_topological_sorts_list = self.create_topsort(
+            self.all_modules, self.user_arg_modules, self.modules_dir
+        )
+
+        # Compiled DAG. This is created before the manifest is dumped, since the
+        # execution plan uses the compiled modules.
+        compiled_dag = CompiledDag(
             self.modules_dir,
-            nxdag,
+            dag,
             all_topological_sorts_list,
             self.user_arg_modules,
-            self.module_manifests
+            self.module_manifests,
+            self.ast_parsers,
+            self.compiled_dir
         )
-        return dag
+
+        # Dump manifest
+        manifest = Manifest(list(self.module_manifests.values()))
+
+        # Add the prism project to the Manifest
+        manifest.add_prism_project(self.prism_project_py_str)
+        if self.plan:
+            compiled_dag.plan = self.create_plan(compiled_dag)
+            manifest.add_plan(compiled_dag.plan)
+        manifest.json_dump(self.compiled_dir)
+
+        # Return dag
+        return compiled_dag
@@ -0,0 +1,237 @@
+"""
+Dag class, a compact directed graph used to plan the execution of a project's modules.
+Nodes are stored in insertion-ordered dictionaries of predecessors and successors, so
+adding nodes and edges and traversing the graph take constant time per node or edge.
+networkx is only needed to convert the DAG into a networkx DiGraph.
+
+Table of Contents
+- Imports
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+# Prism-specific imports
+import prism.exceptions
+
+
+####################
+# Class definition #
+####################
+
+class Dag:
+    """
+    Directed graph of modules. An edge (u, v) means that module v references module u,
+    so u must be executed before v.
+    """
+
+    def __init__(self):
+        self._pred: Dict[Path, Dict[Path, None]] = {}
+        self._succ: Dict[Path, Dict[Path, None]] = {}
+
+    def add_node(self, node: Path):
+        if node not in self._succ:
+            self._succ[node] = {}
+            self._pred[node] = {}
+
+    def add_edge(self, u: Path, v: Path):
+        self.add_node(u)
+        self.add_node(v)
+        self._succ[u][v] = None
+        self._pred[v][u] = None
+
+    @property
+    def nodes(self) -> List[Path]:
+        return list(self._succ.keys())
+
+    @property
+    def edges(self) -> List[Tuple[Path, Path]]:
+        return [(u, v) for u, succ in self._succ.items() for v in succ.keys()]
+
+    def __len__(self) -> int:
+        return len(self._succ)
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self._succ
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(self._succ)
+
+    def _check_node(self, node: Path):
+        if node not in self._succ:
+            raise prism.exceptions.CompileException(
+                message=f'module `{str(node)}` not found in project'
+            )
+
+    def predecessors(self, node: Path) -> Iterator[Path]:
+        """
+        Get the modules that `node` references
+        """
+        self._check_node(node)
+        return iter(self._pred[node])
+
+    def successors(self, node: Path) -> Iterator[Path]:
+        """
+        Get the modules that reference `node`
+        """
+        self._check_node(node)
+        return iter(self._succ[node])
+
+    def subgraph(self, nodes: Iterable[Path]) -> "Dag":
+        """
+        Get the subgraph induced by `nodes`. Nodes keep their order in this graph.
+
+        args:
+            nodes: nodes to keep; duplicates are ignored
+        returns:
+            new Dag
+        """
+        keep = set(nodes)
+        subgraph = Dag()
+        for node in self._succ.keys():
+            if node in keep:
+                subgraph.add_node(node)
+        for node in subgraph.nodes:
+            for succ in self._succ[node].keys():
+                if succ in keep:
+                    subgraph.add_edge(node, succ)
+        return subgraph
+
+    def topological_sort(self) -> List[Path]:
+        """
+        Sort the nodes such that each node appears after the nodes it references, using
+        Kahn's algorithm. Nodes whose references have all been placed are taken
+        last-in, first-out, so the order is the same as the first sort produced by
+        networkx's `all_topological_sorts`.
+
+        returns:
+            topologically sorted nodes
+        """
+        in_degree = {node: len(pred) for node, pred in self._pred.items()}
+        ready = [node for node, degree in in_degree.items() if degree == 0]
+        topsort = []
+        while len(ready) > 0:
+            node = ready.pop()
+            topsort.append(node)
+            for succ in self._succ[node].keys():
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    ready.append(succ)
+        if len(topsort) != len(self._succ):
+            raise prism.exceptions.DAGException(
+                message=f"invalid DAG, cycle found in {str(self.find_cycles())}"
+            )
+        return topsort
+
+    def is_acyclic(self) -> bool:
+        try:
+            self.topological_sort()
+            return True
+        except prism.exceptions.DAGException:
+            return False
+
+    def levels(self) -> List[List[Path]]:
+        """
+        Group the nodes into execution levels. Each node is one level below the deepest
+        node it references, so nodes in the same level don't depend on each other and
+        can be executed at the same time.
+
+        returns:
+            list of levels, each of which is a list of nodes in topological order
+        """
+        depth: Dict[Path, int] = {}
+        levels: List[List[Path]] = []
+        for node in self.topological_sort():
+            depth[node] = max([depth[pred] + 1 for pred in self._pred[node]], default=0)  # noqa: E501
+            if depth[node] == len(levels):
+                levels.append([])
+            levels[depth[node]].append(node)
+        return levels
+
+    def strongly_connected_components(self) -> List[List[Path]]:
+        """
+        Get the strongly connected components of the graph, using an iterative version
+        of Tarjan's algorithm (so that long chains of modules don't exceed the
+        recursion limit)
+
+        returns:
+            list of components
+        """
+        index: Dict[Path, int] = {}
+        lowlink: Dict[Path, int] = {}
+        stack: List[Path] = []
+        on_stack: Set[Path] = set()
+        components: List[List[Path]] = []
+        for root in self._succ.keys():
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._succ[root]))]
+            while len(work) > 0:
+                node, succs = work[-1]
+                for succ in succs:
+                    if succ not in index:
+                        index[succ] = lowlink[succ] = len(index)
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(self._succ[succ])))
+                        break
+                    elif succ in on_stack:
+                        lowlink[node] = min(lowlink[node], index[succ])
+
+                # All successors of `node` have been visited
+                else:
+                    work.pop()
+                    if len(work) > 0:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
+    def find_cycles(self) -> List[Set[str]]:
+        """
+        Get the groups of modules that form cycles, for error messages
+
+        returns:
+            list of sets of module names
+        """
+        return [
+            set(str(node) for node in component)
+            for component in self.strongly_connected_components()
+            if len(component) > 1
+        ]
+
+    def to_networkx(self) -> Any:
+        """
+        Convert the graph into a networkx DiGraph. networkx isn't required by prism, so
+        it must be installed separately.
+
+        returns:
+            networkx DiGraph
+        """
+        try:
+            import networkx as nx
+        except ImportError:
+            raise prism.exceptions.RuntimeException(
+                message='`networkx` is required to convert the DAG to a networkx graph; install it via `pip install networkx`'  # noqa: E501
+            )
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.nodes)
+        graph.add_edges_from(self.edges)
+        return graph
@@ -3,7 +3,10 @@ Prism DagExecutor class
 
 Table of Contents
 - Imports
+- Constants
+- Functions / utils
 - Class definition
+- Process workers
 """
 
 ###########
@@ -11,24 +14,126 @@ Table of Contents
 ###########
 
 # Standard library imports
-from dataclasses import dataclass
-from multiprocessing.dummy import Pool
+import asyncio
+from dataclasses import dataclass, field
+import functools
+import multiprocessing
+import os
 from pathlib import Path
+import queue
+import shutil
+import signal
+import tempfile
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 # Prism-specific imports
 import prism.exceptions
 from prism.infra import module as prism_module
 from prism.infra import compiler as prism_compiler
-from prism.infra.task_manager import PrismTaskManager
+from prism.infra.task_manager import (
+    PrismTaskManager,
+    PrismTaskOutput,
+    StoredTaskOutput,
+    TargetOutput,
+    get_target_types
+)
+from prism.infra.cancellation import (
+    CancellationToken,
+    commit_attempt,
+    set_current_token
+)
+from prism.infra.broker import (
+    LEASE_SECONDS,
+    WORKER_TIMEOUT_SECONDS,
+    FileBroker,
+    RunSpec,
+    TaskMessage
+)
+from prism.infra.output_cache import (
+    OutputCache,
+    compute_key,
+    hash_output
+)
+from prism.infra.serialization import (
+    SerializedObject,
+    dump_object,
+    is_picklable,
+    load_object
+)
+from prism.infra.output_store import OutputStore, StoredOutput
+from prism.infra.manifest import hash_module
+from prism.infra.retries import get_error_classes
+from prism.infra.scheduler import TaskScheduler
+from prism.infra.run_results import RunResults
+from prism.infra.state_store import StateStore, get_target_paths
 from prism.infra.hooks import PrismHooks
 import prism.logging
-from prism.logging import Event, fire_console_event
+from prism.logging import Event, fire_console_event, fire_empty_line_event
 from prism.event_managers import base as base_event_manager
+from prism.event_managers.base import EventManagerOutput
 from prism.constants import INTERNAL_TASK_MANAGER_VARNAME, INTERNAL_HOOKS_VARNAME
 
 
+#############
+# Constants #
+#############
+
+# Number of seconds between checks for results in the broker
+BROKER_POLL_SECONDS = 0.05
+
+# Number of seconds between checks of whether the thread running the previous attempt
+# of a task has exited
+THREAD_POLL_SECONDS = 0.05
+
+
+#####################
+# Functions / utils #
+#####################
+
+def get_attempt_name(name: str, attempt: int) -> str:
+    """
+    Name of task `name` displayed in the execution events for attempt number `attempt`
+    """
+    if attempt == 1:
+        return name
+    return name + f' (RETRY {attempt - 1})'
+
+
+def wrap_output(
+    name: str,
+    output: Any
+) -> Union[PrismTaskOutput, StoredTaskOutput]:
+    """
+    Wrap the output of task `name` received from another process, so that it can be
+    stored in the task manager's `upstream` dictionary. Outputs in the output store are
+    sent as their location, and outputs of tasks with targets are sent along with the
+    targets' types.
+    """
+    if isinstance(output, StoredOutput):
+        return StoredTaskOutput(name, output)
+    if isinstance(output, TargetOutput):
+        return PrismTaskOutput(name, output.output, output.types)
+    return PrismTaskOutput(name, output)
+
+
+def get_event_error_classes(error_event: Optional[Event]) -> List[str]:
+    """
+    Get the class names of the exception associated with an error event
+    """
+    if isinstance(error_event, prism.logging.PrismExceptionErrorEvent):
+        return get_error_classes(error_event.err)
+    if isinstance(error_event, prism.logging.ExecutionErrorEvent):
+
+        # Errors sent from worker processes may have been replaced with a
+        # RuntimeException; the original class names are stored on the event.
+        if error_event.error_classes is not None:
+            return error_event.error_classes
+        return get_error_classes(error_event.value)
+    return []
+
+
 ####################
 # Class definition #
 ####################
@@ -38,11 +143,13 @@ class ExecutorOutput:
     """
     Class for defining output of DagExecutor. Looks very similar to the output of the
     EventManager. We only need this because we need the error event and event list to
-    cascade up to the PrismPipeline class.
+    cascade up to the PrismPipeline class. With `keep_going`, `error_events` contains
+    the error event of every failed task.
     """
     success: int
     error_event: Optional[Event]
     event_list: List[Event]
+    error_events: List[Event] = field(default_factory=list)
 
 
 class DagExecutor:
@@ -56,14 +163,21 @@ class DagExecutor:
         user_arg_all_upstream: bool,
         user_arg_all_downstream: bool,
         threads: int,
-        user_context: Dict[Any, Any] = {}
+        user_context: Dict[Any, Any] = {},
+        executor: str = "threads",
+        resource_limits: Optional[Dict[str, int]] = None,
+        keep_going: bool = False,
+        fail_fast: bool = False,
+        run_timeout: Optional[float] = None,
+        broker_dir: Optional[Path] = None
     ):
         self.project_dir = project_dir
+        self.compiled_dir = project_dir / '.compiled'
         self.compiled_dag = compiled_dag
 
         # Extract attributes from compiled_dag instance
         self.compiled_modules = self.compiled_dag.compiled_modules
-        self.nxdag = self.compiled_dag.nxdag
+        self.dag = self.compiled_dag.dag
         self.topological_sort_relative_path = self.compiled_dag.topological_sort
         self.topological_sort_full_path = self.compiled_dag.topological_sort_full_path
         self.user_arg_modules = self.compiled_dag.user_arg_modules
@@ -71,17 +185,72 @@ class DagExecutor:
         self.user_arg_all_downstream = user_arg_all_downstream
         self.user_context = user_context
 
-        # Identify nodes not explicitly run and update (only if --all-upstream is False)
+        # Identify nodes not explicitly run and update (only if --all-upstream is
+        # False). This is checked for every task, so it's a set.
+        self.nodes_not_explicitly_run: Set[Path] = set()
         if not self.user_arg_all_upstream and not self.user_arg_all_downstream:
-            self.nodes_not_explicitly_run = list(
-                set(self.topological_sort_relative_path) - set(self.user_arg_modules)
-            )
-        else:
-            self.nodes_not_explicitly_run = []
+            self.nodes_not_explicitly_run = set(self.topological_sort_relative_path) \
+                - set(self.user_arg_modules)
 
         # Number of processes used to run concurrent tasks
         self.threads = threads
 
+        # How concurrent tasks are run, i.e., threads, processes, or an event loop
+        self.executor = executor
+
+        # Maximum number of running tasks that can use each resource
+        self.resource_limits = {} if resource_limits is None else resource_limits
+
+        # What to do when a task fails. By default, no new tasks are started and the
+        # executor waits for the running tasks to finish. With `keep_going`, every task
+        # not downstream of a failed task still runs. With `fail_fast`, the executor
+        # returns immediately without waiting for the running tasks.
+        if keep_going and fail_fast:
+            raise prism.exceptions.RuntimeException(
+                message='`keep_going` and `fail_fast` cannot both be used'
+            )
+        self.keep_going = keep_going
+        self.fail_fast = fail_fast
+
+        # Maximum number of seconds the run can take
+        self.run_timeout = run_timeout
+
+        # Directory through which the `distributed` executor hands tasks to workers
+        if broker_dir is None:
+            broker_dir = self.compiled_dir / 'broker'
+        self.broker_dir = broker_dir
+
+        # Hooks exposed to tasks. Set from the run context in `exec` (or, in worker
+        # processes, in `prepare_worker`).
+        self.hooks: PrismHooks
+
+        # Cache of task outputs, if enabled in prism_project.py. Set in `exec`.
+        self.output_cache: Optional[OutputCache] = None
+
+        # Store of memory-mapped task outputs, if enabled in prism_project.py. Set in
+        # `exec`.
+        self.output_store: Optional[OutputStore] = None
+
+        # Store of task states, if `SKIP_FRESH_TARGETS` is enabled in prism_project.py.
+        # Set in `exec`.
+        self.state_store: Optional[StateStore] = None
+
+        # Tasks whose outputs were loaded from a previous run (i.e., tasks with fresh
+        # targets or cached outputs) rather than executed. Their execution time isn't
+        # recorded in the task durations.
+        self._reused_outputs: Set[str] = set()
+
+        # Cancellation token of the current attempt of each task, and the thread
+        # running the latest attempt of each task executed in a thread. Threads cannot
+        # be interrupted, so attempts that are cancelled may still be running.
+        self._cancellation_tokens: Dict[str, CancellationToken] = {}
+        self._attempt_threads: Dict[str, threading.Thread] = {}
+
+        # First error of the run and, with `keep_going`, every error of the run. These
+        # are reset in `exec`.
+        self.error_event: Optional[Event] = None
+        self.error_events: List[Event] = []
+
     def set_run_context(self, run_context: Dict[Any, Any]):
         """
         Set executor globals; needs to be called before `exec`
@@ -109,20 +278,18 @@ class DagExecutor:
                 )
             return module.refs
 
-    def exec_single(self,
-        full_tb: bool,
-        module: prism_module.CompiledModule,
-        task_manager: Union[int, PrismTaskManager],
-        hooks: PrismHooks,
-        user_context: Dict[Any, Any] = {}
-    ) -> base_event_manager.EventManagerOutput:
+    def get_exec_event_metadata(self,
+        module: prism_module.CompiledModule
+    ) -> Tuple[bool, Optional[int], Optional[int]]:
         """
-        Callback used to get results of module execution in Pool
+        Get the metadata used to fire the execution events for `module`
+
+        args:
+            module: CompiledModule object
+        returns:
+            whether to fire the execution events, the module's index, and the total
+            number of modules
         """
-        # Keep track of events
-        event_list: List[Event] = []
-        if task_manager == 0:
-            base_event_manager.EventManagerOutput(0, None, event_list)
         relative_path = module.module_relative_path
         full_path = module.module_full_path
 
@@ -154,73 +321,509 @@ class DagExecutor:
         else:
             idx = None
             total = None
+        return fire_exec_events, idx, total
+
+    def create_task_namespace(self,
+        module: prism_module.CompiledModule
+    ) -> Dict[Any, Any]:
+        """
+        Create the namespace (i.e., the globals) in which `module` is executed. Each
+        task gets its own shallow copy of the project's globals, so the names a module
+        defines (its imports, classes, and `__file__`) never clobber those of tasks
+        running concurrently. Objects shared via the project's globals (e.g., the task
+        manager and hooks) are not copied.
 
-        # Event manager. We want '__file__' to be the path to the un-compiled module.
-        # Instances of DagExecutor will only be called within the project directory.
-        # Therefore, __files__ should be modules/{name of script}
-        self.run_context['__file__'] = str(
-            self.project_dir / f'modules/{str(relative_path)}'
+        args:
+            module: CompiledModule object
+        returns:
+            namespace for `module`
+        """
+        namespace = self.run_context.copy()
+
+        # We want '__file__' to be the path to the un-compiled module. Instances of
+        # DagExecutor will only be called within the project directory. Therefore,
+        # __files__ should be modules/{name of script}
+        namespace['__file__'] = str(
+            self.project_dir / f'modules/{str(module.module_relative_path)}'
         )
+        return namespace
 
-        # Execute the module with appropriate number of retries
-        retries, retry_delay_seconds = module.grab_retries_metadata()
-        num_runs = 0
-        num_expected_runs = retries + 1
-        outputs = 0
-        name = module.name
-        while num_runs != num_expected_runs and outputs == 0:
-            num_runs += 1
-            if num_runs > 1:
-                event_list = fire_console_event(
-                    prism.logging.DelayEvent(name, retry_delay_seconds),
-                    log_level='warn'
-                )
-                time.sleep(retry_delay_seconds)
-                name = module.name + f' (RETRY {num_runs - 1})'
-
-            # Only fire empty line if last retry has been executed
-            fire_empty_line_events = num_runs == num_expected_runs
-            script_manager = base_event_manager.BaseEventManager(
-                idx=idx,
-                total=total,
-                name=name,
-                full_tb=full_tb,
-                func=module.exec
-            )
-            script_event_manager_result: base_event_manager.EventManagerOutput = script_manager.manage_events_during_run(  # noqa: E501
-                event_list,
-                fire_exec_events,
-                fire_empty_line_events,
-                run_context=self.run_context,
-                task_manager=task_manager,
-                hooks=hooks,
-                explicit_run=relative_path not in self.nodes_not_explicitly_run,
-                user_context=user_context
-            )
-            outputs = script_event_manager_result.outputs
+    def publish_task(self,
+        module: prism_module.CompiledModule,
+        namespace: Dict[Any, Any]
+    ):
+        """
+        Make the task instantiated in `namespace` available in the project's globals,
+        so that its output can be retrieved after the run (e.g., via the PrismDAG
+        client)
 
+        args:
+            module: CompiledModule object
+            namespace: namespace in which `module` was executed
+        """
+        task_var_name = prism_module.get_task_var_name(module.module_relative_path)
+        if task_var_name in namespace:
+            self.run_context[task_var_name] = namespace[task_var_name]
+
+    def set_up_output_cache(self):
+        """
+        Get the cache of task outputs from the project and compute the parts of each
+        task's cache key that don't depend on its upstream tasks
+        """
+        project = getattr(self.hooks, 'project', None)
+        self.output_cache = getattr(project, 'output_cache', None)
+        self._output_hashes: Dict[str, str] = {}
+        if self.output_cache is None or project is None:
+            return
+
+        # Referenced `prism_project` variables, with the user's context applied
+        project_module = self.run_context.get(project.filename.replace('.py', ''))
+        self._project_vars = {}
+        for m in self.compiled_modules:
+            self._project_vars[m.name] = {
+                var: getattr(project_module, var, None)
+                for var in m.grab_project_var_refs()
+            }
+        adapters = getattr(project, 'adapters_object_dict', {})
+        self._adapter_identity = [
+            (name, adapter.adapter_dict) for name, adapter in adapters.items()
+        ]
+
+    def get_cache_key(self,
+        module: prism_module.CompiledModule,
+        task_manager: PrismTaskManager
+    ) -> Optional[str]:
+        """
+        Get the cache key of `module`, or None if its output cannot be cached (e.g.,
+        because the output of one of its upstream tasks cannot be hashed)
+
+        args:
+            module: CompiledModule object
+            task_manager: PrismTaskManager containing the outputs of upstream tasks
+        returns:
+            cache key
+        """
+        if self.output_cache is None or not module.grab_cache():
+            return None
+        upstream_hashes = {}
+        for ref in self.check_task_refs(module):
+            if ref not in self._output_hashes:
+                try:
+                    output = task_manager.upstream[ref].get_output()
+                except (KeyError, prism.exceptions.RuntimeException):
+                    return None
+                output_hash = hash_output(output)
+                if output_hash is None:
+                    return None
+                self._output_hashes[ref] = output_hash
+            upstream_hashes[ref] = self._output_hashes[ref]
+        return compute_key(
+            module.module_str,
+            upstream_hashes,
+            self._project_vars[module.name],
+            self._adapter_identity
+        )
+
+    def load_cached_output(self,
+        module: prism_module.CompiledModule,
+        key: str,
+        run_context: Dict[Any, Any],
+        task_manager: PrismTaskManager
+    ) -> bool:
+        """
+        If the output of `module` is cached under `key`, then make it available to
+        downstream tasks as if the module had been executed
+
+        args:
+            module: CompiledModule object
+            key: cache key
+            run_context: namespace in which the module would have been executed
+            task_manager: PrismTaskManager object
+        returns:
+            True if the output was loaded from the cache
+        """
+        output_cache = self.output_cache
+        if output_cache is None:
+            return False
+        cached = output_cache.get(key)
+        if cached is None:
+            return False
+        output, output_hash = cached
+
+        # Tasks with a target output the target's location. If the target has since
+        # been removed, then the task must be re-run.
+        if module.has_targets() and isinstance(output, (str, Path)) \
+                and not Path(output).exists():
+            return False
+        commit_attempt()
+        task_output = PrismTaskOutput(module.name, output)
+        task_manager.upstream[module.name] = task_output
+        task_var_name = prism_module.get_task_var_name(module.module_relative_path)
+        run_context[task_var_name] = task_output
+        self._output_hashes[module.name] = output_hash
+        fire_console_event(prism.logging.CachedOutputEvent(module.name), [], 0)
+        return True
+
+    def store_cached_output(self,
+        module: prism_module.CompiledModule,
+        key: str,
+        task_manager: PrismTaskManager
+    ):
+        """
+        Cache the output of an executed module under `key`
+        """
+        output_cache = self.output_cache
+        if output_cache is None:
+            return
+        output = getattr(task_manager.upstream[module.name], 'output', None)
+        if output is None:
+            return
+        output_hash = hash_output(output)
+        if output_hash is None:
+            return
+        self._output_hashes[module.name] = output_hash
+        output_cache.put(key, output, output_hash)
+
+    def set_up_output_store(self, clear: bool = False):
+        """
+        Get the store of memory-mapped task outputs from the project. If the project
+        doesn't enable `OUTPUT_STORE`, outputs are kept in memory.
+
+        args:
+            clear: whether to remove the outputs stored by previous runs
+        """
+        project = getattr(self.hooks, 'project', None)
+        self.output_store = getattr(project, 'output_store', None)
+        if self.output_store is not None and clear:
+            self.output_store.clear()
+
+    def store_output(self,
+        module: prism_module.CompiledModule,
+        run_context: Dict[Any, Any],
+        task_manager: PrismTaskManager
+    ):
+        """
+        Write the output of an executed module to the output store, and replace the
+        module's task with a handle to the stored output. The in-memory output is
+        dropped, so that only the memory-mapped file holds the output.
+
+        args:
+            module: CompiledModule object
+            run_context: namespace in which `module` was executed
+            task_manager: PrismTaskManager object
+        """
+        if self.output_store is None:
+            return
+        task = task_manager.upstream.get(module.name, None)
+        if task is None or isinstance(task, StoredTaskOutput):
+            return
+        output = getattr(task, 'output', None)
+        if output is None:
+            return
+        stored = self.output_store.put(module.name, output)
+        if stored is None:
+            return
+        task_output = StoredTaskOutput(module.name, stored)
+        task_manager.upstream[module.name] = task_output
+        task_var_name = prism_module.get_task_var_name(module.module_relative_path)
+        run_context[task_var_name] = task_output
+        task.output = None
+
+    def set_up_state_store(self):
+        """
+        Get the store of task states from the project. If the project doesn't enable
+        `SKIP_FRESH_TARGETS`, tasks are never skipped.
+        """
+        project = getattr(self.hooks, 'project', None)
+        self.state_store = getattr(project, 'state_store', None)
+
+    def get_module_state(self,
+        module: prism_module.CompiledModule,
+        task: Any,
+        task_manager: PrismTaskManager,
+        previous: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the current state of `module`'s targets, of its upstream tasks' targets, and
+        of its declared inputs
+
+        args:
+            module: CompiledModule object
+            task: instance of `module`'s task
+            task_manager: PrismTaskManager containing the outputs of upstream tasks
+            previous: previously recorded state of `module`
+        returns:
+            state, or None if the state can't be determined
+        """
+        state_store = self.state_store
+        if state_store is None:
+            return None
+        try:
+            targets = get_target_paths(task.get_output())
+        except (AttributeError, prism.exceptions.RuntimeException):
+            return None
+        if targets is None:
+            return None
+        upstream: Dict[str, Optional[List[str]]] = {}
+        for ref in self.check_task_refs(module):
+            try:
+                ref_output = task_manager.upstream[ref].get_output()
+            except (KeyError, prism.exceptions.RuntimeException):
+                upstream[ref] = None
+                continue
+            upstream[ref] = get_target_paths(ref_output)
+        return state_store.get_state(
+            hash_module(module.module_str),
+            targets,
+            upstream,
+            module.grab_inputs(),
+            previous
+        )
+
+    def skip_fresh_module(self,
+        module: prism_module.CompiledModule,
+        run_context: Dict[Any, Any],
+        task_manager: PrismTaskManager,
+        hooks: PrismHooks,
+        user_context: Dict[Any, Any] = {}
+    ) -> bool:
+        """
+        If the targets of `module` are up to date, then make them available to
+        downstream tasks without executing the module. This is what happens to tasks
+        that aren't explicitly run: the task is instantiated, and its output is the
+        location of its targets.
+
+        returns:
+            True if the module was skipped
+        """
+        if self.state_store is None or not module.has_targets():
+            return False
+        previous = self.state_store.get(module.name)
+        if previous is None:
+            return False
+
+        # Instantiate the task without running it to get the location of its targets.
+        # The instance is only added to the task manager if the targets are up to date;
+        # otherwise, the task is executed.
+        task_var_name = module.instantiate_module_class(
+            run_context, task_manager, hooks, False, user_context
+        )
+        task = run_context[task_var_name]
+        task.exec()
+        state = self.get_module_state(module, task, task_manager, previous)
+        if not self.state_store.is_fresh(module.name, state):
+            return False
+        commit_attempt()
+        task_manager.upstream[module.name] = task
+        fire_console_event(prism.logging.FreshTargetsEvent(module.name), [], 0)
+        return True
+
+    def record_module_state(self,
+        module: prism_module.CompiledModule,
+        task_manager: PrismTaskManager
+    ):
+        """
+        Record the state of an executed module's targets, so that the module can be
+        skipped on the next run if nothing changed
+        """
+        if self.state_store is None or not module.has_targets():
+            return
+        previous = self.state_store.get(module.name)
+        task = task_manager.upstream.get(module.name, None)
+        self.state_store.put(
+            module.name, self.get_module_state(module, task, task_manager, previous)
+        )
+
+    def exec_module(self,
+        module: prism_module.CompiledModule,
+        run_context: Dict[Any, Any],
+        task_manager: PrismTaskManager,
+        hooks: PrismHooks,
+        explicit_run: bool = True,
+        user_context: Dict[Any, Any] = {}
+    ) -> PrismTaskManager:
+        """
+        Execute `module`, unless its targets are up to date or its output can be loaded
+        from the output cache. Tasks that aren't explicitly run can be loaded from the
+        cache (e.g., upstream tasks with `--changed-since`), but their outputs are never
+        stored. They aren't executed at all if their outputs are still held from a
+        previous run (e.g., with `prism run --watch`).
+        """
+        self._reused_outputs.discard(module.name)
+        if not explicit_run and task_manager.has_output(module.name):
+            return task_manager
+        if explicit_run and self.skip_fresh_module(
+            module, run_context, task_manager, hooks, user_context
+        ):
+            self._reused_outputs.add(module.name)
+            return task_manager
+        key = self.get_cache_key(module, task_manager)
+        if key is not None and self.load_cached_output(
+            module, key, run_context, task_manager
+        ):
+            self._reused_outputs.add(module.name)
+            self.store_output(module, run_context, task_manager)
+            return task_manager
+        task_manager = module.exec(
+            run_context, task_manager, hooks, explicit_run, user_context
+        )
+        if explicit_run:
+            self.record_module_state(module, task_manager)
+            if key is not None:
+                self.store_cached_output(module, key, task_manager)
+        self.store_output(module, run_context, task_manager)
+        return task_manager
+
+    async def aexec_module(self,
+        module: prism_module.CompiledModule,
+        run_context: Dict[Any, Any],
+        task_manager: PrismTaskManager,
+        hooks: PrismHooks,
+        explicit_run: bool = True,
+        user_context: Dict[Any, Any] = {}
+    ) -> PrismTaskManager:
+        """
+        Execute `module` within a running event loop, unless its targets are up to date
+        or its output can be loaded from the output cache
+        """
+        self._reused_outputs.discard(module.name)
+        if not explicit_run and task_manager.has_output(module.name):
+            return task_manager
+        if explicit_run and self.skip_fresh_module(
+            module, run_context, task_manager, hooks, user_context
+        ):
+            self._reused_outputs.add(module.name)
+            return task_manager
+        key = self.get_cache_key(module, task_manager)
+        if key is not None and self.load_cached_output(
+            module, key, run_context, task_manager
+        ):
+            self._reused_outputs.add(module.name)
+            self.store_output(module, run_context, task_manager)
+            return task_manager
+        task_manager = await module.aexec(
+            run_context, task_manager, hooks, explicit_run, user_context
+        )
+        if explicit_run:
+            self.record_module_state(module, task_manager)
+            if key is not None:
+                self.store_cached_output(module, key, task_manager)
+        self.store_output(module, run_context, task_manager)
+        return task_manager
+
+    def exec_single(self,
+        full_tb: bool,
+        module: prism_module.CompiledModule,
+        task_manager: Union[int, PrismTaskManager],
+        hooks: PrismHooks,
+        user_context: Dict[Any, Any] = {},
+        attempt: int = 1
+    ) -> base_event_manager.EventManagerOutput:
+        """
+        Callback used to get results of module execution in Pool. This executes a single
+        attempt; failed attempts are retried by the scheduler (see `_schedule_retry`),
+        so that a worker isn't held while waiting to retry.
+        """
+        # Keep track of events
+        event_list: List[Event] = []
+        if task_manager == 0:
+            base_event_manager.EventManagerOutput(0, None, event_list)
+        relative_path = module.module_relative_path
+        fire_exec_events, idx, total = self.get_exec_event_metadata(module)
+
+        # Only fire empty line if last retry has been executed
+        fire_empty_line_events = attempt > self.retry_policies[module.name].retries
+        namespace = self.create_task_namespace(module)
+        script_manager = base_event_manager.BaseEventManager(
+            idx=idx,
+            total=total,
+            name=get_attempt_name(module.name, attempt),
+            full_tb=full_tb,
+            func=functools.partial(self.exec_module, module)
+        )
+        script_event_manager_result: base_event_manager.EventManagerOutput = script_manager.manage_events_during_run(  # noqa: E501
+            event_list,
+            fire_exec_events,
+            fire_empty_line_events,
+            run_context=namespace,
+            task_manager=task_manager,
+            hooks=hooks,
+            explicit_run=relative_path not in self.nodes_not_explicitly_run,
+            user_context=user_context
+        )
+        if module.name in self._reused_outputs:
+            script_event_manager_result.executed = False
+
+        # Attempts that were cancelled don't publish their task
+        try:
+            commit_attempt()
+        except prism.exceptions.CancelledException:
+            return script_event_manager_result
+        self.publish_task(module, namespace)
         return script_event_manager_result
 
-    def _cancel_connections(self, pool):
+    async def aexec_single(self,
+        full_tb: bool,
+        module: prism_module.CompiledModule,
+        task_manager: PrismTaskManager,
+        hooks: PrismHooks,
+        user_context: Dict[Any, Any] = {},
+        attempt: int = 1
+    ) -> base_event_manager.EventManagerOutput:
         """
-        Given a pool, cancel all adapter connections and wait until all
-        runners gentle terminates.
+        Execute a module whose `run` function is a coroutine function within the
+        running event loop. Otherwise, identical to `exec_single`.
         """
-        pool.close()
-        pool.terminate()
-        pool.join()
+        # Keep track of events
+        event_list: List[Event] = []
+        relative_path = module.module_relative_path
+        fire_exec_events, idx, total = self.get_exec_event_metadata(module)
+
+        # Only fire empty line if last retry has been executed
+        fire_empty_line_events = attempt > self.retry_policies[module.name].retries
+        namespace = self.create_task_namespace(module)
+        script_manager = base_event_manager.BaseEventManager(
+            idx=idx,
+            total=total,
+            name=get_attempt_name(module.name, attempt),
+            full_tb=full_tb,
+            func=functools.partial(self.aexec_module, module)
+        )
+        script_event_manager_result: base_event_manager.EventManagerOutput = await script_manager.amanage_events_during_run(  # noqa: E501
+            event_list,
+            fire_exec_events,
+            fire_empty_line_events,
+            run_context=namespace,
+            task_manager=task_manager,
+            hooks=hooks,
+            explicit_run=relative_path not in self.nodes_not_explicitly_run,
+            user_context=user_context
+        )
+        if module.name in self._reused_outputs:
+            script_event_manager_result.executed = False
+
+        # Attempts that were cancelled don't publish their task
+        try:
+            commit_attempt()
+        except prism.exceptions.CancelledException:
+            return script_event_manager_result
+        self.publish_task(module, namespace)
+        return script_event_manager_result
 
     def exec(self, full_tb: bool):
         """
         Execute DAG. Our general approach is as follows:
-            1. Create a queue of the tasks (i.e., the modules) that need to be executed.
+            1. Count the number of upstream tasks for each task (i.e., its in-degree).
+               Tasks without any upstream tasks are placed in the ready queue.
             2. Create a pool with `n` processes
-            3. While queue is not empty
-                - Get task from the top of the queue
-                - If task doesn't have any refs, add it to the pool
-                - If task does have refs, then wait for those refs to finish before
-                  adding it to pool
-                - Once task has been added to queue, remove it from queue
+            3. While there are tasks in the ready queue and idle workers, dispatch
+               tasks from the ready queue to the pool.
+            4. Whenever a task completes, decrement the in-degree of each of its
+               successors. Successors whose in-degree reaches 0 are placed in the ready
+               queue and dispatched at the next opportunity.
+
+        This ensures that a slow task only blocks its own successors; independent
+        branches of the DAG continue to run on idle workers.
         """
 
         # Keep track of events
@@ -234,93 +837,1201 @@ class DagExecutor:
             # If task_manager==0, then we want to raise an error. However, if we do so
             # here, it'll get swallowed by the pool.
             if task_manager == 0:
-                self._wait_and_return = True
-                self.error_event = error_event
-            self.task_manager = task_manager
+                if not self.keep_going:
+                    self._wait_and_return = True
+                if self.error_event is None:
+                    self.error_event = error_event
+                if error_event is not None:
+                    self.error_events.append(error_event)
+            else:
+                self.task_manager = task_manager
             self.event_list += runner_event_list
             return
 
         # Execute all statements, stopping at first error
         self.task_manager = self.run_context[INTERNAL_TASK_MANAGER_VARNAME]
         self.hooks = self.run_context[INTERNAL_HOOKS_VARNAME]
+
+        # With `prism run --watch`, the task manager holds the outputs of previous runs.
+        # Tasks that are explicitly run replace their outputs, so these are discarded
+        # up front (in case the tasks fail). The other outputs are reused, so the
+        # output store isn't cleared.
+        has_previous_outputs = len(self.task_manager.upstream) > 0
+        for module in self.compiled_modules:
+            if module.module_relative_path not in self.nodes_not_explicitly_run:
+                self.task_manager.discard(module.name)
+        self.set_up_output_cache()
+        self.set_up_output_store(clear=not has_previous_outputs)
+        self.set_up_state_store()
         self._wait_and_return = False
         self.error_event = None
+        self.error_events = []
+        self.failed_tasks: List[str] = []
+
+        # Ready-queue scheduler. If tasks run concurrently, then tasks on the critical
+        # path (weighted by their durations from previous runs) are started first. If
+        # tasks run one at a time, the order does not affect the total run time, so we
+        # preserve the topological sort. Completed tasks are placed in the `completed`
+        # queue by the pool's callbacks and consumed by the main thread.
+        modules = {m.name: m for m in self.compiled_modules}
+        self.set_up_output_eviction(modules)
+        self.set_up_prefetching(modules)
+        run_results = RunResults(self.compiled_dir)
+        runs_concurrently = self.threads > 1 or self.executor == "asyncio"
+        scheduler = TaskScheduler(
+            {name: self.check_task_refs(m) for name, m in modules.items()},
+            durations=run_results.durations if runs_concurrently else None,
+            priorities={name: m.grab_priority() for name, m in modules.items()},
+            resources={name: m.grab_resources() for name, m in modules.items()},
+            resource_limits=self.resource_limits
+        )
+        self.durations: Dict[str, float] = {}
 
-        # If single-threaded, just run the modules in order
-        if self.threads == 1:
-            while self.compiled_modules != []:
-                curr = self.compiled_modules.pop(0)
+        # Retry policy and current attempt number for each task
+        self.retry_policies = {
+            name: m.grab_retry_policy() for name, m in modules.items()
+        }
+        self.attempts = {name: 1 for name in modules.keys()}
+
+        # Timeout of each task and deadline of the run. `running_tasks` maps the name of
+        # each running task --> (attempt, start time, deadline).
+        self.timeouts = {name: m.grab_timeout() for name, m in modules.items()}
+        self.run_deadline = None
+        if self.run_timeout is not None:
+            self.run_deadline = time.monotonic() + self.run_timeout
+        self.running_tasks: Dict[str, Tuple[int, float, Optional[float]]] = {}
+        has_timeouts = self.run_timeout is not None \
+            or any(t is not None for t in self.timeouts.values())
+        completed: "queue.Queue[Tuple[str, int, EventManagerOutput]]" = queue.Queue()
+
+        # If the `asyncio` executor is used, then tasks run on an event loop in the main
+        # thread
+        if self.executor == "asyncio":
+            self._exec_asyncio(full_tb, scheduler, modules, callback)
+
+        # If single-threaded, just run the modules in the main thread. Tasks running in
+        # the main thread cannot be timed out, so this isn't done if a timeout is set.
+        elif self.threads == 1 and not has_timeouts:
+
+            def dispatch(module: prism_module.CompiledModule):
+                attempt = self.attempts[module.name]
                 result = self.exec_single(
                     full_tb,
-                    curr,
+                    module,
                     self.task_manager,
                     self.hooks,
-                    self.user_context
+                    self.user_context,
+                    attempt
                 )
-                callback(result)
-                if self.task_manager == 0:
-                    return ExecutorOutput(0, self.error_event, self.event_list)
+                completed.put((module.name, attempt, result))
+
+            self._exec_ready_queue(
+                full_tb, scheduler, modules, dispatch, completed, callback
+            )
+
+        # If tasks run in separate processes, then upstream outputs must be shipped to
+        # the process executing each task
+        elif self.executor == "processes":
+            self._exec_processes(full_tb, scheduler, modules, completed, callback)
+
+        # If tasks run on workers started with `prism worker`, then tasks and their
+        # outputs are exchanged through the broker
+        elif self.executor == "distributed":
+            self._exec_distributed(full_tb, scheduler, modules, completed, callback)
+
+        # Otherwise, run each task in its own thread, at most `self.threads` at once.
+        # Threads cannot be interrupted, so tasks that time out (or that are cancelled
+        # with `fail_fast`) are cancelled through their cancellation token: the task
+        # can stop early by polling the token, and it never writes its output. The run
+        # doesn't wait for the cancelled thread to exit, but a retry of the task does.
+        else:
+
+            def dispatch(module: prism_module.CompiledModule):
+                thread = threading.Thread(
+                    target=self._exec_in_thread,
+                    args=(
+                        full_tb,
+                        module,
+                        self.attempts[module.name],
+                        self._cancellation_tokens[module.name],
+                        self._attempt_threads.get(module.name, None),
+                        completed
+                    ),
+                    daemon=True
+                )
+                self._attempt_threads[module.name] = thread
+                thread.start()
+
+            self._exec_ready_queue(
+                full_tb, scheduler, modules, dispatch, completed, callback
+            )
+
+        # Persist task durations for future runs
+        self.dump_durations(run_results)
+
+        # If error was found, then return a failed output. We need the error event and
+        # event list to cascade up to the PrismPipeline class.
+        if len(self.error_events) > 0:
+            if self.keep_going:
+                self.event_list = fire_console_event(
+                    prism.logging.FailureSummaryEvent(
+                        self.failed_tasks, list(scheduler.skipped.keys())
+                    ),
+                    self.event_list,
+                    log_level='error'
+                )
+            return ExecutorOutput(
+                0, self.error_event, self.event_list, self.error_events
+            )
+        return ExecutorOutput(1, self.error_event, self.event_list)
+
+    def should_cancel(self) -> bool:
+        """
+        Whether a task failed and the remaining tasks should be cancelled immediately
+        """
+        return self.fail_fast and self._wait_and_return
+
+    def _exec_in_thread(self,
+        full_tb: bool,
+        module: prism_module.CompiledModule,
+        attempt: int,
+        token: CancellationToken,
+        previous: Optional[threading.Thread],
+        completed: "queue.Queue[Tuple[str, int, EventManagerOutput]]"
+    ):
+        """
+        Execute a single module in a worker thread and place the result in `completed`.
+        If the thread running the previous attempt of the module is still alive, then
+        wait for it to exit first.
+        """
+        set_current_token(token)
+        if not self._wait_for_thread(previous, token):
+            return
+        try:
+            result = self.exec_single(
+                full_tb,
+                module,
+                self.task_manager,
+                self.hooks,
+                self.user_context,
+                attempt
+            )
+        except Exception as err:
+            result = self._error_result(full_tb, module.name, err)
+        completed.put((module.name, attempt, result))
+
+    def _wait_for_thread(self,
+        thread: Optional[threading.Thread],
+        token: CancellationToken
+    ) -> bool:
+        """
+        Wait for `thread`, which ran a previous attempt of a task that was cancelled, to
+        exit. This way, a retry never runs at the same time as the attempt it replaces.
+
+        args:
+            thread: thread running the previous attempt, if any
+            token: cancellation token of the current attempt
+        returns:
+            False if the current attempt was cancelled while waiting
+        """
+        while thread is not None and thread.is_alive():
+            if token.event.wait(THREAD_POLL_SECONDS):
+                return False
+        return True
 
-            # We need the error event and event list to cascade up to the PrismPipeline
-            # class.
-            return ExecutorOutput(1, self.error_event, self.event_list)
+    def _error_result(self,
+        full_tb: bool,
+        name: str,
+        err: BaseException
+    ) -> base_event_manager.EventManagerOutput:
+        """
+        Result for errors raised by `exec_single` itself (rather than by the module)
+        """
+        error_event = prism.logging.ExecutionErrorEvent(
+            name, type(err), err, err.__traceback__, full_tb
+        )
+        return base_event_manager.EventManagerOutput(0, error_event, [])
 
-        # If the pool has multiple threads, then iterate through modules and add them to
-        # the Pool
+    def _timeout_result(self,
+        full_tb: bool,
+        module: prism_module.CompiledModule,
+        attempt: int,
+        start_time: float
+    ) -> base_event_manager.EventManagerOutput:
+        """
+        Fire the error events for an attempt that exceeded its timeout or the run's
+        deadline, as if the attempt had raised a TimeoutException
+
+        args:
+            full_tb: boolean indicating whether to show the full traceback
+            module: CompiledModule that timed out
+            attempt: attempt number, starting at 1
+            start_time: time at which the attempt started
+        returns:
+            EventManagerOutput
+        """
+        timeout = self.timeouts[module.name]
+        if timeout is not None and time.time() - start_time >= timeout:
+            msg = f'task exceeded `TIMEOUT_SECONDS = {timeout}`'
         else:
-            async_results = {}
-            with Pool(processes=self.threads) as pool:
-                while self.compiled_modules != []:
+            msg = f'run exceeded `RUN_TIMEOUT_SECONDS = {self.run_timeout}`'
+        fire_exec_events, idx, total = self.get_exec_event_metadata(module)
+        script_manager = base_event_manager.BaseEventManager(
+            idx=idx,
+            total=total,
+            name=get_attempt_name(module.name, attempt),
+            full_tb=full_tb,
+            func=module.exec
+        )
+        try:
+            raise prism.exceptions.TimeoutException(message=msg)
+        except prism.exceptions.TimeoutException:
+            return script_manager.manage_error_events(
+                start_time,
+                [],
+                fire_exec_events,
+                attempt > self.retry_policies[module.name].retries
+            )
+
+    def _start_task(self, name: str) -> CancellationToken:
+        """
+        Record the start time and deadline of the current attempt of task `name`
+
+        returns:
+            cancellation token of the attempt
+        """
+        deadline = self.run_deadline
+        timeout = self.timeouts[name]
+        if timeout is not None:
+            task_deadline = time.monotonic() + timeout
+            if deadline is None or task_deadline < deadline:
+                deadline = task_deadline
+        self.running_tasks[name] = (self.attempts[name], time.time(), deadline)
+        self._cancellation_tokens[name] = CancellationToken()
+        return self._cancellation_tokens[name]
+
+    def _is_running(self, name: str, attempt: int) -> bool:
+        """
+        Whether attempt `attempt` of task `name` is running. Results of attempts that
+        timed out are discarded, and their cancellation token prevents them from
+        writing their output in the meantime.
+        """
+        return name in self.running_tasks and self.running_tasks[name][0] == attempt
+
+    def _cancel_running_tasks(self):
+        """
+        Cancel the attempts that are still running when the executor returns (i.e.,
+        with `fail_fast`), so that they don't write their outputs after the run
+        """
+        for name in self.running_tasks.keys():
+            self._cancellation_tokens[name].cancel()
+
+    def _get_wait(self, scheduler: TaskScheduler) -> Optional[float]:
+        """
+        Number of seconds until the next task should be retried or the next deadline
+        expires, or None if there is nothing to wait for
+        """
+        now = time.monotonic()
+        waits: List[float] = []
+        retry_wait = scheduler.time_until_next_retry()
+        if retry_wait is not None:
+            waits.append(retry_wait)
+        waits += [
+            deadline - now
+            for _, _, deadline in self.running_tasks.values()
+            if deadline is not None
+        ]
+        if self.run_deadline is not None and not self._wait_and_return:
+            waits.append(self.run_deadline - now)
+        if len(waits) == 0:
+            return None
+        return max(min(waits), 0.0)
+
+    def _expire_tasks(self,
+        full_tb: bool,
+        scheduler: TaskScheduler,
+        modules: Dict[str, prism_module.CompiledModule],
+        callback: Callable[[base_event_manager.EventManagerOutput], None],
+        cancel: Callable[[str, int], None]
+    ):
+        """
+        Cancel running tasks that have exceeded their timeout or the run's deadline,
+        and free their slots. If the run's deadline has passed, then no more tasks are
+        started.
 
-                    # Get first module to execute
-                    curr = self.compiled_modules[0]
-                    refs = self.check_task_refs(curr)
+        args:
+            full_tb: boolean indicating whether to show the full traceback
+            scheduler: TaskScheduler for the DAG
+            modules: dictionary mapping module name --> CompiledModule
+            callback: function to process the result of each module
+            cancel: function that cancels attempt `attempt` of task `name`
+        """
+        now = time.monotonic()
+        for name, (attempt, start_time, deadline) in list(self.running_tasks.items()):
+            if deadline is None or deadline > now:
+                continue
+
+            # Attempts that have already started writing their output are about to
+            # complete, so they're no longer timed out
+            if not self._cancellation_tokens[name].cancel():
+                self.running_tasks[name] = (attempt, start_time, None)
+                continue
+            cancel(name, attempt)
+            result = self._timeout_result(full_tb, modules[name], attempt, start_time)
+            self._complete_task(name, result, scheduler, modules, callback)
+
+        if (
+            self.run_deadline is not None
+            and now >= self.run_deadline  # noqa: W503
+            and not self._wait_and_return  # noqa: W503
+            and not scheduler.is_finished()  # noqa: W503
+        ):
+            error_event = prism.logging.PrismExceptionErrorEvent(
+                prism.exceptions.TimeoutException(
+                    message=f'run exceeded `RUN_TIMEOUT_SECONDS = {self.run_timeout}`; remaining tasks were not started'  # noqa: E501
+                ),
+                'run'
+            )
+            callback(base_event_manager.EventManagerOutput(0, error_event, []))
+            self._wait_and_return = True
+
+    def _exec_processes(self,
+        full_tb: bool,
+        scheduler: TaskScheduler,
+        modules: Dict[str, prism_module.CompiledModule],
+        completed: "queue.Queue[Tuple[str, int, EventManagerOutput]]",
+        callback: Callable[[base_event_manager.EventManagerOutput], None]
+    ):
+        """
+        Execute the DAG using a pool of worker processes. This avoids the GIL for
+        CPU-bound tasks. Workers are forked from the current process, so they inherit
+        the project's globals and compiled modules; only each task's upstream outputs
+        and its own output are sent between processes. Large buffers (e.g., the arrays
+        underlying a DataFrame) are written to a spill directory and memory-mapped by
+        the receiver rather than being copied through a pipe. Tasks that time out are
+        cancelled by killing their worker process, which the pool then replaces.
 
-                    # If an error occurred, skip all remaining tasks
-                    if self._wait_and_return:
-                        break  # type: ignore
+        args:
+            full_tb: boolean indicating whether to show the full traceback
+            scheduler: TaskScheduler for the DAG
+            modules: dictionary mapping module name --> CompiledModule
+            completed: queue populated with (name, attempt, result) as modules
+                complete
+            callback: function to process the result of each module
+        """
+        try:
+            ctx = multiprocessing.get_context("fork")
+        except ValueError:
+            raise prism.exceptions.RuntimeException(
+                message='`processes` executor is not supported on this platform; use `threads`'  # noqa: E501
+            )
+        self._modules = modules
+        self._spill_dir = Path(tempfile.mkdtemp(prefix='prism-'))
+
+        # Serialized outputs of completed tasks. Each output is serialized once, by the
+        # worker that produced it, and shipped to each of its successors.
+        self._serialized_outputs: Dict[str, SerializedObject] = {}
+
+        # Workers report the process ID of each attempt they start, so that attempts
+        # that time out can be killed
+        started = ctx.SimpleQueue()
+        worker_pids: Dict[Tuple[str, int], int] = {}
+        killed_workers = False
+
+        def cancel(name: str, attempt: int):
+            nonlocal killed_workers
+            while not started.empty():
+                started_name, started_attempt, pid = started.get()
+                worker_pids[(started_name, started_attempt)] = pid
+            pid = worker_pids.pop((name, attempt), None)
+            if pid is not None:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                    killed_workers = True
+                except ProcessLookupError:
+                    pass
+
+        try:
+            with ctx.Pool(
+                processes=self.threads,
+                initializer=_init_process_worker,
+                initargs=(self, full_tb, started)
+            ) as pool:
+
+                def dispatch(module: prism_module.CompiledModule):
+                    name = module.name
+                    attempt = self.attempts[name]
+                    upstream = {
+                        ref: self._serialized_outputs[ref]
+                        for ref in self.check_task_refs(module)
+                        if ref in self._serialized_outputs
+                    }
+                    # Callbacks run on the pool's result-handler thread, so they only
+                    # hand the result to the main thread
+                    pool.apply_async(
+                        _exec_in_process,
+                        args=(name, upstream, attempt),
+                        callback=lambda result: completed.put((name, attempt, result)),
+                        error_callback=lambda err: completed.put(
+                            (name, attempt, self._error_result(full_tb, name, err))
+                        )
+                    )
+
+                self._exec_ready_queue(
+                    full_tb, scheduler, modules, dispatch, completed, callback, cancel,
+                    receive=self._receive_process_result
+                )
+
+                # With `fail_fast`, exiting the context manager terminates the workers
+                # that are still running. The results of killed workers never arrive,
+                # so the pool must be terminated rather than joined.
+                if not self.should_cancel() and not killed_workers:
+                    pool.close()
+                    pool.join()
+        finally:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+
+    def _receive_process_result(self,
+        name: str,
+        result: base_event_manager.EventManagerOutput
+    ) -> base_event_manager.EventManagerOutput:
+        """
+        Load the output of a task executed in another process. This modifies the task
+        manager and the project's namespace, so it must run on the main thread.
 
+        args:
+            name: name of completed task
+            result: result sent by the other process
+        returns:
+            result whose outputs are the task manager
+        """
+        if result.outputs == 0:
+            return result
+        try:
+            self._store_process_output(name, result.outputs)
+            result.outputs = self.task_manager
+        except prism.exceptions.PrismException as err:
+            error_event = prism.logging.PrismExceptionErrorEvent(err, name)
+            result = base_event_manager.EventManagerOutput(
+                0, error_event, result.event_list
+            )
+        return result
+
+    def _exec_distributed(self,
+        full_tb: bool,
+        scheduler: TaskScheduler,
+        modules: Dict[str, prism_module.CompiledModule],
+        completed: "queue.Queue[Tuple[str, int, EventManagerOutput]]",
+        callback: Callable[[base_event_manager.EventManagerOutput], None]
+    ):
+        """
+        Execute the DAG on workers started with `prism worker`, which may run on other
+        machines. The current process acts as the coordinator: it places ready tasks
+        (along with their upstream outputs) in the broker and collects the results.
+        Workers execute the same compiled DAG, so only task outputs are sent between
+        processes. At most `self.threads` tasks are queued or running at once. Tasks
+        that time out are withdrawn if no worker has claimed them yet, and abandoned
+        otherwise. Tasks claimed by workers that stop renewing their lease (e.g.,
+        because they died) are requeued, and tasks fail if no worker is available.
+
+        args:
+            full_tb: boolean indicating whether to show the full traceback
+            scheduler: TaskScheduler for the DAG
+            modules: dictionary mapping module name --> CompiledModule
+            completed: queue populated with (name, attempt, result) as modules
+                complete
+            callback: function to process the result of each module
+        """
+        broker = FileBroker(self.broker_dir)
+        broker.open(RunSpec(
+            self.compiled_dag,
+            self.user_arg_all_upstream,
+            self.user_arg_all_downstream,
+            self.user_context,
+            full_tb
+        ))
+        self._modules = modules
+        self._serialized_outputs = {}
+        task_ids: Dict[Tuple[str, int], str] = {}
+
+        def poll(stop: threading.Event):
+            while not stop.wait(BROKER_POLL_SECONDS):
+                broker.requeue_expired(LEASE_SECONDS)
+                for message in broker.withdraw_stalled(WORKER_TIMEOUT_SECONDS):
+                    error_event = prism.logging.PrismExceptionErrorEvent(
+                        prism.exceptions.RuntimeException(
+                            message=f'no worker claimed task `{message.name}` within `WORKER_TIMEOUT_SECONDS = {WORKER_TIMEOUT_SECONDS}`; start workers with `prism worker`'  # noqa: E501
+                        ),
+                        message.name
+                    )
+                    completed.put((
+                        message.name,
+                        message.attempt,
+                        base_event_manager.EventManagerOutput(0, error_event, [])
+                    ))
+                for name, attempt, result in broker.get_results():
+                    completed.put((name, attempt, result))
+
+        # Workers log their events to their own console. Log them here, too, so that
+        # the coordinator's output looks the same as with any other executor.
+        def receive(
+            name: str,
+            result: base_event_manager.EventManagerOutput
+        ) -> base_event_manager.EventManagerOutput:
+            self._relog_events(result.event_list)
+            return self._receive_process_result(name, result)
+
+        def dispatch(module: prism_module.CompiledModule):
+            name = module.name
+            attempt = self.attempts[name]
+            upstream = {
+                ref: self._serialized_outputs[ref]
+                for ref in self.check_task_refs(module)
+                if ref in self._serialized_outputs
+            }
+            task_ids[(name, attempt)] = broker.submit(
+                TaskMessage(name, attempt, upstream)
+            )
+
+        def cancel(name: str, attempt: int):
+            task_id = task_ids.pop((name, attempt), None)
+            if task_id is not None:
+                broker.withdraw(task_id)
+
+        stop = threading.Event()
+        poller = threading.Thread(target=poll, args=(stop,), daemon=True)
+        poller.start()
+        try:
+            self._exec_ready_queue(
+                full_tb, scheduler, modules, dispatch, completed, callback, cancel,
+                receive=receive
+            )
+        finally:
+            stop.set()
+            poller.join()
+            broker.close()
+
+    def _relog_events(self, event_list: List[Event]):
+        """
+        Log events that were fired in another process
+        """
+        for event in event_list:
+            log_level = 'info'
+            if isinstance(event, prism.logging.ExecutionEvent) \
+                    and event.status == 'ERROR':
+                log_level = 'error'
+            fire_console_event(event, [], 0, log_level)
+
+    def _exec_asyncio(self,
+        full_tb: bool,
+        scheduler: TaskScheduler,
+        modules: Dict[str, prism_module.CompiledModule],
+        callback: Callable[[base_event_manager.EventManagerOutput], None]
+    ):
+        """
+        Execute the DAG on an event loop. Tasks whose `run` function is a coroutine
+        function are awaited on the loop, so any number of them can wait on I/O (e.g.,
+        `hooks.sql_async`) at once. All other tasks run in worker threads, at most
+        `self.threads` at a time.
+
+        args:
+            full_tb: boolean indicating whether to show the full traceback
+            scheduler: TaskScheduler for the DAG
+            modules: dictionary mapping module name --> CompiledModule
+            callback: function to process the result of each module
+        """
+        try:
+            asyncio.get_running_loop()
+            loop_is_running = True
+        except RuntimeError:
+            loop_is_running = False
+        if loop_is_running:
+            raise prism.exceptions.RuntimeException(
+                message='`asyncio` executor cannot be used within a running event loop'
+            )
+        asyncio.run(self._aexec_ready_queue(full_tb, scheduler, modules, callback))
+
+    async def _aexec_ready_queue(self,
+        full_tb: bool,
+        scheduler: TaskScheduler,
+        modules: Dict[str, prism_module.CompiledModule],
+        callback: Callable[[base_event_manager.EventManagerOutput], None]
+    ):
+        """
+        Dispatch tasks from the scheduler's ready queue until the DAG has finished
+        executing or an error occurs. Unlike `_exec_ready_queue`, every ready task is
+        dispatched immediately; synchronous tasks wait for one of `self.threads` slots.
+        Tasks that time out are cancelled.
+
+        args:
+            full_tb: boolean indicating whether to show the full traceback
+            scheduler: TaskScheduler for the DAG
+            modules: dictionary mapping module name --> CompiledModule
+            callback: function to process the result of each module
+        """
+        running: Dict[str, "asyncio.Future[EventManagerOutput]"] = {}
+        thread_slots = asyncio.Semaphore(self.threads)
+
+        def cancel(name: str, attempt: int):
+            running.pop(name).cancel()
+
+        try:
+            while not self.should_cancel():
+                self._expire_tasks(full_tb, scheduler, modules, callback, cancel)
+
+                # If an error occurred, skip all remaining tasks and wait for the
+                # running tasks to finish.
+                while not self._wait_and_return and scheduler.has_ready():
+                    module = modules[scheduler.pop_ready()]
+                    args = (
+                        full_tb,
+                        module,
+                        self.task_manager,
+                        self.hooks,
+                        self.user_context,
+                        self.attempts[module.name]
+                    )
+                    if module.is_async():
+                        token = self._start_task(module.name)
+                        coro = self._aexec_attempt(token, *args)
                     else:
+                        coro = self._arun_in_thread(
+                            thread_slots,
+                            module.name,
+                            functools.partial(self.exec_single, *args)
+                        )
+                    running[module.name] = asyncio.ensure_future(coro)
 
-                        # If no refs, then add module to pool
-                        if len(refs) == 0:
-                            res = pool.apply_async(
-                                self.exec_single,
-                                args=(full_tb, curr, self.task_manager, self.hooks, self.user_context),  # noqa: E501
-                                callback=callback
-                            )
-                            async_results[curr.name] = res
-                            self.compiled_modules.pop(0)
-
-                        # Since DAG is run in order, refs should have been added to pool
-                        # before current task. Wait for upstream tasks
-                        else:
-                            for ref in refs:
-                                async_results[ref].wait()
-
-                            # If an error occurred, skip all remaining tasks
-                            if self._wait_and_return:
-                                break  # type: ignore
-                            else:
-                                res = pool.apply_async(
-                                    self.exec_single,
-                                    args=(full_tb, curr, self.task_manager, self.hooks, self.user_context),  # noqa: E501
-                                    callback=callback
-                                )
-                                async_results[curr.name] = res
-                                self.compiled_modules.pop(0)
-                pool.close()
-                pool.join()
-
-            # If error was found, then terminate pool
-            if self._wait_and_return:
-                self._cancel_connections(pool)
-                # We need the error event and event list to cascade up to the
-                # PrismPipeline class.
-                return ExecutorOutput(0, self.error_event, self.event_list)
-
-            # Otherwise, pool should close automatically
-            else:
-                # We need the error event and event list to cascade up to the
-                # PrismPipeline class.
-                return ExecutorOutput(1, self.error_event, self.event_list)
+                # If no tasks are running, then either the DAG has finished executing
+                # or all remaining tasks are waiting to be retried.
+                wait = self._get_wait(scheduler)
+                if len(running) == 0:
+                    if (
+                        wait is None
+                        or scheduler.time_until_next_retry() is None  # noqa: W503
+                        or self._wait_and_return  # noqa: W503
+                    ):
+                        break
+                    await asyncio.sleep(wait)
+                    continue
+
+                # Wait for the next task(s) to complete and release their successors.
+                # Stop waiting once the next retry or deadline is due.
+                done, _ = await asyncio.wait(
+                    list(running.values()),
+                    timeout=wait,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for name, future in list(running.items()):
+                    if future not in done:
+                        continue
+                    del running[name]
+                    try:
+                        result = future.result()
+                    except Exception as err:
+                        result = self._error_result(full_tb, name, err)
+                    self._complete_task(name, result, scheduler, modules, callback)
+        finally:
+
+            # With `fail_fast`, cancel the running tasks. Synchronous tasks that have
+            # already started cannot be interrupted, so their threads are abandoned.
+            self._cancel_running_tasks()
+            for future in running.values():
+                future.cancel()
+
+    async def _aexec_attempt(self,
+        token: CancellationToken,
+        *args: Any
+    ) -> base_event_manager.EventManagerOutput:
+        """
+        Execute an attempt of a module whose `run` function is a coroutine function.
+        Each attempt runs in its own asyncio task, so `token` only applies to this
+        attempt.
+        """
+        set_current_token(token)
+        return await self.aexec_single(*args)
+
+    async def _arun_in_thread(self,
+        thread_slots: asyncio.Semaphore,
+        name: str,
+        func: Callable[[], base_event_manager.EventManagerOutput]
+    ) -> base_event_manager.EventManagerOutput:
+        """
+        Run synchronous task `name` in its own worker thread once one of the slots in
+        `thread_slots` is free. If the task is cancelled (e.g., because it timed out),
+        then its slot is released immediately and the thread is abandoned.
+        """
+        async with thread_slots:
+            token = self._start_task(name)
+            previous = self._attempt_threads.get(name, None)
+            loop = asyncio.get_running_loop()
+            future: "asyncio.Future[EventManagerOutput]" = loop.create_future()
+
+            def set_result(result: Any, err: Optional[BaseException]):
+                if future.done():
+                    return
+                if err is not None:
+                    future.set_exception(err)
+                else:
+                    future.set_result(result)
+
+            def target():
+                set_current_token(token)
+                if not self._wait_for_thread(previous, token):
+                    return
+                result, err = None, None
+                try:
+                    result = func()
+                except Exception as e:
+                    err = e
+                try:
+                    loop.call_soon_threadsafe(set_result, result, err)
+
+                # The event loop has already been closed
+                except RuntimeError:
+                    pass
+
+            thread = threading.Thread(target=target, daemon=True)
+            self._attempt_threads[name] = thread
+            thread.start()
+            return await future
+
+    def _store_process_output(self, name: str, serialized: SerializedObject):
+        """
+        Load the output of a task executed in a worker process and make it available to
+        downstream tasks and to the project's namespace.
+
+        args:
+            name: name of completed task
+            serialized: serialized output of the task
+        """
+        # The buffer file is kept in the spill directory so that it can be memory-mapped
+        # by each of the task's successors. The spill directory is removed at the end of
+        # the run.
+        task_output = wrap_output(name, load_object(serialized, remove=False))
+        self._serialized_outputs[name] = serialized
+        self.task_manager.upstream[name] = task_output
+        relative_path = self._modules[name].module_relative_path
+        self.run_context[prism_module.get_task_var_name(relative_path)] = task_output
+
+    def exec_single_in_process(self,
+        full_tb: bool,
+        name: str,
+        upstream: Dict[str, SerializedObject],
+        attempt: int = 1
+    ) -> base_event_manager.EventManagerOutput:
+        """
+        Execute a single module in a worker process. The module's upstream outputs are
+        loaded into a fresh task manager. On success, `outputs` contains the serialized
+        output of the module rather than the task manager.
+
+        args:
+            full_tb: boolean indicating whether to show the full traceback
+            name: name of module to execute
+            upstream: dictionary mapping upstream module name --> serialized output
+            attempt: attempt number, starting at 1
+        returns:
+            EventManagerOutput
+        """
+        module = self._modules[name]
+        task_manager = PrismTaskManager(
+            upstream={
+                ref: wrap_output(ref, load_object(obj, remove=False))
+                for ref, obj in upstream.items()
+            },
+            hooks=self.hooks
+        )
+        result = self.exec_single(
+            full_tb, module, task_manager, self.hooks, self.user_context, attempt
+        )
+
+        # Tracebacks cannot be sent to the main process
+        if result.outputs == 0:
+            if isinstance(result.event_to_fire, prism.logging.ExecutionErrorEvent):
+                result.event_to_fire.detach()
+            return result
+        # Outputs in the output store are sent as their location. Outputs of tasks with
+        # targets are sent along with the targets' types, so that downstream tasks can
+        # load the targets.
+        task = result.outputs.upstream[name]
+        output: Union[StoredOutput, TargetOutput, Any]
+        if isinstance(task, StoredTaskOutput):
+            output = task.stored
+        else:
+            output = task.output
+            types = get_target_types(task)
+            if types is not None and is_picklable(types):
+                output = TargetOutput(output, types)
+        try:
+            serialized = dump_object(output, self._spill_dir)
+        except Exception as err:
+            error_event = prism.logging.PrismExceptionErrorEvent(
+                prism.exceptions.RuntimeException(
+                    message=f'could not send output to the main process: {err}'
+                ),
+                name
+            )
+            return base_event_manager.EventManagerOutput(
+                0, error_event, result.event_list
+            )
+        return base_event_manager.EventManagerOutput(
+            serialized, None, result.event_list, result.execution_time, result.executed
+        )
+
+    def prepare_worker(self, spill_dir: Path):
+        """
+        Prepare the executor to execute single tasks via `exec_single_in_process` on
+        behalf of a coordinator, e.g., in a process started with `prism worker`. Must be
+        called after `set_run_context`.
+
+        args:
+            spill_dir: directory in which to write large task outputs
+        """
+        self.task_manager = self.run_context[INTERNAL_TASK_MANAGER_VARNAME]
+        self.hooks = self.run_context[INTERNAL_HOOKS_VARNAME]
+        self.set_up_output_cache()
+        self.set_up_output_store()
+        self.set_up_state_store()
+        self._modules = {m.name: m for m in self.compiled_modules}
+        self.retry_policies = {
+            name: m.grab_retry_policy() for name, m in self._modules.items()
+        }
+        self._spill_dir = spill_dir
+
+    def reconnect_adapters(self):
+        """
+        Re-create the project's adapters. Connections cannot be shared between
+        processes, so each worker process opens its own.
+        """
+        project = self.hooks.project
+        if not hasattr(project, 'profile'):
+            return
+        project.profile.adapters_obj_dict = {}
+        project.profile.generate_adapters()
+        project.adapters_object_dict = project.profile.get_adapters_obj_dict()
+
+    def set_up_output_eviction(self,
+        modules: Dict[str, prism_module.CompiledModule]
+    ):
+        """
+        If `EVICT_OUTPUTS = True`, count the number of downstream tasks (i.e., the
+        consumers) of each task. A task's output is evicted from memory once all of its
+        consumers have finished, so peak memory is bounded by the outputs that are still
+        needed rather than by the sum of all outputs.
+
+        args:
+            modules: dictionary mapping module name --> CompiledModule
+        """
+        project = getattr(self.hooks, 'project', None)
+        self._consumers: Optional[Dict[str, int]] = None
+        self._evicted_dir: Optional[Path] = None
+        if not getattr(project, 'evict_outputs', False):
+            return
+        self._consumers = {name: 0 for name in modules.keys()}
+        for module in modules.values():
+            for ref in set(self.check_task_refs(module)):
+                if ref in self._consumers:
+                    self._consumers[ref] += 1
+
+        # Outputs spilled by previous runs are stale
+        self._evicted_dir = getattr(project, 'evicted_outputs_dir', None)
+        if self._evicted_dir is not None:
+            shutil.rmtree(self._evicted_dir, ignore_errors=True)
+
+    def set_up_prefetching(self,
+        modules: Dict[str, prism_module.CompiledModule]
+    ):
+        """
+        Find the upstream tasks whose targets each task loads via
+        `tasks.ref(..., load=True)`. Tasks executed in other processes load their
+        targets themselves, so targets are only prefetched if tasks share the task
+        manager.
+
+        args:
+            modules: dictionary mapping module name --> CompiledModule
+        """
+        self._loaded_refs: Dict[str, List[str]] = {}
+        if self.executor in ["processes", "distributed"]:
+            return
+        for name, module in modules.items():
+            self._loaded_refs[name] = module.grab_loaded_refs()
+
+    def prefetch_targets(self, name: str):
+        """
+        Start loading the targets that task `name` loads in the background, once the
+        task is released into the ready queue. Reading the targets then overlaps with
+        other tasks, and the loaded objects are shared by all of their consumers.
+
+        args:
+            name: name of task
+        """
+        for ref in self._loaded_refs.get(name, []):
+            self.task_manager.prefetch(ref)
+
+    def _release_upstream(self,
+        name: str,
+        modules: Dict[str, prism_module.CompiledModule]
+    ):
+        """
+        Record that task `name` no longer needs the outputs of its upstream tasks (it
+        finished, failed, or was skipped), and evict the outputs that have no remaining
+        consumers.
+
+        args:
+            name: name of finished task
+            modules: dictionary mapping module name --> CompiledModule
+        """
+        if self._consumers is None:
+            return
+        for ref in set(self.check_task_refs(modules[name])):
+            if ref not in self._consumers:
+                continue
+            self._consumers[ref] -= 1
+            if self._consumers[ref] == 0:
+                self.evict_output(ref, modules)
+
+    def evict_output(self,
+        name: str,
+        modules: Dict[str, prism_module.CompiledModule]
+    ):
+        """
+        Evict the output of task `name` from the task manager and the project's
+        namespace. Outputs received from worker processes are also removed from the
+        spill directory.
+
+        args:
+            name: name of task
+            modules: dictionary mapping module name --> CompiledModule
+        """
+        evicted = self.task_manager.evict(name, self._evicted_dir)
+        if evicted is not None:
+            task_var_name = prism_module.get_task_var_name(
+                modules[name].module_relative_path
+            )
+            if task_var_name in self.run_context:
+                self.run_context[task_var_name] = evicted
+        serialized = getattr(self, '_serialized_outputs', {}).pop(name, None)
+        if serialized is not None and serialized.buffer_path is not None:
+            try:
+                os.unlink(serialized.buffer_path)
+            except OSError:
+                pass
+
+    def _exec_ready_queue(self,
+        full_tb: bool,
+        scheduler: TaskScheduler,
+        modules: Dict[str, prism_module.CompiledModule],
+        dispatch: Callable[[prism_module.CompiledModule], None],
+        completed: "queue.Queue[Tuple[str, int, EventManagerOutput]]",
+        callback: Callable[[base_event_manager.EventManagerOutput], None],
+        cancel: Callable[[str, int], None] = lambda name, attempt: None,
+        receive: Optional[
+            Callable[[str, EventManagerOutput], EventManagerOutput]
+        ] = None
+    ):
+        """
+        Dispatch tasks from the scheduler's ready queue until the DAG has finished
+        executing or an error occurs. At most `self.threads` tasks run at once.
+
+        args:
+            full_tb: boolean indicating whether to show the full traceback
+            scheduler: TaskScheduler for the DAG
+            modules: dictionary mapping module name --> CompiledModule
+            dispatch: function that starts executing a module
+            completed: queue populated with (name, attempt, result) as modules
+                complete
+            callback: function to process the result of each module
+            cancel: function that cancels a running attempt that timed out. By
+                default, the attempt is abandoned and its result is discarded.
+            receive: function that loads the result of a module executed in another
+                process. It's called on the main thread, and only for attempts that
+                are still running.
+        """
+        while not self.should_cancel():
+            self._expire_tasks(full_tb, scheduler, modules, callback, cancel)
+
+            # If an error occurred, skip all remaining tasks and wait for the running
+            # tasks to finish.
+            while (
+                not self._wait_and_return
+                and len(self.running_tasks) < self.threads  # noqa: W503
+                and scheduler.has_ready()  # noqa: W503
+            ):
+                module = modules[scheduler.pop_ready()]
+                self._start_task(module.name)
+                dispatch(module)
+
+            # If no tasks are running, then either the DAG has finished executing or
+            # all remaining tasks are waiting to be retried.
+            wait = self._get_wait(scheduler)
+            if len(self.running_tasks) == 0:
+                if (
+                    wait is None
+                    or scheduler.time_until_next_retry() is None  # noqa: W503
+                    or self._wait_and_return  # noqa: W503
+                ):
+                    break
+                time.sleep(wait)
+                continue
+
+            # Wait for the next task to complete and release its successors. Stop
+            # waiting once the next retry or deadline is due.
+            try:
+                name, attempt, result = completed.get(timeout=wait)
+            except queue.Empty:
+                continue
+            if self._is_running(name, attempt):
+                if receive is not None:
+                    result = receive(name, result)
+                self._complete_task(name, result, scheduler, modules, callback)
+
+        # With `fail_fast`, the running tasks are abandoned
+        self._cancel_running_tasks()
+
+    def _complete_task(self,
+        name: str,
+        result: base_event_manager.EventManagerOutput,
+        scheduler: TaskScheduler,
+        modules: Dict[str, prism_module.CompiledModule],
+        callback: Callable[[base_event_manager.EventManagerOutput], None]
+    ):
+        """
+        Process the result of a completed task and, if it succeeded, release its
+        successors into the scheduler's ready queue
+
+        args:
+            name: name of completed task
+            result: result of the task
+            scheduler: TaskScheduler for the DAG
+            modules: dictionary mapping module name --> CompiledModule
+            callback: function to process the result of each module
+        """
+        self.running_tasks.pop(name, None)
+        if result.outputs == 0 and self._schedule_retry(name, result, scheduler):
+            return
+        callback(result)
+        scheduler.release(name)
+        self._release_upstream(name, modules)
+        if result.outputs != 0:
+            # Tasks that were skipped because their targets are up to date, or whose
+            # outputs were loaded from the output cache, barely take any time. Keep
+            # their duration from the last run that executed them.
+            relative_path = modules[name].module_relative_path
+            explicit_run = relative_path not in self.nodes_not_explicitly_run
+            if explicit_run and result.executed and result.execution_time is not None:
+                self.durations[name] = result.execution_time
+            for released in scheduler.mark_done(name):
+                self.prefetch_targets(released)
+
+        else:
+            self.failed_tasks.append(name)
+
+            # With `keep_going`, skip the tasks downstream of the failed task and
+            # continue running the rest of the DAG
+            if not self.keep_going:
+                return
+            for skipped in scheduler.skip_downstream(name):
+                self._release_upstream(skipped, modules)
+                self.event_list = fire_console_event(
+                    prism.logging.SkippedTaskEvent(skipped, name),
+                    self.event_list,
+                    log_level='warn'
+                )
+
+    def _schedule_retry(self,
+        name: str,
+        result: base_event_manager.EventManagerOutput,
+        scheduler: TaskScheduler
+    ) -> bool:
+        """
+        If the task's retry policy allows it, schedule a failed task to be retried
+        after a delay. The task's worker and resources are released in the meantime.
+
+        args:
+            name: name of failed task
+            result: result of the failed attempt
+            scheduler: TaskScheduler for the DAG
+        returns:
+            True if the task will be retried
+        """
+        attempt = self.attempts[name]
+        policy = self.retry_policies[name]
+        error_classes = get_event_error_classes(result.event_to_fire)
+        if self._wait_and_return or not policy.should_retry(attempt, error_classes):
+
+            # `exec_single` only fires the empty line after the last attempt
+            if attempt <= policy.retries:
+                result.event_list = fire_empty_line_event(result.event_list)
+            return False
+
+        delay = policy.get_delay(attempt)
+        self.event_list += result.event_list
+        self.event_list = fire_console_event(
+            prism.logging.DelayEvent(get_attempt_name(name, attempt), round(delay, 2)),
+            self.event_list,
+            log_level='warn'
+        )
+        self.attempts[name] += 1
+        scheduler.release(name)
+        scheduler.schedule_retry(name, delay)
+        return True
+
+    def dump_durations(self, run_results: RunResults):
+        """
+        Save the duration of each task executed in this run to `run_results.json`.
+        These are used to prioritize tasks on the critical path in future runs.
+
+        args:
+            run_results: RunResults object
+        """
+        if len(self.durations) == 0 or not self.compiled_dir.is_dir():
+            return
+        run_results.update_durations(self.durations)
+        try:
+            run_results.json_dump(self.compiled_dir)
+
+        # Failing to persist durations should never fail the run
+        except OSError:
+            pass
+
+
+###################
+# Process workers #
+###################
+
+# DagExecutor used by the current worker process, and the queue to which the worker
+# reports the attempts it starts
+_process_executor: Optional[DagExecutor] = None
+_process_full_tb: bool = True
+_process_started: Optional[Any] = None
+
+
+def _init_process_worker(executor: DagExecutor, full_tb: bool, started: Any):
+    """
+    Initialize a worker process. Workers are forked, so `executor` is inherited rather
+    than pickled.
+    """
+    global _process_executor, _process_full_tb, _process_started
+    _process_executor = executor
+    _process_full_tb = full_tb
+    _process_started = started
+    executor.reconnect_adapters()
+
+
+def _exec_in_process(
+    name: str,
+    upstream: Dict[str, SerializedObject],
+    attempt: int = 1
+) -> base_event_manager.EventManagerOutput:
+    """
+    Execute module `name` in the current worker process
+    """
+    if _process_executor is None:
+        raise prism.exceptions.RuntimeException(
+            message='worker process was not initialized'
+        )
+    if _process_started is not None:
+        _process_started.put((name, attempt, os.getpid()))
+    return _process_executor.exec_single_in_process(
+        _process_full_tb, name, upstream, attempt
+    )
@@ -12,13 +12,15 @@ Table of Contents
 
 # Standard library imports
 import pandas as pd
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 # Prism-specific imports
 from prism.infra import project as prism_project
 import prism.constants
 import prism.exceptions
 import prism.logging
+from prism.infra.cancellation import raise_if_cancelled
+from prism.infra.query_cache import QueryCache, compute_query_key, is_read_only
 
 
 ####################
@@ -34,17 +36,46 @@ class PrismHooks:
     def __init__(self, project: prism_project.PrismProject):
         self.project = project
 
+    def get_sql_cache_key(self,
+        adapter_name: str,
+        adapter_obj: Any,
+        query: str,
+        return_type: str,
+        cache: bool
+    ) -> Optional[Tuple[QueryCache, str]]:
+        """
+        Get the cache and the key under which the results of `query` are cached, or
+        None if they shouldn't be cached. Only queries whose results are returned as a
+        DataFrame are cached, only if the query just reads data, and only if the
+        project's `SQL_CACHE` is enabled.
+        """
+        sql_cache: Optional[QueryCache] = getattr(self.project, 'sql_cache', None)
+        if sql_cache is None or not cache or return_type != "pandas":
+            return None
+        if not is_read_only(query):
+            return None
+        key = compute_query_key(
+            adapter_name, getattr(adapter_obj, 'adapter_dict', None), query
+        )
+        return sql_cache, key
+
     def sql(self,
         adapter_name: str,
         query: str,
-        return_type: str = "pandas"
+        return_type: str = "pandas",
+        cache: bool = True
     ) -> Any:
         """
-        Execute SQL query using adapter
+        Execute SQL query using adapter. If the project's `SQL_CACHE` is enabled, then
+        results are cached, and identical queries that run concurrently only hit the
+        warehouse once.
 
         args:
             adapter: SQL adapter
             query: query to execute
+            return_type: how to return the results; only "pandas" is supported
+            cache: whether results can be loaded from and stored in the cache. Set
+                this to False for queries that must always hit the warehouse.
         returns:
             DataFrame containing results of SQL query
         """
@@ -58,10 +89,66 @@ class PrismHooks:
             raise prism.exceptions.RuntimeException(
                 message=f'class for adapter `{adapter_name}` does not have `execute_sql` method'  # noqa: E501
             )
+
+        # Attempts that were cancelled (e.g., because they timed out) keep running in
+        # their thread, but they don't issue any more queries
+        raise_if_cancelled()
+        cache_key = self.get_sql_cache_key(
+            adapter_name, adapter_obj, query, return_type, cache
+        )
+        if cache_key is not None:
+            sql_cache, key = cache_key
+            return sql_cache.get_or_execute(
+                key, lambda: adapter_obj.execute_sql(query, return_type)
+            )
         df = adapter_obj.execute_sql(query, return_type)
         if return_type == "pandas":
             return df
 
+    async def sql_async(self,
+        adapter_name: str,
+        query: str,
+        return_type: str = "pandas",
+        cache: bool = True
+    ) -> Any:
+        """
+        Execute SQL query using adapter without blocking the event loop. Use this in
+        tasks whose `run` function is a coroutine function, so that several queries can
+        be awaited concurrently. Results are cached the same way as in `sql`.
+
+        args:
+            adapter: SQL adapter
+            query: query to execute
+            return_type: how to return the results; only "pandas" is supported
+            cache: whether results can be loaded from and stored in the cache
+        returns:
+            DataFrame containing results of SQL query
+        """
+        try:
+            adapter_obj = self.project.adapters_object_dict[adapter_name]
+        except KeyError:
+            raise prism.exceptions.RuntimeException(
+                message=f'adapter `{adapter_name}` not defined'
+            )
+        if not hasattr(adapter_obj, "execute_sql_async"):
+            raise prism.exceptions.RuntimeException(
+                message=f'class for adapter `{adapter_name}` does not have `execute_sql_async` method'  # noqa: E501
+            )
+
+        # Attempts that were cancelled don't issue any more queries
+        raise_if_cancelled()
+        cache_key = self.get_sql_cache_key(
+            adapter_name, adapter_obj, query, return_type, cache
+        )
+        if cache_key is not None:
+            sql_cache, key = cache_key
+            return await sql_cache.aget_or_execute(
+                key, lambda: adapter_obj.execute_sql_async(query, return_type)
+            )
+        df = await adapter_obj.execute_sql_async(query, return_type)
+        if return_type == "pandas":
+            return df
+
     def dbt_ref(self,
         adapter_name: str,
         target_1: str,
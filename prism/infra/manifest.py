@@ -3,6 +3,7 @@ Prism Manifest class
 
 Table of Contents
 - Imports
+- Functions / utils
 - Class definition
 """
 
@@ -11,11 +12,29 @@ Table of Contents
 ###########
 
 # Standard library imports
+import hashlib
 import json
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
 
+#####################
+# Functions / utils #
+#####################
+
+def hash_module(module_str: str) -> str:
+    """
+    Hash a module's source. Used to detect which modules changed since a previous
+    manifest.
+
+    args:
+        module_str: module source
+    returns:
+        hex digest
+    """
+    return hashlib.sha256(module_str.encode('utf-8')).hexdigest()
+
+
 ####################
 # Class definition #
 ####################
@@ -31,6 +50,9 @@ class ModuleManifest:
     def add_module(self, module_name: Path):
         self.manifest_dict["modules"].append(str(module_name))
 
+    def add_hash(self, module_str: str):
+        self.manifest_dict["hash"] = hash_module(module_str)
+
     def add_ref(self, target: Path, source: Path):
         obj = {
             "target": str(target),
@@ -45,6 +67,9 @@ class ModuleManifest:
         }
         self.manifest_dict["targets"].append(obj)
 
+    def add_tags(self, tags: List[str]):
+        self.manifest_dict["tags"] = tags
+
 
 class Manifest:
     """
@@ -53,7 +78,12 @@ class Manifest:
 
     def __init__(self, module_manifests: List[ModuleManifest] = []):
         self.manifest_dict: Dict[str, Any] = {
-            "targets": [], "prism_project": "", "modules": [], "refs": []
+            "targets": [],
+            "prism_project": "",
+            "modules": [],
+            "refs": [],
+            "module_hashes": {},
+            "tags": {},
         }
         self.module_manifests = module_manifests
 
@@ -62,10 +92,19 @@ class Manifest:
             self.manifest_dict["targets"].extend(mm.manifest_dict["targets"])
             self.manifest_dict["modules"].extend(mm.manifest_dict["modules"])
             self.manifest_dict["refs"].extend(mm.manifest_dict["refs"])
+            if "hash" in mm.manifest_dict:
+                for module_name in mm.manifest_dict["modules"]:
+                    self.manifest_dict["module_hashes"][module_name] = mm.manifest_dict["hash"]  # noqa: E501
+            if len(mm.manifest_dict.get("tags", [])) > 0:
+                for module_name in mm.manifest_dict["modules"]:
+                    self.manifest_dict["tags"][module_name] = mm.manifest_dict["tags"]
 
     def add_prism_project(self, prism_project_data: str):
         self.manifest_dict["prism_project"] = prism_project_data
 
+    def add_plan(self, plan: Dict[str, Any]):
+        self.manifest_dict["plan"] = plan
+
     def add_module(self, module_name: Path, module_data: str):
         obj = {
             "module_name": str(module_name),
@@ -92,8 +131,8 @@ class Manifest:
             json.dump(self.manifest_dict, f, sort_keys=False)
         f.close()
 
-    def json_load(self, path: Path):
-        with open(path / 'manifest.json', 'r') as f:
+    def json_load(self, path: Path, filename: str = 'manifest.json'):
+        with open(path / filename, 'r') as f:
             manifest = json.loads(f.read())
         f.close()
         return manifest
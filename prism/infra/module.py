@@ -3,6 +3,8 @@ Prism Module class
 
 Table of Contents
 - Imports
+- Constants
+- Functions / utils
 - Class definition
 """
 
@@ -11,18 +13,44 @@ Table of Contents
 ###########
 
 # Standard library imports
+import ast
 from pathlib import Path
-from typing import Any, Dict
-from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+from types import CodeType, ModuleType
 
 # Prism-specific imports
 import prism.exceptions
+from prism.infra.bytecode_cache import BytecodeCache
+from prism.infra.cancellation import commit_attempt, get_current_token
 from prism.infra.task_manager import PrismTaskManager
 from prism.infra.hooks import PrismHooks
 from prism.infra.manifest import ModuleManifest
+from prism.infra.output_cache import get_project_var_refs
+from prism.infra.retries import RetryPolicy
 from prism.parsers.ast_parser import AstParser
 
 
+#############
+# Constants #
+#############
+
+# Task settings read from each module, and whether their values are read with
+# `AstParser.get_literal_assignment` (True) or `AstParser.get_variable_assignments`
+TASK_SETTINGS = {
+    'RETRIES': False,
+    'RETRY_DELAY_SECONDS': False,
+    'RETRY_BACKOFF': False,
+    'RETRY_MAX_DELAY_SECONDS': False,
+    'RETRY_JITTER': False,
+    'RETRY_ON': True,
+    'PRIORITY': False,
+    'RESOURCES': True,
+    'TIMEOUT_SECONDS': False,
+    'CACHE': False,
+    'INPUTS': True,
+}
+
+
 #####################
 # Functions / utils #
 #####################
@@ -52,17 +80,27 @@ class CompiledModule:
     def __init__(self,
         module_relative_path: Path,
         module_full_path: Path,
-        module_manifest: ModuleManifest
+        module_manifest: ModuleManifest,
+        ast_parser: Optional[AstParser] = None,
+        bytecode_cache: Optional[BytecodeCache] = None
     ):
         self.module_relative_path = module_relative_path
         self.module_full_path = module_full_path
-        with open(self.module_full_path, 'r') as f:
-            self.module_str = f.read()
-        f.close()
 
-        # Module as an AST
-        parent_path = Path(str(module_full_path).replace(str(module_relative_path), ''))
-        self.ast_parser = AstParser(self.module_relative_path, parent_path)
+        # Reuse the compiler's AST if the module was parsed during compilation.
+        # Otherwise, the module is only parsed if its AST is needed.
+        self._ast_parser = ast_parser
+        if ast_parser is not None:
+            self.module_str = ast_parser.module_str
+        else:
+            with open(self.module_full_path, 'r') as f:
+                self.module_str = f.read()
+            f.close()
+
+        # Compiled code object, and the metadata read from the module's AST
+        self.bytecode_cache = bytecode_cache
+        self._code: Optional[CodeType] = None
+        self._metadata: Optional[Dict[str, Any]] = None
 
         # Module name
         self.name = str(self.module_relative_path)
@@ -71,6 +109,117 @@ class CompiledModule:
         self.module_manifest = module_manifest
         self.refs = self._check_manifest(self.module_manifest)
 
+    def __getstate__(self):
+        # Code objects can't be pickled, and the bytecode cache lives on the machine
+        # that compiled the DAG
+        state = self.__dict__.copy()
+        state['_code'] = None
+        state['bytecode_cache'] = None
+        return state
+
+    @property
+    def ast_parser(self) -> AstParser:
+        """
+        Module as an AST. The module is parsed at most once.
+        """
+        if self._ast_parser is None:
+            parent_path = Path(
+                str(self.module_full_path).replace(str(self.module_relative_path), '')
+            )
+            self._ast_parser = AstParser(
+                self.module_relative_path, parent_path, self.module_str
+            )
+        return self._ast_parser
+
+    def _load(self) -> Tuple[CodeType, Dict[str, Any]]:
+        """
+        Load the module's code object and metadata from the bytecode cache if the
+        module hasn't changed since it was last compiled; otherwise, compile and parse
+        them from the module's AST and cache them.
+        """
+        filename = str(self.module_full_path)
+        cache_name = get_task_var_name(self.module_relative_path)
+        if self.bytecode_cache is not None:
+            entry = self.bytecode_cache.get(cache_name, self.module_str, filename)
+            if entry is not None:
+                return entry
+        code = compile(self.ast_parser.ast_module, filename, 'exec')
+        metadata = self._parse_metadata()
+        if self.bytecode_cache is not None:
+            self.bytecode_cache.put(
+                cache_name, self.module_str, filename, code, metadata
+            )
+        return code, metadata
+
+    def _parse_metadata(self) -> Dict[str, Any]:
+        """
+        Read the name of the module's PrismTask class, the task's settings, and the
+        other values used to schedule the task from the module's AST. Settings that
+        can't be read are stored with their error, which is raised when the setting is
+        used.
+        """
+        prism_task_class = self.ast_parser.get_prism_task_node(
+            self.ast_parser.classes, self.ast_parser.bases
+        )
+        run_func = None
+        if prism_task_class is not None:
+            run_func = self.ast_parser.get_run_func(prism_task_class)
+        settings = {}
+        setting_errors = {}
+        for var, literal in TASK_SETTINGS.items():
+            try:
+                if literal:
+                    settings[var] = self.ast_parser.get_literal_assignment(
+                        self.ast_parser.ast_module, var
+                    )
+                else:
+                    settings[var] = self.ast_parser.get_variable_assignments(
+                        self.ast_parser.ast_module, var
+                    )
+            except prism.exceptions.ParserException as e:
+                setting_errors[var] = e.message
+        return {
+            'class_name': None if prism_task_class is None else prism_task_class.name,
+            'is_async': isinstance(run_func, ast.AsyncFunctionDef),
+            'settings': settings,
+            'setting_errors': setting_errors,
+            'project_var_refs': get_project_var_refs(self.ast_parser.ast_module),
+            'loaded_refs': self.ast_parser.get_loaded_refs(),
+        }
+
+    def get_code(self) -> CodeType:
+        """
+        Get the module's compiled code object
+        """
+        if self._code is None:
+            self._code, self._metadata = self._load()
+        return self._code
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """
+        Get the metadata read from the module's AST. If the module's code object is in
+        the bytecode cache, the metadata is loaded with it and the module isn't parsed.
+        """
+        if self._metadata is None:
+            self._code, self._metadata = self._load()
+        return self._metadata
+
+    def get_setting(self, var: str) -> Any:
+        """
+        Get the value assigned to one of the `TASK_SETTINGS` in the module
+
+        args:
+            var: setting name
+        returns:
+            assigned value, or None if the setting isn't assigned
+        """
+        metadata = self.get_metadata()
+        if var in metadata['setting_errors']:
+            raise prism.exceptions.ParserException(
+                message=metadata['setting_errors'][var]
+            )
+        return metadata['settings'][var]
+
     def _check_manifest(self, module_manifest: ModuleManifest):
         """
         Check manifest and return list of refs associated with compiled
@@ -90,18 +239,175 @@ class CompiledModule:
             1. How many retries to undertake
             2. The delay between retries
         """
-        retries = self.ast_parser.get_variable_assignments(
-            self.ast_parser.ast_module, 'RETRIES'
-        )
-        retry_delay_seconds = self.ast_parser.get_variable_assignments(
-            self.ast_parser.ast_module, 'RETRY_DELAY_SECONDS'
-        )
+        retries = self.get_setting('RETRIES')
+        retry_delay_seconds = self.get_setting('RETRY_DELAY_SECONDS')
         if retries is None:
             retries = 0
         if retry_delay_seconds is None:
             retry_delay_seconds = 0
         return retries, retry_delay_seconds
 
+    def grab_retry_policy(self) -> RetryPolicy:
+        """
+        Grab the task's retry policy, including:
+            1. How many retries to undertake
+            2. The delay before the first retry
+            3. The factor by which the delay increases with each retry
+            4. The maximum delay
+            5. The maximum random variation in the delay, as a fraction of the delay
+            6. The errors to retry
+        """
+        retries, retry_delay_seconds = self.grab_retries_metadata()
+        policy_vars = {
+            'RETRIES': retries,
+            'RETRY_DELAY_SECONDS': retry_delay_seconds,
+            'RETRY_BACKOFF': self.get_setting('RETRY_BACKOFF'),
+            'RETRY_MAX_DELAY_SECONDS': self.get_setting('RETRY_MAX_DELAY_SECONDS'),
+            'RETRY_JITTER': self.get_setting('RETRY_JITTER'),
+        }
+        for var, val in policy_vars.items():
+            if val is None:
+                continue
+            if isinstance(val, bool) or not isinstance(val, (int, float)) or val < 0:
+                raise prism.exceptions.RuntimeException(
+                    message=f'invalid value `{var} = {val}` in `{self.name}`; must be a non-negative number'  # noqa: E501
+                )
+        if policy_vars['RETRY_JITTER'] is not None and policy_vars['RETRY_JITTER'] > 1:
+            raise prism.exceptions.RuntimeException(
+                message=f'invalid value `RETRY_JITTER = {policy_vars["RETRY_JITTER"]}` in `{self.name}`; must be between 0 and 1'  # noqa: E501
+            )
+
+        # Errors to retry
+        retry_on = self.get_setting('RETRY_ON')
+        if retry_on is None:
+            retry_on = []
+        elif isinstance(retry_on, str):
+            retry_on = [retry_on]
+        if not isinstance(retry_on, (list, tuple)) or not all(isinstance(r, str) for r in retry_on):  # noqa: E501
+            raise prism.exceptions.RuntimeException(
+                message=f'invalid value `RETRY_ON = {retry_on}` in `{self.name}`; must be a string or a list of strings'  # noqa: E501
+            )
+
+        backoff = policy_vars['RETRY_BACKOFF']
+        jitter = policy_vars['RETRY_JITTER']
+        return RetryPolicy(
+            retries=int(retries),
+            delay_seconds=retry_delay_seconds,
+            backoff=1 if backoff is None else backoff,
+            max_delay_seconds=policy_vars['RETRY_MAX_DELAY_SECONDS'],
+            jitter=0 if jitter is None else jitter,
+            retry_on=list(retry_on)
+        )
+
+    def grab_priority(self) -> int:
+        """
+        Grab the task's explicit priority. When more tasks are ready to run than there
+        are threads, tasks with a higher priority are started first. Default is 0.
+        """
+        priority = self.get_setting('PRIORITY')
+        if priority is None:
+            return 0
+        if isinstance(priority, bool) or not isinstance(priority, int):
+            raise prism.exceptions.RuntimeException(
+                message=f'invalid value `PRIORITY = {priority}` in `{self.name}`; must be an integer'  # noqa: E501
+            )
+        return priority
+
+    def grab_resources(self) -> List[str]:
+        """
+        Grab the resources used by the task, e.g., the names of the adapters it queries
+        or custom pools like `warehouse_heavy`. The number of running tasks that use a
+        resource is capped by the `RESOURCE_LIMITS` in prism_project.py. Default is [].
+        """
+        resources = self.get_setting('RESOURCES')
+        if resources is None:
+            return []
+        if isinstance(resources, str):
+            return [resources]
+        if not isinstance(resources, (list, tuple)) or not all(isinstance(r, str) for r in resources):  # noqa: E501
+            raise prism.exceptions.RuntimeException(
+                message=f'invalid value `RESOURCES = {resources}` in `{self.name}`; must be a string or a list of strings'  # noqa: E501
+            )
+        return list(dict.fromkeys(resources))
+
+    def grab_timeout(self) -> Optional[float]:
+        """
+        Grab the maximum number of seconds that a single attempt of the task can run.
+        Tasks that exceed this are cancelled and fail with a TimeoutException. Default
+        is None, i.e., no limit.
+        """
+        timeout = self.get_setting('TIMEOUT_SECONDS')
+        if timeout is None:
+            return None
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0:  # noqa: E501
+            raise prism.exceptions.RuntimeException(
+                message=f'invalid value `TIMEOUT_SECONDS = {timeout}` in `{self.name}`; must be a positive number'  # noqa: E501
+            )
+        return timeout
+
+    def grab_cache(self) -> bool:
+        """
+        Grab whether the task's output can be cached, if the project's `OUTPUT_CACHE`
+        is enabled. Tasks with side effects beyond their output and target (e.g., tasks
+        that write to a database) should set `CACHE = False`. Default is True.
+        """
+        cache = self.get_setting('CACHE')
+        if cache is None:
+            return True
+        if not isinstance(cache, bool):
+            raise prism.exceptions.RuntimeException(
+                message=f'invalid value `CACHE = {cache}` in `{self.name}`; must be a boolean'  # noqa: E501
+            )
+        return cache
+
+    def grab_inputs(self) -> List[str]:
+        """
+        Grab the files the task reads other than the outputs of its upstream tasks.
+        If the project's `SKIP_FRESH_TARGETS` is enabled, the task is re-run whenever
+        one of these files changes. Default is [].
+        """
+        inputs = self.get_setting('INPUTS')
+        if inputs is None:
+            return []
+        if isinstance(inputs, str):
+            return [inputs]
+        if not isinstance(inputs, (list, tuple)) or not all(isinstance(i, str) for i in inputs):  # noqa: E501
+            raise prism.exceptions.RuntimeException(
+                message=f'invalid value `INPUTS = {inputs}` in `{self.name}`; must be a string or a list of strings'  # noqa: E501
+            )
+        return list(dict.fromkeys(inputs))
+
+    def grab_project_var_refs(self) -> List[str]:
+        """
+        Grab the names of the `prism_project` variables referenced by the task. Their
+        values are part of the key of the task's cached output.
+        """
+        var_refs: List[str] = self.get_metadata()['project_var_refs']
+        return var_refs
+
+    def grab_loaded_refs(self) -> List[str]:
+        """
+        Grab the upstream modules whose targets the task loads via
+        `tasks.ref(..., load=True)`. These are prefetched once the task is scheduled.
+        """
+        loaded_refs: List[str] = self.get_metadata()['loaded_refs']
+        return loaded_refs
+
+    def has_targets(self) -> bool:
+        """
+        Whether the task's `run` function has a target
+        """
+        return any(
+            target["target_locs"] for target in self.module_manifest.manifest_dict["targets"]  # noqa: E501
+        )
+
+    def is_async(self) -> bool:
+        """
+        Whether the task's `run` function is a coroutine function (i.e., `async def`)
+        """
+        is_async: bool = self.get_metadata()['is_async']
+        return is_async
+
     def instantiate_module_class(self,
         run_context: Dict[Any, Any],
         task_manager: PrismTaskManager,
@@ -121,14 +427,11 @@ class CompiledModule:
             variable used to store task instantiation
         """
         # Get prism class from module
-        prism_task_class = self.ast_parser.get_prism_task_node(
-            self.ast_parser.classes, self.ast_parser.bases
-        )
-        if prism_task_class is None:
+        prism_task_class_name = self.get_metadata()['class_name']
+        if prism_task_class_name is None:
             raise prism.exceptions.ParserException(
                 message=f"no PrismTask in `{str(self.module_relative_path)}`"
             )
-        prism_task_class_name = prism_task_class.name
 
         # Variable name should just be the name of the module itself. A project
         # shouldn't contain duplicate modules.
@@ -159,12 +462,15 @@ class CompiledModule:
                     setattr(run_context[prism_project_alias], user_k, user_v)
 
         # Execute class definition and create task
-        exec(self.module_str, run_context)
+        exec(self.get_code(), run_context)
         run_context[task_var_name] = run_context[prism_task_class_name](explicit_run)
 
-        # Set task manager and hooks
+        # Set task manager, hooks, and the event set if the attempt is cancelled
         run_context[task_var_name].set_task_manager(task_manager)
         run_context[task_var_name].set_hooks(hooks)
+        token = get_current_token()
+        if token is not None:
+            run_context[task_var_name].set_cancel_event(token.event)
 
         # Return name of variable used to store task instantiation
         return task_var_name
@@ -185,5 +491,26 @@ class CompiledModule:
 
         # Execute the task
         run_context[task_var_name].exec()
+        commit_attempt()
+        task_manager.upstream[self.name] = run_context[task_var_name]
+        return task_manager
+
+    async def aexec(self,
+        run_context: Dict[Any, Any],
+        task_manager: PrismTaskManager,
+        hooks: PrismHooks,
+        explicit_run: bool = True,
+        user_context: Dict[Any, Any] = {}
+    ) -> PrismTaskManager:
+        """
+        Execute module within a running event loop
+        """
+        task_var_name = self.instantiate_module_class(
+            run_context, task_manager, hooks, explicit_run, user_context
+        )
+
+        # Execute the task
+        await run_context[task_var_name].aexec()
+        commit_attempt()
         task_manager.upstream[self.name] = run_context[task_var_name]
         return task_manager
@@ -0,0 +1,207 @@
+"""
+Content-addressed cache of task outputs. A task's cache key is a hash of everything that
+determines its output: the module's source, the outputs of its upstream tasks, the
+`prism_project` variables it references, and the project's adapters. If none of these
+changed since a previous run, the task's output is loaded from the cache and its `run`
+function is skipped.
+
+Table of Contents
+- Imports
+- Constants
+- Functions / utils
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import ast
+import hashlib
+import os
+from pathlib import Path
+import pickle
+from typing import Any, Dict, List, Optional, Tuple, Union
+import uuid
+
+# Prism-specific imports
+import prism.constants
+
+
+#############
+# Constants #
+#############
+
+# Cached outputs are pickled to `{key}{ENTRY_SUFFIX}` in the cache directory
+ENTRY_SUFFIX = '.pkl'
+
+# Default maximum size of the cache directory
+DEFAULT_MAX_MB = 1024
+
+
+#####################
+# Functions / utils #
+#####################
+
+def hash_output(output: Any) -> Optional[str]:
+    """
+    Hash a task's output. Returns None if the output cannot be pickled, in which case
+    none of the task's successors can be cached. Tasks with a target output the target's
+    location, so if the output is the path to a file, then the file's size and
+    modification time are hashed, too.
+
+    args:
+        output: task output
+    returns:
+        hex digest, or None
+    """
+    try:
+        data = pickle.dumps(output, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    h = hashlib.sha256(data)
+    if isinstance(output, (str, Path)):
+        try:
+            stat = os.stat(output)
+            h.update(f'{stat.st_size}:{stat.st_mtime_ns}'.encode('utf-8'))
+        except (OSError, ValueError):
+            pass
+    return h.hexdigest()
+
+
+def get_project_var_refs(module: Union[str, ast.AST]) -> List[str]:
+    """
+    Get the names of the `prism_project` variables referenced in a module, i.e.,
+    `prism_project.VAR` and `from prism_project import VAR`
+
+    args:
+        module: module source, or the module's AST if it was already parsed
+    returns:
+        sorted list of variable names
+    """
+    if isinstance(module, str):
+        module = ast.parse(module)
+    names = set()
+    for node in ast.walk(module):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if node.value.id == 'prism_project':
+                names.add(node.attr)
+        elif isinstance(node, ast.ImportFrom) and node.module == 'prism_project':
+            names.update(alias.name for alias in node.names)
+    return sorted(names)
+
+
+def compute_key(
+    module_str: str,
+    upstream_hashes: Dict[str, str],
+    project_vars: Dict[str, Any],
+    adapter_identity: List[Tuple[str, Any]]
+) -> str:
+    """
+    Compute the cache key of a task
+
+    args:
+        module_str: module source
+        upstream_hashes: dictionary mapping upstream task --> hash of its output
+        project_vars: dictionary mapping referenced `prism_project` variable --> value
+        adapter_identity: (name, configuration) of each of the project's adapters
+    returns:
+        hex digest
+    """
+    h = hashlib.sha256()
+    parts = [
+        prism.constants.VERSION,
+        module_str,
+        repr(sorted(upstream_hashes.items())),
+        repr(sorted((k, repr(v)) for k, v in project_vars.items())),
+        repr(sorted((k, repr(v)) for k, v in adapter_identity)),
+    ]
+    for part in parts:
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+####################
+# Class definition #
+####################
+
+class OutputCache:
+    """
+    Directory of cached task outputs. When the directory grows beyond `max_mb`, the
+    least recently used outputs are evicted.
+    """
+
+    def __init__(self, cache_dir: Path, max_mb: float = DEFAULT_MAX_MB):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}{ENTRY_SUFFIX}'
+
+    def get(self, key: str) -> Optional[Tuple[Any, str]]:
+        """
+        Load a cached output. Loading an output marks it as recently used.
+
+        args:
+            key: cache key
+        returns:
+            (output, hash of output), or None if `key` isn't cached
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            os.utime(path)
+
+        # Missing or corrupt entries are treated as misses
+        except Exception:
+            return None
+        return entry['output'], entry['output_hash']
+
+    def put(self, key: str, output: Any, output_hash: str):
+        """
+        Cache an output, then evict the least recently used outputs if the cache is
+        over its size limit. Failing to cache an output never fails the run.
+
+        args:
+            key: cache key
+            output: task output
+            output_hash: hash of `output`; see `hash_output`
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f'.{key}.{uuid.uuid4().hex}.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(
+                    {'output': output, 'output_hash': output_hash},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            return
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used outputs until the cache is within its size limit
+        """
+        entries = []
+        total_size = 0
+        for path in self.cache_dir.glob(f'*{ENTRY_SUFFIX}'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total_size -= size
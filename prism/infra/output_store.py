@@ -0,0 +1,173 @@
+"""
+Store of large task outputs as memory-mapped files. DataFrames are written in the Arrow
+IPC file format and ndarrays as `.npy` files. Downstream tasks (in this process or in
+worker processes) map these files rather than each receiving a copy of the output, so
+all of them share one physical copy via the OS page cache.
+
+Arrays loaded from `.npy` files are mapped copy-on-write, so they can be modified
+without affecting the stored output. DataFrames loaded from Arrow files are zero-copy
+views of the file and are read-only; tasks that modify a referenced DataFrame in place
+must copy it first.
+
+Table of Contents
+- Imports
+- Constants
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import shutil
+from typing import Any, Optional
+import uuid
+
+# Third-party imports
+import numpy as np
+import pandas as pd
+
+# Prism-specific imports
+import prism.exceptions
+from prism.infra.serialization import OUT_OF_BAND_MIN_BYTES
+
+
+#############
+# Constants #
+#############
+
+# Formats of stored outputs, along with their file suffixes
+ARROW_FORMAT = 'arrow'
+NPY_FORMAT = 'npy'
+SUFFIXES = {ARROW_FORMAT: '.arrow', NPY_FORMAT: '.npy'}
+
+# Outputs smaller than this are kept in memory; mapping them isn't worth it
+DEFAULT_MIN_BYTES = OUT_OF_BAND_MIN_BYTES
+
+
+####################
+# Class definition #
+####################
+
+@dataclass
+class StoredOutput:
+    """
+    Location of an output in the output store. This is small and picklable, so it can
+    be sent to worker processes in place of the output itself.
+    """
+    path: str
+    format: str
+
+    def load(self) -> Any:
+        """
+        Memory-map the stored output
+
+        returns:
+            DataFrame or ndarray backed by the stored file
+        """
+        try:
+            if self.format == NPY_FORMAT:
+                return np.load(self.path, mmap_mode='c', allow_pickle=False)
+            import pyarrow as pa
+            source = pa.memory_map(self.path, 'r')
+            table = pa.ipc.open_file(source).read_all()
+            return table.to_pandas(split_blocks=True)
+        except OSError as err:
+            raise prism.exceptions.RuntimeException(
+                message=f'could not load task output from `{self.path}`: {err}'
+            )
+
+
+class OutputStore:
+    """
+    Directory of large task outputs. Outputs that aren't DataFrames or ndarrays, that
+    are smaller than `min_bytes`, or that can't be stored without changing their types
+    are kept in memory as usual.
+    """
+
+    def __init__(self, store_dir: Path, min_bytes: int = DEFAULT_MIN_BYTES):
+        self.store_dir = Path(store_dir)
+        self.min_bytes = min_bytes
+
+    def clear(self):
+        """
+        Remove the outputs stored by previous runs
+        """
+        shutil.rmtree(self.store_dir, ignore_errors=True)
+
+    def put(self, name: str, output: Any) -> Optional[StoredOutput]:
+        """
+        Write the output of task `name` to the store. Failing to store an output never
+        fails the task.
+
+        args:
+            name: task name
+            output: task output
+        returns:
+            StoredOutput, or None if the output is kept in memory
+        """
+        if isinstance(output, np.ndarray):
+            fmt = NPY_FORMAT
+            if output.dtype.hasobject or output.nbytes < self.min_bytes:
+                return None
+        elif isinstance(output, pd.DataFrame):
+            fmt = ARROW_FORMAT
+            if output.memory_usage(index=True).sum() < self.min_bytes:
+                return None
+        else:
+            return None
+
+        path = self.store_dir / f'{name.replace("/", "_")}{SUFFIXES[fmt]}'
+        tmp_path = self.store_dir / f'.{path.name}.{uuid.uuid4().hex}.tmp'
+        try:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            if fmt == NPY_FORMAT:
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, output, allow_pickle=False)
+            elif not self._write_arrow(output, tmp_path):
+                return None
+            os.replace(tmp_path, path)
+        except Exception:
+            return None
+        finally:
+            if tmp_path.exists():
+                os.unlink(tmp_path)
+        return StoredOutput(str(path), fmt)
+
+    def _write_arrow(self, df: pd.DataFrame, path: Path) -> bool:
+        """
+        Write `df` to an Arrow IPC file. DataFrames whose column labels or dtypes
+        wouldn't survive the round trip (e.g., integer column labels or columns of
+        mixed types) aren't written.
+
+        args:
+            df: DataFrame
+            path: path of Arrow file
+        returns:
+            True if `df` was written
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return False
+        columns = df.columns
+        if isinstance(columns, pd.MultiIndex) or not columns.is_unique \
+                or not all(isinstance(c, str) for c in columns):
+            return False
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowException, TypeError, ValueError):
+            return False
+
+        # Converting an empty table only uses the schema, so this is cheap
+        empty = table.schema.empty_table().to_pandas()
+        if not empty.dtypes.equals(df.dtypes) or type(empty.index) is not type(df.index):  # noqa: E501
+            return False
+        with pa.OSFile(str(path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        return True
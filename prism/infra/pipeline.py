@@ -11,7 +11,7 @@ Table of Contents
 ###########
 
 # Standard library imports
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 # Prism-specific imports
 from prism.infra import project as prism_project
@@ -35,7 +35,8 @@ class PrismPipeline:
     def __init__(self,
         project: prism_project.PrismProject,
         executor: prism_executor.DagExecutor,
-        run_context: Dict[Any, Any]
+        run_context: Dict[Any, Any],
+        task_manager_obj: Optional[task_manager.PrismTaskManager] = None
     ):
         self.project = project
         self.dag_executor = executor
@@ -66,9 +67,20 @@ class PrismPipeline:
                     message='`pyspark` adapter found in profile YML, use `spark-submit` command'  # noqa; E501
                 )
 
-        # Create task_manager and hooks objects
-        task_manager_obj = task_manager.PrismTaskManager(upstream={})
+        # The SparkSession lives in the main process, so it cannot be used by tasks
+        # running in worker processes
+        if 'pyspark' in adapter_types and self.dag_executor.executor in ['processes', 'distributed']:  # noqa: E501
+            raise prism.exceptions.RuntimeException(
+                message=f'`pyspark` adapter cannot be used with the `{self.dag_executor.executor}` executor'  # noqa: E501
+            )
+
+        # Create task_manager and hooks objects. With `prism run --watch`, the task
+        # manager of the previous run is reused, so that the outputs of tasks that
+        # aren't run again remain available.
         hooks_obj = hooks.PrismHooks(self.project)
+        if task_manager_obj is None:
+            task_manager_obj = task_manager.PrismTaskManager(upstream={})
+        task_manager_obj.set_hooks(hooks_obj)
 
         # If PySpark adapter is specified in the profile, then explicitly add
         # SparkSession to hooks
@@ -87,18 +99,23 @@ class PrismPipeline:
 
         self.dag_executor.set_run_context(self.run_context)
 
-    def exec(self, full_tb: bool):
+    def exec(self, full_tb: bool, close_adapters: bool = True):
         """
-        Execute pipeline
+        Execute pipeline. With `prism run --watch`, the adapters' connections are kept
+        open for the next run, and `close_adapters` is False.
         """
         executor_output = self.dag_executor.exec(full_tb)
+        if close_adapters:
+            self.close_adapters()
+        return executor_output
 
-        # Close SQL adapter connections
+    def close_adapters(self):
+        """
+        Close SQL adapter connections
+        """
         if "snowflake" in list(self.project.adapters_object_dict.keys()):
             self.project.adapters_object_dict["snowflake"].engine.close()
         if "redshift" in list(self.project.adapters_object_dict.keys()):
             self.project.adapters_object_dict["redshift"].engine.close()
         if "bigquery" in list(self.project.adapters_object_dict.keys()):
             self.project.adapters_object_dict["bigquery"].engine.close()
-
-        return executor_output
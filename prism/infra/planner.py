@@ -0,0 +1,146 @@
+"""
+Execution plan for a compiled DAG, produced by `prism compile --plan`. The plan groups
+the modules into levels that can run at the same time and predicts how long a run will
+take, so that THREADS (and the machines running the project) can be sized before paying
+for a run.
+
+Predictions use the duration of each module from previous runs (i.e., the durations
+in `run_results.json`). The run is simulated with the same TaskScheduler that executes
+the DAG, so priorities and resource limits are taken into account.
+
+Table of Contents
+- Imports
+- Functions / utils
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+# Prism-specific imports
+from prism.infra.dag import Dag
+from prism.infra.scheduler import TaskScheduler
+
+
+#####################
+# Functions / utils #
+#####################
+
+def get_critical_path(scheduler: TaskScheduler) -> List[str]:
+    """
+    Get the longest chain of tasks, weighted by each task's duration. The scheduler's
+    ranks are the length of the longest path from each task to the end of the DAG, so
+    the critical path starts at the root with the highest rank and follows the
+    successor with the highest rank.
+
+    args:
+        scheduler: TaskScheduler whose ranks were computed from durations
+    returns:
+        names of the tasks on the critical path
+    """
+    roots = [name for name, in_degree in scheduler.in_degree.items() if in_degree == 0]
+    critical_path: List[str] = []
+    candidates = roots
+    while len(candidates) > 0:
+        name = max(candidates, key=lambda n: (scheduler.ranks[n], -scheduler.order[n]))
+        critical_path.append(name)
+        candidates = scheduler.successors[name]
+    return critical_path
+
+
+def predict_wall_time(scheduler: TaskScheduler,
+    durations: Dict[str, float],
+    threads: int
+) -> float:
+    """
+    Simulate a run of the DAG with `threads` workers. Whenever a worker is free, it
+    takes the next task from the scheduler's ready queue, exactly as the executor does.
+
+    args:
+        scheduler: TaskScheduler for the DAG; the scheduler is consumed
+        durations: dictionary mapping task name --> predicted duration in seconds
+        threads: number of workers
+    returns:
+        predicted wall time in seconds
+    """
+    now = 0.0
+    running: List[Tuple[float, int, str]] = []
+    while not scheduler.is_finished():
+        while len(running) < threads and scheduler.has_ready():
+            name = scheduler.pop_ready()
+            heapq.heappush(
+                running, (now + durations[name], scheduler.order[name], name)
+            )
+
+        # Complete every task that finishes at the same time before dispatching more
+        now = running[0][0]
+        while len(running) > 0 and running[0][0] == now:
+            scheduler.mark_done(heapq.heappop(running)[-1])
+    return now
+
+
+def create_plan(dag: Dag,
+    threads: int,
+    durations: Dict[str, float],
+    priorities: Optional[Dict[str, int]] = None,
+    resources: Optional[Dict[str, List[str]]] = None,
+    resource_limits: Optional[Dict[str, int]] = None
+) -> Dict[str, Any]:
+    """
+    Create the execution plan for the modules in `dag`. Modules without a duration from
+    a previous run are assumed to take the average duration of the modules that have
+    one (or one second, if no module has one).
+
+    args:
+        dag: DAG of the modules to run
+        threads: number of threads used to run the project
+        durations: dictionary mapping module name --> duration (in seconds) from
+            previous runs
+        priorities: dictionary mapping module name --> explicit priority
+        resources: dictionary mapping module name --> names of resources used by the
+            module
+        resource_limits: dictionary mapping resource name --> maximum number of running
+            modules that can use the resource
+    returns:
+        plan as a JSON-serializable dictionary
+    """
+    task_refs = {
+        str(node): [str(pred) for pred in dag.predecessors(node)]
+        for node in dag.topological_sort()
+    }
+    known = [durations[name] for name in task_refs.keys() if name in durations]
+    default_duration = sum(known) / len(known) if len(known) > 0 else 1.0
+    predicted_durations = {
+        name: durations.get(name, default_duration) for name in task_refs.keys()
+    }
+
+    def _create_scheduler() -> TaskScheduler:
+        return TaskScheduler(
+            task_refs,
+            durations=predicted_durations,
+            priorities=priorities,
+            resources=resources,
+            resource_limits=resource_limits
+        )
+
+    scheduler = _create_scheduler()
+    critical_path = get_critical_path(scheduler)
+    levels = [[str(node) for node in level] for level in dag.levels()]
+    return {
+        "threads": threads,
+        "levels": levels,
+        "max_parallel_width": max([len(level) for level in levels], default=0),
+        "critical_path": critical_path,
+        "critical_path_duration": sum(predicted_durations[n] for n in critical_path),
+        "total_duration": sum(predicted_durations.values()),
+        "predicted_wall_time": predict_wall_time(
+            _create_scheduler(), predicted_durations, threads
+        ),
+        "modules_without_durations": [
+            name for name in task_refs.keys() if name not in durations
+        ],
+    }
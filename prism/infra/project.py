@@ -26,6 +26,10 @@ import prism.logging
 from prism.parsers import yml_parser
 from prism.profiles import profile
 from prism.infra.sys_path import SysPathEngine
+from prism.infra.output_cache import OutputCache, DEFAULT_MAX_MB
+from prism.infra.query_cache import QueryCache, DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS
+from prism.infra.state_store import StateStore
+from prism.infra.output_store import OutputStore
 
 
 ####################
@@ -128,6 +132,52 @@ class PrismProject():
 
         self.thread_count = self.get_thread_count(self.run_context)
 
+        # ------------------------------------------------------------------------------
+        # Executor
+
+        self.executor = self.get_executor(self.run_context)
+
+        # ------------------------------------------------------------------------------
+        # Resource limits
+
+        self.resource_limits = self.get_resource_limits(self.run_context)
+
+        # ------------------------------------------------------------------------------
+        # Run timeout
+
+        self.run_timeout = self.get_run_timeout(self.run_context)
+
+        # ------------------------------------------------------------------------------
+        # Broker directory
+
+        self.broker_dir = self.get_broker_dir(self.run_context)
+
+        # ------------------------------------------------------------------------------
+        # Output cache
+
+        self.output_cache = self.get_output_cache(self.run_context)
+
+        # ------------------------------------------------------------------------------
+        # State store for skipping tasks with up-to-date targets
+
+        self.state_store = self.get_state_store(self.run_context)
+
+        # ------------------------------------------------------------------------------
+        # Cache of `hooks.sql` query results
+
+        self.sql_cache = self.get_sql_cache(self.run_context)
+
+        # ------------------------------------------------------------------------------
+        # Store of memory-mapped task outputs
+
+        self.output_store = self.get_output_store(self.run_context)
+
+        # ------------------------------------------------------------------------------
+        # Eviction of task outputs once their downstream tasks finish
+
+        self.evict_outputs = self.get_evict_outputs(self.run_context)
+        self.evicted_outputs_dir = self.get_evicted_outputs_dir(self.run_context)
+
         # ------------------------------------------------------------------------------
         # Profile name, profiles dir, and profiles path
 
@@ -156,6 +206,12 @@ class PrismProject():
             # the moment.
             self.profile_yml = self.load_profile_yml(self.profile_yml_path)
 
+        # Workers started with `prism worker` only need the broker directory. Each run
+        # they execute creates its own project (and adapters). `prism compile --plan`
+        # only needs the thread count and resource limits.
+        elif self.which in ["worker", "compile"]:
+            pass
+
         # Otherwise, the user wishes to run the project locally (either via the `run` or
         # `spark-submit` commands). For these, we do need to generate the adapters.
         else:
@@ -382,6 +438,326 @@ class PrismProject():
             return 1
         return thread_count
 
+    def get_executor(self,
+        run_context: Dict[Any, Any]
+    ) -> str:
+        """
+        Get the executor used to run tasks concurrently from prism_project.py. If the
+        executor is not specified, then default to `threads`.
+
+        args:
+            run_context: dictionary with run context variables
+        returns:
+            executor
+        """
+        try:
+            executor = run_context[self.filename.replace(".py", "")].EXECUTOR
+        except AttributeError:
+            executor = None
+        if executor is None:
+            return "threads"
+        if executor not in prism.constants.VALID_EXECUTORS:
+            valid_executors_str = ','.join([f'`{k}`' for k in prism.constants.VALID_EXECUTORS])  # noqa: E501
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `EXECUTOR = {executor}`; must be one of {valid_executors_str}'  # noqa: E501
+            )
+        return str(executor)
+
+    def get_resource_limits(self,
+        run_context: Dict[Any, Any]
+    ) -> Dict[str, int]:
+        """
+        Get the maximum number of running tasks that can use each resource from
+        prism_project.py. Tasks declare the resources they use with the `RESOURCES`
+        variable. If the limits are not specified, then default to {}.
+
+        args:
+            run_context: dictionary with run context variables
+        returns:
+            dictionary mapping resource name --> maximum number of running tasks
+        """
+        try:
+            resource_limits = run_context[self.filename.replace(".py", "")].RESOURCE_LIMITS  # noqa: E501
+        except AttributeError:
+            resource_limits = None
+        if resource_limits is None:
+            return {}
+        if not isinstance(resource_limits, dict):
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `RESOURCE_LIMITS = {resource_limits}`; must be a dictionary'  # noqa: E501
+            )
+        for k, v in resource_limits.items():
+            if not isinstance(k, str) or isinstance(v, bool) or not isinstance(v, int) or v < 1:  # noqa: E501
+                raise prism.exceptions.InvalidProjectPyException(
+                    message=f'invalid resource limit `{k}: {v}` in `RESOURCE_LIMITS`; must map resource names to positive integers'  # noqa: E501
+                )
+        return resource_limits
+
+    def get_run_timeout(self,
+        run_context: Dict[Any, Any]
+    ) -> Optional[float]:
+        """
+        Get the maximum number of seconds that a run can take from prism_project.py.
+        Tasks still running at the deadline are cancelled, and tasks that haven't
+        started are not run. If not specified, then default to None, i.e., no limit.
+
+        args:
+            run_context: dictionary with run context variables
+        returns:
+            run timeout in seconds
+        """
+        try:
+            run_timeout = run_context[self.filename.replace(".py", "")].RUN_TIMEOUT_SECONDS  # noqa: E501
+        except AttributeError:
+            run_timeout = None
+        if run_timeout is None:
+            return None
+        if isinstance(run_timeout, bool) or not isinstance(run_timeout, (int, float)) or run_timeout <= 0:  # noqa: E501
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `RUN_TIMEOUT_SECONDS = {run_timeout}`; must be a positive number'  # noqa: E501
+            )
+        return run_timeout
+
+    def get_broker_dir(self,
+        run_context: Dict[Any, Any]
+    ) -> Path:
+        """
+        Get the directory through which the `distributed` executor hands tasks to
+        workers from prism_project.py. Relative paths are relative to the project
+        directory. If not specified, then default to `.compiled/broker`.
+
+        args:
+            run_context: dictionary with run context variables
+        returns:
+            broker directory
+        """
+        try:
+            broker_dir = run_context[self.filename.replace(".py", "")].BROKER_DIR
+        except AttributeError:
+            broker_dir = None
+        if broker_dir is None:
+            return self.project_dir / '.compiled' / 'broker'
+        if not isinstance(broker_dir, (str, Path)):
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `BROKER_DIR = {broker_dir}`; must be a path'
+            )
+        return self.project_dir / Path(broker_dir)
+
+    def get_output_cache(self,
+        run_context: Dict[Any, Any]
+    ) -> Optional[OutputCache]:
+        """
+        Get the cache of task outputs from prism_project.py. The cache is only used if
+        `OUTPUT_CACHE = True`. Outputs are stored in `OUTPUT_CACHE_DIR` (default
+        `.compiled/cache`), and the least recently used outputs are evicted once the
+        directory exceeds `OUTPUT_CACHE_MAX_MB` (default 1024).
+
+        args:
+            run_context: dictionary with run context variables
+        returns:
+            OutputCache, or None if the cache is disabled
+        """
+        try:
+            enabled = run_context[self.filename.replace(".py", "")].OUTPUT_CACHE
+        except AttributeError:
+            enabled = None
+        if enabled is None or enabled is False:
+            return None
+        if enabled is not True:
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `OUTPUT_CACHE = {enabled}`; must be a boolean'
+            )
+        try:
+            cache_dir = run_context[self.filename.replace(".py", "")].OUTPUT_CACHE_DIR
+        except AttributeError:
+            cache_dir = None
+        if cache_dir is None:
+            cache_dir = self.project_dir / '.compiled' / 'cache'
+        elif not isinstance(cache_dir, (str, Path)):
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `OUTPUT_CACHE_DIR = {cache_dir}`; must be a path'  # noqa: E501
+            )
+        try:
+            max_mb = run_context[self.filename.replace(".py", "")].OUTPUT_CACHE_MAX_MB
+        except AttributeError:
+            max_mb = None
+        if max_mb is None:
+            max_mb = DEFAULT_MAX_MB
+        elif isinstance(max_mb, bool) or not isinstance(max_mb, (int, float)) or max_mb <= 0:  # noqa: E501
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `OUTPUT_CACHE_MAX_MB = {max_mb}`; must be a positive number'  # noqa: E501
+            )
+        return OutputCache(self.project_dir / Path(cache_dir), max_mb)
+
+    def get_state_store(self,
+        run_context: Dict[Any, Any]
+    ) -> Optional[StateStore]:
+        """
+        Get the store of task states from prism_project.py. The store is only used if
+        `SKIP_FRESH_TARGETS = True`, in which case tasks whose targets are up to date
+        are skipped. States are stored in `.compiled/state`.
+
+        args:
+            run_context: dictionary with run context variables
+        returns:
+            StateStore, or None if tasks are never skipped
+        """
+        try:
+            enabled = run_context[self.filename.replace(".py", "")].SKIP_FRESH_TARGETS
+        except AttributeError:
+            enabled = None
+        if enabled is None or enabled is False:
+            return None
+        if enabled is not True:
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `SKIP_FRESH_TARGETS = {enabled}`; must be a boolean'  # noqa: E501
+            )
+        return StateStore(self.project_dir / '.compiled' / 'state')
+
+    def get_sql_cache(self,
+        run_context: Dict[Any, Any]
+    ) -> Optional[QueryCache]:
+        """
+        Get the cache of `hooks.sql` query results from prism_project.py. The cache is
+        only used if `SQL_CACHE = True`. Results expire after `SQL_CACHE_TTL_SECONDS`
+        (default 3600), and at most `SQL_CACHE_MAX_ENTRIES` (default 128) results are
+        kept in memory. If `SQL_CACHE_DIR` is specified, results are also stored there
+        as Parquet files, so that they can be reused by later runs.
+
+        args:
+            run_context: dictionary with run context variables
+        returns:
+            QueryCache, or None if the cache is disabled
+        """
+        try:
+            enabled = run_context[self.filename.replace(".py", "")].SQL_CACHE
+        except AttributeError:
+            enabled = None
+        if enabled is None or enabled is False:
+            return None
+        if enabled is not True:
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `SQL_CACHE = {enabled}`; must be a boolean'
+            )
+        try:
+            ttl_seconds = run_context[self.filename.replace(".py", "")].SQL_CACHE_TTL_SECONDS  # noqa: E501
+        except AttributeError:
+            ttl_seconds = None
+        if ttl_seconds is None:
+            ttl_seconds = DEFAULT_TTL_SECONDS
+        elif isinstance(ttl_seconds, bool) or not isinstance(ttl_seconds, (int, float)) or ttl_seconds <= 0:  # noqa: E501
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `SQL_CACHE_TTL_SECONDS = {ttl_seconds}`; must be a positive number'  # noqa: E501
+            )
+        try:
+            max_entries = run_context[self.filename.replace(".py", "")].SQL_CACHE_MAX_ENTRIES  # noqa: E501
+        except AttributeError:
+            max_entries = None
+        if max_entries is None:
+            max_entries = DEFAULT_MAX_ENTRIES
+        elif isinstance(max_entries, bool) or not isinstance(max_entries, int) or max_entries <= 0:  # noqa: E501
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `SQL_CACHE_MAX_ENTRIES = {max_entries}`; must be a positive integer'  # noqa: E501
+            )
+        try:
+            cache_dir = run_context[self.filename.replace(".py", "")].SQL_CACHE_DIR
+        except AttributeError:
+            cache_dir = None
+        if cache_dir is not None:
+            if not isinstance(cache_dir, (str, Path)):
+                raise prism.exceptions.InvalidProjectPyException(
+                    message=f'invalid value `SQL_CACHE_DIR = {cache_dir}`; must be a path'  # noqa: E501
+                )
+            cache_dir = self.project_dir / Path(cache_dir)
+        return QueryCache(ttl_seconds, max_entries, cache_dir)
+
+    def get_output_store(self,
+        run_context: Dict[Any, Any]
+    ) -> Optional[OutputStore]:
+        """
+        Get the store of memory-mapped task outputs from prism_project.py. The store is
+        only used if `OUTPUT_STORE = True`, in which case large DataFrame and ndarray
+        outputs are written to `OUTPUT_STORE_DIR` (default `.compiled/outputs`) and
+        downstream tasks reference memory-mapped views of them.
+
+        args:
+            run_context: dictionary with run context variables
+        returns:
+            OutputStore, or None if outputs are kept in memory
+        """
+        try:
+            enabled = run_context[self.filename.replace(".py", "")].OUTPUT_STORE
+        except AttributeError:
+            enabled = None
+        if enabled is None or enabled is False:
+            return None
+        if enabled is not True:
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `OUTPUT_STORE = {enabled}`; must be a boolean'
+            )
+        try:
+            store_dir = run_context[self.filename.replace(".py", "")].OUTPUT_STORE_DIR
+        except AttributeError:
+            store_dir = None
+        if store_dir is None:
+            store_dir = self.project_dir / '.compiled' / 'outputs'
+        elif not isinstance(store_dir, (str, Path)):
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `OUTPUT_STORE_DIR = {store_dir}`; must be a path'  # noqa: E501
+            )
+        return OutputStore(self.project_dir / Path(store_dir))
+
+    def get_evict_outputs(self,
+        run_context: Dict[Any, Any]
+    ) -> bool:
+        """
+        Get whether task outputs should be evicted from memory once all of their
+        downstream tasks have finished from prism_project.py. The outputs of tasks
+        without downstream tasks are always kept.
+
+        args:
+            run_context: dictionary with run context variables
+        returns:
+            True if `EVICT_OUTPUTS = True`
+        """
+        try:
+            enabled = run_context[self.filename.replace(".py", "")].EVICT_OUTPUTS
+        except AttributeError:
+            enabled = None
+        if enabled is None:
+            return False
+        if not isinstance(enabled, bool):
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `EVICT_OUTPUTS = {enabled}`; must be a boolean'
+            )
+        return enabled
+
+    def get_evicted_outputs_dir(self,
+        run_context: Dict[Any, Any]
+    ) -> Optional[Path]:
+        """
+        Get the directory to which evicted task outputs are spilled from
+        prism_project.py. Outputs are only spilled if `SPILL_EVICTED_OUTPUTS = True`, in
+        which case they can still be retrieved after the run (e.g., via the PrismDAG
+        client). Spilled outputs are stored in `.compiled/evicted`.
+
+        args:
+            run_context: dictionary with run context variables
+        returns:
+            spill directory, or None if evicted outputs are dropped
+        """
+        try:
+            enabled = run_context[self.filename.replace(".py", "")].SPILL_EVICTED_OUTPUTS  # noqa: E501
+        except AttributeError:
+            enabled = None
+        if enabled is None or enabled is False:
+            return None
+        if enabled is not True:
+            raise prism.exceptions.InvalidProjectPyException(
+                message=f'invalid value `SPILL_EVICTED_OUTPUTS = {enabled}`; must be a boolean'  # noqa: E501
+            )
+        return self.project_dir / '.compiled' / 'evicted'
+
     def load_profile_yml(self,
         profile_yml_path: Optional[Path]
     ) -> Dict[Any, Any]:
@@ -0,0 +1,355 @@
+"""
+Cache of `hooks.sql` query results. Results are kept in an in-memory LRU and,
+optionally, as Parquet files on disk so that they survive across runs. Entries expire
+after a TTL. Concurrent identical queries are coalesced, i.e., only one of them is sent
+to the warehouse and the others wait for its result ("single-flight").
+
+Table of Contents
+- Imports
+- Constants
+- Functions / utils
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import asyncio
+from collections import OrderedDict
+import hashlib
+import os
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import uuid
+
+# Third-party imports
+import pandas as pd
+
+
+#############
+# Constants #
+#############
+
+# Query results are stored in `{key}{ENTRY_SUFFIX}` in the cache directory
+ENTRY_SUFFIX = '.parquet'
+
+# First keyword of queries whose results can be cached
+READ_ONLY_KEYWORDS = ['select', 'with', 'show', 'describe', 'desc', 'explain']
+
+# Keywords of statements that write data. Queries that contain any of these aren't
+# cached, even if they start with a read-only keyword.
+WRITE_KEYWORDS = {
+    'insert', 'update', 'delete', 'merge', 'into', 'create', 'drop', 'alter',
+    'truncate', 'copy', 'grant', 'revoke', 'call', 'execute', 'unload'
+}
+
+# String literals and quoted identifiers. Whitespace within them is significant.
+QUOTED_PATTERN = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*"|`[^`]*`)""")
+
+# Defaults
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 128
+
+
+#####################
+# Functions / utils #
+#####################
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query so that queries that only differ in whitespace or in a trailing
+    semicolon share a cache entry. Whitespace within string literals and quoted
+    identifiers is preserved, and so is case, since string literals are
+    case-sensitive.
+
+    args:
+        query: SQL query
+    returns:
+        normalized query
+    """
+    # Whether a backslash escapes a quote, and whether `$` starts a dollar-quoted
+    # string, depends on the SQL dialect. Literals can't be delimited reliably in
+    # queries that contain either.
+    if '\\' in query or '$' in query:
+        return query.strip().rstrip(';').strip()
+
+    # Splitting on the pattern's group places the quoted parts at odd indices
+    parts = QUOTED_PATTERN.split(query)
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r'\s+', ' ', parts[i])
+    return ''.join(parts).strip().rstrip(';').strip()
+
+
+def is_read_only(query: str) -> bool:
+    """
+    Whether a query only reads data. Only the results of such queries are cached, so
+    that, e.g., an `INSERT` is never skipped. Queries that contain several statements
+    are never considered read-only, and neither are queries that contain a keyword
+    that writes data (e.g., `SELECT ... INTO` or a CTE followed by a `DELETE`).
+
+    args:
+        query: SQL query
+    returns:
+        True if the query is a single statement that starts with SELECT, WITH, SHOW,
+        DESCRIBE, or EXPLAIN and doesn't write data
+    """
+    # Remove literals and quoted identifiers, so that their contents aren't mistaken
+    # for keywords. If they can't be delimited reliably, then they're kept; this can
+    # only cause a query to not be cached.
+    query = query.strip().rstrip(';')
+    if '\\' not in query and '$' not in query:
+        query = QUOTED_PATTERN.sub("''", query)
+    if ';' in query:
+        return False
+    first = re.match(r'\s*\(*\s*([A-Za-z_]+)', query)
+    if first is None or first.group(1).lower() not in READ_ONLY_KEYWORDS:
+        return False
+    words = re.findall(r'[A-Za-z_]+', query)
+    return not any(w.lower() in WRITE_KEYWORDS for w in words)
+
+
+def compute_query_key(adapter_name: str, adapter_identity: Any, query: str) -> str:
+    """
+    Compute the cache key of a query
+
+    args:
+        adapter_name: name of the adapter in the profile YML
+        adapter_identity: adapter configuration, so that adapters pointing to
+            different warehouses don't share entries
+        query: SQL query
+    returns:
+        hex digest
+    """
+    h = hashlib.sha256()
+    for part in [adapter_name, repr(adapter_identity), normalize_query(query)]:
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def _copy_result(result: Any) -> Any:
+    return result.copy() if isinstance(result, pd.DataFrame) else result
+
+
+####################
+# Class definition #
+####################
+
+class _Flight:
+    """
+    In-progress query that other callers can wait on
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[pd.DataFrame] = None
+        self.err: Optional[BaseException] = None
+
+
+class QueryCache:
+    """
+    Two-tier cache of query results. Only DataFrames are cached, and each caller gets
+    its own copy, so tasks can modify the results of their queries.
+    """
+
+    def __init__(self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Optional[Path] = None
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        self._memory: "OrderedDict[str, Tuple[float, pd.DataFrame]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[Tuple[int, str], "asyncio.Future[Any]"] = {}
+
+    def _path(self, cache_dir: Path, key: str) -> Path:
+        return cache_dir / f'{key}{ENTRY_SUFFIX}'
+
+    # ----------------------------------------------------------------------------------
+    # Cache tiers
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Get a cached result from memory or, failing that, from disk
+
+        args:
+            key: cache key
+        returns:
+            copy of the cached DataFrame, or None if `key` isn't cached or expired
+        """
+        df = self._get_memory(key)
+        if df is not None or self.cache_dir is None:
+            return df
+        return self._get_disk(key)
+
+    def _get_memory(self, key: str) -> Optional[pd.DataFrame]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key, None)
+            if entry is not None:
+                expires_at, df = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    return df.copy()
+                del self._memory[key]
+        return None
+
+    def _get_disk(self, key: str) -> Optional[pd.DataFrame]:
+        # Entries on disk expire based on when they were written
+        now = time.time()
+        if self.cache_dir is None:
+            return None
+        path = self._path(self.cache_dir, key)
+        try:
+            written_at = path.stat().st_mtime
+            if written_at + self.ttl_seconds <= now:
+                return None
+            df = pd.read_parquet(path)
+
+        # Missing or unreadable entries are treated as misses
+        except Exception:
+            return None
+        self._put_memory(key, df, written_at + self.ttl_seconds)
+        return df.copy()
+
+    def _put_memory(self, key: str, df: pd.DataFrame, expires_at: float):
+        with self._lock:
+            self._memory[key] = (expires_at, df)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def put(self, key: str, df: Any):
+        """
+        Cache a result in memory and, if a cache directory is specified, on disk.
+        Results that aren't DataFrames aren't cached, and failing to write a result to
+        disk (e.g., because no Parquet engine is installed) never fails the query.
+
+        args:
+            key: cache key
+            df: query result
+        """
+        if not isinstance(df, pd.DataFrame):
+            return
+        self._put_memory(key, df.copy(), time.time() + self.ttl_seconds)
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            return
+        tmp_path = cache_dir / f'.{key}.{uuid.uuid4().hex}.tmp'
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, self._path(cache_dir, key))
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except Exception:
+                pass
+
+    # ----------------------------------------------------------------------------------
+    # Single-flight
+
+    def get_or_execute(self, key: str, execute: Callable[[], Any]) -> Any:
+        """
+        Get a cached result or execute the query. If the same query is already being
+        executed by another thread, then wait for its result instead.
+
+        args:
+            key: cache key
+            execute: function that executes the query
+        returns:
+            query result
+        """
+        df = self.get(key)
+        if df is not None:
+            return df
+        with self._lock:
+            existing = self._flights.get(key, None)
+            flight = _Flight() if existing is None else existing
+            if existing is None:
+                self._flights[key] = flight
+        if existing is not None:
+            flight.done.wait()
+            if flight.err is not None:
+                raise flight.err
+            return _copy_result(flight.result)
+        try:
+            result = execute()
+            self.put(key, result)
+
+            # The followers copy the flight's result after it's done, so it must be a
+            # private copy. Otherwise, the leader's caller could modify the result while
+            # it's being copied.
+            flight.result = _copy_result(result)
+            return result
+        except BaseException as err:
+            flight.err = err
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def aget_or_execute(self,
+        key: str,
+        execute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Get a cached result or await the query. If the same query is already being
+        awaited on the current event loop, then wait for its result instead. If the
+        caller awaiting the query is cancelled (e.g., because its task timed out), then
+        one of the waiting callers awaits the query instead.
+
+        args:
+            key: cache key
+            execute: coroutine function that executes the query
+        returns:
+            query result
+        """
+        loop = asyncio.get_running_loop()
+        df = self._get_memory(key)
+
+        # Read the result from disk without blocking the event loop
+        if df is None and self.cache_dir is not None:
+            df = await loop.run_in_executor(None, self._get_disk, key)
+        if df is not None:
+            return df
+        flight_key = (id(loop), key)
+        while True:
+            future = self._async_flights.get(flight_key, None)
+            if future is None:
+                break
+
+            # Unlike awaiting the future, `asyncio.wait` doesn't raise if the future is
+            # cancelled, only if this caller is
+            await asyncio.wait([future])
+            if not future.cancelled():
+                return _copy_result(future.result())
+        future = loop.create_future()
+        self._async_flights[flight_key] = future
+        try:
+            result = await execute()
+            future.set_result(_copy_result(result))
+
+            # Write the result to disk without blocking the event loop
+            await loop.run_in_executor(None, self.put, key, result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+
+            # Mark the exception as retrieved if no other caller was waiting
+            future.exception()
+            raise
+        finally:
+            del self._async_flights[flight_key]
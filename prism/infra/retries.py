@@ -0,0 +1,98 @@
+"""
+RetryPolicy class
+
+Table of Contents
+- Imports
+- Functions / utils
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from dataclasses import dataclass, field
+import random
+from typing import List, Optional
+
+
+#####################
+# Functions / utils #
+#####################
+
+def get_error_classes(err: Optional[BaseException]) -> List[str]:
+    """
+    Get the names of the class of `err` and of its base classes. Both the bare name
+    (e.g., `ConnectionError`) and the fully-qualified name (e.g.,
+    `prism.exceptions.RuntimeException`) of each class are included.
+
+    args:
+        err: exception
+    returns:
+        list of class names
+    """
+    if err is None:
+        return []
+    names = []
+    for cls in type(err).__mro__:
+        names += [cls.__name__, f'{cls.__module__}.{cls.__qualname__}']
+    return names
+
+
+####################
+# Class definition #
+####################
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy for a task. The delay before the n-th retry is
+
+        RETRY_DELAY_SECONDS * RETRY_BACKOFF ** (n - 1)
+
+    capped at RETRY_MAX_DELAY_SECONDS and randomly scaled by up to ±RETRY_JITTER, so
+    that tasks that fail together (e.g., because a warehouse is unavailable) don't all
+    retry at the same instant. If RETRY_ON is specified, then only errors whose class
+    (or one of its base classes) is listed are retried; other errors fail immediately.
+    """
+    retries: int = 0
+    delay_seconds: float = 0
+    backoff: float = 1
+    max_delay_seconds: Optional[float] = None
+    jitter: float = 0
+    retry_on: List[str] = field(default_factory=list)
+
+    def should_retry(self, attempt: int, error_classes: List[str]) -> bool:
+        """
+        Whether to retry a task after attempt number `attempt` failed
+
+        args:
+            attempt: attempt number, starting at 1
+            error_classes: names of the class of the task's error and of its base
+                classes; see `get_error_classes`
+        returns:
+            True if the task should be retried
+        """
+        if attempt > self.retries:
+            return False
+        if len(self.retry_on) == 0:
+            return True
+        return any(name in self.retry_on for name in error_classes)
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Get the delay (in seconds) before retrying a task after attempt number `attempt`
+        failed
+
+        args:
+            attempt: attempt number, starting at 1
+        returns:
+            delay in seconds
+        """
+        delay = self.delay_seconds * self.backoff ** (attempt - 1)
+        if self.max_delay_seconds is not None:
+            delay = min(delay, self.max_delay_seconds)
+        if self.jitter > 0:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(delay, 0)
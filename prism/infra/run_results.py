@@ -0,0 +1,66 @@
+"""
+Prism RunResults class
+
+Table of Contents
+- Imports
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, cast
+
+
+####################
+# Class definition #
+####################
+
+class RunResults:
+    """
+    Class used to persist metadata on previous runs (e.g., how long each task took to
+    execute). The metadata is stored in `run_results.json` in the compiled directory.
+    """
+
+    def __init__(self, compiled_dir: Path):
+        self.compiled_dir = compiled_dir
+        self.run_results_dict: Dict[str, Any] = {"durations": {}}
+        if Path(self.compiled_dir / 'run_results.json').is_file():
+            self.run_results_dict.update(self.json_load(self.compiled_dir))
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        return cast(Dict[str, float], self.run_results_dict["durations"])
+
+    def get_duration(self, module_name: str) -> Optional[float]:
+        return self.durations.get(module_name, None)
+
+    def update_durations(self, durations: Dict[str, float]):
+        """
+        Update the durations with the durations from the latest run. Tasks that weren't
+        executed in the latest run keep their previous duration.
+
+        args:
+            durations: dictionary mapping module name --> duration in seconds
+        """
+        self.durations.update(durations)
+
+    def json_dump(self, path: Path):
+        with open(path / 'run_results.json', 'w') as f:
+            json.dump(self.run_results_dict, f, sort_keys=False)
+        f.close()
+
+    def json_load(self, path: Path):
+        try:
+            with open(path / 'run_results.json', 'r') as f:
+                run_results = json.loads(f.read())
+            f.close()
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(run_results, dict):
+            return {}
+        return run_results
@@ -0,0 +1,277 @@
+"""
+TaskScheduler class
+
+Table of Contents
+- Imports
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import heapq
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+####################
+# Class definition #
+####################
+
+class TaskScheduler:
+    """
+    Ready-queue scheduler for DAG execution. The scheduler keeps track of the number of
+    unfinished upstream tasks for each task (i.e., its in-degree). A task is released
+    into the ready queue as soon as all of its upstream tasks have completed, so
+    independent branches of the DAG never wait on one another.
+
+    When more tasks are ready than there are workers, tasks are dispatched in the
+    following order:
+        1. Tasks with a higher explicit priority (i.e., the `PRIORITY` variable)
+        2. Tasks with a longer critical path, i.e., the longest chain of downstream
+           tasks weighted by each task's duration in previous runs
+        3. Tasks that appear earlier in the topological sort
+
+    Tasks can also declare the resources they use (i.e., the `RESOURCES` variable),
+    e.g., an adapter or a custom pool like `warehouse_heavy`. A task is only dispatched
+    if none of its resources are already used by the maximum number of running tasks
+    allowed for that resource. Ready tasks waiting on a resource are set aside until the
+    resource is released, so they don't hold up tasks that don't need it.
+    """
+
+    def __init__(self,
+        task_refs: Dict[str, List[str]],
+        durations: Optional[Dict[str, float]] = None,
+        priorities: Optional[Dict[str, int]] = None,
+        resources: Optional[Dict[str, List[str]]] = None,
+        resource_limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        args:
+            task_refs: dictionary mapping task name --> names of upstream tasks. The
+                insertion order of the dictionary should be a topological sort of the
+                DAG; it is used to break ties between ready tasks.
+            durations: dictionary mapping task name --> duration (in seconds) from
+                previous runs. If None, then tasks are not prioritized by their critical
+                path.
+            priorities: dictionary mapping task name --> explicit priority
+            resources: dictionary mapping task name --> names of resources used by the
+                task
+            resource_limits: dictionary mapping resource name --> maximum number of
+                running tasks that can use the resource. Resources without a limit can
+                be used by any number of tasks.
+        """
+        self.order = {name: idx for idx, name in enumerate(task_refs.keys())}
+        self.priorities = {} if priorities is None else priorities
+
+        # Upstream tasks that are not part of the DAG being executed are considered
+        # complete. This happens, for example, when the user runs a task and all of its
+        # successors with `--all-downstream`, and a successor references some other
+        # task that wasn't selected.
+        self.in_degree: Dict[str, int] = {}
+        self.successors: Dict[str, List[str]] = {name: [] for name in task_refs.keys()}
+        for name, refs in task_refs.items():
+            upstream = [r for r in dict.fromkeys(refs) if r in self.order]
+            self.in_degree[name] = len(upstream)
+            for ref in upstream:
+                self.successors[ref].append(name)
+
+        # Critical path lengths
+        if durations is None:
+            self.ranks = {name: 0.0 for name in self.order}
+        else:
+            self.ranks = self.compute_ranks(durations)
+
+        # Resources. `resource_usage` tracks the number of running tasks using each
+        # resource, and `waiting` tracks the ready tasks that are waiting for each
+        # resource to be released.
+        self.resources = {} if resources is None else resources
+        self.resource_limits = {} if resource_limits is None else resource_limits
+        self.resource_usage: Dict[str, int] = {}
+        self.waiting: Dict[str, List[Tuple[int, float, int, str]]] = {}
+        self.held: Dict[str, List[str]] = {}
+
+        # Tasks waiting to be retried, as a heap of (time at which the task can be
+        # retried, topological index, task name)
+        self.delayed: List[Tuple[float, int, str]] = []
+
+        # Ready queue
+        self.ready: List[Tuple[int, float, int, str]] = []
+        for name, in_degree in self.in_degree.items():
+            if in_degree == 0:
+                self.push_ready(name)
+
+        # Tasks that have not yet completed
+        self.num_remaining = len(self.order)
+
+        # Tasks that will not run because an upstream task failed
+        self.skipped: Dict[str, str] = {}
+
+    def compute_ranks(self, durations: Dict[str, float]) -> Dict[str, float]:
+        """
+        Compute the length of the longest path from each task to the end of the DAG,
+        weighted by task duration. Tasks without a duration from a previous run are
+        assumed to take the average duration of the tasks that have one.
+
+        args:
+            durations: dictionary mapping task name --> duration (in seconds)
+        returns:
+            dictionary mapping task name --> critical path length
+        """
+        known = [durations[name] for name in self.order if name in durations]
+        default_duration = sum(known) / len(known) if len(known) > 0 else 1.0
+
+        # Iterate through the tasks in reverse topological order, so that the rank of
+        # each successor is computed before the rank of the task itself.
+        ranks: Dict[str, float] = {}
+        for name in sorted(self.order, key=self.order.__getitem__, reverse=True):
+            downstream = [ranks[s] for s in self.successors[name]]
+            ranks[name] = durations.get(name, default_duration) + max(downstream, default=0.0)  # noqa: E501
+        return ranks
+
+    def push_ready(self, name: str):
+        """
+        Add task `name` to the ready queue
+        """
+        heapq.heappush(
+            self.ready,
+            (-self.priorities.get(name, 0), -self.ranks[name], self.order[name], name)
+        )
+
+    def get_blocking_resource(self, name: str) -> Optional[str]:
+        """
+        Get a resource used by task `name` that is at its limit, if any
+        """
+        for resource in self.resources.get(name, []):
+            limit = self.resource_limits.get(resource, None)
+            if limit is not None and self.resource_usage.get(resource, 0) >= limit:
+                return resource
+        return None
+
+    def set_aside_blocked(self):
+        """
+        Move ready tasks that are waiting on a resource from the top of the ready queue
+        to the resource's waiting list, so that the next task in the ready queue can be
+        dispatched
+        """
+        while len(self.ready) > 0:
+            blocking_resource = self.get_blocking_resource(self.ready[0][-1])
+            if blocking_resource is None:
+                return
+            entry = heapq.heappop(self.ready)
+            self.waiting.setdefault(blocking_resource, []).append(entry)
+
+    def schedule_retry(self, name: str, delay: float):
+        """
+        Place task `name` back in the ready queue after `delay` seconds
+
+        args:
+            name: name of task to retry
+            delay: delay in seconds
+        """
+        heapq.heappush(
+            self.delayed, (time.monotonic() + delay, self.order[name], name)
+        )
+
+    def release_due_retries(self):
+        """
+        Move tasks whose retry delay has elapsed into the ready queue
+        """
+        now = time.monotonic()
+        while len(self.delayed) > 0 and self.delayed[0][0] <= now:
+            _, _, name = heapq.heappop(self.delayed)
+            self.push_ready(name)
+
+    def time_until_next_retry(self) -> Optional[float]:
+        """
+        Number of seconds until the next task waiting to be retried can be placed in the
+        ready queue, or None if no tasks are waiting to be retried
+        """
+        if len(self.delayed) == 0:
+            return None
+        return max(self.delayed[0][0] - time.monotonic(), 0.0)
+
+    def has_ready(self) -> bool:
+        """
+        Whether there is at least one task whose upstream tasks have all completed and
+        whose resources are available
+        """
+        self.release_due_retries()
+        self.set_aside_blocked()
+        return len(self.ready) > 0
+
+    def pop_ready(self) -> str:
+        """
+        Remove the next task from the ready queue, acquire its resources, and return
+        its name
+        """
+        self.release_due_retries()
+        self.set_aside_blocked()
+        name = heapq.heappop(self.ready)[-1]
+        self.held[name] = self.resources.get(name, [])
+        for resource in self.held[name]:
+            self.resource_usage[resource] = self.resource_usage.get(resource, 0) + 1
+        return name
+
+    def release(self, name: str):
+        """
+        Release the resources held by task `name`. Tasks waiting on these resources are
+        placed back in the ready queue. Releasing a task more than once has no effect.
+
+        args:
+            name: name of task
+        """
+        for resource in self.held.pop(name, []):
+            self.resource_usage[resource] -= 1
+            for entry in self.waiting.pop(resource, []):
+                heapq.heappush(self.ready, entry)
+
+    def mark_done(self, name: str) -> List[str]:
+        """
+        Mark task `name` as complete, release its resources, and release any
+        successors whose upstream tasks have now all completed
+
+        args:
+            name: name of completed task
+        returns:
+            names of tasks released into the ready queue
+        """
+        self.release(name)
+        self.num_remaining -= 1
+        released = []
+        for successor in self.successors[name]:
+            self.in_degree[successor] -= 1
+            if self.in_degree[successor] == 0:
+                self.push_ready(successor)
+                released.append(successor)
+        return released
+
+    def skip_downstream(self, name: str) -> List[str]:
+        """
+        Mark every task downstream of failed task `name` as skipped. Skipped tasks are
+        never released into the ready queue; the rest of the DAG is unaffected.
+
+        args:
+            name: name of failed task
+        returns:
+            names of newly skipped tasks, in topological order
+        """
+        newly_skipped = []
+        stack = list(self.successors[name])
+        while len(stack) > 0:
+            successor = stack.pop()
+            if successor in self.skipped:
+                continue
+            self.skipped[successor] = name
+            newly_skipped.append(successor)
+            stack.extend(self.successors[successor])
+        self.num_remaining -= len(newly_skipped) + 1
+        return sorted(newly_skipped, key=lambda s: self.order[s])
+
+    def is_finished(self) -> bool:
+        """
+        Whether all tasks have completed
+        """
+        return self.num_remaining == 0
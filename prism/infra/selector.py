@@ -0,0 +1,226 @@
+"""
+Graph selectors for the `--modules` argument. In addition to module paths and `dir/*`,
+modules can be selected with:
+    - `+module.py`: the module and all modules upstream of it
+    - `module.py+`: the module and all modules downstream of it
+    - `tag:nightly`: modules with `nightly` in their `TAGS` variable
+Selectors separated by spaces are combined with a union, and selectors joined by commas
+are combined with an intersection. For example, `--modules tag:nightly,+module04.py
+module05.py` selects the nightly modules upstream of module04.py, plus module05.py.
+
+Selectors are resolved with a ReachabilityIndex, which stores the ancestors and the
+descendants of each module as bitsets. Selecting everything upstream or downstream of a
+set of modules is a union of bitsets, rather than a new traversal of the DAG.
+
+Table of Contents
+- Imports
+- Constants
+- Functions / utils
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import fnmatch
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+# Prism-specific imports
+import prism.exceptions
+from prism.infra.dag import Dag
+
+
+#############
+# Constants #
+#############
+
+SELECTOR_METHODS = ['tag']
+
+
+#####################
+# Functions / utils #
+#####################
+
+def is_selector(arg: str) -> bool:
+    """
+    Whether a `--modules` argument uses the selector syntax, as opposed to a module
+    path or `dir/*`
+
+    args:
+        arg: `--modules` argument
+    returns:
+        True if `arg` is a selector
+    """
+    return arg.startswith('+') or arg.endswith('+') or ',' in arg or ':' in arg \
+        or len(arg.split()) > 1
+
+
+####################
+# Class definition #
+####################
+
+class ReachabilityIndex:
+    """
+    Ancestors and descendants of each module in a DAG. Modules are numbered by their
+    position in a topological sort, and the ancestors (or descendants) of a module are
+    stored as an integer whose i-th bit is set if the i-th module is an ancestor (or
+    descendant). The index is built in one pass over the topological sort in each
+    direction, since a module's ancestors are the union of its predecessors' ancestors.
+    """
+
+    def __init__(self, dag: Dag):
+        self.dag = dag
+        self.nodes = dag.topological_sort()
+        self.positions = {node: i for i, node in enumerate(self.nodes)}
+
+        self.ancestors: List[int] = []
+        for node in self.nodes:
+            mask = 0
+            for pred in dag.predecessors(node):
+                i = self.positions[pred]
+                mask |= self.ancestors[i] | (1 << i)
+            self.ancestors.append(mask)
+
+        self.descendants: List[int] = [0] * len(self.nodes)
+        for i in reversed(range(len(self.nodes))):
+            mask = 0
+            for succ in dag.successors(self.nodes[i]):
+                j = self.positions[succ]
+                mask |= self.descendants[j] | (1 << j)
+            self.descendants[i] = mask
+
+    def to_mask(self, nodes: Iterable[Path]) -> int:
+        mask = 0
+        for node in nodes:
+            if node not in self.positions:
+                raise prism.exceptions.CompileException(
+                    message=f'module `{str(node)}` not found in project'
+                )
+            mask |= 1 << self.positions[node]
+        return mask
+
+    def _bits(self, mask: int) -> List[int]:
+        # The binary representation of `mask`, from the lowest bit to the highest
+        return [i for i, bit in enumerate(bin(mask)[:1:-1]) if bit == '1']
+
+    def to_nodes(self, mask: int) -> List[Path]:
+        """
+        Get the nodes in `mask`, in topological order
+        """
+        return [self.nodes[i] for i in self._bits(mask)]
+
+    def upstream(self, mask: int) -> int:
+        """
+        Get the nodes in `mask` and all nodes upstream of them
+        """
+        result = mask
+        for i in self._bits(mask):
+            result |= self.ancestors[i]
+        return result
+
+    def downstream(self, mask: int) -> int:
+        """
+        Get the nodes in `mask` and all nodes downstream of them
+        """
+        result = mask
+        for i in self._bits(mask):
+            result |= self.descendants[i]
+        return result
+
+
+class ModuleSelector:
+    """
+    Class for resolving `--modules` selectors against a ReachabilityIndex
+    """
+
+    def __init__(self,
+        index: ReachabilityIndex,
+        tags: Dict[Path, List[str]]
+    ):
+        """
+        args:
+            index: ReachabilityIndex of the project's DAG
+            tags: dictionary mapping module --> tags declared in the module
+        """
+        self.index = index
+        self.tag_masks: Dict[str, int] = {}
+        for module, module_tags in tags.items():
+            for tag in module_tags:
+                self.tag_masks[tag] = self.tag_masks.get(tag, 0) | self.index.to_mask([module])  # noqa: E501
+
+    def select(self, selectors: List[str]) -> List[Path]:
+        """
+        Get the modules matched by `selectors`
+
+        args:
+            selectors: `--modules` arguments
+        returns:
+            selected modules, in topological order
+        """
+        mask = 0
+        for selector in selectors:
+            for union_term in selector.split():
+                intersection = self.resolve(union_term.split(',')[0])
+                for atom in union_term.split(',')[1:]:
+                    intersection &= self.resolve(atom)
+                mask |= intersection
+        return self.index.to_nodes(mask)
+
+    def resolve(self, atom: str) -> int:
+        """
+        Get the modules matched by a single selector, e.g., `+module.py` or
+        `tag:nightly`
+
+        args:
+            atom: selector without unions or intersections
+        returns:
+            bitset of matched modules
+        """
+        value = atom
+        upstream = value.startswith('+')
+        if upstream:
+            value = value[1:]
+        downstream = value.endswith('+')
+        if downstream:
+            value = value[:-1]
+        if value == '':
+            raise prism.exceptions.CompileException(
+                message=f'invalid --modules argument `{atom}`'
+            )
+
+        # Methods, e.g., `tag:nightly`
+        if ':' in value:
+            method, _, method_value = value.partition(':')
+            if method not in SELECTOR_METHODS:
+                methods_str = ', '.join([f'`{m}`' for m in SELECTOR_METHODS])
+                raise prism.exceptions.CompileException(
+                    message=f'invalid selector method `{method}` in `{atom}`; must be one of {methods_str}'  # noqa: E501
+                )
+            mask = self.tag_masks.get(method_value, 0)
+
+        # Module paths, with `*` matching any number of characters
+        else:
+            if '*' in value:
+                matches = [
+                    node for node in self.index.nodes
+                    if fnmatch.fnmatchcase(str(node), value)
+                ]
+            else:
+                matches = [Path(value)] if Path(value) in self.index.positions else []
+            if len(matches) == 0:
+                raise prism.exceptions.CompileException(
+                    message=f'invalid --modules argument `{atom}`; no modules match `{value}`'  # noqa: E501
+                )
+            mask = self.index.to_mask(matches)
+
+        # Both closures are taken from the matched modules, so `+module.py+` doesn't
+        # select the descendants of the module's ancestors
+        selected = mask
+        if upstream:
+            selected |= self.index.upstream(mask)
+        if downstream:
+            selected |= self.index.downstream(mask)
+        return selected
@@ -0,0 +1,143 @@
+"""
+Functions for shipping task outputs between processes
+
+Table of Contents
+- Imports
+- Constants
+- Class definition
+- Functions / utils
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from dataclasses import dataclass, field
+import mmap
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from typing import Any, List, Optional
+
+# Prism-specific imports
+import prism.exceptions
+
+
+#############
+# Constants #
+#############
+
+# Pickle protocol 5 (Python 3.8+) supports out-of-band buffers. With older protocols,
+# objects are always pickled in-band.
+OUT_OF_BAND_PROTOCOL = 5
+SUPPORTS_OUT_OF_BAND = pickle.HIGHEST_PROTOCOL >= OUT_OF_BAND_PROTOCOL
+
+# Objects whose out-of-band buffers are smaller than this are sent in-band; writing a
+# file for them isn't worth it.
+OUT_OF_BAND_MIN_BYTES = 1024 * 1024
+
+
+####################
+# Class definition #
+####################
+
+@dataclass
+class SerializedObject:
+    """
+    Pickled object. Large buffers (e.g., the underlying arrays of a DataFrame or an
+    ndarray) are written to `buffer_path` rather than included in `data`, so that the
+    object's metadata can be sent cheaply through a pipe and the buffers can be
+    memory-mapped by the receiver.
+    """
+    data: bytes
+    buffer_path: Optional[str] = None
+    buffer_sizes: List[int] = field(default_factory=list)
+
+
+#####################
+# Functions / utils #
+#####################
+
+def dump_object(obj: Any, spill_dir: Path) -> SerializedObject:
+    """
+    Serialize `obj`. If the object exposes large buffers via pickle protocol 5, then
+    write these to a file in `spill_dir`.
+
+    args:
+        obj: object to serialize
+        spill_dir: directory in which to write out-of-band buffers
+    returns:
+        SerializedObject
+    """
+    if not SUPPORTS_OUT_OF_BAND:
+        return SerializedObject(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+    buffers: List[pickle.PickleBuffer] = []  # type: ignore
+    data = pickle.dumps(
+        obj, protocol=OUT_OF_BAND_PROTOCOL, buffer_callback=buffers.append
+    )
+    raw_buffers = [b.raw() for b in buffers]
+    total_size = sum(b.nbytes for b in raw_buffers)
+    if total_size < OUT_OF_BAND_MIN_BYTES:
+        return SerializedObject(pickle.dumps(obj, protocol=OUT_OF_BAND_PROTOCOL))
+
+    # Write the buffers contiguously
+    fd, buffer_path = tempfile.mkstemp(dir=spill_dir, suffix='.buffers')
+    with os.fdopen(fd, 'wb') as f:
+        for raw in raw_buffers:
+            f.write(raw)
+    return SerializedObject(data, buffer_path, [b.nbytes for b in raw_buffers])
+
+
+def load_object(serialized: SerializedObject, remove: bool = True) -> Any:
+    """
+    Deserialize an object created by `dump_object`. Out-of-band buffers are
+    memory-mapped copy-on-write, so large arrays are not copied unless they are
+    modified.
+
+    args:
+        serialized: SerializedObject
+        remove: whether to remove the buffer file once it has been mapped. This should
+            be False if the same SerializedObject will be loaded more than once.
+    returns:
+        deserialized object
+    """
+    if serialized.buffer_path is None:
+        return pickle.loads(serialized.data)
+
+    try:
+        with open(serialized.buffer_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        view = memoryview(mapped)
+        buffers = []
+        offset = 0
+        for size in serialized.buffer_sizes:
+            buffers.append(view[offset:offset + size])
+            offset += size
+        return pickle.loads(serialized.data, buffers=buffers)  # type: ignore
+    except OSError as err:
+        raise prism.exceptions.RuntimeException(
+            message=f'could not load task output from `{serialized.buffer_path}`: {err}'  # noqa: E501
+        )
+    finally:
+        if remove and Path(serialized.buffer_path).is_file():
+            os.unlink(serialized.buffer_path)
+
+
+def is_picklable(obj: Any) -> bool:
+    """
+    Whether `obj` can be pickled, e.g., whether classes defined in a task's module can
+    be sent to other processes
+
+    args:
+        obj: object
+    returns:
+        True if `obj` can be pickled
+    """
+    try:
+        pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return False
+    return True
@@ -0,0 +1,241 @@
+"""
+On-disk store of the state of each task's targets and inputs, used to skip tasks whose
+targets are already up to date (similar to `make`). After a task with a target runs, the
+store records the size, modification time, and hash of its target files, of the target
+files of its upstream tasks, and of its declared input files, along with a hash of the
+module's source. On the next run, the task is skipped if its targets still exist and
+none of these changed.
+
+Modification times are only used to avoid re-hashing files that haven't been touched.
+If a file's size or modification time changed, its hash is recomputed, so touching a
+file without changing its contents doesn't invalidate the task, and a file replaced
+with an older one does.
+
+Table of Contents
+- Imports
+- Functions / utils
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import uuid
+
+# Prism-specific imports
+import prism.constants
+
+
+#####################
+# Functions / utils #
+#####################
+
+def hash_path(path: Path) -> Optional[str]:
+    """
+    Hash the contents of a file, or of all files in a directory (e.g., the target of
+    a `target_iterator`)
+
+    args:
+        path: path to file or directory
+    returns:
+        hex digest, or None if `path` doesn't exist
+    """
+    h = hashlib.sha256()
+    if path.is_file():
+        files = [path]
+    elif path.is_dir():
+        files = sorted(p for p in path.rglob('*') if p.is_file())
+    else:
+        return None
+    try:
+        for file in files:
+            h.update(str(file.relative_to(path)).encode('utf-8'))
+            h.update(b'\0')
+            with open(file, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def get_target_paths(output: Any) -> Optional[List[str]]:
+    """
+    Get the paths of a task's targets from its output. Tasks with a target output the
+    target's location, or a list of locations if the task has several targets.
+
+    args:
+        output: task output
+    returns:
+        list of paths, or None if the output isn't the location of local files
+    """
+    locs = output if isinstance(output, (list, tuple)) else [output]
+    if len(locs) == 0 or not all(isinstance(loc, (str, Path)) for loc in locs):
+        return None
+    return [str(loc) for loc in locs]
+
+
+####################
+# Class definition #
+####################
+
+class StateStore:
+    """
+    Directory of task states, with one JSON file per task so that tasks executed in
+    other processes (or by distributed workers) can record their state concurrently
+    """
+
+    def __init__(self, state_dir: Path):
+        self.state_dir = Path(state_dir)
+
+    def _path(self, name: str) -> Path:
+        return self.state_dir / f'{name.replace("/", "_")}.json'
+
+    def file_state(self,
+        path: Union[str, Path],
+        previous: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the size, modification time, and hash of a file or directory. If the size
+        and modification time match `previous`, then the hash isn't recomputed.
+
+        args:
+            path: path to file or directory
+            previous: previously recorded state of `path`
+        returns:
+            dictionary with `size`, `mtime_ns`, and `hash`, or None if `path` doesn't
+            exist
+        """
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        # Directories are always re-hashed, since their modification time doesn't
+        # reflect changes to nested files
+        size_mtime = [stat.st_size, stat.st_mtime_ns]
+        if path.is_file() and previous is not None and previous.get("stat") == size_mtime:  # noqa: E501
+            return previous
+        file_hash = hash_path(path)
+        if file_hash is None:
+            return None
+        return {"stat": size_mtime, "hash": file_hash}
+
+    def get_state(self,
+        source_hash: str,
+        targets: List[str],
+        upstream: Dict[str, Optional[List[str]]],
+        inputs: List[str],
+        previous: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the current state of a task
+
+        args:
+            source_hash: hash of the module's source
+            targets: paths of the task's targets
+            upstream: dictionary mapping upstream task --> paths of its targets, or
+                None if the upstream task doesn't have local targets
+            inputs: paths of the task's declared input files
+            previous: previously recorded state of the task, used to avoid re-hashing
+                unchanged files
+        returns:
+            state as a dictionary, or None if the state can't be determined (e.g.,
+            because a file doesn't exist or an upstream task has no local targets)
+        """
+        previous_files = {} if previous is None else previous.get("files", {})
+        paths = list(targets) + list(inputs)
+        upstream_paths: Dict[str, List[str]] = {}
+        for ref, ref_paths in upstream.items():
+            if ref_paths is None:
+                return None
+            upstream_paths[ref] = sorted(ref_paths)
+            paths.extend(ref_paths)
+        files = {}
+        for path in paths:
+            state = self.file_state(path, previous_files.get(path, None))
+            if state is None:
+                return None
+            files[path] = state
+        return {
+            "version": prism.constants.VERSION,
+            "source_hash": source_hash,
+            "targets": sorted(targets),
+            "upstream": upstream_paths,
+            "inputs": sorted(inputs),
+            "files": files,
+        }
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the recorded state of a task
+
+        args:
+            name: task name
+        returns:
+            state as a dictionary, or None if the task has no recorded state
+        """
+        try:
+            with open(self._path(name), 'r') as f:
+                state = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) else None
+
+    def put(self, name: str, state: Optional[Dict[str, Any]]):
+        """
+        Record the state of a task. If `state` is None, any recorded state is removed,
+        so the task won't be skipped on the next run. Failing to record the state never
+        fails the run.
+
+        args:
+            name: task name
+            state: state returned by `get_state`
+        """
+        path = self._path(name)
+        try:
+            if state is None:
+                if path.exists():
+                    os.unlink(path)
+                return
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_dir / f'.{path.name}.{uuid.uuid4().hex}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f, sort_keys=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+    def is_fresh(self, name: str, state: Optional[Dict[str, Any]]) -> bool:
+        """
+        Whether a task's targets are up to date, i.e., its current state matches its
+        recorded state
+
+        args:
+            name: task name
+            state: current state returned by `get_state`
+        returns:
+            True if the task can be skipped
+        """
+        if state is None:
+            return False
+        previous = self.get(name)
+        if previous is None:
+            return False
+        for key in ["version", "source_hash", "targets", "upstream", "inputs"]:
+            if previous.get(key) != state[key]:
+                return False
+        previous_files = previous.get("files", {})
+        for path, file_state in state["files"].items():
+            previous_file_state = previous_files.get(path, None)
+            if previous_file_state is None or previous_file_state.get("hash") != file_state["hash"]:  # noqa: E501
+                return False
+        return True
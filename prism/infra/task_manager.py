@@ -4,6 +4,7 @@ PrismTaskManager class
 Table of Contents
 - Imports
 - Class definition
+- Functions / utils
 """
 
 ###########
@@ -11,7 +12,17 @@ Table of Contents
 ###########
 
 # Standard library imports
-from typing import Any, Dict
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import pickle
+import threading
+from typing import Any, Dict, List, Optional
+import uuid
+
+# Prism-specific imports
+import prism.exceptions
+from prism.infra.output_store import StoredOutput
 
 
 ####################
@@ -26,8 +37,324 @@ class PrismTaskManager:
     via `tasks.ref('...')`.
     """
 
-    def __init__(self, upstream: Dict[str, Any]):
+    def __init__(self, upstream: Dict[str, Any], hooks: Any = None):
         self.upstream = upstream
 
-    def ref(self, module: str):
+        # Hooks passed to targets when they are loaded (e.g., PySparkParquet targets
+        # are loaded with `hooks.spark`)
+        self.hooks = hooks
+
+        # Lazy handles to the targets of upstream tasks, shared by all consumers
+        self.handles: Dict[str, TargetHandle] = {}
+        self._handles_lock = threading.Lock()
+
+    def ref(self, module: str, load: bool = False):
+        """
+        Get the output of `module`. Tasks with targets output the targets' locations.
+        If `load` is True, then the objects saved at those locations are returned
+        instead. Targets are loaded once (possibly in the background, before the
+        calling task starts) and shared by all tasks that reference them. Tasks whose
+        targets don't match their output (e.g., with `target_iterator`) cannot be
+        loaded.
+
+        args:
+            module: name of upstream module
+            load: whether to load the targets of `module`
+        returns:
+            output of `module`
+        """
+        if load:
+            handle = self.get_handle(module)
+            if handle is not None:
+                return handle.get()
+
+            # The task has targets, but they don't match its output (e.g., with
+            # `target_iterator`), so its output isn't a list of target locations
+            if getattr(self.upstream.get(module, None), 'types', None):
+                raise prism.exceptions.RuntimeException(
+                    message=f'targets of `{module}` cannot be loaded; use `tasks.ref("{module}")` without `load=True` and load the targets in the task'  # noqa: E501
+                )
         return self.upstream[module].get_output()
+
+    def set_hooks(self, hooks: Any):
+        self.hooks = hooks
+
+    def get_handle(self, module: str) -> Optional["TargetHandle"]:
+        """
+        Get the lazy handle to the targets of `module`
+
+        args:
+            module: name of upstream module
+        returns:
+            TargetHandle, or None if `module` has no loadable targets
+        """
+        with self._handles_lock:
+            handle = self.handles.get(module, None)
+            if handle is not None:
+                return handle
+            task = self.upstream.get(module, None)
+            types = get_target_types(task)
+            if types is None:
+                return None
+            handle = TargetHandle(module, types, getattr(task, 'output'), self.hooks)
+            self.handles[module] = handle
+            return handle
+
+    def prefetch(self, module: str):
+        """
+        Start loading the targets of `module` in the background
+
+        args:
+            module: name of upstream module
+        """
+        handle = self.get_handle(module)
+        if handle is not None:
+            handle.prefetch()
+
+    def has_output(self, module: str) -> bool:
+        """
+        Whether the output of `module` is available, e.g., from a previous run with
+        `prism run --watch`. Evicted outputs are not, since spilled outputs are removed
+        at the start of each run.
+
+        args:
+            module: name of module
+        returns:
+            True if `module` completed and its output is still held
+        """
+        task = self.upstream.get(module, None)
+        return task is not None and not isinstance(task, EvictedTaskOutput)
+
+    def discard(self, module: str):
+        """
+        Remove the output of `module`, e.g., before the module is executed again
+
+        args:
+            module: name of module
+        """
+        with self._handles_lock:
+            self.handles.pop(module, None)
+        self.upstream.pop(module, None)
+
+    def evict(self,
+        module: str,
+        spill_dir: Optional[Path] = None
+    ) -> Optional["EvictedTaskOutput"]:
+        """
+        Drop the output of `module` from memory, e.g., once all of its downstream tasks
+        have finished. If `spill_dir` is specified, the output is first pickled to a
+        file in that directory, so that it can still be retrieved after the run (e.g.,
+        via the PrismDAG client).
+
+        args:
+            module: name of module whose output should be evicted
+            spill_dir: directory in which to spill the output
+        returns:
+            EvictedTaskOutput that replaces the task in `upstream`, or None if the task
+            has no output
+        """
+        with self._handles_lock:
+            self.handles.pop(module, None)
+
+        # Stored outputs are only held in memory while they are referenced
+        task = self.upstream.get(module, None)
+        if isinstance(task, (EvictedTaskOutput, StoredTaskOutput)):
+            return None
+        output = getattr(task, 'output', None)
+        if output is None:
+            return None
+        path = None if spill_dir is None else spill_output(module, output, spill_dir)
+        evicted = EvictedTaskOutput(module, path)
+        self.upstream[module] = evicted
+
+        # Other objects may still reference the task (e.g., the globals of downstream
+        # modules), so the output must be removed from the task itself to be freed
+        task.output = None  # type: ignore
+        return evicted
+
+
+class PrismTaskOutput:
+    """
+    Output of a task that was executed outside of the current process (e.g., by the
+    `processes` executor). Exposes the same `get_output` interface as PrismTask, so it
+    can be stored in the task manager's `upstream` dictionary.
+    """
+
+    def __init__(self, name: str, output: Any, types: Optional[List[Any]] = None):
+        self.name = name
+        self.output = output
+
+        # Types of the task's targets, if any
+        self.types = types
+
+    def get_output(self):
+        """
+        Return the output attribute
+        """
+        if self.output is None:
+            msg = f"cannot access the output of `{self.name}` without either explicitly running task or setting a target"  # noqa: E501
+            raise prism.exceptions.RuntimeException(message=msg)
+        return self.output
+
+
+@dataclass
+class TargetOutput:
+    """
+    Output of a task with targets (i.e., the targets' locations) along with the types
+    of its targets, so that a process receiving the output can load the targets
+    """
+    output: Any
+    types: List[Any]
+
+
+class TargetHandle:
+    """
+    Lazy handle to the targets of a task. The targets are loaded on first access (or
+    when prefetched), and the loaded objects are cached for all consumers.
+    """
+
+    def __init__(self, name: str, types: List[Any], output: Any, hooks: Any = None):
+        self.name = name
+        self.types = types
+        self.locs = output if isinstance(output, list) else [output]
+        self.hooks = hooks
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._value: Any = None
+        self._err: Optional[BaseException] = None
+
+    def get(self) -> Any:
+        """
+        Load the targets, unless they have already been loaded
+
+        returns:
+            loaded object, or tuple of loaded objects if the task has several targets
+        """
+        with self._lock:
+            if not self._loaded:
+                try:
+                    objs = [
+                        target_type(None, loc, self.hooks).load()
+                        for target_type, loc in zip(self.types, self.locs)
+                    ]
+                    self._value = objs[0] if len(objs) == 1 else tuple(objs)
+                except Exception as err:
+                    self._err = err
+                self._loaded = True
+        if self._err is not None:
+            raise self._err
+        return self._value
+
+    def prefetch(self):
+        """
+        Load the targets in a background thread. Errors are raised when the targets
+        are accessed.
+        """
+        if self._loaded:
+            return
+
+        def target():
+            try:
+                self.get()
+            except Exception:
+                pass
+
+        threading.Thread(target=target, daemon=True).start()
+
+
+class StoredTaskOutput:
+    """
+    Output of a task that was written to the output store. Each call to `get_output`
+    memory-maps the stored file, so tasks referencing the output share one physical
+    copy rather than each holding its own.
+    """
+
+    def __init__(self, name: str, stored: StoredOutput):
+        self.name = name
+        self.stored = stored
+
+    @property
+    def output(self):
+        return self.stored.load()
+
+    def get_output(self):
+        """
+        Memory-map the stored output
+        """
+        return self.stored.load()
+
+
+class EvictedTaskOutput:
+    """
+    Placeholder for the output of a task that was evicted from memory once all of its
+    downstream tasks finished. If the output was spilled to disk, then it is loaded
+    from disk each time it is accessed; it is never kept in memory.
+    """
+
+    def __init__(self, name: str, path: Optional[Path] = None):
+        self.name = name
+        self.path = path
+        self.output = None
+
+    def get_output(self):
+        """
+        Load the spilled output from disk
+        """
+        if self.path is None:
+            msg = f"output of `{self.name}` was evicted from memory after its downstream tasks finished; to retrieve it after the run, set `SPILL_EVICTED_OUTPUTS = True` in prism_project.py and make sure the output can be pickled"  # noqa: E501
+            raise prism.exceptions.RuntimeException(message=msg)
+        with open(self.path, 'rb') as f:
+            return pickle.load(f)
+
+
+#####################
+# Functions / utils #
+#####################
+
+def get_target_types(task: Any) -> Optional[List[Any]]:
+    """
+    Get the types of a task's targets
+
+    args:
+        task: PrismTask or PrismTaskOutput
+    returns:
+        list of target types, or None if the task has no targets (or its targets
+        don't match its output, e.g., with `target_iterator`)
+    """
+    types = getattr(task, 'types', None)
+    if not types:
+        return None
+    output = getattr(task, 'output', None)
+    if output is None:
+        return None
+    locs = output if isinstance(output, list) else [output]
+    if len(locs) != len(types) or not all(isinstance(loc, (str, Path)) for loc in locs):  # noqa: E501
+        return None
+    return list(types)
+
+
+def spill_output(name: str, output: Any, spill_dir: Path) -> Optional[Path]:
+    """
+    Pickle the output of task `name` to a file in `spill_dir`
+
+    args:
+        name: task name
+        output: task output
+        spill_dir: directory in which to write the output
+    returns:
+        path to the pickled output, or None if the output could not be pickled
+    """
+    path = Path(spill_dir) / f'{name.replace("/", "_")}.pkl'
+    tmp_path = Path(spill_dir) / f'.{path.name}.{uuid.uuid4().hex}.tmp'
+    try:
+        Path(spill_dir).mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return None
+    return path
@@ -0,0 +1,108 @@
+"""
+Watcher for changes to a project's modules and prism_project.py, used by
+`prism run --watch`. Files are polled for changes to their modification times and
+sizes, which only requires the standard library and works on any filesystem.
+
+Table of Contents
+- Imports
+- Constants
+- Class definition
+"""
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from pathlib import Path
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+
+#############
+# Constants #
+#############
+
+# Seconds between polls while waiting for a change
+DEFAULT_POLL_INTERVAL = 0.5
+
+# Seconds that files must stop changing for before a change is reported
+DEFAULT_DEBOUNCE = 0.2
+
+
+####################
+# Class definition #
+####################
+
+class ProjectWatcher:
+    """
+    Watch the modules directory and prism_project.py of a project. Editors often write
+    a file in several steps (or save several files at once), so changes are only
+    reported once the files have stopped changing for `debounce` seconds.
+    """
+
+    def __init__(self,
+        project_dir: Path,
+        modules_dir: Path,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE
+    ):
+        self.prism_project_py = Path(project_dir) / 'prism_project.py'
+        self.modules_dir = Path(modules_dir)
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.state = self.snapshot()
+
+    def snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        """
+        Get the modification time and size of each watched file
+
+        returns:
+            dictionary mapping path --> (mtime in nanoseconds, size)
+        """
+        paths = [self.prism_project_py]
+        if self.modules_dir.is_dir():
+            paths.extend(self.modules_dir.glob('**/*.py'))
+        state = {}
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def poll(self) -> List[Path]:
+        """
+        Get the files that were added, removed, or modified since the last poll
+
+        returns:
+            sorted list of changed paths
+        """
+        state = self.snapshot()
+        changed = [
+            path for path in set(state.keys()) | set(self.state.keys())
+            if state.get(path, None) != self.state.get(path, None)
+        ]
+        self.state = state
+        return sorted(changed)
+
+    def wait(self, timeout: Optional[float] = None) -> List[Path]:
+        """
+        Block until the watched files change
+
+        args:
+            timeout: maximum number of seconds to wait; if None, wait indefinitely
+        returns:
+            sorted list of changed paths, or an empty list if `timeout` elapsed first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed: Set[Path] = set()
+        while True:
+            new = self.poll()
+            if len(changed) > 0 and len(new) == 0:
+                return sorted(changed)
+            changed.update(new)
+            if len(changed) == 0 and deadline is not None and time.monotonic() >= deadline:  # noqa: E501
+                return []
+            time.sleep(self.debounce if len(changed) > 0 else self.poll_interval)
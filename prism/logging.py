@@ -18,19 +18,21 @@ import re
 import os
 import copy
 import math
+import pickle
 import logging
 import time
 from typing import List, Union
 from dataclasses import dataclass
 import traceback
 import types
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 import functools
 import warnings
 
 # Prism imports
 import prism.constants
 import prism.exceptions
+from prism.infra.retries import get_error_classes
 from prism.ui import (
     RED,
     GREEN,
@@ -485,8 +487,12 @@ class ExecutionErrorEvent(Event):
     value: Optional[BaseException]
     tb: Optional[types.TracebackType]
     full_tb: bool
+    formatted_tb: Optional[List[str]] = None
+    error_classes: Optional[List[str]] = None
 
     def prepare_initial_tb(self) -> List[str]:
+        if self.formatted_tb is not None:
+            return self.formatted_tb
         if self.full_tb:
             tb_stack = traceback.format_exception(
                 self.type, self.value, self.tb, limit=None
@@ -506,6 +512,25 @@ class ExecutionErrorEvent(Event):
         msg = re.sub(r'"<[a-z\s\/]+>"', self.name, msg)
         return msg
 
+    def detach(self):
+        """
+        Format the traceback and drop the traceback object. Traceback objects cannot be
+        pickled, so this must be called before sending the event to another process.
+        """
+        self.formatted_tb = self.prepare_initial_tb()
+        self.error_classes = get_error_classes(self.value)
+        self.tb = None
+        if self.value is not None:
+            self.value.__traceback__ = None
+
+            # Exceptions defined within a module cannot be unpickled by another process
+            try:
+                pickle.loads(pickle.dumps(self.value))
+            except Exception:
+                self.value = prism.exceptions.RuntimeException(message=str(self.value))
+                self.type = prism.exceptions.RuntimeException
+        return self
+
 
 @dataclass
 class ExecutionSyntaxErrorEvent(ExecutionErrorEvent):
@@ -580,7 +605,7 @@ class ThreadsWarningEvent(Event):
 @dataclass
 class DelayEvent(Event):
     name: str
-    delay_seconds: int
+    delay_seconds: Union[int, float]
 
     def message(self):
         if self.delay_seconds > 0:
@@ -589,6 +614,96 @@ class DelayEvent(Event):
             return f'{YELLOW}{self.name} failed...restarting immediately{RESET}'
 
 
+@dataclass
+class CachedOutputEvent(Event):
+    name: str
+
+    def message(self):
+        return f'{self.name} unchanged since a previous run...output loaded from cache'  # noqa: E501
+
+
+@dataclass
+class FreshTargetsEvent(Event):
+    name: str
+
+    def message(self):
+        return f'{self.name} targets up to date...skipping'
+
+
+@dataclass
+class NoChangedModulesEvent(Event):
+    changed_since: str
+
+    def message(self):
+        return f'No modules changed since `{self.changed_since}`...nothing to run'
+
+
+@dataclass
+class WatchingForChangesEvent(Event):
+
+    def message(self):
+        return f'Watching modules and prism_project.py for changes...press {BOLD}{YELLOW}Ctrl+C{RESET} to exit'  # noqa: E501
+
+
+@dataclass
+class FilesChangedEvent(Event):
+    paths: List[str]
+
+    def message(self):
+        paths_str = ', '.join([f'`{path}`' for path in self.paths])
+        return f'{len(self.paths)} file(s) changed: {paths_str}...re-running'
+
+
+@dataclass
+class ExecutionPlanEvent(Event):
+    plan: Dict[str, Any]
+
+    def message(self):
+        return (
+            f'Execution plan: {len(self.plan["levels"])} level(s), max parallel width {self.plan["max_parallel_width"]}, '  # noqa: E501
+            f'critical path of {len(self.plan["critical_path"])} module(s) ({self.plan["critical_path_duration"]:.2f}s), '  # noqa: E501
+            f'predicted wall time {BOLD}{self.plan["predicted_wall_time"]:.2f}s{RESET} with {self.plan["threads"]} thread(s)'  # noqa: E501
+        )
+
+
+@dataclass
+class SkippedTaskEvent(Event):
+    name: str
+    failed_task: str
+
+    def message(self):
+        return f'{YELLOW}{self.name} skipped...upstream task {self.failed_task} failed{RESET}'  # noqa: E501
+
+
+@dataclass
+class FailureSummaryEvent(Event):
+    failed: List[str]
+    skipped: List[str]
+
+    def message(self):
+        failed_str = ', '.join([f'`{name}`' for name in self.failed])
+        msg = f'{len(self.failed)} task(s) failed: {failed_str}'
+        if len(self.skipped) > 0:
+            msg += f'; {len(self.skipped)} downstream task(s) skipped'
+        return f'{RED}{msg}{RESET}'
+
+
+@dataclass
+class WorkerStartEvent(Event):
+    broker_dir: str
+
+    def message(self):
+        return f'{BOLD}Waiting for tasks in {MAGENTA}{self.broker_dir}{RESET}'
+
+
+@dataclass
+class WorkerIdleEvent(Event):
+    idle_seconds: Union[int, float]
+
+    def message(self):
+        return f'No tasks received for {self.idle_seconds} seconds...stopping worker'
+
+
 @dataclass
 class HeaderEvent(Event):
     msg: str
@@ -25,7 +25,8 @@ from prism.cli import (
     create_agent,
     create_task,
     create_trigger,
-    agent
+    agent,
+    worker
 )
 import prism.exceptions
 from typing import List
@@ -238,6 +239,20 @@ def build_compile_subparser(sub):
         formatter_class=RichHelpFormatter,
     )
 
+    # Add argument for adding the execution plan to the manifest
+    command_options = compile_sub.add_argument_group("Command Options")
+    command_options.add_argument(
+        '--plan',
+        required=False,
+        action='store_true',
+        help="""
+        Add the execution plan to the manifest: the levels of modules that can run at
+        the same time, the maximum parallel width, the critical path, and the predicted
+        wall time with the configured THREADS. Predictions use the durations of each
+        module from previous runs.
+        """
+    )
+
     # General options
     general_options = compile_sub.add_argument_group("General Options")
     general_options = add_other_option_arguments(
@@ -459,7 +474,10 @@ def _exec_project_args(sub):
         required=False,
         help="""
         Path to script(s) that you want to run; if not specified, all modules in
-        project are run
+        project are run. Modules can also be selected with `+X.py` (X.py and all modules
+        upstream of it), `X.py+` (X.py and all modules downstream of it), and
+        `tag:TAG` (modules whose TAGS include TAG). Selectors joined by commas are
+        intersected, e.g., `tag:nightly,+X.py`.
         """
     )
 
@@ -483,6 +501,44 @@ def _exec_project_args(sub):
         """
     )
 
+    # Add argument for how to run concurrent tasks
+    sub.add_argument(
+        '--executor',
+        type=str,
+        required=False,
+        choices=prism.constants.VALID_EXECUTORS,
+        default=None,
+        help="""
+        How to run concurrent tasks. `threads` runs tasks in a thread pool; `processes`
+        runs tasks in separate processes, which is faster for CPU-bound tasks; `asyncio`
+        awaits tasks with an `async def run` function concurrently on an event loop;
+        `distributed` hands tasks to workers started with `prism worker`. If not
+        specified, uses the `EXECUTOR` variable in prism_project.py (default
+        `threads`).
+        """
+    )
+
+    # Add arguments for what to do when a task fails. By default, no new tasks are
+    # started and the running tasks are allowed to finish.
+    failure_mode = sub.add_mutually_exclusive_group()
+    failure_mode.add_argument(
+        '--keep-going',
+        required=False,
+        action='store_true',
+        help="""
+        If a task fails, keep running every task that is not downstream of it, and
+        report all failures at the end of the run
+        """
+    )
+    failure_mode.add_argument(
+        '--fail-fast',
+        required=False,
+        action='store_true',
+        help="""
+        If a task fails, cancel all queued and running tasks and exit immediately
+        """
+    )
+
 
 def build_run_subparser(sub):
     """
@@ -505,6 +561,33 @@ def build_run_subparser(sub):
     command_options = run_sub.add_argument_group("Command Options")
     _exec_project_args(command_options)
 
+    # Add argument for only running the modules that changed since a previous run
+    command_options.add_argument(
+        '--changed-since',
+        type=str,
+        required=False,
+        metavar="MANIFEST",
+        help="""
+        Path to a manifest.json from a previous run (or to the directory containing
+        it). Only modules that changed since then, and all modules downstream of them,
+        are run; the outputs of upstream modules are loaded from their targets or the
+        output cache.
+        """
+    )
+
+    # Add argument for re-running the project whenever it changes
+    command_options.add_argument(
+        '--watch',
+        required=False,
+        action='store_true',
+        help="""
+        After running, keep watching the modules directory and prism_project.py. When a
+        module changes, only it and the modules downstream of it are run again. Adapter
+        connections and the outputs of the other modules are kept in memory between
+        runs.
+        """
+    )
+
     # General options
     general_options = run_sub.add_argument_group("General Options")
     general_options = add_other_option_arguments(general_options)
@@ -598,6 +681,61 @@ def build_graph_subparser(sub):
     )
 
 
+def build_worker_subparser(sub):
+    """
+    Build subparser for worker command line argument.
+
+    args:
+        sub: special-action object (see argparse docs) to add subparsers to
+    returns:
+        None
+    """
+    desc = """
+    Execute tasks for runs that use the `distributed` executor. Start any number of
+    workers, on any machine that can access the broker directory and has a copy of the
+    project.
+    """
+    worker_sub = sub.add_parser(
+        'worker',
+        help=desc,
+        description=desc,
+        formatter_class=RichHelpFormatter
+    )
+
+    command_options = worker_sub.add_argument_group("Command Options")
+    command_options.add_argument(
+        '--broker-dir',
+        type=str,
+        default=None,
+        help="""
+        Directory through which tasks are received. Default is `BROKER_DIR` in
+        `prism_project.py`, or `.compiled/broker` if not specified
+        """
+    )
+    command_options.add_argument(
+        '--max-idle',
+        type=float,
+        default=None,
+        help="""
+        Stop the worker if it hasn't received a task for this many seconds. By default,
+        the worker runs until it is interrupted
+        """
+    )
+
+    # General options
+    general_options = worker_sub.add_argument_group("General Options")
+    general_options = add_other_option_arguments(general_options, ["log-level"])
+
+    # Set default class argument to WorkerTask()
+    worker_sub.set_defaults(
+        cls=worker.WorkerTask,
+        which='worker',
+        full_tb=False,
+        vars=None,
+        context='{}'
+    )
+
+
 def build_agent_parser(sub):
     """
     Build subparser for graph command line argument.
@@ -752,6 +890,7 @@ def build_full_arg_parser() -> argparse.ArgumentParser:
     build_run_subparser(subparser)
     build_spark_submit_subparser(subparser)
     build_graph_subparser(subparser)
+    build_worker_subparser(subparser)
     build_agent_parser(subparser)
 
     # Return base parser
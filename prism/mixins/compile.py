@@ -15,7 +15,7 @@ Table of Contents
 import re
 import argparse
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, cast
 
 # Prism-specific imports
 import prism.cli.base
@@ -23,6 +23,7 @@ import prism.exceptions
 import prism.constants
 from prism.infra import compiler
 from prism.infra.project import PrismProject
+from prism.infra.selector import is_selector
 
 
 ####################
@@ -142,6 +143,11 @@ class CompileMixin():
             raw_modules = args.modules
             if raw_modules is None:
                 processed_modules = self.get_modules(modules_dir)
+
+            # Selectors (e.g., `+module.py` or `tag:nightly`) are resolved once the DAG
+            # is built. Until then, every module is a candidate.
+            elif self.user_arg_selectors(args) is not None:
+                processed_modules = self.get_modules(modules_dir)
             else:
                 processed_modules = []
                 for m in raw_modules:
@@ -180,6 +186,23 @@ class CompileMixin():
 
         return processed_modules
 
+    def user_arg_selectors(self,
+        args: argparse.Namespace
+    ) -> Optional[List[str]]:
+        """
+        Get the `--modules` arguments if any of them use the selector syntax (e.g.,
+        `+module.py`, `module.py+`, or `tag:nightly`)
+
+        args:
+            args: user arguments
+        returns:
+            list of selectors, or None if the modules are only paths
+        """
+        raw_modules = getattr(args, 'modules', None)
+        if raw_modules is None or not any(is_selector(m) for m in raw_modules):
+            return None
+        return cast(List[str], raw_modules)
+
     def get_compiled_dir(self,
         project_dir: Path
     ) -> Path:
@@ -219,7 +242,10 @@ class CompileMixin():
         all_modules: List[Path],
         user_arg_modules: List[Path],
         user_arg_all_downstream: bool = True,
-        project: Optional[PrismProject] = None
+        project: Optional[PrismProject] = None,
+        changed_since: Optional[Path] = None,
+        plan: bool = False,
+        selectors: Optional[List[str]] = None
     ) -> compiler.CompiledDag:
         """
         Wrapper for the `compile` method in the DagCompiler class
@@ -231,6 +257,12 @@ class CompileMixin():
             user_arg_all_downstream: boolean indicating whether the user wants to run
                 all modules downstream of inputted args
             compiler_globals: globals() dictionary
+            changed_since: manifest from a previous compilation; if specified, only
+                the modules that changed since then are selected
+            plan: whether to add the execution plan to the manifest; requires a
+                `project` that has been set up
+            selectors: `--modules` selectors; if specified, the selected modules
+                replace `user_arg_modules`
         returns:
             CompiledDag object
         """
@@ -240,7 +272,10 @@ class CompileMixin():
             all_modules,
             user_arg_modules,
             user_arg_all_downstream,
-            project
+            project,
+            changed_since,
+            plan=plan,
+            selectors=selectors
         )
         compiled_dag = dag_compiler.compile()
 
@@ -12,12 +12,13 @@ Table of Contents
 ###########
 
 # Standard library imports
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 # Prism-specific imports
 from prism.infra import project as prism_project
 from prism.infra import pipeline as prism_pipeline
 from prism.infra import executor as prism_executor
+from prism.infra.task_manager import PrismTaskManager
 
 
 ####################
@@ -32,7 +33,8 @@ class RunMixin():
     def create_pipeline(self,
         project: prism_project.PrismProject,
         dag_executor: prism_executor.DagExecutor,
-        run_context: Dict[Any, Any]
+        run_context: Dict[Any, Any],
+        task_manager: Optional[PrismTaskManager] = None
     ) -> prism_pipeline.PrismPipeline:
         """
         Wrapper for creation of PrismPipeline object. Needed in order to be compatible
@@ -45,6 +47,6 @@ class RunMixin():
             PrismPipeline object
         """
         pipeline = prism_pipeline.PrismPipeline(
-            project, dag_executor, run_context
+            project, dag_executor, run_context, task_manager
         )
         return pipeline
@@ -16,7 +16,7 @@ import re
 import ast
 import astor
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 # Prism imports
 import prism.constants
@@ -40,7 +40,8 @@ class AstParser:
 
     def __init__(self,
         module_relative_path: Path,
-        parent_path: Path
+        parent_path: Path,
+        module_str: Optional[str] = None
     ):
         self.module_relative_path = module_relative_path
         self.parent_path = parent_path
@@ -48,15 +49,18 @@ class AstParser:
         # Create a module manifest
         self.module_manifest = ModuleManifest()
 
-        # Extract module as a string and parse
+        # Extract module as a string (unless the caller already read it) and parse
         self.module_path = Path(self.parent_path / self.module_relative_path)
-        with open(self.module_path, 'r') as f:
-            self.module_str = f.read()
-        f.close()
+        if module_str is None:
+            with open(self.module_path, 'r') as f:
+                module_str = f.read()
+            f.close()
+        self.module_str = module_str
         self.ast_module = ast.parse(self.module_str)
 
         # Add module source code to manifest
         self.module_manifest.add_module(self.module_relative_path)
+        self.module_manifest.add_hash(self.module_str)
 
         # Check existence of if-name-main
         bool_if_name_main = self.check_if_name_main(self.ast_module)
@@ -129,33 +133,44 @@ class AstParser:
                         return class_
         return None
 
-    def get_all_funcs(self, prism_task: ast.ClassDef) -> List[ast.FunctionDef]:
+    def get_all_funcs(self,
+        prism_task: ast.ClassDef
+    ) -> List[Union[ast.FunctionDef, ast.AsyncFunctionDef]]:
         """
-        Get all functions from PrismTask class
+        Get all functions (including coroutine functions) from PrismTask class
 
         args:
             prism_task: PrismTask class as an AST class
         returns:
-            run function as an ast.FunctionDef
+            functions as ast.FunctionDef or ast.AsyncFunctionDef objects
         """
-        return [f for f in prism_task.body if isinstance(f, ast.FunctionDef)]
-
-    def get_run_func(self, prism_task: ast.ClassDef) -> Optional[ast.FunctionDef]:
+        return [
+            f for f in prism_task.body
+            if isinstance(f, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ]
+
+    def get_run_func(self,
+        prism_task: ast.ClassDef
+    ) -> Optional[Union[ast.FunctionDef, ast.AsyncFunctionDef]]:
         """
-        Get `run` function from PrismTask class
+        Get `run` function from PrismTask class. The `run` function can be a coroutine
+        function (i.e., `async def run`), in which case an ast.AsyncFunctionDef is
+        returned.
 
         args:
             prism_task: PrismTask class as an AST class
         returns:
             run function as an ast.FunctionDef
         """
-        functions = [f for f in prism_task.body if isinstance(f, ast.FunctionDef)]
+        functions = self.get_all_funcs(prism_task)
         for func in functions:
             if func.name == "run":
                 return func
         return None
 
-    def get_func_args(self, func: ast.FunctionDef) -> List[str]:
+    def get_func_args(self,
+        func: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> List[str]:
         """
         Get arguments of `func` as a list of strings
 
@@ -170,7 +185,9 @@ class AstParser:
             results.append(a.arg)
         return results
 
-    def get_prism_mod_calls(self, func: ast.FunctionDef) -> List[Path]:
+    def get_prism_mod_calls(self,
+        func: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> List[Path]:
         """
         Get calls to `tasks.ref` from `func`
 
@@ -213,6 +230,34 @@ class AstParser:
 
         return mod_calls
 
+    def get_loaded_refs(self) -> List[str]:
+        """
+        Get the modules whose targets are loaded via `tasks.ref(..., load=True)`
+
+        returns:
+            names of referenced modules
+        """
+        prism_task_class = self.get_prism_task_node(self.classes, self.bases)
+        if prism_task_class is None:
+            return []
+        loaded_refs: List[str] = []
+        for node in ast.walk(prism_task_class):
+            if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):  # noqa: E501
+                continue
+            func = node.func
+            if not isinstance(func.value, ast.Name) or func.value.id != prism_task_manager_alias or func.attr != 'ref':  # noqa: E501
+                continue
+            load = [
+                kw.value for kw in node.keywords
+                if kw.arg == 'load' and isinstance(kw.value, ast.Constant)
+            ]
+            if len(node.args) == 1 and isinstance(node.args[0], ast.Constant) \
+                    and load and load[0].value is True:
+                ref = str(node.args[0].value)
+                if ref not in loaded_refs:
+                    loaded_refs.append(ref)
+        return loaded_refs
+
     def check_if_name_main(self,
         ast_module: ast.Module
     ) -> bool:
@@ -252,7 +297,9 @@ class AstParser:
                     return True
         return False
 
-    def get_targets(self, run_func: ast.FunctionDef) -> Union[str, List[str]]:
+    def get_targets(self,
+        run_func: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> Union[str, List[str]]:
         """
         Get targets as strings
 
@@ -302,6 +349,24 @@ class AstParser:
         else:
             return locs
 
+    def get_tags(self) -> List[str]:
+        """
+        Get the tags declared in the module's `TAGS` variable. Default is [].
+
+        returns:
+            list of tags
+        """
+        tags = self.get_literal_assignment(self.ast_module, 'TAGS')
+        if tags is None:
+            return []
+        if isinstance(tags, str):
+            return [tags]
+        if not isinstance(tags, (list, tuple)) or not all(isinstance(t, str) for t in tags):  # noqa: E501
+            raise prism.exceptions.ParserException(
+                message=f'invalid value `TAGS = {tags}` in `{str(self.module_relative_path)}`; must be a string or a list of strings'  # noqa: E501
+            )
+        return list(dict.fromkeys(tags))
+
     def parse(self) -> Union[List[Path], Path]:
         """
         Parse module and return mod references
@@ -339,6 +404,9 @@ class AstParser:
         target_locs = self.get_targets(run_func)
         self.module_manifest.add_target(self.module_relative_path, target_locs)
 
+        # Parse tags, used to select modules with `--modules tag:...`
+        self.module_manifest.add_tags(self.get_tags())
+
         # Iterate through all functions and get prism task.ref calls
         all_funcs = self.get_all_funcs(prism_task_class_node)
         all_task_refs: List[Path] = []
@@ -359,7 +427,8 @@ class AstParser:
     def get_variable_assignments(self, node, var_name: str):
         """
         Get `var_name` assignment from the Prism task. This can be used to assess the
-        number of retries and the retry delay seconds.
+        number of retries and the retry delay seconds. Like `get_literal_assignment`,
+        only the assignments returned by `get_setting_assignments` are inspected.
 
         args:
             node: parent node
@@ -394,10 +463,7 @@ class AstParser:
         # Assume that the var name is an ast.Assign object. If it isn't, then it isn't a
         # variable assignment, it's something else.
         else:
-            assigns = []
-            for node in ast.walk(node):
-                if isinstance(node, ast.Assign):
-                    assigns.append(node)
+            assigns = self.get_setting_assignments(node)
 
             # Iterate through assign objects
             val = None
@@ -409,3 +475,51 @@ class AstParser:
             # Return val. This will return None if the var name is found, and it will
             # return the last value for var name if it is defined multiple times.
             return val
+
+    def get_setting_assignments(self, node) -> List[ast.Assign]:
+        """
+        Get the assignments that can define a task's settings (e.g., `RETRIES` or
+        `TAGS`). Only the statements directly in `node` and in the body of the
+        PrismTask class are inspected, so variables assigned within functions or other
+        classes are ignored.
+
+        args:
+            node: parent node
+        returns:
+            list of assignments, in the order they appear
+        """
+        prism_task_class = self.get_prism_task_node(self.classes, self.bases)
+        statements = []
+        for stmt in getattr(node, 'body', []):
+            statements.append(stmt)
+            if prism_task_class is not None and stmt is prism_task_class:
+                statements.extend(prism_task_class.body)
+        return [stmt for stmt in statements if isinstance(stmt, ast.Assign)]
+
+    def get_literal_assignment(self, node, var_name: str) -> Any:
+        """
+        Get the value of a `var_name` assignment whose value is a literal (e.g., a list
+        of strings). Unlike `get_variable_assignments`, this supports containers. Only
+        the assignments returned by `get_setting_assignments` are inspected.
+
+        args:
+            node: parent node
+            var_name: variable name
+        returns:
+            assigned value of variable, or None if the variable is not assigned. If the
+            variable is assigned multiple times, then the last value is returned.
+        """
+        val = None
+        for sub_node in self.get_setting_assignments(node):
+            for target in sub_node.targets:
+                if isinstance(target, ast.Name) and target.id == var_name:
+                    try:
+                        val = ast.literal_eval(sub_node.value)
+
+                    # Depending on the value and the Python version, `literal_eval`
+                    # raises any of these errors for values that aren't literals
+                    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):  # noqa: E501
+                        raise prism.exceptions.ParserException(
+                            message=f'`{var_name}` in `{str(self.module_relative_path)}` must be a literal'  # noqa: E501
+                        )
+        return val
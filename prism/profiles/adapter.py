@@ -11,6 +11,8 @@ Table of Contents
 ###########
 
 # Standard library imports
+import asyncio
+import functools
 from typing import Any, Dict, Union
 
 # Prism-specific imports
@@ -94,3 +96,25 @@ class Adapter(metaclass=MetaAdapter):
         raise prism.exceptions.InvalidProfileException(
             message='`parse_config` method not implemented'
         )
+
+    async def execute_sql_async(self, query: str, return_type: str) -> Any:
+        """
+        Execute the SQL query without blocking the event loop. The database drivers
+        used by our adapters are blocking, so by default the adapter's `execute_sql`
+        method runs in the event loop's default executor. Adapters whose drivers
+        support asyncio natively can override this method.
+
+        args:
+            query: query to execute
+            return_type: type of object to return
+        returns:
+            result of `execute_sql`
+        """
+        if not hasattr(self, "execute_sql"):
+            raise prism.exceptions.RuntimeException(
+                message=f"`execute_sql` not implemented in class `{self.__class__.__name__}`"  # noqa: E501
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.execute_sql, query, return_type)  # type: ignore # noqa: E501
+        )
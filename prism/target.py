@@ -31,18 +31,42 @@ class PrismTarget:
     def save(self):
         raise prism.exceptions.RuntimeException(message="`save` method not implemented")
 
+    def load(self):
+        """
+        Load the object saved at `loc`. This is used by `tasks.ref(..., load=True)`.
+        """
+        raise prism.exceptions.RuntimeException(
+            message=f"`load` method not implemented for `{self.__class__.__name__}`"
+        )
+
 
 class PySparkParquet(PrismTarget):
 
     def save(self, **kwargs):
         self.obj.write.parquet(self.loc, **kwargs)
 
+    def load(self):
+        return self.hooks.spark.read.parquet(str(self.loc))
+
 
 class PandasCsv(PrismTarget):
 
     def save(self, **kwargs):
         self.obj.to_csv(self.loc, **kwargs)
 
+    def load(self):
+        """
+        Load the DataFrame. `save` writes the index as an unnamed first column by
+        default, so that column is read back as the index. DataFrames saved with
+        `index=False` have no such column.
+        """
+        import pandas as pd
+        df = pd.read_csv(self.loc)
+        if len(df.columns) > 0 and df.columns[0] == 'Unnamed: 0':
+            df = df.set_index(df.columns[0])
+            df.index.name = None
+        return df
+
 
 class NumpyTxt(PrismTarget):
 
@@ -50,6 +74,10 @@ class NumpyTxt(PrismTarget):
         import numpy as np
         np.savetxt(self.loc, self.obj, **kwargs)
 
+    def load(self):
+        import numpy as np
+        return np.loadtxt(self.loc)
+
 
 class Txt(PrismTarget):
 
@@ -58,6 +86,10 @@ class Txt(PrismTarget):
             f.write(self.obj, **kwargs)
         f.close()
 
+    def load(self):
+        with open(self.loc, "r") as f:
+            return f.read()
+
 
 class MatplotlibPNG(PrismTarget):
 
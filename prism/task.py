@@ -4,12 +4,20 @@ PrismTask class definition. All user-created tasks should inherit from PrismTask
 Table of Contents
 - Imports
 - Class definition
+- Functions / utils
 """
 
 ###########
 # Imports #
 ###########
 
+# Standard library imports
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import inspect
+import threading
+
 import prism.exceptions
 
 # Prism logging
@@ -36,40 +44,81 @@ class PrismTask:
         self.locs = []
         self.kwargs = []
 
+        # Set by the executor if the attempt can be cancelled
+        self.cancel_event = threading.Event()
+
     def set_task_manager(self, task_manager: prism.infra.task_manager.PrismTaskManager):
         self.task_manager = task_manager
 
     def set_hooks(self, hooks: prism.infra.hooks.PrismHooks):
         self.hooks = hooks
 
-    def exec(self):
+    def set_cancel_event(self, cancel_event: threading.Event):
+        self.cancel_event = cancel_event
+
+    def is_cancelled(self) -> bool:
+        """
+        Whether the current attempt of the task was cancelled (e.g., because it timed
+        out). Tasks that run in threads cannot be interrupted, so long-running tasks
+        should check this periodically and return early.
+        """
+        return self.cancel_event.is_set()
 
+    def raise_if_cancelled(self):
+        """
+        Raise a CancelledException if the current attempt of the task was cancelled
+        """
+        if self.is_cancelled():
+            raise prism.exceptions.CancelledException(message='attempt was cancelled')
+
+    def should_call_run(self) -> bool:
+        """
+        Whether `exec` should call the `run` function
+        """
         # If the `target` decorator isn't applied, then only execute the `run` function
-        # of bool_run is true
+        # of bool_run is true. If the code reaches this stage, then the user is
+        # attempting to use this tasks output without explicitly running the task or
+        # setting a target. We will throw an error in the get_output() method.
         if self.run.__name__ == "run":
+            return bool(self.bool_run)
 
-            # If bool_run, then execute the `run` function and set the `output`
-            # attribute to its result
-            if self.bool_run:
-                self.output = self.run(self.task_manager, self.hooks)
-                if self.output is None:
-                    raise prism.exceptions.RuntimeException(
-                        "`run` method must produce a non-null output"
-                    )
+        # Otherwise, the decorator uses bool_run in its internal computation
+        return True
 
-            # If the code reaches this stage, then the user is attempting to use this
-            # tasks output without explicitly running the task or setting a target. We
-            # will throw an error in the get_output() method.
-            else:
-                self.output = None
+    def set_output(self, output):
+        """
+        Set the `output` attribute to the result of the `run` function
+        """
+        if output is None:
+            raise prism.exceptions.RuntimeException(
+                "`run` method must produce a non-null output"
+            )
+        self.output = output
 
-        # Otherwise, the decorator uses bool_run in its internal computation
-        else:
-            self.output = self.run(self.task_manager, self.hooks)
-            if self.output is None:
-                raise prism.exceptions.RuntimeException(
-                    "`run` method must produce a non-null output"
-                )
+    def exec(self):
+        if not self.should_call_run():
+            self.output = None
+            return
+
+        # If `run` is a coroutine function, then run it to completion in a new event
+        # loop. Tasks executed by the `asyncio` executor use `aexec` instead.
+        output = self.run(self.task_manager, self.hooks)
+        if inspect.isawaitable(output):
+            output = _run_to_completion(output)
+        self.set_output(output)
+
+    async def aexec(self):
+        """
+        Execute the task within a running event loop. This is used by the `asyncio`
+        executor for tasks whose `run` function is a coroutine function.
+        """
+        if not self.should_call_run():
+            self.output = None
+            return
+        output = self.run(self.task_manager, self.hooks)
+        if inspect.isawaitable(output):
+            output = await output
+        self.set_output(output)
 
     def run(self,
         tasks: prism.infra.task_manager.PrismTaskManager,
@@ -131,3 +180,31 @@ class PrismTask:
             msg = f"cannot access the output of `{self.__class__.__name__}` without either explicitly running task or setting a target"  # noqa: E501
             raise prism.exceptions.RuntimeException(message=msg)
         return self.output
+
+
+#####################
+# Functions / utils #
+#####################
+
+async def _await(awaitable):
+    """
+    Wrap `awaitable` in a coroutine, so that it can be passed to `asyncio.run`
+    """
+    return await awaitable
+
+
+def _run_to_completion(awaitable):
+    """
+    Run `awaitable` in a new event loop and return its result. `asyncio.run` cannot be
+    called from a thread whose event loop is running (e.g., when tasks are executed
+    from a Jupyter notebook), so in that case the event loop runs in a helper thread.
+    The helper thread gets a copy of the current context, so that the attempt's
+    cancellation token is still visible.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_await(awaitable))
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(context.run, asyncio.run, _await(awaitable)).result()
@@ -22,6 +22,7 @@ import prism.client
 import prism.tests.integration.test_connect as test_connect
 import prism.tests.integration.integration_test_class as integration_test_class
 import prism.exceptions
+from prism.infra.task_manager import EvictedTaskOutput, StoredTaskOutput
 
 
 #################################
@@ -40,6 +41,8 @@ P005_SIMPLE_PROJECT_NO_NULL = Path(TEST_PROJECTS / '005_simple_project_no_null')
 P006_SIMPLE_PROJECT_WITH_PROFILE = Path(TEST_PROJECTS / '006_simple_project_with_profile')  # noqa: E501
 P007_SPARK_PROJECT = Path(TEST_PROJECTS / '007_spark_project')
 P009_SIMPLE_DBT_PROJECT = Path(TEST_PROJECTS / '009_simple_dbt_project' / 'prism')
+P026_EVICT_OUTPUTS = Path(TEST_PROJECTS / '026_evict_outputs')
+P027_OUTPUT_STORE = Path(TEST_PROJECTS / '027_output_store')
 
 
 #############
@@ -344,6 +347,60 @@ class TestClient(
         # Set up directory for next test
         self._set_up_wkdir()
 
+    def test_get_evicted_task_output(self):
+        """
+        With `EVICT_OUTPUTS = True`, outputs are evicted from memory once their
+        downstream tasks finish. Spilled outputs can still be retrieved after the run.
+        """
+        for executor in ['threads', 'processes']:
+            dag26 = prism.client.PrismDAG(P026_EVICT_OUTPUTS)
+            dag26.run(executor=executor)
+            for name in ['module01.py', 'module02.py']:
+                task = dag26._get_task_cls_from_namespace(Path(name))
+                self.assertIsInstance(task, EvictedTaskOutput)
+            self.assertEqual(list(range(200)), dag26.get_task_output('module01.py'))
+            self.assertEqual(19900, dag26.get_task_output('module02.py'))
+
+            # Outputs of tasks without downstream tasks are kept in memory
+            self.assertEqual(20100, dag26.get_task_output('module03.py'))
+            self.assertNotIsInstance(
+                dag26._get_task_cls_from_namespace(Path('module03.py')),
+                EvictedTaskOutput
+            )
+
+        # Remove compiled directory, if it exists
+        self._remove_compiled_dir(P026_EVICT_OUTPUTS)
+
+        # Set up directory for next test
+        self._set_up_wkdir()
+
+    def test_get_stored_task_output(self):
+        """
+        With `OUTPUT_STORE = True`, large DataFrame and ndarray outputs are written to
+        memory-mapped files that are shared by downstream tasks and processes
+        """
+        for executor in ['threads', 'processes']:
+            dag27 = prism.client.PrismDAG(P027_OUTPUT_STORE)
+            dag27.run(executor=executor)
+            for name in ['module01.py', 'module02.py']:
+                task = dag27._get_task_cls_from_namespace(Path(name))
+                self.assertIsInstance(task, StoredTaskOutput)
+            df = dag27.get_task_output('module01.py')
+            self.assertIsInstance(df, pd.DataFrame)
+            self.assertEqual(200000, df.shape[0])
+            arr = dag27.get_task_output('module02.py')
+            self.assertEqual(
+                str(P027_OUTPUT_STORE / '.compiled' / 'outputs' / 'module02.py.npy'),
+                arr.filename
+            )
+            self.assertEqual(4e10, dag27.get_task_output('module03.py'))
+
+        # Remove compiled directory, if it exists
+        self._remove_compiled_dir(P027_OUTPUT_STORE)
+
+        # Set up directory for next test
+        self._set_up_wkdir()
+
     def test_get_pipeline_output(self):
         """
         Test pipeline output retrieval
@@ -13,9 +13,11 @@ Table of Contents:
 ###########
 
 # Standard library imports
+import json
 import os
 from pathlib import Path
 import shutil
+import sys
 
 # Prism imports
 import prism.tests.integration.integration_test_class as integration_test_class
@@ -71,6 +73,24 @@ simple_project_expected_events = [
     'SeparatorEvent'
 ]
 
+# Expected events for `compile --plan`. The project is set up so that the plan can use
+# its thread count and resource limits.
+plan_expected_events = [
+    'SeparatorEvent',
+    'TaskRunEvent',
+    'CurrentProjectDirEvent',
+    'EmptyLineEvent',
+    'ExecutionEvent - parsing prism_project.py - RUN',
+    'ExecutionEvent - parsing prism_project.py - DONE',
+    'ExecutionEvent - module DAG - RUN',
+    'ExecutionEvent - module DAG - DONE',
+    'EmptyLineEvent',
+    'ExecutionPlanEvent',
+    'EmptyLineEvent',
+    'TaskSuccessfulEndEvent',
+    'SeparatorEvent'
+]
+
 
 ##############################
 # Test case class definition #
@@ -235,3 +255,52 @@ class TestCompileIntegration(integration_test_class.IntegrationTestCase):
         # Set up wkdir for the next test case
         shutil.rmtree(Path(wkdir / '.compiled'))
         self._set_up_wkdir()
+
+    def test_plan(self):
+        """
+        `prism compile --plan` adds the execution plan to the manifest, using the
+        durations from previous runs
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '012_concurrency'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists, and add the durations of a
+        # previous run. module04.py wasn't run, so it takes the average duration.
+        if Path(wkdir / '.compiled').is_dir():
+            shutil.rmtree(Path(wkdir / '.compiled'))
+        Path(wkdir / '.compiled').mkdir()
+        durations = {"module01.py": 15.0, "module02.py": 5.0, "module03.py": 1.0}
+        with open(wkdir / '.compiled' / 'run_results.json', 'w') as f:
+            json.dump({"durations": durations}, f)
+
+        # The project is imported as `prism_project`, so an earlier test's project may
+        # still be cached. Import this project's THREADS = 2 instead.
+        sys.modules.pop('prism_project', None)
+        args = ['compile', '--plan']
+        compile_run = self._run_prism(args)
+        compile_run_results = compile_run.get_results()
+        self.assertEqual(' | '.join(plan_expected_events), compile_run_results)
+
+        # Check the plan. module01.py and module02.py run at the same time on the
+        # project's two threads.
+        manifest = self._load_manifest(Path(wkdir / '.compiled' / 'manifest.json'))
+        plan = manifest["plan"]
+        self.assertEqual(2, plan["threads"])
+        self.assertEqual(
+            [['module01.py', 'module02.py'], ['module03.py'], ['module04.py']],
+            [sorted(level) for level in plan["levels"]]
+        )
+        self.assertEqual(2, plan["max_parallel_width"])
+        self.assertEqual(
+            ['module01.py', 'module03.py', 'module04.py'], plan["critical_path"]
+        )
+        self.assertEqual(23.0, plan["critical_path_duration"])
+        self.assertEqual(28.0, plan["total_duration"])
+        self.assertEqual(23.0, plan["predicted_wall_time"])
+        self.assertEqual(['module04.py'], plan["modules_without_durations"])
+
+        # Set up wkdir for the next test case
+        shutil.rmtree(Path(wkdir / '.compiled'))
+        self._set_up_wkdir()
@@ -0,0 +1,50 @@
+###########
+# Imports #
+###########
+
+# Prism infrastructure imports
+import prism.task
+import prism.target
+import prism.decorators
+
+# Prism project imports
+import prism_project
+
+# Other imports
+import asyncio
+import time
+import pandas as pd
+
+
+######################
+## Class definition ##
+######################
+
+class Module01(prism.task.PrismTask):
+
+    ## Run
+    @prism.decorators.target(type=prism.target.PandasCsv, loc=prism_project.OUTPUT / 'module01.csv', index=False)
+    async def run(self, tasks, hooks):
+        """
+        Execute task.
+
+        args:
+            tasks: used to reference output of other tasks --> tasks.ref('...')
+            hooks: built-in Prism hooks. These include:
+                - hooks.dbt_ref --> for getting dbt models as a pandas DataFrame
+                - hooks.sql     --> for executing sql query using an adapter in profile YML
+                - hooks.spark   --> for accessing SparkSession (if pyspark specified in profile YML)
+        returns:
+            task output
+        """
+        start_time = time.time()
+        await asyncio.sleep(5)
+        end_time = time.time()
+        time_df = pd.DataFrame({
+            'start_time': [start_time],
+            'end_time': [end_time]
+        })
+        return time_df
+
+
+# EOF
\ No newline at end of file
@@ -0,0 +1,50 @@
+###########
+# Imports #
+###########
+
+# Prism infrastructure imports
+import prism.task
+import prism.target
+import prism.decorators
+
+# Prism project imports
+import prism_project
+
+# Other imports
+from pathlib import Path
+import time
+
+
+#############
+# Variables #
+#############
+
+# This task hangs, and is cancelled after one second
+TIMEOUT_SECONDS = 1
+
+
+######################
+## Class definition ##
+######################
+
+class Module01(prism.task.PrismTask):
+
+    ## Run
+    def run(self, tasks, hooks):
+        """
+        Execute task.
+
+        args:
+            tasks: used to reference output of other tasks --> tasks.ref('...')
+            hooks: built-in Prism hooks. These include:
+                - hooks.dbt_ref --> for getting dbt models as a pandas DataFrame
+                - hooks.sql     --> for executing sql query using an adapter in profile YML
+                - hooks.spark   --> for accessing SparkSession (if pyspark specified in profile YML)
+        returns:
+            task output
+        """
+        time.sleep(30)
+        return "module01"
+
+
+# EOF
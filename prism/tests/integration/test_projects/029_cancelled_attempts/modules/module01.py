@@ -0,0 +1,64 @@
+###########
+# Imports #
+###########
+
+# Prism infrastructure imports
+import prism.task
+import prism.target
+import prism.decorators
+
+# Prism project imports
+import prism_project
+
+# Other imports
+from pathlib import Path
+import time
+
+
+#############
+# Variables #
+#############
+
+# The first attempt of this task times out and is retried
+TIMEOUT_SECONDS = 1
+RETRIES = 1
+
+
+######################
+## Class definition ##
+######################
+
+class Module01(prism.task.PrismTask):
+
+    ## Run
+    @prism.decorators.target(type=prism.target.Txt, loc=Path(prism_project.OUTPUT) / 'module01.txt')
+    def run(self, tasks, hooks):
+        """
+        Execute task.
+
+        args:
+            tasks: used to reference output of other tasks --> tasks.ref('...')
+            hooks: built-in Prism hooks. These include:
+                - hooks.dbt_ref --> for getting dbt models as a pandas DataFrame
+                - hooks.sql     --> for executing sql query using an adapter in profile YML
+                - hooks.spark   --> for accessing SparkSession (if pyspark specified in profile YML)
+        returns:
+            task output
+        """
+        log = Path(prism_project.OUTPUT) / 'module01.log'
+        attempt = 1
+        if log.is_file():
+            attempt += len([l for l in log.read_text().splitlines() if l.startswith('start')])
+        with open(log, 'a') as f:
+            f.write(f'start {attempt}\n')
+
+        # The first attempt ignores its cancellation and keeps running after it times
+        # out
+        if attempt == 1:
+            time.sleep(1.5)
+        with open(log, 'a') as f:
+            f.write(f'end {attempt}\n')
+        return f"attempt {attempt}"
+
+
+# EOF
@@ -17,9 +17,15 @@ import pandas as pd
 import os
 from pathlib import Path
 import shutil
+import subprocess
+import sys
+import time
 from typing import Dict, List
+from unittest import mock
 
 # Prism imports
+import prism
+from prism.infra.run_results import RunResults
 import prism.tests.integration.integration_test_class as integration_test_class
 
 
@@ -523,6 +529,551 @@ class TestRunIntegration(integration_test_class.IntegrationTestCase):
         # Set up wkdir for the next test case
         self._set_up_wkdir()
 
+    def test_concurrency_processes(self):
+        """
+        Test concurrent behavior when threads>1 and tasks run in separate processes
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '012_concurrency'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        if Path(wkdir / '.compiled').is_dir():
+            shutil.rmtree(Path(wkdir / '.compiled'))
+        self.maxDiff = None
+        args = ['run', '--executor', 'processes']
+        runtask_run = self._run_prism(args)
+        self.assertFalse(runtask_run.has_error)
+
+        # Get times
+        module2_times = pd.read_csv(wkdir / 'output' / 'module02.csv')
+        module1_times = pd.read_csv(wkdir / 'output' / 'module01.csv')
+
+        # Module 1 and 2 should start at the same time
+        module2_start_time = int(module2_times['start_time'][0])
+        module1_start_time = int(module1_times['start_time'][0])
+        self.assertTrue(abs(module2_start_time - module1_start_time) <= 1)
+
+        # Module 2 should finish before module 1
+        module2_end_time = int(module2_times['end_time'][0])
+        module1_end_time = int(module1_times['end_time'][0])
+        self.assertTrue(module2_end_time < module1_end_time)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_async_tasks(self):
+        """
+        Tasks with an `async def run` function are awaited concurrently by the
+        `asyncio` executor, even when threads=1
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '019_async_tasks'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        if Path(wkdir / '.compiled').is_dir():
+            shutil.rmtree(Path(wkdir / '.compiled'))
+        self.maxDiff = None
+        args = ['run']
+        runtask_run = self._run_prism(args)
+        self.assertFalse(runtask_run.has_error)
+
+        # Get times
+        module2_times = pd.read_csv(wkdir / 'output' / 'module02.csv')
+        module1_times = pd.read_csv(wkdir / 'output' / 'module01.csv')
+
+        # Module 1 and 2 should start and finish at the same time
+        module2_start_time = int(module2_times['start_time'][0])
+        module1_start_time = int(module1_times['start_time'][0])
+        self.assertTrue(abs(module2_start_time - module1_start_time) <= 1)
+        module2_end_time = int(module2_times['end_time'][0])
+        module1_end_time = int(module1_times['end_time'][0])
+        self.assertTrue(abs(module2_end_time - module1_end_time) <= 1)
+
+        # With the `threads` executor, async tasks are run one at a time
+        self._remove_files_in_output(wkdir)
+        args = ['run', '--executor', 'threads']
+        runtask_run = self._run_prism(args)
+        self.assertFalse(runtask_run.has_error)
+        module2_times = pd.read_csv(wkdir / 'output' / 'module02.csv')
+        module1_times = pd.read_csv(wkdir / 'output' / 'module01.csv')
+        module2_start_time = int(module2_times['start_time'][0])
+        module1_start_time = int(module1_times['start_time'][0])
+        self.assertTrue(abs(module2_start_time - module1_start_time) >= 4)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_isolated_namespaces(self):
+        """
+        Concurrent tasks are executed in separate namespaces, so module-level variables
+        and `__file__` are not shared between them
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '020_isolated_namespaces'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+        self.maxDiff = None
+        args = ['run']
+        runtask_run = self._run_prism(args)
+        self.assertFalse(runtask_run.has_error)
+
+        # Check contents
+        module01_txt = self._file_as_str(Path(wkdir / 'output' / 'module01.txt'))
+        module02_txt = self._file_as_str(Path(wkdir / 'output' / 'module02.txt'))
+        self.assertEqual('module01 module01.py', module01_txt)
+        self.assertEqual('module02 module02.py', module02_txt)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_keep_going(self):
+        """
+        By default, no new tasks are started after a task fails. With `--keep-going`,
+        every task that isn't downstream of the failed task still runs.
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '021_keep_going'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+        self.maxDiff = None
+
+        # module01 fails while module03 is running, so module04 is never started
+        args = ['run']
+        runtask_run = self._run_prism(args)
+        self.assertTrue(runtask_run.has_error)
+        self.assertTrue(Path(wkdir / 'output' / 'module03.txt').is_file())
+        self.assertFalse(Path(wkdir / 'output' / 'module04.txt').is_file())
+        self._remove_files_in_output(wkdir)
+
+        # module02 is downstream of module01 and is skipped
+        args = ['run', '--keep-going']
+        runtask_run = self._run_prism(args)
+        self.assertTrue(runtask_run.has_error)
+        self.assertFalse(Path(wkdir / 'output' / 'module02.txt').is_file())
+        self.assertTrue(Path(wkdir / 'output' / 'module03.txt').is_file())
+        self.assertEqual(
+            'module04', self._file_as_str(Path(wkdir / 'output' / 'module04.txt'))
+        )
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_fail_fast(self):
+        """
+        With `--fail-fast`, running tasks are cancelled as soon as a task fails
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '021_keep_going'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+        self.maxDiff = None
+
+        # Worker processes are terminated, so module03 never finishes
+        args = ['run', '--fail-fast', '--executor', 'processes']
+        runtask_run = self._run_prism(args)
+        self.assertTrue(runtask_run.has_error)
+        time.sleep(3)
+        self.assertFalse(Path(wkdir / 'output' / 'module03.txt').is_file())
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_timeouts(self):
+        """
+        Tasks that exceed TIMEOUT_SECONDS or the run's RUN_TIMEOUT_SECONDS are
+        cancelled, and their slot is freed for the next task
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '022_timeouts'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+        self.maxDiff = None
+
+        # module01 hangs and times out after 1 second. THREADS = 1, so module02 can only
+        # start once module01's slot is freed. module03 hangs until the run's deadline.
+        for executor in ['threads', 'processes']:
+            start_time = time.time()
+            args = ['run', '--keep-going', '--executor', executor]
+            runtask_run = self._run_prism(args)
+            self.assertTrue(runtask_run.has_error)
+            self.assertLess(time.time() - start_time, 20)
+            self.assertEqual(
+                'module02', self._file_as_str(Path(wkdir / 'output' / 'module02.txt'))
+            )
+            self.assertFalse(Path(wkdir / 'output' / 'module04.txt').is_file())
+            self._remove_files_in_output(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_cancelled_attempts(self):
+        """
+        Attempts that time out are cancelled. They don't save their targets, and the
+        retry of a task only starts once its previous attempt has exited.
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '029_cancelled_attempts'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+        self._remove_files_in_output(wkdir)
+        self.maxDiff = None
+
+        # The first attempt of module01 keeps running for half a second after it times
+        # out. module02 stops as soon as it's cancelled.
+        args = ['run', '--keep-going']
+        runtask_run = self._run_prism(args)
+        self.assertTrue(runtask_run.has_error)
+        self.assertEqual(
+            ['start 1', 'end 1', 'start 2', 'end 2'],
+            self._file_as_str(Path(wkdir / 'output' / 'module01.log')).splitlines()
+        )
+        self.assertEqual(
+            'attempt 2', self._file_as_str(Path(wkdir / 'output' / 'module01.txt'))
+        )
+        time.sleep(1)
+        self.assertFalse(Path(wkdir / 'output' / 'module02.txt').is_file())
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_distributed(self):
+        """
+        With the `distributed` executor, tasks are executed by workers started with
+        `prism worker`, and upstream outputs are sent to the worker running each task
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '023_distributed'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+        self.maxDiff = None
+
+        # Start two local workers
+        env = os.environ.copy()
+        env['PYTHONPATH'] = os.pathsep.join(
+            [str(Path(prism.__file__).parent.parent)] + sys.path
+        )
+        workers = [
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    '-c',
+                    "from prism.main import main; main(['worker', '--max-idle', '60'])"
+                ],
+                cwd=wkdir,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            for _ in range(2)
+        ]
+        try:
+            args = ['run', '--executor', 'distributed']
+            runtask_run = self._run_prism(args)
+            self.assertFalse(runtask_run.has_error)
+        finally:
+            for worker in workers:
+                worker.terminate()
+                worker.wait()
+
+        # module02 received module01's output from a worker
+        self.assertEqual(
+            'module01-module02',
+            self._file_as_str(Path(wkdir / 'output' / 'module02.txt'))
+        )
+
+        # module03 ran in a worker rather than in this process
+        worker_pid = int(self._file_as_str(Path(wkdir / 'output' / 'module03.txt')))
+        self.assertIn(worker_pid, [worker.pid for worker in workers])
+
+        # The run's directory is removed from the broker
+        self.assertEqual([], list(Path(wkdir / '.compiled' / 'broker').iterdir()))
+
+        # Without workers, the run fails rather than waiting forever
+        with mock.patch('prism.infra.executor.WORKER_TIMEOUT_SECONDS', 0.5):
+            runtask_run = self._run_prism(['run', '--executor', 'distributed'])
+        self.assertTrue(runtask_run.has_error)
+        self.assertIn(
+            'no worker claimed task `module01.py`', str(runtask_run.event_list)
+        )
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_output_cache(self):
+        """
+        With `OUTPUT_CACHE = True`, tasks whose code and inputs haven't changed since a
+        previous run are loaded from the cache rather than re-run
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '024_output_cache'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+        self.maxDiff = None
+
+        # module01 outputs the current time, so its output only stays the same if it is
+        # loaded from the cache
+        self.assertFalse(self._run_prism(['run']).has_error)
+        first_output = self._file_as_str(Path(wkdir / 'output' / 'module02.txt'))
+        first_duration = RunResults(wkdir / '.compiled').get_duration('module01.py')
+        self.assertFalse(self._run_prism(['run']).has_error)
+        self.assertEqual(
+            first_output, self._file_as_str(Path(wkdir / 'output' / 'module02.txt'))
+        )
+
+        # Loading module01 from the cache doesn't overwrite its duration
+        self.assertIsNotNone(first_duration)
+        self.assertEqual(
+            first_duration,
+            RunResults(wkdir / '.compiled').get_duration('module01.py')
+        )
+
+        # module01 references VAR_2, so changing it invalidates module01 and, in turn,
+        # module02
+        self.assertFalse(self._run_prism(['run', '--vars', 'VAR_2=300']).has_error)
+        second_output = self._file_as_str(Path(wkdir / 'output' / 'module02.txt'))
+        self.assertNotEqual(first_output, second_output)
+        self.assertTrue(second_output.startswith('300-'))
+
+        # A task whose target was removed is re-run
+        self._remove_files_in_output(wkdir)
+        self.assertFalse(self._run_prism(['run', '--vars', 'VAR_2=300']).has_error)
+        self.assertEqual(
+            second_output, self._file_as_str(Path(wkdir / 'output' / 'module02.txt'))
+        )
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_fresh_targets(self):
+        """
+        With `SKIP_FRESH_TARGETS = True`, tasks whose targets are up to date are skipped
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '025_fresh_targets'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+        self._remove_files_in_output(wkdir)
+        self.maxDiff = None
+
+        # Both modules output the current time, so their targets only stay the same if
+        # they are skipped
+        module01_path = Path(wkdir / 'output' / 'module01.txt')
+        module02_path = Path(wkdir / 'output' / 'module02.txt')
+        self.assertFalse(self._run_prism(['run']).has_error)
+        module01_txt = self._file_as_str(module01_path)
+        module02_txt = self._file_as_str(module02_path)
+        durations = RunResults(wkdir / '.compiled').durations
+
+        # Touching a target doesn't change its contents
+        os.utime(module01_path)
+        self.assertFalse(self._run_prism(['run']).has_error)
+        self.assertEqual(module01_txt, self._file_as_str(module01_path))
+        self.assertEqual(module02_txt, self._file_as_str(module02_path))
+
+        # Skipped tasks keep their durations from the run that executed them
+        self.assertEqual(
+            ['module01.py', 'module02.py'], sorted(list(durations.keys()))
+        )
+        self.assertEqual(durations, RunResults(wkdir / '.compiled').durations)
+
+        # A changed target is rebuilt
+        with open(module02_path, 'w') as f:
+            f.write('changed')
+        self.assertFalse(self._run_prism(['run']).has_error)
+        self.assertEqual(module01_txt, self._file_as_str(module01_path))
+        self.assertTrue(self._file_as_str(module02_path).startswith(module01_txt))
+
+        # Changing a declared input re-runs the task and everything downstream of it
+        input_path = Path(wkdir / 'data' / 'input.txt')
+        input_str = self._file_as_str(input_path)
+        try:
+            with open(input_path, 'w') as f:
+                f.write('changed')
+            self.assertFalse(self._run_prism(['run']).has_error)
+        finally:
+            with open(input_path, 'w') as f:
+                f.write(input_str)
+        self.assertTrue(self._file_as_str(module01_path).startswith('changed-'))
+        self.assertTrue(self._file_as_str(module02_path).startswith('changed-'))
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_target_handles(self):
+        """
+        `tasks.ref(..., load=True)` loads the targets of upstream tasks, including
+        tasks that aren't explicitly run
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '028_target_handles'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+        self._remove_files_in_output(wkdir)
+
+        module03_path = Path(wkdir / 'output' / 'module03.txt')
+        self.assertFalse(self._run_prism(['run']).has_error)
+        self.assertEqual('200-19900', self._file_as_str(module03_path))
+
+        # module01.py and module02.py are not run, so their targets are loaded from
+        # disk
+        os.unlink(module03_path)
+        for executor in ['threads', 'processes', 'asyncio']:
+            run = self._run_prism(['run', '--modules', 'module03.py', '--executor', executor])  # noqa: E501
+            self.assertFalse(run.has_error)
+            self.assertEqual('200-19900', self._file_as_str(module03_path))
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
+    def test_changed_since(self):
+        """
+        `prism run --changed-since` only runs the modules that changed since a previous
+        manifest, along with everything downstream of them
+        """
+
+        # Set working directory
+        wkdir = Path(TEST_PROJECTS) / '005_simple_project_no_null'
+        os.chdir(wkdir)
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+        self._remove_files_in_output(wkdir)
+        self.maxDiff = None
+
+        self.assertFalse(self._run_prism(['run']).has_error)
+        baseline = Path(wkdir / 'output' / 'baseline_manifest.json')
+        shutil.copy(Path(wkdir / '.compiled' / 'manifest.json'), baseline)
+
+        # Nothing changed
+        run = self._run_prism(['run', '--changed-since', str(baseline)])
+        self.assertEqual(
+            ' | '.join(run_success_starting_events[:-3] + [
+                'EmptyLineEvent', 'NoChangedModulesEvent', 'SeparatorEvent'
+            ]),
+            run.get_results()
+        )
+
+        # Change module03. module01 and module02 are loaded from their targets.
+        module03_path = Path(wkdir / 'modules' / 'module03.py')
+        module03_str = self._file_as_str(module03_path)
+        try:
+            with open(module03_path, 'a') as f:
+                f.write('\n# Changed\n')
+            run = self._run_prism(['run', '--changed-since', str(baseline)])
+        finally:
+            with open(module03_path, 'w') as f:
+                f.write(module03_str)
+        expected_events = run_success_starting_events + \
+            ['TasksHeaderEvent'] + \
+            _execution_events_modules({
+                'module03.py': 'DONE',
+                'module04.py': 'DONE',
+            }) + _run_task_end_events('TaskSuccessfulEndEvent')
+        self.assertEqual(' | '.join(expected_events), run.get_results())
+
+        # Remove the .compiled directory, if it exists
+        self._remove_compiled_dir(wkdir)
+
+        # Remove stuff in output to avoid recommitting to github
+        self._remove_files_in_output(wkdir)
+
+        # Set up wkdir for the next test case
+        self._set_up_wkdir()
+
     def test_user_context_cli(self):
         """
         Test that CLI user context works as expected
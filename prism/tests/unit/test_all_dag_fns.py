@@ -15,12 +15,15 @@ Table of Contents:
 
 # Standard library imports
 import unittest
+from unittest import mock
 from pathlib import Path
 from typing import Union
 
 # Prism imports
 import prism.exceptions
 from prism.infra import compiler
+import prism.infra.dag
+from prism.infra.selector import ReachabilityIndex
 from prism.tests.unit.test_all_things_dag import TASK_REF_TEST_CASES
 from prism.tests.unit.test_all_things_dag.task_ref_3nodes import TASK_REF_3NODES_LIST
 from prism.tests.unit.test_all_things_dag.task_ref_5nodes import TASK_REF_5NODES_LIST
@@ -54,6 +57,52 @@ TASK_REF_SELFREF_DIR = Path(TASK_REF_TEST_CASES) / 'task_ref_selfref'
 DAG_CYCLE_DIR = Path(TASK_REF_TEST_CASES) / 'dag_cycle'
 
 
+class _Visits:
+    """
+    Number of nodes and edges visited while traversing a _CountingDag
+    """
+    nodes = 0
+    edges = 0
+
+
+class _CountingDict(dict):
+    """
+    Dictionary mapping each node to its adjacent nodes. Looking up a node's adjacent
+    nodes counts as visiting the node.
+    """
+
+    def __getitem__(self, key):
+        _Visits.nodes += 1
+        return super().__getitem__(key)
+
+
+class _CountingAdjacency(dict):
+    """
+    Adjacent nodes of a node. Iterating over an adjacent node counts as visiting the
+    edge to it.
+    """
+
+    def __iter__(self):
+        for key in super().__iter__():
+            _Visits.edges += 1
+            yield key
+
+    def keys(self):
+        return iter(self)
+
+
+def _counting_dag(dag: prism.infra.dag.Dag) -> prism.infra.dag.Dag:
+    """
+    Copy `dag` into a Dag that counts the nodes and edges visited while traversing it
+    """
+    counting = prism.infra.dag.Dag()
+    counting._pred = _CountingDict({k: _CountingAdjacency(v) for k, v in dag._pred.items()})  # noqa: E501
+    counting._succ = _CountingDict({k: _CountingAdjacency(v) for k, v in dag._succ.items()})  # noqa: E501
+    _Visits.nodes = 0
+    _Visits.edges = 0
+    return counting
+
+
 ##############################
 # Test case class definition #
 ##############################
@@ -199,6 +248,35 @@ class TestAllDagFunctions(unittest.TestCase):
         expected_msg = "self-references found in `moduleB.py`"
         self.assertEqual(expected_msg, str(cm.exception))
 
+    @mock.patch.object(compiler, 'PARALLEL_PARSE_MIN_MODULES', 1)
+    def test_parallel_task_refs(self):
+        """
+        Modules parsed in a pool of processes produce the same mod refs and manifests,
+        in the same order, as modules parsed serially. Errors are raised as if the
+        modules were parsed serially.
+        """
+        parallel_dag_compiler = compiler.DagCompiler(
+            TASK_REF_TEST_CASES, None, None, None, False, parse_processes=4
+        )
+        task_refs = dag_compiler.parse_task_refs(
+            TASK_REF_15NODES_LIST, TASK_REF_15NODES_DIR
+        )
+        parallel_task_refs = parallel_dag_compiler.parse_task_refs(
+            TASK_REF_15NODES_LIST, TASK_REF_15NODES_DIR
+        )
+        self.assertEqual(list(task_refs.items()), list(parallel_task_refs.items()))
+        self.assertEqual(
+            [dag_compiler.module_manifests[m].manifest_dict for m in TASK_REF_15NODES_LIST],  # noqa: E501
+            [parallel_dag_compiler.module_manifests[m].manifest_dict for m in TASK_REF_15NODES_LIST]  # noqa: E501
+        )
+
+        with self.assertRaises(prism.exceptions.ParserException) as cm:
+            parallel_dag_compiler.parse_task_refs(
+                TASK_REF_SELFREF_LIST, TASK_REF_SELFREF_DIR
+            )
+        expected_msg = "self-references found in `moduleB.py`"
+        self.assertEqual(expected_msg, str(cm.exception))
+
     #######################
     # Create nodes, edges #
     #######################
@@ -684,3 +762,77 @@ class TestAllDagFunctions(unittest.TestCase):
         # will be moduleB and moduleC
         actual_topsort_no_modrefs = [Path('moduleB.py'), Path('moduleC.py')]
         self.assertEqual(set(actual_topsort_no_modrefs), set(dag_topsort_no_modrefs))
+
+    ###########
+    # Scaling #
+    ###########
+
+    def _create_large_dag(self, n: int):
+        """
+        Create a synthetic DAG with `n` modules, in which each module references up to
+        three earlier modules
+        """
+        modules = [Path(f'module{i:06d}.py') for i in range(n)]
+        task_refs = {}
+        for i, m in enumerate(modules):
+            refs = sorted(set(modules[j] for j in [i - 1, i // 2, i // 3] if 0 <= j < i))  # noqa: E501
+            task_refs[m] = refs if len(refs) > 0 else None
+        return modules, task_refs
+
+    def test_large_topsort(self):
+        """
+        The topsort of a large DAG, both of the full DAG and of the modules upstream
+        and downstream of a single module, places parents before their children
+        """
+        modules, task_refs = self._create_large_dag(2500)
+        for user_arg_modules in [modules, [modules[1250]]]:
+            large_dag_compiler = compiler.DagCompiler(
+                TASK_REF_TEST_CASES, None, None, None, True
+            )
+            with mock.patch.object(large_dag_compiler, 'parse_task_refs', return_value=task_refs):  # noqa: E501
+                _, topsort = large_dag_compiler.create_topsort(
+                    modules, user_arg_modules, Path('.')
+                )
+            self.assertEqual(len(modules), len(topsort))
+            positions = {m: idx for idx, m in enumerate(topsort)}
+            for m, refs in task_refs.items():
+                if refs is not None:
+                    self.assertTrue(all(positions[r] < positions[m] for r in refs))
+
+    def test_topsort_scaling(self):
+        """
+        Sorting a DAG visits each node and each edge exactly once, so it takes linear
+        time in the number of modules and references
+        """
+        for n in [2500, 20000]:
+            modules, task_refs = self._create_large_dag(n)
+            nodes, edges = dag_compiler.create_nodes_edges(task_refs)
+            dag = _counting_dag(dag_compiler.create_dag(nodes, edges))
+            topsort = dag.topological_sort()
+            self.assertEqual(n, len(topsort))
+            self.assertEqual(n, _Visits.nodes)
+            self.assertEqual(len(edges), _Visits.edges)
+
+    def test_reachability_index_scaling(self):
+        """
+        Building the ReachabilityIndex sorts the DAG and then visits each node and each
+        edge once in each direction. Only the bitset unions, which cost one operation
+        per 64 modules, grow faster than the DAG.
+        """
+        for n in [2500, 20000]:
+            modules, task_refs = self._create_large_dag(n)
+            nodes, edges = dag_compiler.create_nodes_edges(task_refs)
+            dag = _counting_dag(dag_compiler.create_dag(nodes, edges))
+            index = ReachabilityIndex(dag)
+            self.assertEqual(3 * n, _Visits.nodes)
+            self.assertEqual(3 * len(edges), _Visits.edges)
+
+            # Selecting from the index doesn't traverse the DAG
+            _Visits.nodes = 0
+            _Visits.edges = 0
+            mask = index.to_mask([modules[n // 2]])
+            upstream = index.to_nodes(index.upstream(mask))
+            downstream = index.to_nodes(index.downstream(mask))
+            self.assertEqual((0, 0), (_Visits.nodes, _Visits.edges))
+            self.assertIn(modules[0], upstream)
+            self.assertIn(modules[-1], downstream)
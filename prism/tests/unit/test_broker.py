@@ -0,0 +1,139 @@
+"""
+Unit testing for the FileBroker class, which hands tasks from the coordinator of a run
+that uses the `distributed` executor to workers.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import os
+from pathlib import Path
+import tempfile
+import time
+import unittest
+
+# Prism imports
+from prism.infra.broker import FileBroker, RunSpec, TaskMessage
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestFileBroker(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.broker_dir = Path(self.tmpdir.name)
+        self.coordinator = FileBroker(self.broker_dir)
+        self.coordinator.open(RunSpec(None, True, False, {'VAR': 'a'}))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_list_runs(self):
+        """
+        Workers see runs that are open, along with their RunSpec
+        """
+        runs = FileBroker.list_runs(self.broker_dir)
+        self.assertEqual([self.coordinator.run_id], [run.run_id for run in runs])
+        self.assertEqual({'VAR': 'a'}, runs[0].get_spec().user_context)
+        self.assertTrue(runs[0].is_open())
+
+        self.coordinator.close()
+        self.assertEqual([], FileBroker.list_runs(self.broker_dir))
+        self.assertFalse(runs[0].is_open())
+
+    def test_claim_and_result(self):
+        """
+        Tasks are claimed in the order in which they are submitted, and each task is
+        claimed only once
+        """
+        self.coordinator.submit(TaskMessage('a.py', 1))
+        self.coordinator.submit(TaskMessage('b.py', 2))
+        worker1 = FileBroker(self.broker_dir, self.coordinator.run_id)
+        worker2 = FileBroker(self.broker_dir, self.coordinator.run_id)
+
+        task_id, message = worker1.claim()
+        self.assertEqual(('a.py', 1), (message.name, message.attempt))
+        _, message = worker2.claim()
+        self.assertEqual(('b.py', 2), (message.name, message.attempt))
+        self.assertIsNone(worker1.claim())
+
+        self.assertEqual([], self.coordinator.get_results())
+        worker1.put_result(task_id, 'a.py', 1, 'output')
+        self.assertEqual([('a.py', 1, 'output')], self.coordinator.get_results())
+        self.assertEqual([], self.coordinator.get_results())
+
+    def test_withdraw(self):
+        """
+        Tasks can be withdrawn until a worker claims them
+        """
+        task_id = self.coordinator.submit(TaskMessage('a.py', 1))
+        self.assertTrue(self.coordinator.withdraw(task_id))
+        worker = FileBroker(self.broker_dir, self.coordinator.run_id)
+        self.assertIsNone(worker.claim())
+
+        task_id = self.coordinator.submit(TaskMessage('a.py', 2))
+        self.assertIsNotNone(worker.claim())
+        self.assertFalse(self.coordinator.withdraw(task_id))
+
+    def test_lease(self):
+        """
+        Claimed tasks whose lease isn't renewed are requeued, so that another worker can
+        claim them
+        """
+        self.coordinator.submit(TaskMessage('a.py', 1))
+        worker1 = FileBroker(self.broker_dir, self.coordinator.run_id)
+        worker2 = FileBroker(self.broker_dir, self.coordinator.run_id)
+        task_id, _ = worker1.claim()
+
+        # The lease starts when the coordinator first sees the claimed task
+        self.assertEqual([], self.coordinator.requeue_expired(0.05))
+        time.sleep(0.05)
+
+        # Renewing the lease changes the claimed file's modification time
+        claimed_path = worker1._claimed_path(task_id)
+        os.utime(claimed_path, (0, 0))
+        self.assertTrue(worker1.renew(task_id))
+        self.assertEqual([], self.coordinator.requeue_expired(0.05))
+        time.sleep(0.05)
+        self.assertEqual([task_id], self.coordinator.requeue_expired(0.05))
+
+        # The task is claimed by another worker, and the first worker loses its lease
+        self.assertFalse(worker1.renew(task_id))
+        _, message = worker2.claim()
+        self.assertEqual(('a.py', 1), (message.name, message.attempt))
+        self.assertFalse(worker1.renew(task_id))
+
+        # The first worker's result doesn't remove the second worker's claim
+        worker1.put_result(task_id, 'a.py', 1, 'output')
+        self.assertTrue(worker2.renew(task_id))
+        self.assertEqual([('a.py', 1, 'output')], self.coordinator.get_results())
+        self.assertEqual([], self.coordinator.requeue_expired(0.05))
+
+    def test_withdraw_stalled(self):
+        """
+        Waiting tasks are withdrawn if no worker claims, renews, or completes a task
+        """
+        self.coordinator.submit(TaskMessage('a.py', 1))
+        self.assertEqual([], self.coordinator.withdraw_stalled(0.05))
+        time.sleep(0.05)
+        withdrawn = self.coordinator.withdraw_stalled(0.05)
+        self.assertEqual([('a.py', 1)], [(m.name, m.attempt) for m in withdrawn])
+        worker = FileBroker(self.broker_dir, self.coordinator.run_id)
+        self.assertIsNone(worker.claim())
+
+        # Claimed tasks aren't waiting
+        self.coordinator.submit(TaskMessage('b.py', 1))
+        self.assertIsNotNone(worker.claim())
+        self.coordinator.requeue_expired()
+        time.sleep(0.05)
+        self.assertEqual([], self.coordinator.withdraw_stalled(0.05))
@@ -0,0 +1,109 @@
+"""
+Unit testing for the BytecodeCache class, which persists the compiled code objects of
+modules across runs.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from pathlib import Path
+import pickle
+import shutil
+import tempfile
+import unittest
+
+# Prism imports
+import prism.task
+from prism.infra.bytecode_cache import BytecodeCache
+from prism.infra.hooks import PrismHooks
+from prism.infra.manifest import ModuleManifest
+from prism.infra.module import CompiledModule
+from prism.infra.task_manager import PrismTaskManager
+
+
+# Modules used in tests
+TASK_REF_3NODES_DIR = Path(__file__).parent / 'test_all_things_dag' / 'task_ref_3nodes'
+TASK_WITH_RESOURCES_DIR = Path(__file__).parent / 'test_modules'
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestBytecodeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = BytecodeCache(Path(self.tmpdir.name) / 'bytecode')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_get_and_put(self):
+        """
+        Cached code objects and metadata are only returned if the module's source and
+        path match
+        """
+        self.assertIsNone(self.cache.get('module', 'x = 1', 'module.py'))
+        code = compile('x = 1', 'module.py', 'exec')
+        self.cache.put('module', 'x = 1', 'module.py', code, {'x': [1]})
+        self.assertEqual(
+            (code, {'x': [1]}), self.cache.get('module', 'x = 1', 'module.py')
+        )
+        self.assertIsNone(self.cache.get('module', 'x = 2', 'module.py'))
+        self.assertIsNone(self.cache.get('module', 'x = 1', 'other.py'))
+
+    def test_compiled_module(self):
+        """
+        CompiledModule compiles its code object once and then loads it from the cache.
+        Compiled modules can still be pickled.
+        """
+        modules_dir = Path(self.tmpdir.name) / 'modules'
+        shutil.copytree(TASK_REF_3NODES_DIR, modules_dir)
+        module = CompiledModule(
+            Path('module01.py'),
+            modules_dir / 'module01.py',
+            ModuleManifest(),
+            bytecode_cache=self.cache
+        )
+        code = module.get_code()
+        self.assertTrue((self.cache.cache_dir / 'module01.bin').is_file())
+        run_context = {'prism': prism}
+        exec(code, run_context)
+        self.assertIn('Module01', run_context)
+
+        module = pickle.loads(pickle.dumps(module))
+        self.assertIsNone(module.bytecode_cache)
+        self.assertEqual(code, module.get_code())
+
+    def test_cached_metadata(self):
+        """
+        Modules whose code object is in the cache aren't parsed to find their task
+        class and settings
+        """
+        modules_dir = Path(self.tmpdir.name) / 'modules'
+        shutil.copytree(TASK_WITH_RESOURCES_DIR, modules_dir)
+        args = (
+            Path('task_with_resources.py'),
+            modules_dir / 'task_with_resources.py',
+            ModuleManifest()
+        )
+        module = CompiledModule(*args, bytecode_cache=self.cache)
+        module.get_code()
+
+        module = CompiledModule(*args, bytecode_cache=self.cache)
+        self.assertEqual(['snowflake', 'warehouse_heavy'], module.grab_resources())
+        self.assertEqual(0, module.grab_priority())
+        run_context = {'prism': prism}
+        task_var_name = module.instantiate_module_class(
+            run_context, PrismTaskManager({}), PrismHooks(None)
+        )
+        self.assertIsInstance(run_context[task_var_name], prism.task.PrismTask)
+        self.assertIsNone(module._ast_parser)
@@ -0,0 +1,134 @@
+"""
+Unit testing for the CancellationToken class, through which the executor cancels
+attempts of tasks that run in threads.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import asyncio
+import threading
+from types import SimpleNamespace
+import unittest
+
+# Prism imports
+import prism.exceptions
+from prism.infra.cancellation import (
+    CancellationToken,
+    commit_attempt,
+    get_current_token,
+    raise_if_cancelled,
+    set_current_token
+)
+from prism.infra.hooks import PrismHooks
+from prism.task import PrismTask
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestCancellationToken(unittest.TestCase):
+
+    def test_cancel_before_commit(self):
+        """
+        Attempts that were cancelled can't commit
+        """
+        token = CancellationToken()
+        self.assertTrue(token.cancel())
+        self.assertTrue(token.event.is_set())
+        with self.assertRaises(prism.exceptions.CancelledException):
+            token.commit()
+
+    def test_commit_before_cancel(self):
+        """
+        Attempts that have committed can't be cancelled
+        """
+        token = CancellationToken()
+        token.commit()
+        self.assertFalse(token.cancel())
+        self.assertFalse(token.is_cancelled())
+        token.commit()
+
+    def test_current_token(self):
+        """
+        Each thread has its own current token. Without a token, attempts can't be
+        cancelled.
+        """
+        token = CancellationToken()
+        token.cancel()
+        errors = []
+
+        def target():
+            set_current_token(token)
+            try:
+                raise_if_cancelled()
+            except prism.exceptions.CancelledException as err:
+                errors.append(err)
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+        self.assertEqual(1, len(errors))
+        self.assertIsNone(get_current_token())
+        raise_if_cancelled()
+        commit_attempt()
+
+    def test_hooks_sql(self):
+        """
+        `hooks.sql` doesn't execute queries for attempts that were cancelled
+        """
+        queries = []
+
+        class Adapter:
+            def execute_sql(self, query, return_type):
+                queries.append(query)
+
+        project = SimpleNamespace(adapters_object_dict={'postgres': Adapter()})
+        hooks = PrismHooks(project)
+        token = CancellationToken()
+        errors = []
+
+        def target():
+            set_current_token(token)
+            hooks.sql('postgres', 'SELECT 1')
+            token.cancel()
+            try:
+                hooks.sql('postgres', 'SELECT 2')
+            except prism.exceptions.CancelledException as err:
+                errors.append(err)
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+        self.assertEqual(['SELECT 1'], queries)
+        self.assertEqual(1, len(errors))
+
+    def test_async_run_in_running_loop(self):
+        """
+        Tasks whose `run` function is a coroutine function can be executed from a
+        thread whose event loop is running, and they still see the attempt's token
+        """
+        class AsyncTask(PrismTask):
+            async def run(self, tasks, hooks):
+                await asyncio.sleep(0)
+                return get_current_token()
+
+        token = CancellationToken()
+
+        async def main():
+            set_current_token(token)
+            task = AsyncTask()
+            task.set_task_manager(None)
+            task.set_hooks(None)
+            task.exec()
+            return task.output
+
+        self.assertIs(token, asyncio.run(main()))
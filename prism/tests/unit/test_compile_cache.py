@@ -0,0 +1,140 @@
+"""
+Unit testing for the CompileCache class, which persists the result of parsing each
+module across compilations.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Prism imports
+import prism.exceptions
+import prism.infra.compiler as compiler
+import prism.parsers.ast_parser as ast_parser
+from prism.infra.compile_cache import CompileCache
+
+
+# Directory containing DAG test cases
+TASK_REF_3NODES_DIR = Path(__file__).parent / 'test_all_things_dag' / 'task_ref_3nodes'
+MODULES = [Path('module01.py'), Path('module02.py'), Path('module03.py')]
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestCompileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.wkdir = os.getcwd()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.modules_dir = Path(self.tmpdir.name) / 'modules'
+        self.compiled_dir = Path(self.tmpdir.name) / '.compiled'
+        self.compiled_dir.mkdir()
+        shutil.copytree(TASK_REF_3NODES_DIR, self.modules_dir)
+
+    def tearDown(self):
+        os.chdir(self.wkdir)
+        self.tmpdir.cleanup()
+
+    def parse(self):
+        """
+        Compile the modules with a new DagCompiler and return the mod refs, along with
+        the modules that were actually parsed
+        """
+        dag_compiler = compiler.DagCompiler(
+            Path(self.tmpdir.name), self.compiled_dir, MODULES, MODULES, False
+        )
+        parsed = []
+        parser_cls = ast_parser.AstParser
+
+        def _parser(module_relative_path, parent_path):
+            parsed.append(module_relative_path)
+            return parser_cls(module_relative_path, parent_path)
+
+        with mock.patch.object(ast_parser, 'AstParser', side_effect=_parser):
+            dag_compiler.create_topsort(MODULES, MODULES, self.modules_dir)
+        task_refs = dag_compiler.parse_task_refs(MODULES, self.modules_dir)
+        return task_refs, dag_compiler.module_manifests, parsed
+
+    def test_unchanged_modules_are_not_parsed(self):
+        """
+        Only modules that changed since the last compilation are parsed, and cached
+        parse results are identical to fresh ones
+        """
+        task_refs, manifests, parsed = self.parse()
+        self.assertEqual(MODULES, parsed)
+        self.assertTrue((self.compiled_dir / 'compile_cache.json').is_file())
+
+        cached_task_refs, cached_manifests, parsed = self.parse()
+        self.assertEqual([], parsed)
+        self.assertEqual(task_refs, cached_task_refs)
+        self.assertEqual(
+            {k: v.manifest_dict for k, v in manifests.items()},
+            {k: v.manifest_dict for k, v in cached_manifests.items()},
+        )
+
+        # Change module03
+        with open(self.modules_dir / 'module03.py', 'a') as f:
+            f.write('\n# Changed\n')
+        _, _, parsed = self.parse()
+        self.assertEqual([Path('module03.py')], parsed)
+
+    def test_version_mismatch(self):
+        """
+        Entries written by a different version of Prism are ignored
+        """
+        self.parse()
+        cache = CompileCache(self.compiled_dir)
+        self.assertEqual(3, len(cache.modules))
+        cache.cache_dict["version"] = "0.0.0"
+        cache.json_dump(self.compiled_dir)
+        self.assertEqual({}, CompileCache(self.compiled_dir).modules)
+
+    def test_corrupt_cache(self):
+        """
+        Cache files and entries that aren't dictionaries are ignored
+        """
+        with open(self.compiled_dir / 'compile_cache.json', 'w') as f:
+            f.write('[1, 2, 3]')
+        self.assertEqual({}, CompileCache(self.compiled_dir).modules)
+
+        self.parse()
+        cache = CompileCache(self.compiled_dir)
+        cache.modules['module01.py'] = ['not', 'a', 'dict']
+        cache.json_dump(self.compiled_dir)
+        cache = CompileCache(self.compiled_dir)
+        module01 = self.modules_dir / 'module01.py'
+        self.assertIsNone(cache.get(Path('module01.py'), module01))
+        self.assertIsNotNone(
+            cache.get(Path('module02.py'), self.modules_dir / 'module02.py')
+        )
+        _, _, parsed = self.parse()
+        self.assertEqual([Path('module01.py')], parsed)
+
+    def test_failed_compilation(self):
+        """
+        Parse results are not saved if the DAG doesn't compile
+        """
+        with open(self.modules_dir / 'module01.py', 'r') as f:
+            module01 = f.read()
+        with open(self.modules_dir / 'module01.py', 'w') as f:
+            f.write(module01.replace(
+                'return "This is module 1."', 'return tasks.ref("module03.py")'
+            ))
+        with self.assertRaises(prism.exceptions.DAGException):
+            self.parse()
+        self.assertFalse((self.compiled_dir / 'compile_cache.json').is_file())
@@ -0,0 +1,81 @@
+"""
+Unit testing for the Dag class, which sorts modules into their execution order.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from pathlib import Path
+import unittest
+
+# Prism imports
+import prism.exceptions
+from prism.infra.dag import Dag
+
+
+# Modules
+a, b, c, d, e = [Path(f'{x}.py') for x in 'abcde']
+
+
+def _create_dag(edges, nodes=()):
+    dag = Dag()
+    for u, v in edges:
+        dag.add_edge(u, v)
+    for node in nodes:
+        dag.add_node(node)
+    return dag
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestDag(unittest.TestCase):
+
+    def test_topological_sort(self):
+        """
+        Modules are sorted after the modules they reference. Modules whose references
+        have all been sorted are taken last-in, first-out.
+        """
+        dag = _create_dag([(a, b), (a, c), (b, d), (c, d)], nodes=[e])
+        self.assertEqual([e, a, c, b, d], dag.topological_sort())
+        self.assertEqual([a, b], dag.subgraph([b, a, b]).topological_sort())
+        self.assertEqual([b, c], list(dag.predecessors(d)))
+        self.assertEqual([b, c], list(dag.successors(a)))
+        with self.assertRaises(prism.exceptions.CompileException) as cm:
+            dag.successors(Path('f.py'))
+        self.assertIn('module `f.py` not found in project', str(cm.exception))
+
+    def test_levels(self):
+        """
+        Each module is one level below the deepest module it references
+        """
+        dag = _create_dag([(a, b), (b, c), (a, c), (d, c)], nodes=[e])
+        self.assertEqual([[e, d, a], [b], [c]], dag.levels())
+
+    def test_cycles(self):
+        """
+        Cycles are reported with the modules that form them
+        """
+        dag = _create_dag([(a, b), (b, c), (c, a), (c, d), (d, e), (e, d)])
+        self.assertFalse(dag.is_acyclic())
+        self.assertEqual(
+            sorted([{'a.py', 'b.py', 'c.py'}, {'d.py', 'e.py'}], key=sorted),
+            sorted(dag.find_cycles(), key=sorted)
+        )
+        with self.assertRaises(prism.exceptions.DAGException) as cm:
+            dag.topological_sort()
+        self.assertIn('invalid DAG, cycle found in', str(cm.exception))
+
+        # Long chains don't exceed the recursion limit
+        chain = [Path(f'module{i}.py') for i in range(5000)]
+        dag = _create_dag(zip(chain[:-1], chain[1:]))
+        self.assertTrue(dag.is_acyclic())
+        self.assertEqual([], dag.find_cycles())
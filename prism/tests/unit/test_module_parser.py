@@ -42,6 +42,8 @@ BAD_RUN_EXTRA_ARG = Path('bad_run_extra_arg.py')
 BAD_RUN_MISSING_ARG = Path('bad_run_missing_arg.py')
 BAD_RUN_NO_TASKS = Path('bad_run_no_tasks.py')
 NO_RUN_FUNC = Path('no_run_func.py')
+ASYNC_PRISM_TASK = Path('async_prism_task.py')
+TASK_WITH_RESOURCES = Path('task_with_resources.py')
 
 
 ##############################
@@ -238,6 +240,58 @@ class TestModuleParsing(unittest.TestCase):
         ]
         self.assertEqual(sorted(expected_tasks), sorted(parser.parse()))
 
+    def test_async_prism_task(self):
+        """
+        The `run` function and other functions in the PrismTask can be coroutine
+        functions
+        """
+        # Prism task
+        parser = ast_parser.AstParser(ASYNC_PRISM_TASK, MODULE_TEST_CASES)
+
+        # Prism task name
+        prism_task_class = parser.get_prism_task_node(parser.classes, parser.bases)
+        prism_task_name = prism_task_class.name
+
+        # Run function
+        run_func = parser.get_run_func(prism_task_class)
+        run_func_args = parser.get_func_args(run_func)
+
+        self.assertEqual("AsyncPrismTask", prism_task_name)
+        self.assertEqual(['self', 'tasks', 'hooks'], run_func_args)
+
+        # Calling `parse` shouldn't throw an error, and refs in all functions should be
+        # found
+        expected_tasks = [Path('hello.py'), Path('world.py')]
+        self.assertEqual(sorted(expected_tasks), sorted(parser.parse()))
+
+    def test_literal_assignment(self):
+        """
+        Literal assignments, e.g., lists of strings, can be extracted from a module
+        """
+        parser = ast_parser.AstParser(TASK_WITH_RESOURCES, MODULE_TEST_CASES)
+        resources = parser.get_literal_assignment(parser.ast_module, 'RESOURCES')
+        self.assertEqual(["snowflake", "warehouse_heavy"], resources)
+        self.assertIsNone(
+            parser.get_literal_assignment(parser.ast_module, 'PRIORITY')
+        )
+
+        # Variables in the PrismTask's body are found, but variables assigned within
+        # functions or other classes are not
+        self.assertEqual(
+            ["data/input.csv"],
+            parser.get_literal_assignment(parser.ast_module, 'INPUTS')
+        )
+        self.assertIsNone(parser.get_literal_assignment(parser.ast_module, 'TAGS'))
+        self.assertEqual([], parser.get_tags())
+
+        # Other settings follow the same scoping rule
+        self.assertEqual(
+            2, parser.get_variable_assignments(parser.ast_module, 'RETRIES')
+        )
+        self.assertIsNone(
+            parser.get_variable_assignments(parser.ast_module, 'PRIORITY')
+        )
+
     def test_if_name_main(self):
         """
         If a module contains `if __name__ == '__main__'`, throw an error
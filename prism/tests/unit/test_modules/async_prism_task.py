@@ -0,0 +1,15 @@
+from prism.task import PrismTask
+import asyncio
+
+
+class AsyncPrismTask(PrismTask):
+
+    async def helper(self, tasks):
+        return tasks.ref('hello.py')
+
+    async def run(self, tasks, hooks):
+        await asyncio.sleep(0)
+        return await self.helper(tasks) + tasks.ref('world.py')
+
+
+# EOF
@@ -0,0 +1,25 @@
+from prism.task import PrismTask
+
+RESOURCES = ["snowflake", "warehouse_heavy"]
+
+
+class TaskWithResources(PrismTask):
+    INPUTS = ["data/input.csv"]
+    RETRIES = 2
+
+    def run(self, tasks, hooks):
+        TAGS = ["nightly"]
+        PRIORITY = 5
+
+        def helper():
+            TAGS = ["inner"]
+            return TAGS
+
+        return hooks.sql("snowflake", "SELECT 1"), TAGS, PRIORITY, helper()
+
+
+class Helper:
+    TAGS = ["hourly"]
+
+
+# EOF
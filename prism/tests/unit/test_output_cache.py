@@ -0,0 +1,101 @@
+"""
+Unit testing for the content-addressed cache of task outputs.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+# Prism imports
+from prism.infra.output_cache import (
+    OutputCache,
+    compute_key,
+    get_project_var_refs,
+    hash_output
+)
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestOutputCache(unittest.TestCase):
+
+    def test_project_var_refs(self):
+        """
+        Both `prism_project.VAR` and `from prism_project import VAR` are detected
+        """
+        module_str = '\n'.join([
+            'import prism_project',
+            'from prism_project import VAR_1',
+            'x = prism_project.VAR_2 + prism_project.VAR_2',
+            'y = other.VAR_3',
+        ])
+        self.assertEqual(['VAR_1', 'VAR_2'], get_project_var_refs(module_str))
+
+    def test_compute_key(self):
+        """
+        The key changes if the module, its upstream outputs, its project variables, or
+        the adapters change
+        """
+        args = ('x = 1', {'a.py': 'abc'}, {'VAR_1': 1}, [('postgres', {'port': 1})])
+        key = compute_key(*args)
+        self.assertEqual(key, compute_key(*args))
+        self.assertNotEqual(key, compute_key('x = 2', *args[1:]))
+        self.assertNotEqual(key, compute_key(args[0], {'a.py': 'def'}, *args[2:]))
+        self.assertNotEqual(key, compute_key(*args[:2], {'VAR_1': 2}, args[3]))
+        self.assertNotEqual(key, compute_key(*args[:3], [('postgres', {'port': 2})]))
+
+    def test_hash_output(self):
+        """
+        Outputs that can't be pickled can't be hashed. Hashes of file paths depend on
+        the file.
+        """
+        self.assertEqual(hash_output([1, 2]), hash_output([1, 2]))
+        self.assertIsNone(hash_output(lambda: 1))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'target.txt'
+            path.write_text('a')
+            first_hash = hash_output(str(path))
+            path.write_text('ab')
+            self.assertNotEqual(first_hash, hash_output(str(path)))
+
+    def test_get_and_put(self):
+        """
+        Cached outputs can be retrieved by their key
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = OutputCache(Path(tmpdir) / 'cache')
+            self.assertIsNone(cache.get('key'))
+            cache.put('key', {'a': 1}, 'hash')
+            self.assertEqual(({'a': 1}, 'hash'), cache.get('key'))
+
+    def test_lru_eviction(self):
+        """
+        Once the cache exceeds its size limit, the least recently used outputs are
+        evicted
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = OutputCache(Path(tmpdir), max_mb=2.5)
+            output = b'x' * 1024 * 1024
+            cache.put('a', output, 'a')
+            cache.put('b', output, 'b')
+
+            # Make `a` the most recently used output
+            os.utime(Path(tmpdir) / 'b.pkl', (0, 0))
+            self.assertIsNotNone(cache.get('a'))
+            cache.put('c', output, 'c')
+            self.assertIsNone(cache.get('b'))
+            self.assertIsNotNone(cache.get('a'))
+            self.assertIsNotNone(cache.get('c'))
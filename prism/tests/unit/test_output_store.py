@@ -0,0 +1,80 @@
+"""
+Unit testing for the OutputStore class, which writes large task outputs to
+memory-mapped files.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from pathlib import Path
+import pickle
+import tempfile
+import unittest
+
+# Third-party imports
+import numpy as np
+import pandas as pd
+
+# Prism imports
+from prism.infra.output_store import OutputStore
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestOutputStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = OutputStore(Path(self.tmpdir.name), min_bytes=1024)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_ndarray(self):
+        """
+        Arrays are mapped copy-on-write, so modifying them doesn't affect the stored
+        output
+        """
+        arr = np.arange(1000, dtype='float64')
+        stored = self.store.put('a.py', arr)
+        self.assertEqual('npy', stored.format)
+
+        # Stored outputs can be sent to other processes
+        stored = pickle.loads(pickle.dumps(stored))
+        loaded = stored.load()
+        self.assertIsInstance(loaded, np.memmap)
+        self.assertTrue(np.array_equal(arr, loaded))
+        loaded[0] = 5
+        self.assertEqual(0, stored.load()[0])
+
+    def test_dataframe(self):
+        """
+        DataFrames are stored as Arrow files, unless they wouldn't survive the round
+        trip
+        """
+        df = pd.DataFrame({'a': np.arange(1000), 'b': 1.0}).set_index('a')
+        stored = self.store.put('a.py', df)
+        self.assertEqual('arrow', stored.format)
+        self.assertTrue(df.equals(stored.load()))
+
+        self.assertIsNone(self.store.put('b.py', pd.DataFrame({1: np.arange(1000)})))
+        self.assertIsNone(self.store.put('c.py', pd.DataFrame({'a': [1, 'a'] * 500})))
+
+    def test_small_outputs(self):
+        """
+        Small outputs and outputs of other types are kept in memory
+        """
+        self.assertIsNone(self.store.put('a.py', np.arange(10)))
+        self.assertIsNone(self.store.put('b.py', list(range(1000))))
+        self.assertIsNone(self.store.put('c.py', np.array([object()] * 1000)))
+        self.store.clear()
+        self.assertFalse(Path(self.tmpdir.name).exists())
@@ -0,0 +1,95 @@
+"""
+Unit testing for the execution plan created by `prism compile --plan`.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from pathlib import Path
+import unittest
+
+# Prism imports
+from prism.infra.dag import Dag
+from prism.infra.planner import create_plan
+
+
+def _create_dag(edges, nodes=()):
+    dag = Dag()
+    for u, v in edges:
+        dag.add_edge(Path(u), Path(v))
+    for node in nodes:
+        dag.add_node(Path(node))
+    return dag
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestPlanner(unittest.TestCase):
+
+    def test_plan(self):
+        """
+        The critical path is the longest chain of modules weighted by duration, and the
+        predicted wall time depends on the number of threads
+        """
+        dag = _create_dag(
+            [('a.py', 'c.py'), ('b.py', 'c.py'), ('c.py', 'd.py')],
+            nodes=['e.py']
+        )
+        durations = {'a.py': 4.0, 'b.py': 2.0, 'c.py': 1.0, 'd.py': 3.0, 'e.py': 6.0}
+        plan = create_plan(dag, 1, durations)
+        self.assertEqual(
+            [['e.py', 'b.py', 'a.py'], ['c.py'], ['d.py']], plan["levels"]
+        )
+        self.assertEqual(3, plan["max_parallel_width"])
+        self.assertEqual(['a.py', 'c.py', 'd.py'], plan["critical_path"])
+        self.assertEqual(8.0, plan["critical_path_duration"])
+        self.assertEqual(16.0, plan["total_duration"])
+        self.assertEqual(16.0, plan["predicted_wall_time"])
+
+        # With two threads, the run is simulated with the scheduler's order. a.py starts
+        # first, since it is on the critical path. e.py and b.py have critical paths of
+        # the same length, so e.py (which comes first in the topological sort) starts
+        # next and holds up c.py until b.py finishes.
+        self.assertEqual(10.0, create_plan(dag, 2, durations)["predicted_wall_time"])
+
+        # No matter how many threads there are, the run takes at least as long as the
+        # critical path
+        self.assertEqual(8.0, create_plan(dag, 8, durations)["predicted_wall_time"])
+
+    def test_resource_limits(self):
+        """
+        Modules that share a resource at its limit don't run at the same time
+        """
+        dag = _create_dag([], nodes=['a.py', 'b.py', 'c.py'])
+        durations = {'a.py': 2.0, 'b.py': 2.0, 'c.py': 2.0}
+        resources = {'a.py': ['warehouse'], 'b.py': ['warehouse']}
+        self.assertEqual(2.0, create_plan(dag, 3, durations)["predicted_wall_time"])
+        plan = create_plan(
+            dag, 3, durations, resources=resources, resource_limits={'warehouse': 1}
+        )
+        self.assertEqual(4.0, plan["predicted_wall_time"])
+
+    def test_missing_durations(self):
+        """
+        Modules that haven't run before take the average duration of the modules that
+        have, or one second if no module has run
+        """
+        dag = _create_dag([('a.py', 'b.py'), ('b.py', 'c.py')])
+        plan = create_plan(dag, 1, {'a.py': 2.0, 'b.py': 4.0})
+        self.assertEqual(9.0, plan["predicted_wall_time"])
+        self.assertEqual(['c.py'], plan["modules_without_durations"])
+        self.assertEqual(3.0, create_plan(dag, 1, {})["predicted_wall_time"])
+
+        # Empty DAG
+        plan = create_plan(Dag(), 2, {})
+        self.assertEqual(([], 0, []), (plan["levels"], plan["max_parallel_width"], plan["critical_path"]))  # noqa: E501
+        self.assertEqual(0.0, plan["predicted_wall_time"])
@@ -0,0 +1,23 @@
+"""
+@name: ...
+@author: ...
+@version: ...
+@description: ...
+
+--------------------------------------------------------------------------------
+Table of Contents
+- Resource limits
+"""
+
+###################
+# Resource limits #
+###################
+
+# Maximum number of running tasks that can use each resource
+RESOURCE_LIMITS = {
+    "snowflake": 2,
+    "warehouse_heavy": 1,
+}
+
+
+# EOF
@@ -41,6 +41,8 @@ TRIGGERS_NORMAL = 'triggers_normal.py'
 ON_FAILURE_TRIGGERS_ONLY = 'on_failure_triggers_only.py'
 ON_SUCCESS_TRIGGERS_ONLY = 'on_success_triggers_only.py'
 BAD_TRIGGER_KEY = 'bad_trigger_key.py'
+RESOURCE_LIMITS = 'resource_limits.py'
+BAD_RESOURCE_LIMITS = 'bad_resource_limits.py'
 
 # List of all test case .yml files
 ALL_TEST_CASE_FILES = [
@@ -235,3 +237,51 @@ class TestPrismProject(unittest.TestCase):
             prism_project.get_triggers(run_context)
         expected_msg = 'invalid key `this_key_should_not_exist` in TRIGGERS dictionary'
         self.assertEqual(str(cm.exception), expected_msg)
+
+    def test_resource_limits(self):
+        """
+        Resource limits are parsed from RESOURCE_LIMITS, and default to an empty dict
+        """
+        run_context = {}
+        prism_project = project.PrismProject(
+            project_dir=PRISM_PROJECT_PY_TEST_CASES,
+            user_context={},
+            which="run",
+            filename=RESOURCE_LIMITS
+        )
+        engine = SysPathEngine(run_context)
+        prism_project.exec(run_context, engine)
+        expected_limits = {"snowflake": 2, "warehouse_heavy": 1}
+        self.assertEqual(
+            expected_limits, prism_project.get_resource_limits(run_context)
+        )
+
+        # No resource limits
+        run_context = {}
+        prism_project = project.PrismProject(
+            project_dir=PRISM_PROJECT_PY_TEST_CASES,
+            user_context={},
+            which="run",
+            filename=NO_PROFILE
+        )
+        engine = SysPathEngine(run_context)
+        prism_project.exec(run_context, engine)
+        self.assertEqual({}, prism_project.get_resource_limits(run_context))
+
+    def test_bad_resource_limits(self):
+        """
+        Resource limits must be positive integers
+        """
+        run_context = {}
+        prism_project = project.PrismProject(
+            project_dir=PRISM_PROJECT_PY_TEST_CASES,
+            user_context={},
+            which="run",
+            filename=BAD_RESOURCE_LIMITS
+        )
+        engine = SysPathEngine(run_context)
+        prism_project.exec(run_context, engine)
+        with self.assertRaises(prism.exceptions.InvalidProjectPyException) as cm:
+            prism_project.get_resource_limits(run_context)
+        expected_msg = 'invalid resource limit `snowflake: 0` in `RESOURCE_LIMITS`; must map resource names to positive integers'  # noqa: E501
+        self.assertEqual(str(cm.exception), expected_msg)
@@ -0,0 +1,268 @@
+"""
+Unit testing for the QueryCache class, which caches the results of `hooks.sql` queries.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import asyncio
+from pathlib import Path
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+import unittest
+
+# Third-party imports
+import pandas as pd
+
+# Prism imports
+from prism.infra.hooks import PrismHooks
+from prism.infra.query_cache import (
+    QueryCache,
+    compute_query_key,
+    is_read_only,
+    normalize_query
+)
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestQueryCache(unittest.TestCase):
+
+    def test_key(self):
+        """
+        Queries that only differ in whitespace share a key. Queries that use different
+        adapters don't.
+        """
+        self.assertEqual('SELECT * FROM a', normalize_query(' SELECT *\n  FROM a;\n'))
+        key = compute_query_key('postgres', {'port': 1}, 'SELECT * FROM a')
+        self.assertEqual(key, compute_query_key('postgres', {'port': 1}, 'SELECT *  FROM a;'))  # noqa: E501
+        self.assertNotEqual(key, compute_query_key('postgres', {'port': 2}, 'SELECT * FROM a'))  # noqa: E501
+        self.assertNotEqual(key, compute_query_key('postgres', {'port': 1}, 'SELECT * FROM b'))  # noqa: E501
+
+    def test_key_literals(self):
+        """
+        Whitespace within string literals and quoted identifiers is significant
+        """
+        self.assertEqual(
+            "SELECT 'a  b', \"x  y\" FROM a WHERE b = 'it''s  c'",
+            normalize_query("SELECT  'a  b',\n\"x  y\" FROM a WHERE b = 'it''s  c';")
+        )
+        self.assertNotEqual(
+            normalize_query("SELECT * FROM a WHERE b = 'a  b'"),
+            normalize_query("SELECT * FROM a WHERE b = 'a b'")
+        )
+
+        # If literals can't be delimited reliably, then only the ends are stripped
+        self.assertEqual(
+            "SELECT 'a\\'  b'", normalize_query(" SELECT 'a\\'  b';")
+        )
+        self.assertEqual(
+            "SELECT $$a  b$$", normalize_query("SELECT $$a  b$$;")
+        )
+
+    def test_read_only(self):
+        """
+        Only queries that read data are cached
+        """
+        self.assertTrue(is_read_only('select 1'))
+        self.assertTrue(is_read_only('\n  WITH a AS (SELECT 1) SELECT * FROM a'))
+        self.assertFalse(is_read_only('INSERT INTO a VALUES (1)'))
+        self.assertFalse(is_read_only('create table a (b int)'))
+
+        # Statements that write data after a read-only keyword
+        self.assertTrue(is_read_only("SELECT 'insert into a' AS b;"))
+        self.assertFalse(is_read_only('WITH x AS (SELECT 1) DELETE FROM t'))
+        self.assertFalse(is_read_only('SELECT * INTO t2 FROM t'))
+        self.assertFalse(is_read_only('SELECT 1; DROP TABLE t'))
+        self.assertFalse(is_read_only('explain analyze update t set a = 1'))
+
+    def test_lru_and_ttl(self):
+        """
+        The least recently used results are evicted, and results expire after the TTL
+        """
+        cache = QueryCache(ttl_seconds=60, max_entries=2)
+        cache.put('a', pd.DataFrame({'x': [1]}))
+        cache.put('b', pd.DataFrame({'x': [2]}))
+        self.assertIsNotNone(cache.get('a'))
+        cache.put('c', pd.DataFrame({'x': [3]}))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual([1], cache.get('a')['x'].tolist())
+
+        cache = QueryCache(ttl_seconds=0.01)
+        cache.put('a', pd.DataFrame({'x': [1]}))
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('a'))
+
+    def test_copies(self):
+        """
+        Callers can modify their results without affecting the cache
+        """
+        cache = QueryCache()
+        cache.put('a', pd.DataFrame({'x': [1]}))
+        df = cache.get('a')
+        df['x'] = [2]
+        self.assertEqual([1], cache.get('a')['x'].tolist())
+
+    def test_disk(self):
+        """
+        Results stored on disk are available to new caches, e.g., in later runs
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            QueryCache(cache_dir=Path(tmpdir)).put('a', pd.DataFrame({'x': [1]}))
+            self.assertTrue((Path(tmpdir) / 'a.parquet').is_file())
+            df = QueryCache(cache_dir=Path(tmpdir)).get('a')
+            self.assertEqual([1], df['x'].tolist())
+            self.assertIsNone(QueryCache(0.0001, cache_dir=Path(tmpdir)).get('a'))
+
+    def test_async_disk(self):
+        """
+        Results are read from disk without blocking the event loop
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            QueryCache(cache_dir=Path(tmpdir)).put('a', pd.DataFrame({'x': [1]}))
+            cache = QueryCache(cache_dir=Path(tmpdir))
+            get_disk = cache._get_disk
+            threads = []
+
+            def _get_disk(key):
+                threads.append(threading.current_thread())
+                return get_disk(key)
+
+            async def execute():
+                raise AssertionError('query should not be executed')
+
+            cache._get_disk = _get_disk  # type: ignore
+            df = asyncio.run(cache.aget_or_execute('a', execute))
+            self.assertEqual([1], df['x'].tolist())
+            self.assertEqual(1, len(threads))
+            self.assertIsNot(threading.main_thread(), threads[0])
+
+    def test_single_flight(self):
+        """
+        Concurrent identical queries are only executed once
+        """
+        cache = QueryCache()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def execute():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return pd.DataFrame({'x': [1]})
+
+        # Each caller modifies its result in place, which doesn't affect the results of
+        # the other callers
+        results = []
+
+        def query(i):
+            df = cache.get_or_execute('a', execute)
+            results.append(df['x'].tolist())
+            df['x'] = [i]
+
+        threads = [threading.Thread(target=query, args=(i,)) for i in range(4)]
+        threads[0].start()
+        started.wait()
+        for t in threads[1:]:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(1, len(calls))
+        self.assertEqual([[1]] * 4, results)
+        self.assertEqual([1], cache.get('a')['x'].tolist())
+
+    def test_async_single_flight(self):
+        """
+        Concurrent identical queries on an event loop are only awaited once
+        """
+        calls = []
+
+        async def execute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return pd.DataFrame({'x': [1]})
+
+        async def query(i):
+            df = await cache.aget_or_execute('a', execute)
+            result = df['x'].tolist()
+            df['x'] = [i]
+            return result
+
+        async def main():
+            return await asyncio.gather(*[query(i) for i in range(4)])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = QueryCache(cache_dir=Path(tmpdir))
+            results = asyncio.run(main())
+            self.assertTrue((Path(tmpdir) / 'a.parquet').is_file())
+        self.assertEqual(1, len(calls))
+        self.assertEqual([[1]] * 4, results)
+        self.assertEqual([1], cache.get('a')['x'].tolist())
+
+    def test_async_leader_cancelled(self):
+        """
+        If the caller awaiting a query is cancelled, then the callers waiting for the
+        same query still get a result
+        """
+        calls = []
+
+        async def execute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return pd.DataFrame({'x': [len(calls)]})
+
+        async def main():
+            cache = QueryCache()
+            leader = asyncio.ensure_future(cache.aget_or_execute('a', execute))
+            await asyncio.sleep(0)
+            followers = [
+                asyncio.ensure_future(cache.aget_or_execute('a', execute))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            results = await asyncio.gather(*followers)
+            self.assertTrue(leader.cancelled())
+            return [df['x'].tolist() for df in results]
+
+        self.assertEqual([[2], [2]], asyncio.run(main()))
+        self.assertEqual(2, len(calls))
+
+    def test_hooks_sql(self):
+        """
+        `hooks.sql` uses the cache unless `cache=False`. Queries that write data are
+        never cached.
+        """
+        class Adapter:
+            adapter_dict = {'port': 1}
+            queries = []
+
+            def execute_sql(self, query, return_type):
+                self.queries.append(query)
+                return pd.DataFrame({'x': [len(self.queries)]})
+
+        adapter = Adapter()
+        project = SimpleNamespace(
+            adapters_object_dict={'postgres': adapter}, sql_cache=QueryCache()
+        )
+        hooks = PrismHooks(project)
+        self.assertEqual([1], hooks.sql('postgres', 'SELECT 1')['x'].tolist())
+        self.assertEqual([1], hooks.sql('postgres', 'SELECT 1;')['x'].tolist())
+        self.assertEqual([2], hooks.sql('postgres', 'SELECT 1', cache=False)['x'].tolist())  # noqa: E501
+        hooks.sql('postgres', 'INSERT INTO a VALUES (1)')
+        hooks.sql('postgres', 'INSERT INTO a VALUES (1)')
+        self.assertEqual(4, len(adapter.queries))
@@ -0,0 +1,80 @@
+"""
+Unit testing for the RetryPolicy class, which determines whether and when a failed task
+is retried.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import unittest
+
+# Prism imports
+import prism.exceptions
+from prism.infra.retries import RetryPolicy, get_error_classes
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_no_retries(self):
+        """
+        By default, tasks are not retried
+        """
+        policy = RetryPolicy()
+        self.assertFalse(policy.should_retry(1, get_error_classes(ValueError())))
+
+    def test_exponential_backoff(self):
+        """
+        The delay grows by a factor of `backoff` after each attempt, up to the maximum
+        """
+        policy = RetryPolicy(
+            retries=5, delay_seconds=2, backoff=3, max_delay_seconds=30
+        )
+        self.assertEqual(
+            [2, 6, 18, 30, 30], [policy.get_delay(i) for i in range(1, 6)]
+        )
+        self.assertTrue(policy.should_retry(5, get_error_classes(ValueError())))
+        self.assertFalse(policy.should_retry(6, get_error_classes(ValueError())))
+
+    def test_jitter(self):
+        """
+        Jitter randomly scales the delay within the specified fraction
+        """
+        policy = RetryPolicy(retries=1, delay_seconds=10, jitter=0.5)
+        delays = [policy.get_delay(1) for _ in range(100)]
+        self.assertTrue(all(5 <= d <= 15 for d in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_retry_on(self):
+        """
+        If `retry_on` is specified, then only errors of those classes (or of their
+        subclasses) are retried
+        """
+        policy = RetryPolicy(retries=1, retry_on=['ConnectionError'])
+        self.assertTrue(policy.should_retry(1, get_error_classes(ConnectionError())))
+        self.assertTrue(
+            policy.should_retry(1, get_error_classes(ConnectionRefusedError()))
+        )
+        self.assertFalse(policy.should_retry(1, get_error_classes(ValueError())))
+        self.assertFalse(policy.should_retry(1, get_error_classes(None)))
+
+        # Errors can also be specified by their fully-qualified name
+        policy = RetryPolicy(
+            retries=1, retry_on=['prism.exceptions.RuntimeException']
+        )
+        self.assertTrue(
+            policy.should_retry(
+                1, get_error_classes(prism.exceptions.RuntimeException('error'))
+            )
+        )
+        self.assertFalse(policy.should_retry(1, get_error_classes(RuntimeError())))
@@ -0,0 +1,192 @@
+"""
+Unit testing for the TaskScheduler class, which releases tasks into the ready queue as
+soon as their upstream tasks have completed.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import unittest
+
+# Prism imports
+from prism.infra.scheduler import TaskScheduler
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestTaskScheduler(unittest.TestCase):
+
+    def _drain_ready(self, scheduler: TaskScheduler) -> list:
+        ready = []
+        while scheduler.has_ready():
+            ready.append(scheduler.pop_ready())
+        return ready
+
+    def test_roots_are_ready(self):
+        """
+        Tasks without upstream tasks are immediately ready, in topological order
+        """
+        scheduler = TaskScheduler({
+            'a.py': [],
+            'b.py': ['a.py'],
+            'c.py': [],
+        })
+        self.assertEqual(['a.py', 'c.py'], self._drain_ready(scheduler))
+        self.assertFalse(scheduler.is_finished())
+
+    def test_successors_released_on_completion(self):
+        """
+        A successor is released only after all of its upstream tasks complete
+        """
+        scheduler = TaskScheduler({
+            'a.py': [],
+            'b.py': [],
+            'c.py': ['a.py', 'b.py'],
+            'd.py': ['c.py'],
+        })
+        self.assertEqual(['a.py', 'b.py'], self._drain_ready(scheduler))
+        self.assertEqual([], scheduler.mark_done('a.py'))
+        self.assertFalse(scheduler.has_ready())
+        self.assertEqual(['c.py'], scheduler.mark_done('b.py'))
+        self.assertEqual(['c.py'], self._drain_ready(scheduler))
+        self.assertEqual(['d.py'], scheduler.mark_done('c.py'))
+        self.assertEqual(['d.py'], self._drain_ready(scheduler))
+        scheduler.mark_done('d.py')
+        self.assertTrue(scheduler.is_finished())
+
+    def test_slow_branch_does_not_block_independent_branch(self):
+        """
+        Completing one branch releases its successors even if an earlier task in the
+        topological sort is still running
+        """
+        scheduler = TaskScheduler({
+            'slow.py': [],
+            'slow_child.py': ['slow.py'],
+            'fast.py': [],
+            'fast_child.py': ['fast.py'],
+        })
+        self.assertEqual(['slow.py', 'fast.py'], self._drain_ready(scheduler))
+        self.assertEqual(['fast_child.py'], scheduler.mark_done('fast.py'))
+
+    def test_refs_outside_dag_and_duplicates(self):
+        """
+        References to tasks outside of the DAG are ignored, and duplicate references
+        only count once
+        """
+        scheduler = TaskScheduler({
+            'a.py': ['not_selected.py'],
+            'b.py': ['a.py', 'a.py'],
+        })
+        self.assertEqual(['a.py'], self._drain_ready(scheduler))
+        self.assertEqual(['b.py'], scheduler.mark_done('a.py'))
+
+    def test_critical_path_first(self):
+        """
+        When several tasks are ready and durations are provided, the task with the
+        longest downstream path (weighted by duration) is dispatched first
+        """
+        task_refs = {
+            'short.py': [],
+            'long.py': [],
+            'long_child.py': ['long.py'],
+            'long_grandchild.py': ['long_child.py'],
+        }
+        scheduler = TaskScheduler(task_refs)
+        self.assertEqual(['short.py', 'long.py'], self._drain_ready(scheduler))
+
+        # Without durations from previous runs, each task counts equally
+        scheduler = TaskScheduler(task_refs, durations={})
+        self.assertEqual(['long.py', 'short.py'], self._drain_ready(scheduler))
+
+        # Durations from previous runs take precedence over the number of tasks
+        durations = {
+            'short.py': 100.0,
+            'long.py': 1.0,
+            'long_child.py': 1.0,
+            'long_grandchild.py': 1.0,
+        }
+        scheduler = TaskScheduler(task_refs, durations=durations)
+        self.assertEqual(3.0, scheduler.ranks['long.py'])
+        self.assertEqual(['short.py', 'long.py'], self._drain_ready(scheduler))
+
+    def test_explicit_priority(self):
+        """
+        Explicit priorities take precedence over the critical path
+        """
+        scheduler = TaskScheduler(
+            {'a.py': [], 'b.py': [], 'c.py': ['a.py']},
+            priorities={'b.py': 10}
+        )
+        self.assertEqual(['b.py', 'a.py'], self._drain_ready(scheduler))
+
+    def test_resource_limits(self):
+        """
+        A task is only dispatched if its resources are below their limits. Tasks waiting
+        on a resource don't block tasks that don't use it.
+        """
+        scheduler = TaskScheduler(
+            {'a.py': [], 'b.py': [], 'c.py': [], 'd.py': []},
+            resources={
+                'a.py': ['snowflake'],
+                'b.py': ['snowflake', 'warehouse_heavy'],
+                'c.py': ['warehouse_heavy'],
+            },
+            resource_limits={'snowflake': 1}
+        )
+        self.assertEqual(['a.py', 'c.py', 'd.py'], self._drain_ready(scheduler))
+
+        # Releasing the resource places the waiting task back in the ready queue
+        scheduler.mark_done('a.py')
+        self.assertEqual(['b.py'], self._drain_ready(scheduler))
+        self.assertEqual(1, scheduler.resource_usage['snowflake'])
+
+        # Failed tasks release their resources, too. Releasing twice has no effect.
+        scheduler.release('b.py')
+        scheduler.release('b.py')
+        self.assertEqual(0, scheduler.resource_usage['snowflake'])
+
+    def test_retry_after_delay(self):
+        """
+        A task scheduled to be retried re-enters the ready queue once its delay has
+        elapsed, without blocking other tasks in the meantime
+        """
+        scheduler = TaskScheduler({'a.py': [], 'b.py': []})
+        self.assertEqual(['a.py', 'b.py'], self._drain_ready(scheduler))
+        self.assertIsNone(scheduler.time_until_next_retry())
+
+        scheduler.release('a.py')
+        scheduler.schedule_retry('a.py', 60)
+        self.assertFalse(scheduler.has_ready())
+        self.assertGreater(scheduler.time_until_next_retry(), 59)
+
+        scheduler.release('b.py')
+        scheduler.schedule_retry('b.py', 0)
+        self.assertEqual(['b.py'], self._drain_ready(scheduler))
+        self.assertEqual([], scheduler.mark_done('b.py'))
+        self.assertFalse(scheduler.is_finished())
+
+    def test_skip_downstream(self):
+        """
+        When a task fails, its downstream tasks are skipped; independent tasks are
+        unaffected
+        """
+        scheduler = TaskScheduler({
+            'a.py': [],
+            'b.py': ['a.py'],
+            'c.py': ['b.py'],
+            'd.py': [],
+            'e.py': ['d.py', 'a.py'],
+        })
+        self.assertEqual(['a.py', 'd.py'], self._drain_ready(scheduler))
+        self.assertEqual(['b.py', 'c.py', 'e.py'], scheduler.skip_downstream('a.py'))
+        self.assertEqual([], scheduler.mark_done('d.py'))
+        self.assertTrue(scheduler.is_finished())
@@ -0,0 +1,149 @@
+"""
+Unit testing for `--modules` selectors and the ReachabilityIndex used to resolve them.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+
+# Prism imports
+import prism.exceptions
+import prism.infra.compiler as compiler
+from prism.infra.dag import Dag
+from prism.infra.selector import ModuleSelector, ReachabilityIndex, is_selector
+
+
+# Directory containing DAG test cases
+TASK_REF_3NODES_DIR = Path(__file__).parent / 'test_all_things_dag' / 'task_ref_3nodes'
+MODULES = [Path('module01.py'), Path('module02.py'), Path('module03.py')]
+
+# DAG used for most tests:
+#   a --> b --> d
+#   c --> d --> e
+#   x/f
+a, b, c, d, e, f = [Path(p) for p in ['a.py', 'b.py', 'c.py', 'd.py', 'e.py', 'x/f.py']]
+
+
+def _create_dag():
+    dag = Dag()
+    for u, v in [(a, b), (b, d), (c, d), (d, e)]:
+        dag.add_edge(u, v)
+    dag.add_node(f)
+    return dag
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestSelector(unittest.TestCase):
+
+    def test_is_selector(self):
+        """
+        Module paths and `dir/*` are not selectors
+        """
+        for arg in ['+a.py', 'a.py+', 'tag:nightly', 'a.py,b.py', 'a.py b.py']:
+            self.assertTrue(is_selector(arg))
+        for arg in ['a.py', 'x/f.py', 'x/*']:
+            self.assertFalse(is_selector(arg))
+
+    def test_reachability_index(self):
+        """
+        The ancestors and descendants of each module are stored as bitsets
+        """
+        index = ReachabilityIndex(_create_dag())
+        self.assertEqual(
+            {a, b, c, d}, set(index.to_nodes(index.upstream(index.to_mask([d]))))
+        )
+        self.assertEqual(
+            {b, d, e}, set(index.to_nodes(index.downstream(index.to_mask([b]))))
+        )
+        self.assertEqual([f], index.to_nodes(index.upstream(index.to_mask([f]))))
+        with self.assertRaises(prism.exceptions.CompileException) as cm:
+            index.to_mask([Path('g.py')])
+        self.assertIn('module `g.py` not found in project', str(cm.exception))
+
+    def test_select(self):
+        """
+        Selectors separated by spaces are combined with a union, and selectors joined
+        by commas are combined with an intersection
+        """
+        selector = ModuleSelector(
+            ReachabilityIndex(_create_dag()),
+            {a: ['nightly'], c: ['nightly', 'hourly'], e: ['hourly']}
+        )
+
+        def _select(*selectors):
+            return set(selector.select(list(selectors)))
+
+        self.assertEqual({a, b, c, d}, _select('+d.py'))
+        self.assertEqual({d, e}, _select('d.py+'))
+        self.assertEqual({b, d, e}, _select('b.py+'))
+
+        # `+b.py+` doesn't select c.py, which is only upstream of b.py's descendants
+        self.assertEqual({a, b, d, e}, _select('+b.py+'))
+        self.assertEqual({a, c}, _select('tag:nightly'))
+        self.assertEqual({a, c, e}, _select('tag:nightly', 'tag:hourly'))
+        self.assertEqual({a, c, e}, _select('tag:nightly tag:hourly'))
+        self.assertEqual({c}, _select('tag:nightly,tag:hourly'))
+        self.assertEqual({a}, _select('tag:nightly,+b.py+'))
+        self.assertEqual({a, b, c, d, e}, _select('tag:nightly+'))
+        self.assertEqual({f}, _select('x/*', 'tag:daily'))
+        self.assertEqual(set(), _select('tag:daily'))
+
+        # Invalid selectors
+        for arg, msg in [
+            ('g.py+', 'invalid --modules argument `g.py+`; no modules match `g.py`'),
+            ('y/*', 'invalid --modules argument `y/*`; no modules match `y/*`'),
+            ('+', 'invalid --modules argument `+`'),
+            ('a.py,,b.py', 'invalid --modules argument ``'),
+            ('path:a.py', 'invalid selector method `path` in `path:a.py`'),
+        ]:
+            with self.assertRaises(prism.exceptions.CompileException) as cm:
+                selector.select([arg])
+            self.assertIn(msg, str(cm.exception))
+
+    def test_compiler_selectors(self):
+        """
+        Tags are declared with the `TAGS` variable, and the selected modules replace
+        the modules passed in the user arguments
+        """
+        wkdir = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            modules_dir = Path(tmpdir) / 'modules'
+            shutil.copytree(TASK_REF_3NODES_DIR, modules_dir)
+            with open(modules_dir / 'module02.py', 'r') as f:
+                module02 = f.read()
+            with open(modules_dir / 'module02.py', 'w') as f:
+                f.write(module02.replace(
+                    'class Module02(prism.task.PrismTask):\n',
+                    'class Module02(prism.task.PrismTask):\n    TAGS = "nightly"\n'
+                ))
+            try:
+                dag_compiler = compiler.DagCompiler(
+                    Path(tmpdir), None, MODULES, MODULES, False,
+                    selectors=['+tag:nightly']
+                )
+                _, topsort = dag_compiler.create_topsort(MODULES, MODULES, modules_dir)
+            finally:
+                os.chdir(wkdir)
+        self.assertEqual(
+            [Path('module01.py'), Path('module02.py')], dag_compiler.user_arg_modules
+        )
+        self.assertEqual([Path('module01.py'), Path('module02.py')], topsort)
+        self.assertEqual(
+            ['nightly'],
+            dag_compiler.module_manifests[Path('module02.py')].manifest_dict["tags"]
+        )
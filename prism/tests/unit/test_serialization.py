@@ -0,0 +1,88 @@
+"""
+Unit testing for functions used to ship task outputs between processes.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+
+# Third-party imports
+import numpy as np
+import pandas as pd
+
+# Prism imports
+from prism.infra import serialization
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestSerialization(unittest.TestCase):
+
+    def setUp(self):
+        self.spill_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def test_small_object_in_band(self):
+        """
+        Small objects are pickled in-band; no buffer file is written
+        """
+        obj = {'a': [1, 2, 3], 'b': 'hello'}
+        serialized = serialization.dump_object(obj, self.spill_dir)
+        self.assertIsNone(serialized.buffer_path)
+        self.assertEqual([], list(self.spill_dir.iterdir()))
+        self.assertEqual(obj, serialization.load_object(serialized))
+
+    @unittest.skipIf(
+        not serialization.SUPPORTS_OUT_OF_BAND, "requires pickle protocol 5"
+    )
+    def test_large_array_out_of_band(self):
+        """
+        Large arrays are written to a buffer file, which is removed once loaded
+        """
+        arr = np.arange(serialization.OUT_OF_BAND_MIN_BYTES, dtype=np.float64)
+        serialized = serialization.dump_object(arr, self.spill_dir)
+        self.assertIsNotNone(serialized.buffer_path)
+        self.assertTrue(Path(serialized.buffer_path).is_file())
+        self.assertLess(len(serialized.data), 1024)
+
+        loaded = serialization.load_object(serialized)
+        np.testing.assert_array_equal(arr, loaded)
+        self.assertFalse(Path(serialized.buffer_path).is_file())
+
+        # The mapping is copy-on-write, so the loaded array can be modified
+        loaded[0] = -1
+        self.assertEqual(-1, loaded[0])
+
+    @unittest.skipIf(
+        not serialization.SUPPORTS_OUT_OF_BAND, "requires pickle protocol 5"
+    )
+    def test_dataframe_loaded_multiple_times(self):
+        """
+        A serialized object can be loaded more than once if the buffer file is kept
+        """
+        df = pd.DataFrame({
+            'col1': np.arange(serialization.OUT_OF_BAND_MIN_BYTES),
+            'col2': np.ones(serialization.OUT_OF_BAND_MIN_BYTES),
+        })
+        serialized = serialization.dump_object(df, self.spill_dir)
+        self.assertIsNotNone(serialized.buffer_path)
+        pd.testing.assert_frame_equal(
+            df, serialization.load_object(serialized, remove=False)
+        )
+        pd.testing.assert_frame_equal(df, serialization.load_object(serialized))
+        self.assertFalse(Path(serialized.buffer_path).is_file())
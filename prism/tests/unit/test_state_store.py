@@ -0,0 +1,88 @@
+"""
+Unit testing for the StateStore class, which is used to skip tasks whose targets are up
+to date.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+# Prism imports
+from prism.infra.state_store import StateStore, get_target_paths
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestStateStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.wkdir = Path(self.tmpdir.name)
+        self.store = StateStore(self.wkdir / 'state')
+        self.target = str(self.wkdir / 'target.txt')
+        self.input = str(self.wkdir / 'input.txt')
+        Path(self.target).write_text('target')
+        Path(self.input).write_text('input')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def get_state(self, source_hash='abc'):
+        return self.store.get_state(
+            source_hash, [self.target], {}, [self.input], self.store.get('a.py')
+        )
+
+    def test_get_target_paths(self):
+        """
+        Only outputs that are locations are treated as targets
+        """
+        self.assertEqual(['a.txt'], get_target_paths(Path('a.txt')))
+        self.assertEqual(['a.txt', 'b.txt'], get_target_paths(['a.txt', 'b.txt']))
+        self.assertIsNone(get_target_paths(1))
+        self.assertIsNone(get_target_paths([]))
+
+    def test_fresh(self):
+        """
+        A task is fresh if its source, targets, and inputs match its recorded state.
+        Touching a file without changing it doesn't invalidate the task.
+        """
+        self.assertFalse(self.store.is_fresh('a.py', self.get_state()))
+        self.store.put('a.py', self.get_state())
+        self.assertTrue(self.store.is_fresh('a.py', self.get_state()))
+        os.utime(self.target, (0, 0))
+        self.assertTrue(self.store.is_fresh('a.py', self.get_state()))
+        self.assertFalse(self.store.is_fresh('a.py', self.get_state('def')))
+
+    def test_changed_files(self):
+        """
+        A task is not fresh if a target or input changed, or if a target is missing
+        """
+        self.store.put('a.py', self.get_state())
+        Path(self.input).write_text('changed')
+        self.assertFalse(self.store.is_fresh('a.py', self.get_state()))
+        Path(self.input).write_text('input')
+        self.assertTrue(self.store.is_fresh('a.py', self.get_state()))
+        os.unlink(self.target)
+        self.assertIsNone(self.get_state())
+        self.assertFalse(self.store.is_fresh('a.py', self.get_state()))
+
+    def test_upstream_without_targets(self):
+        """
+        The state of a task whose upstream task doesn't have targets can't be
+        determined
+        """
+        state = self.store.get_state('abc', [self.target], {'b.py': None}, [])
+        self.assertIsNone(state)
@@ -0,0 +1,178 @@
+"""
+Unit testing for the PrismTaskManager class, in particular the eviction of task outputs
+and the loading of targets.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+from pathlib import Path
+import tempfile
+import threading
+import unittest
+
+# Prism imports
+import prism.exceptions
+import prism.target
+from prism.infra.task_manager import (
+    EvictedTaskOutput,
+    PrismTaskManager,
+    PrismTaskOutput
+)
+
+
+class CountingTxt(prism.target.Txt):
+    loads = 0
+
+    def load(self):
+        CountingTxt.loads += 1
+        return super().load()
+
+
+class HooksTarget(prism.target.PrismTarget):
+
+    def load(self):
+        return self.hooks
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestTaskManager(unittest.TestCase):
+
+    def test_evict(self):
+        """
+        Evicted outputs are removed from the task itself and can no longer be
+        referenced
+        """
+        task = PrismTaskOutput('a.py', [1, 2, 3])
+        task_manager = PrismTaskManager(upstream={'a.py': task})
+        evicted = task_manager.evict('a.py')
+        self.assertIsNone(task.output)
+        self.assertIs(evicted, task_manager.upstream['a.py'])
+        with self.assertRaises(prism.exceptions.RuntimeException) as cm:
+            task_manager.ref('a.py')
+        self.assertIn('`a.py` was evicted from memory', str(cm.exception))
+
+        # Evicting an output twice, or a task without an output, is a no-op
+        self.assertIsNone(task_manager.evict('a.py'))
+        self.assertIsNone(task_manager.evict('b.py'))
+
+    def test_has_output(self):
+        """
+        Outputs held from a previous run are available until they are discarded or
+        evicted
+        """
+        task_manager = PrismTaskManager(upstream={
+            'a.py': PrismTaskOutput('a.py', None),
+            'b.py': PrismTaskOutput('b.py', [1, 2, 3])
+        })
+        self.assertTrue(task_manager.has_output('a.py'))
+        self.assertFalse(task_manager.has_output('c.py'))
+        task_manager.discard('a.py')
+        self.assertFalse(task_manager.has_output('a.py'))
+        task_manager.evict('b.py')
+        self.assertFalse(task_manager.has_output('b.py'))
+
+    def test_spill(self):
+        """
+        Spilled outputs are loaded from disk. Outputs that cannot be pickled are
+        dropped.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task_manager = PrismTaskManager(upstream={
+                'a.py': PrismTaskOutput('a.py', [1, 2, 3]),
+                'b.py': PrismTaskOutput('b.py', threading.Lock())
+            })
+            task_manager.evict('a.py', Path(tmpdir))
+            self.assertEqual([1, 2, 3], task_manager.ref('a.py'))
+            self.assertTrue((Path(tmpdir) / 'a.py.pkl').is_file())
+
+            task_manager.evict('b.py', Path(tmpdir))
+            self.assertIsNone(task_manager.upstream['b.py'].path)
+            with self.assertRaises(prism.exceptions.RuntimeException):
+                task_manager.ref('b.py')
+            self.assertIsInstance(task_manager.upstream['b.py'], EvictedTaskOutput)
+
+    def test_load_targets(self):
+        """
+        Targets are loaded once and shared by all consumers. Without `load=True`, the
+        target's location is returned.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            loc = str(Path(tmpdir) / 'a.txt')
+            Path(loc).write_text('hello')
+            task_manager = PrismTaskManager(upstream={
+                'a.py': PrismTaskOutput('a.py', loc, [CountingTxt]),
+                'b.py': PrismTaskOutput('b.py', 'world')
+            })
+            CountingTxt.loads = 0
+            self.assertEqual(loc, task_manager.ref('a.py'))
+            task_manager.prefetch('a.py')
+            self.assertEqual('hello', task_manager.ref('a.py', load=True))
+            self.assertEqual('hello', task_manager.ref('a.py', load=True))
+            self.assertEqual(1, CountingTxt.loads)
+
+            # Tasks without targets return their output
+            self.assertEqual('world', task_manager.ref('b.py', load=True))
+
+            # Errors are raised to each consumer
+            Path(loc).unlink()
+            task_manager.evict('a.py')
+            task_manager.upstream['a.py'] = PrismTaskOutput('a.py', loc, [CountingTxt])
+            for _ in range(2):
+                with self.assertRaises(FileNotFoundError):
+                    task_manager.ref('a.py', load=True)
+
+    def test_unloadable_targets(self):
+        """
+        Tasks whose targets don't match their output (e.g., with `target_iterator`)
+        raise an error rather than returning the targets' locations
+        """
+        task_manager = PrismTaskManager(upstream={
+            'a.py': PrismTaskOutput('a.py', {'x.txt': 'x'}, [prism.target.Txt])
+        })
+        self.assertEqual({'x.txt': 'x'}, task_manager.ref('a.py'))
+        with self.assertRaises(prism.exceptions.RuntimeException) as cm:
+            task_manager.ref('a.py', load=True)
+        self.assertIn('targets of `a.py` cannot be loaded', str(cm.exception))
+
+    def test_target_hooks(self):
+        """
+        Targets are loaded with the task manager's hooks, even if the upstream task
+        was executed in another process
+        """
+        hooks = object()
+        task_manager = PrismTaskManager(
+            upstream={'a.py': PrismTaskOutput('a.py', 'a.parquet', [HooksTarget])},
+            hooks=hooks
+        )
+        self.assertIs(hooks, task_manager.ref('a.py', load=True))
+
+    def test_pandas_csv_round_trip(self):
+        """
+        DataFrames saved with the default `PandasCsv.save` arguments are loaded
+        unchanged. DataFrames saved with `index=False` are loaded with a default index.
+        """
+        import pandas as pd
+        df = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}, index=[3, 4])
+        for kwargs, expected in [
+            ({}, df), ({'index': False}, df.reset_index(drop=True))
+        ]:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                loc = str(Path(tmpdir) / 'a.csv')
+                prism.target.PandasCsv(df, loc, None).save(**kwargs)
+                task_manager = PrismTaskManager(upstream={
+                    'a.py': PrismTaskOutput('a.py', loc, [prism.target.PandasCsv])
+                })
+                pd.testing.assert_frame_equal(
+                    expected, task_manager.ref('a.py', load=True)
+                )
@@ -0,0 +1,77 @@
+"""
+Unit testing for the ProjectWatcher class, which is used by `prism run --watch`.
+
+Table of Contents:
+- Imports
+- Test case class definition
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+# Prism imports
+from prism.infra.watcher import ProjectWatcher
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestProjectWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.project_dir = Path(self.tmpdir.name)
+        self.modules_dir = self.project_dir / 'modules'
+        (self.modules_dir / 'nested').mkdir(parents=True)
+        (self.project_dir / 'prism_project.py').write_text('VAR = 1')
+        (self.modules_dir / 'module01.py').write_text('a = 1')
+        (self.modules_dir / 'nested' / 'module02.py').write_text('b = 1')
+        self.watcher = ProjectWatcher(
+            self.project_dir, self.modules_dir, poll_interval=0.01, debounce=0.01
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_poll(self):
+        """
+        Added, removed, and modified modules are detected, as are changes to
+        prism_project.py. Other files are ignored.
+        """
+        self.assertEqual([], self.watcher.poll())
+        (self.modules_dir / 'module01.py').write_text('a = 12')
+        (self.modules_dir / 'module03.py').write_text('c = 1')
+        os.unlink(self.modules_dir / 'nested' / 'module02.py')
+        (self.modules_dir / 'data.csv').write_text('x')
+        expected = [
+            self.modules_dir / 'module01.py',
+            self.modules_dir / 'module03.py',
+            self.modules_dir / 'nested' / 'module02.py',
+        ]
+        self.assertEqual(expected, self.watcher.poll())
+        self.assertEqual([], self.watcher.poll())
+
+        # Touching a file is reported, since file contents aren't compared
+        os.utime(self.project_dir / 'prism_project.py', ns=(0, 0))
+        self.assertEqual(
+            [self.project_dir / 'prism_project.py'], self.watcher.poll()
+        )
+
+    def test_wait(self):
+        """
+        `wait` returns the changed files, or an empty list after the timeout
+        """
+        self.assertEqual([], self.watcher.wait(timeout=0.05))
+        (self.modules_dir / 'module01.py').write_text('a = 12')
+        self.assertEqual(
+            [self.modules_dir / 'module01.py'], self.watcher.wait(timeout=1)
+        )